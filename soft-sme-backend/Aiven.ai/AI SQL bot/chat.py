@@ -126,6 +126,13 @@ def main(argv: List[str]) -> int:
     contents: List[types.Content] = []
     # Text-mode fallback history for non-tool usage
     history: List[dict] = []
+    # Tool calls executed by the SDK during the current turn, as reported by
+    # the automatic function calling hook: (FunctionCall, FunctionResponse)
+    tool_events: List[tuple] = []
+
+    def _on_tool_result(function_call, function_response) -> None:
+        tool_events.append((function_call, function_response))
+
     system_preface = system_instruction if system_instruction else None
 
     def _should_retry(exc: Exception) -> bool:
@@ -146,6 +153,8 @@ def main(argv: List[str]) -> int:
     def generate_with_retries(contents_obj, config_obj):
         attempt = 0
         while True:
+            # Only report the tool calls of the attempt that succeeds
+            tool_events.clear()
             try:
                 return client.models.generate_content(model=model, contents=contents_obj, config=config_obj)
             except APIError as e:
@@ -230,6 +239,11 @@ def main(argv: List[str]) -> int:
                 tool_config=tool_cfg,
                 temperature=args.temperature,
                 thinking_config=think_cfg,
+                # Surface tool results already computed by the SDK so the
+                # preview below does not re-run the query against Postgres
+                automatic_function_calling=types.AutomaticFunctionCallingConfig(
+                    function_response_hook=_on_tool_result,
+                ),
             )
 
             # Prepare structured history
@@ -241,41 +255,34 @@ def main(argv: List[str]) -> int:
 
             try:
                 response = generate_with_retries(contents, config)
-                # Progress logging for tool calls
-                try:
-                    parts = response.candidates[0].content.parts
-                    had_tool_call = False
-                    for p in parts:
-                        if getattr(p, "function_call", None):
-                            fn = p.function_call
-                            print(f"[tool] Calling {fn.name} with args: {dict(fn.args)}")
-                            # Local preview for run_select_readonly results
-                            if fn.name == "run_select_readonly":
-                                try:
-                                    # Import locally to avoid circulars at module load
-                                    from db_tools import run_select_readonly as _run
-                                    # Support args as dict-like
-                                    tool_res = _run(sql=fn.args.get("sql", ""), params=fn.args.get("params"))
-                                    if isinstance(tool_res, dict) and tool_res.get("error"):
-                                        print(f"[tool][local] error: {tool_res['error']}")
-                                    else:
-                                        cols = tool_res.get("columns", [])
-                                        rows = tool_res.get("rows", [])
-                                        preview = rows[:5]
-                                        print(f"[tool][local] columns: {cols}")
-                                        print(f"[tool][local] preview ({len(preview)} rows): {preview}")
-                                    had_tool_call = True
-                                except Exception as _e:
-                                    print(f"[tool][local] preview failed: {_e}")
-                except Exception:
-                    pass
+                # Progress logging for tool calls executed during this turn
+                had_tool_call = False
+                for fn, fn_response in tool_events:
+                    try:
+                        print(f"[tool] Called {fn.name} with args: {dict(fn.args or {})}")
+                        # Preview run_select_readonly results from the SDK's result
+                        if fn.name == "run_select_readonly":
+                            payload = (fn_response.response if fn_response else None) or {}
+                            tool_res = payload.get("result", payload)
+                            if payload.get("error") or (isinstance(tool_res, dict) and tool_res.get("error")):
+                                err = payload.get("error") or tool_res.get("error")
+                                print(f"[tool][result] error: {err}")
+                            else:
+                                cols = tool_res.get("columns", [])
+                                rows = tool_res.get("rows", [])
+                                preview = rows[:5]
+                                print(f"[tool][result] columns: {cols}")
+                                print(f"[tool][result] preview ({len(preview)} rows): {preview}")
+                            had_tool_call = True
+                    except Exception as _e:
+                        print(f"[tool][result] preview failed: {_e}")
 
                 text = (response.text or "").strip()
                 if not text:
                     print("[tool] Executed tool call(s); awaiting model response...")
                     # Finalization retry if a tool call happened but no text was produced
                     try:
-                        if 'had_tool_call' in locals() and had_tool_call:
+                        if had_tool_call:
                             delay = args.retry_backoff * (0.8 + 0.4 * random.random())
                             time.sleep(delay)
                             # Minimal micro-prompt to nudge summarization only
@@ -0,0 +1,108 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmarks request body encoding and response body decoding.
+
+Encoding compares the previous two-pass path (`convert_to_dict`, then
+`encode_unserializable_types`, then `json.dumps`) with the single pass
+`convert_to_json_dict` followed by each available JSON codec. Decoding compares
+the codecs on a response of the same size.
+
+Usage: python benchmarks/bench_json_codec.py
+"""
+
+import json
+import time
+
+from google.genai import _common
+from google.genai import _transformers as t
+from google.genai import types
+from google.genai.models import _Content_to_mldev
+
+
+def _request_dict(contents: list[types.Content]) -> dict[str, object]:
+  return {
+      'contents': [_Content_to_mldev(item) for item in t.t_contents(contents)],
+      'generationConfig': {'temperature': 0.0},
+  }
+
+
+def _cases() -> list[tuple[str, dict[str, object]]]:
+  history = [
+      types.Content(
+          role='user' if i % 2 == 0 else 'model',
+          parts=[types.Part(text=f'turn {i} ' * 40)],
+      )
+      for i in range(50)
+  ]
+  media = types.Content(
+      role='user',
+      parts=[
+          types.Part.from_bytes(
+              data=b'\x89PNG' + b'\x00' * (10 * 1024 * 1024),
+              mime_type='image/png',
+          ),
+          types.Part(text='Describe this image.'),
+      ],
+  )
+  return [
+      (
+          'text only',
+          _request_dict(
+              [types.Content(role='user', parts=[types.Part(text='Hi')])]
+          ),
+      ),
+      ('50 turn history', _request_dict(history)),
+      ('10 MB inline media', _request_dict([media])),
+  ]
+
+
+def _ms_per_call(fn, calls: int) -> float:
+  start = time.perf_counter()
+  for _ in range(calls):
+    fn()
+  return (time.perf_counter() - start) / calls * 1e3
+
+
+def _two_pass_encode(request_dict: dict[str, object]) -> str:
+  converted = _common.convert_to_dict(request_dict)
+  return json.dumps(_common.encode_unserializable_types(converted))
+
+
+def main() -> None:
+  codecs = ['json']
+  if _common.has_orjson:
+    codecs.append('orjson')
+  if _common.has_msgspec:
+    codecs.append('msgspec')
+
+  print(f'{"request":>20} {"codec":>8} {"encode ms":>10} {"decode ms":>10}')
+  for name, request_dict in _cases():
+    calls = 5 if 'media' in name else 200
+    baseline = _ms_per_call(lambda: _two_pass_encode(request_dict), calls)
+    print(f'{name:>20} {"two-pass":>8} {baseline:>10.3f} {"":>10}')
+    for codec_name in codecs:
+      _common.set_json_codec(codec_name)
+      encode_request = lambda: _common.json_dumps(
+          _common.convert_to_json_dict(request_dict)
+      )
+      body = encode_request()
+      encode = _ms_per_call(encode_request, calls)
+      decode = _ms_per_call(lambda: _common.json_loads(body), calls)
+      print(f'{name:>20} {codec_name:>8} {encode:>10.3f} {decode:>10.3f}')
+
+
+if __name__ == '__main__':
+  main()
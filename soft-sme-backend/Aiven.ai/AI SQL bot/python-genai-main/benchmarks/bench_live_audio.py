@@ -0,0 +1,125 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmarks sending audio frames over a live session.
+
+Frames of 20 ms of 16 kHz PCM audio are sent over a websocket stand-in that
+discards them, so the numbers are SDK CPU time only. Reports frames per second
+of CPU time (i.e. per core) and CPU microseconds per frame for:
+  * send_realtime_input: `session.send_realtime_input(audio=...)` per frame;
+  * stream_audio: `session.stream_audio(frames, ...)`, which sends a message
+    per frame;
+  * real time: frames arrive every 20 ms for three seconds, and are sent by
+    `send_realtime_input`, by `stream_audio`, and by `stream_audio` with
+    `max_latency_ms=40`, which sends a message per two frames. This includes
+    the CPU time of the event loop waiting for the frames.
+
+Usage: python benchmarks/bench_live_audio.py [frames]
+"""
+
+import asyncio
+import sys
+import time
+
+from google.genai import live
+from google.genai import types
+
+
+_FRAME = bytes(range(256)) * 2 + bytes(128)  # 20 ms of 16 kHz 16-bit PCM.
+_MIME_TYPE = 'audio/pcm;rate=16000'
+
+
+class _ApiClient:
+  vertexai = False
+
+
+class _WebSocket:
+
+  def __init__(self):
+    self.messages = 0
+
+  async def send(self, message: str) -> None:
+    self.messages += 1
+
+
+async def _frames(count: int, interval: float = 0):
+  for _ in range(count):
+    if interval:
+      await asyncio.sleep(interval)
+    yield _FRAME
+
+
+async def _send_realtime_input(
+    session: live.AsyncSession, count: int, interval: float = 0
+) -> None:
+  async for frame in _frames(count, interval):
+    await session.send_realtime_input(
+        audio=types.Blob(data=frame, mime_type=_MIME_TYPE)
+    )
+
+
+async def _report(name: str, run, frames: int) -> None:
+  websocket = _WebSocket()
+  session = live.AsyncSession(
+      api_client=_ApiClient(), websocket=websocket  # type: ignore[arg-type]
+  )
+  start = time.process_time()
+  await run(session)
+  cpu = time.process_time() - start
+  print(
+      f'{name:>37} {frames / cpu:>12.0f} {cpu / frames * 1e6:>10.1f}'
+      f' {websocket.messages:>9}'
+  )
+
+
+async def main(frames: int) -> None:
+  print(f'{"":>37} {"frames/s":>12} {"us/frame":>10} {"messages":>9}')
+  await _report(
+      'send_realtime_input',
+      lambda session: _send_realtime_input(session, frames),
+      frames,
+  )
+  await _report(
+      'stream_audio',
+      lambda session: session.stream_audio(
+          _frames(frames), mime_type=_MIME_TYPE
+      ),
+      frames,
+  )
+  for name, run in (
+      (
+          'send_realtime_input',
+          lambda session: _send_realtime_input(session, 150, interval=0.02),
+      ),
+      (
+          'stream_audio',
+          lambda session: session.stream_audio(
+              _frames(150, interval=0.02), mime_type=_MIME_TYPE
+          ),
+      ),
+      (
+          'stream_audio, coalesced',
+          lambda session: session.stream_audio(
+              _frames(150, interval=0.02),
+              mime_type=_MIME_TYPE,
+              max_latency_ms=40,
+          ),
+      ),
+  ):
+    await _report(f'{name}, real time', run, 150)
+
+
+if __name__ == '__main__':
+  asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000))
@@ -0,0 +1,154 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmarks `LocalTokenizer.count_tokens_batch` against a `count_tokens` loop.
+
+A synthetic sentencepiece model is placed in the local model cache, so no
+download happens. Reports texts per second for:
+  * loop: `count_tokens` called once per text;
+  * batch: `count_tokens_batch` with one thread, and with all cores;
+  * batch, cached: the same batch again, answered from the per-text cache;
+  * batch, process pool: `count_tokens_batch` with a `ProcessPoolExecutor`
+    (worker start-up, including loading the model, is excluded).
+Every batch run starts with an empty per-text cache unless noted.
+
+Usage: python benchmarks/bench_local_tokenizer_batch.py [number of texts]
+"""
+
+import concurrent.futures
+import hashlib
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from unittest import mock
+import warnings
+
+from sentencepiece import sentencepiece_model_pb2
+
+from google.genai import _local_tokenizer_loader as loader
+from google.genai import local_tokenizer
+
+
+_MODEL_URL = 'https://example.com/bench.model'
+_PIECES = 32_000
+
+
+def _model(pieces: int) -> bytes:
+  piece_type = sentencepiece_model_pb2.ModelProto.SentencePiece.Type
+  model = sentencepiece_model_pb2.ModelProto()
+  model.pieces.add(piece='<unk>', score=0, type=piece_type.UNKNOWN)
+  model.pieces.add(piece='<s>', score=0, type=piece_type.CONTROL)
+  model.pieces.add(piece='</s>', score=0, type=piece_type.CONTROL)
+  for i in range(pieces):
+    model.pieces.add(piece=f'▁w{i}', score=-float(i), type=piece_type.NORMAL)
+  return model.SerializeToString()
+
+
+def _texts(count: int) -> list[str]:
+  rng = random.Random(0)
+  return [
+      ' '.join(f'w{rng.randrange(_PIECES)}' for _ in range(rng.randint(20, 80)))
+      for _ in range(count)
+  ]
+
+
+def _load_tokenizer(model_name: str) -> None:
+  local_tokenizer._get_task_tokenizer(model_name)
+
+
+def _report(name: str, run, texts: list[str], expected: list[int]) -> None:
+  start = time.perf_counter()
+  totals = run()
+  elapsed = time.perf_counter() - start
+  assert totals == expected, name
+  print(f'{name:>22} {len(texts) / elapsed:>14.0f}')
+
+
+def main() -> None:
+  count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+  warnings.simplefilter('ignore')
+  content = _model(_PIECES)
+  with tempfile.TemporaryDirectory() as tempdir, mock.patch(
+      'tempfile.gettempdir', return_value=tempdir
+  ), mock.patch.dict(
+      loader._TOKENIZERS,
+      {
+          'bench': loader._TokenizerConfig(
+              _MODEL_URL, hashlib.sha256(content).hexdigest()
+          )
+      },
+  ), mock.patch.dict(
+      loader._GEMINI_MODELS_TO_TOKENIZER_NAMES, {'bench-model': 'bench'}
+  ):
+    model_dir = os.path.join(tempdir, 'vertexai_tokenizer_model')
+    os.makedirs(model_dir)
+    with open(
+        os.path.join(model_dir, hashlib.sha1(_MODEL_URL.encode()).hexdigest()),
+        'wb',
+    ) as f:
+      f.write(content)
+
+    tokenizer = local_tokenizer.LocalTokenizer('bench-model')
+    texts = _texts(count)
+    expected = [tokenizer.count_tokens(text).total_tokens for text in texts]
+
+    def batch(**kwargs) -> list[int]:
+      return [
+          result.total_tokens
+          for result in tokenizer.count_tokens_batch(texts, **kwargs)
+      ]
+
+    def uncached_batch(**kwargs) -> list[int]:
+      tokenizer._token_counts.clear()
+      return batch(**kwargs)
+
+    print(f'texts: {count}, cpus: {os.cpu_count()}')
+    print(f'{"":>22} {"texts/s":>14}')
+    _report(
+        'loop',
+        lambda: [tokenizer.count_tokens(text).total_tokens for text in texts],
+        texts,
+        expected,
+    )
+    _report(
+        'batch, 1 thread',
+        lambda: uncached_batch(num_threads=1),
+        texts,
+        expected,
+    )
+    _report('batch, all cores', uncached_batch, texts, expected)
+    _report('batch, cached', batch, texts, expected)
+    # Forked workers inherit the patched model cache.
+    with concurrent.futures.ProcessPoolExecutor(
+        mp_context=multiprocessing.get_context('fork')
+    ) as executor:
+      list(
+          executor.map(
+              _load_tokenizer, ['bench-model'] * (os.cpu_count() or 1) * 4
+          )
+      )
+      _report(
+          'batch, process pool',
+          lambda: uncached_batch(executor=executor, num_threads=1),
+          texts,
+          expected,
+      )
+
+
+if __name__ == '__main__':
+  main()
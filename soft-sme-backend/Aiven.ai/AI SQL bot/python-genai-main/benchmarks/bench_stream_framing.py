@@ -0,0 +1,161 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmarks streaming throughput of long generate_content_stream sessions.
+
+Reports events per second and CPU milliseconds per MB of body for:
+  * framing alone, with the previous line based framer and with
+    `_JsonStreamFramer`, for SSE events and for multi-line JSON objects
+    (the shape of errors returned mid-stream), which are framed by balancing
+    braces;
+  * a full `generate_content_stream` session served by an in-process httpx
+    transport, so the numbers are SDK CPU time only.
+
+Usage: python benchmarks/bench_stream_framing.py
+"""
+
+import json
+import time
+from typing import Iterator
+
+import httpx
+
+from google import genai
+from google.genai import _api_client
+from google.genai import types
+
+
+def _chunk(i: int) -> dict[str, object]:
+  return {
+      'candidates': [{
+          'content': {
+              'role': 'model',
+              'parts': [{'text': f'token {i} ' * 30}],
+          },
+          'index': 0,
+      }],
+      'usageMetadata': {'promptTokenCount': 12, 'totalTokenCount': 12 + i},
+      'modelVersion': 'gemini-2.5-flash',
+  }
+
+
+def _sse_body(events: int) -> bytes:
+  return ''.join(
+      f'data: {json.dumps(_chunk(i))}\r\n\r\n' for i in range(events)
+  ).encode('utf-8')
+
+
+def _multi_line_json_body(events: int) -> bytes:
+  return ''.join(
+      json.dumps(_chunk(i), indent=2) + '\n' for i in range(events)
+  ).encode('utf-8')
+
+
+def _reads(body: bytes, size: int = 16 * 1024) -> Iterator[bytes]:
+  for i in range(0, len(body), size):
+    yield body[i : i + size]
+
+
+def _previous_framer(body: bytes) -> Iterator[str]:
+  response = httpx.Response(200, stream=httpx.ByteStream(body))
+  chunk = ''
+  balance = 0
+  for line in response.iter_lines():
+    if not line:
+      continue
+    if line.startswith('data: '):
+      yield line[len('data: ') :]
+      continue
+    for c in line:
+      if c == '{':
+        balance += 1
+      elif c == '}':
+        balance -= 1
+    chunk += line
+    if balance == 0:
+      yield chunk
+      chunk = ''
+  if chunk:
+    yield chunk
+
+
+def _framer(body: bytes) -> Iterator[str]:
+  framer = _api_client._JsonStreamFramer()
+  for data in _reads(body):
+    yield from framer.feed(data)
+  yield from framer.flush()
+
+
+def _report(name: str, run, events: int, body: bytes) -> None:
+  start = time.process_time()
+  count = run()
+  cpu = time.process_time() - start
+  assert count == events, (name, count)
+  megabytes = len(body) / (1024 * 1024)
+  print(
+      f'{name:>34} {events / cpu:>12.0f} {cpu / megabytes * 1e3:>12.2f}'
+  )
+
+
+def main() -> None:
+  events = 5000
+  body = _sse_body(events)
+
+  def handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={'content-type': 'text/event-stream'},
+        stream=httpx.ByteStream(body),
+    )
+
+  client = genai.Client(
+      api_key='bench-api-key',
+      http_options=types.HttpOptions(
+          client_args={'transport': httpx.MockTransport(handler)}
+      ),
+  )
+
+  print(f'{"":>34} {"events/s":>12} {"cpu ms/MB":>12}')
+  for label, framed_body in (
+      ('sse', body),
+      ('multi-line json', _multi_line_json_body(events)),
+  ):
+    _report(
+        f'previous framer, {label}',
+        lambda: sum(1 for _ in _previous_framer(framed_body)),
+        events,
+        framed_body,
+    )
+    _report(
+        f'_JsonStreamFramer, {label}',
+        lambda: sum(1 for _ in _framer(framed_body)),
+        events,
+        framed_body,
+    )
+  _report(
+      'generate_content_stream',
+      lambda: sum(
+          1
+          for _ in client.models.generate_content_stream(
+              model='gemini-2.5-flash', contents='Tell me a long story.'
+          )
+      ),
+      events,
+      body,
+  )
+
+
+if __name__ == '__main__':
+  main()
@@ -20,37 +20,43 @@ The BaseApiClient is intended to be a private module and is subject to change.
 """
 
 import asyncio
+import base64
 from collections.abc import Generator
 import copy
 from dataclasses import dataclass
+import functools
+import hashlib
+import importlib.util
 import inspect
 import io
 import json
 import logging
 import math
+import mmap
 import os
 import random
 import ssl
 import sys
 import threading
 import time
-from typing import Any, AsyncIterator, Iterator, Optional, Tuple, TYPE_CHECKING, Union
+from typing import Any, AsyncIterator, Callable, cast, Iterator, Optional, Tuple, TYPE_CHECKING, Union
 from urllib.parse import urlparse
 from urllib.parse import urlunparse
 import warnings
 
-import anyio
 import certifi
 import google.auth
 import google.auth.credentials
 from google.auth.credentials import Credentials
-from google.auth.transport.requests import Request
 import httpx
 from pydantic import BaseModel
 from pydantic import ValidationError
 import tenacity
 
 from . import _common
+from . import _hedging
+from . import instrumentation as _instrumentation
+from . import _rate_limiter
 from . import errors
 from . import version
 from .types import HttpOptions
@@ -59,33 +65,45 @@ from .types import HttpResponse as SdkHttpResponse
 from .types import HttpRetryOptions
 
 
-try:
-  from websockets.asyncio.client import connect as ws_connect
-except ModuleNotFoundError:
-  # This try/except is for TAP, mypy complains about it which is why we have the type: ignore
-  from websockets.client import connect as ws_connect  # type: ignore
-
-has_aiohttp = False
-try:
+# aiohttp takes a long time to import, and is only needed by async requests.
+# It is imported by `_import_aiohttp` when it is first used.
+has_aiohttp = importlib.util.find_spec('aiohttp') is not None
+if TYPE_CHECKING:
   import aiohttp
-
-  has_aiohttp = True
-except ImportError:
-  pass
+  from multidict import CIMultiDictProxy
+else:
+  aiohttp = None
 
 
-if TYPE_CHECKING:
-  from multidict import CIMultiDictProxy
+def _import_aiohttp() -> bool:
+  """Imports aiohttp on first use, returns whether it can be used."""
+  global aiohttp, has_aiohttp
+  if has_aiohttp and aiohttp is None:
+    try:
+      import aiohttp  # pylint: disable=g-import-not-at-top,redefined-outer-name
+    except ImportError:
+      logger.warning(
+          'aiohttp could not be imported, httpx is used instead.',
+          exc_info=True,
+      )
+      has_aiohttp = False
+  return has_aiohttp
 
 
 logger = logging.getLogger('google_genai._api_client')
 CHUNK_SIZE = 8 * 1024 * 1024  # 8 MB chunk size
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
 READ_BUFFER_SIZE = 2**22
 MAX_RETRY_COUNT = 3
 INITIAL_RETRY_DELAY = 1  # second
 DELAY_MULTIPLIER = 2
 
 
+def _aiohttp_upload_errors() -> tuple[type[Exception], ...]:
+  """Returns the aiohttp errors after which an upload chunk is sent again."""
+  return (aiohttp.ClientConnectionError,) if _import_aiohttp() else ()
+
+
 class EphemeralTokenAPIKeyError(ValueError):
   """Error raised when the API key is invalid."""
 
@@ -197,6 +215,8 @@ def load_auth(*, project: Union[str, None]) -> Tuple[Credentials, str]:
 
 
 def refresh_auth(credentials: Credentials) -> Credentials:
+  from google.auth.transport.requests import Request  # pylint: disable=g-import-not-at-top
+
   credentials.refresh(Request())  # type: ignore[no-untyped-call]
   return credentials
 
@@ -223,6 +243,93 @@ class HttpRequest:
   timeout: Optional[float] = None
 
 
+def _encode_request_body(
+    http_request: HttpRequest,
+) -> tuple[
+    Optional[Union[str, bytes, _common.StreamingJsonBody]], dict[str, str]
+]:
+  """Returns the body to send for a request, and the headers to send it with.
+
+  Large inline data is encoded while the body is sent, see
+  `_common.LazyBase64`. Such bodies are sent with a Content-Length rather than
+  in chunks.
+  """
+  if not http_request.data:
+    return None, http_request.headers
+  if isinstance(http_request.data, bytes):
+    return http_request.data, http_request.headers
+  data = _common.encode_json_body(http_request.data)
+  if isinstance(data, str):
+    return data, http_request.headers
+  return data, {
+      **http_request.headers,
+      'Content-Length': str(data.content_length),
+  }
+
+
+class _JsonStreamFramer:
+  """Splits a streamed response body into JSON payloads.
+
+  Lines prefixed with "data: " (server-sent events) are payloads on their own.
+  Other lines, such as a JSON error returned mid-stream, are buffered until
+  their braces balance. Bytes are fed as they arrive; a line split across
+  reads is held until its newline is seen.
+  """
+
+  def __init__(self) -> None:
+    self._partial_line = bytearray()
+    self._pending_lines: list[bytes] = []
+    self._balance = 0
+
+  def feed(self, data: bytes) -> list[str]:
+    """Consumes bytes read from the stream and returns completed payloads."""
+    lines = data.split(b'\n')
+    if len(lines) == 1:
+      self._partial_line += data
+      return []
+    if self._partial_line:
+      self._partial_line += lines[0]
+      lines[0] = bytes(self._partial_line)
+      self._partial_line.clear()
+    # The text after the last newline is the start of the next line.
+    self._partial_line += lines.pop()
+    return self._frame_lines(lines)
+
+  def flush(self) -> list[str]:
+    """Returns the payloads left when the stream ends."""
+    payloads = self._frame_lines([bytes(self._partial_line)])
+    self._partial_line.clear()
+    # If there is any remaining chunk, return it.
+    if self._pending_lines:
+      payloads.append(b''.join(self._pending_lines).decode('utf-8'))
+      self._pending_lines.clear()
+      self._balance = 0
+    return payloads
+
+  def _frame_lines(self, lines: list[bytes]) -> list[str]:
+    payloads: list[str] = []
+    for line in lines:
+      line = line.rstrip()
+      if not line:
+        continue
+
+      # In streaming mode, the response of JSON is prefixed with "data: "
+      # which we must strip before parsing.
+      if line.startswith(b'data: '):
+        payloads.append(line[6:].decode('utf-8'))
+        continue
+
+      # When API returns an error message, it comes line by line. So we buffer
+      # the lines until a complete JSON string is read. A complete JSON string
+      # is found when the balance is 0.
+      self._balance += line.count(b'{') - line.count(b'}')
+      self._pending_lines.append(line)
+      if self._balance == 0:
+        payloads.append(b''.join(self._pending_lines).decode('utf-8'))
+        self._pending_lines.clear()
+    return payloads
+
+
 class HttpResponse:
 
   def __init__(
@@ -288,6 +395,25 @@ class HttpResponse:
       async for chunk in self._aiter_response_stream():
         yield self._load_json_from_response(chunk)
 
+  def _segment_bodies(self) -> Generator[str, None, None]:
+    """Yields the JSON text of each segment, leaving parsing to the caller."""
+    if isinstance(self.response_stream, list):
+      for chunk in self.response_stream:
+        yield chunk if chunk else '{}'
+    elif self.response_stream is None:
+      yield from []
+    else:
+      yield from self._iter_response_stream()
+
+  async def _async_segment_bodies(self) -> AsyncIterator[str]:
+    """Yields the JSON text of each segment, leaving parsing to the caller."""
+    if isinstance(self.response_stream, list):
+      for chunk in self.response_stream:
+        yield chunk if chunk else '{}'
+    elif self.response_stream is not None:
+      async for chunk in self._aiter_response_stream():
+        yield chunk
+
   def byte_segments(self) -> Generator[Union[bytes, Any], None, None]:
     if isinstance(self.byte_stream, list):
       # list of objects retrieved from replay or from non-streaming API.
@@ -313,40 +439,16 @@ class HttpResponse:
           f'but got {type(self.response_stream).__name__}.'
       )
 
-    chunk = ''
-    balance = 0
-    for line in self.response_stream.iter_lines():
-      if not line:
-        continue
-
-      # In streaming mode, the response of JSON is prefixed with "data: " which
-      # we must strip before parsing.
-      if line.startswith('data: '):
-        yield line[len('data: '):]
-        continue
-
-      # When API returns an error message, it comes line by line. So we buffer
-      # the lines until a complete JSON string is read. A complete JSON string
-      # is found when the balance is 0.
-      for c in line:
-        if c == '{':
-          balance += 1
-        elif c == '}':
-          balance -= 1
-
-      chunk += line
-      if balance == 0:
-        yield chunk
-        chunk = ''
-
-    # If there is any remaining chunk, yield it.
-    if chunk:
-      yield chunk
+    framer = _JsonStreamFramer()
+    for data in self.response_stream.iter_bytes():
+      yield from framer.feed(data)
+    yield from framer.flush()
 
   async def _aiter_response_stream(self) -> AsyncIterator[str]:
     """Asynchronously iterates over chunks retrieved from the API."""
     is_valid_response = isinstance(self.response_stream, httpx.Response) or (
-        has_aiohttp and isinstance(self.response_stream, aiohttp.ClientResponse)
+        _import_aiohttp()
+        and isinstance(self.response_stream, aiohttp.ClientResponse)
     )
     if not is_valid_response:
       raise TypeError(
@@ -355,76 +457,28 @@ class HttpResponse:
           f' {type(self.response_stream).__name__}.'
       )
 
-    chunk = ''
-    balance = 0
-    # httpx.Response has a dedicated async line iterator.
+    framer = _JsonStreamFramer()
+    # httpx.Response has a dedicated async byte iterator.
     if isinstance(self.response_stream, httpx.Response):
       try:
-        async for line in self.response_stream.aiter_lines():
-          if not line:
-            continue
-          # In streaming mode, the response of JSON is prefixed with "data: "
-          # which we must strip before parsing.
-          if line.startswith('data: '):
-            yield line[len('data: '):]
-            continue
-
-          # When API returns an error message, it comes line by line. So we buffer
-          # the lines until a complete JSON string is read. A complete JSON string
-          # is found when the balance is 0.
-          for c in line:
-            if c == '{':
-              balance += 1
-            elif c == '}':
-              balance -= 1
-
-          chunk += line
-          if balance == 0:
+        async for data in self.response_stream.aiter_bytes():
+          for chunk in framer.feed(data):
             yield chunk
-            chunk = ''
-        # If there is any remaining chunk, yield it.
-        if chunk:
+        for chunk in framer.flush():
           yield chunk
       finally:
         # Close the response and release the connection.
         await self.response_stream.aclose()
 
-    # aiohttp.ClientResponse uses a content stream that we read line by line.
-    elif has_aiohttp and isinstance(
+    # aiohttp.ClientResponse exposes its body as a content stream.
+    elif _import_aiohttp() and isinstance(
         self.response_stream, aiohttp.ClientResponse
     ):
       try:
-        while True:
-          # Read a line from the stream. This returns bytes.
-          line_bytes = await self.response_stream.content.readline()
-          if not line_bytes:
-            break
-          # Decode the bytes and remove trailing whitespace and newlines.
-          line = line_bytes.decode('utf-8').rstrip()
-          if not line:
-            continue
-
-          # In streaming mode, the response of JSON is prefixed with "data: "
-          # which we must strip before parsing.
-          if line.startswith('data: '):
-            yield line[len('data: '):]
-            continue
-
-          # When API returns an error message, it comes line by line. So we
-          # buffer the lines until a complete JSON string is read. A complete
-          # JSON strings found when the balance is 0.
-          for c in line:
-            if c == '{':
-              balance += 1
-            elif c == '}':
-              balance -= 1
-
-          chunk += line
-          if balance == 0:
+        async for data in self.response_stream.content.iter_any():
+          for chunk in framer.feed(data):
             yield chunk
-            chunk = ''
-        # If there is any remaining chunk, yield it.
-        if chunk:
+        for chunk in framer.flush():
           yield chunk
       finally:
         # Release the connection back to the pool for potential reuse.
@@ -434,13 +488,225 @@ class HttpResponse:
   def _load_json_from_response(cls, response: Any) -> Any:
     """Loads JSON from the response, or raises an error if the parsing fails."""
     try:
-      return json.loads(response)
+      return _common.json_loads(response)
     except json.JSONDecodeError as e:
       raise errors.UnknownApiResponseError(
           f'Failed to parse response as JSON. Raw response: {response}'
       ) from e
 
 
+
+class _UploadChunkReader:
+  """Reads the chunks of a resumable upload as memoryview slices.
+
+  Regular files are memory mapped and every chunk is a slice of the mapping, so
+  no bytes are copied to read it. Other streams, such as io.BytesIO, are read
+  into a single reusable buffer, so a chunk is only valid until the next read.
+  Chunks should be released (e.g. used as a context manager) once they are sent.
+  """
+
+  def __init__(self, file: io.IOBase, chunk_size: int):
+    self._file = file
+    self._start = file.tell()
+    self._mmap: Optional[mmap.mmap] = None
+    self._buffer: Optional[bytearray] = None
+    try:
+      fileno: Optional[int] = file.fileno()
+    except (AttributeError, OSError):
+      fileno = None
+    if fileno is not None and os.fstat(fileno).st_size > self._start:
+      try:
+        self._mmap = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+      except (OSError, ValueError):
+        self._mmap = None
+    if self._mmap is None:
+      self._buffer = bytearray(chunk_size)
+
+  def __enter__(self) -> '_UploadChunkReader':
+    return self
+
+  def __exit__(self, *args: Any) -> None:
+    self.close()
+
+  def read(self, offset: int, size: int) -> memoryview:
+    """Returns up to `size` bytes starting `offset` bytes into the upload."""
+    position = self._start + offset
+    if self._mmap is not None:
+      return memoryview(self._mmap)[position : position + size]
+    if self._buffer is None or len(self._buffer) < size:
+      self._buffer = bytearray(size)
+    view = memoryview(self._buffer)
+    self._file.seek(position, os.SEEK_SET)
+    read = 0
+    while read < size:
+      count = self._file.readinto(view[read:size])  # type: ignore[attr-defined]
+      if not count:
+        break
+      read += count
+    return view[:read]
+
+  def close(self) -> None:
+    if self._mmap is not None:
+      try:
+        self._mmap.close()
+      except BufferError:
+        # A chunk is still referenced, the mapping is closed when it is
+        # garbage collected.
+        pass
+      self._mmap = None
+
+
+def _upload_chunk_headers(
+    offset: int,
+    chunk_size: int,
+    finalize: bool,
+    timeout_in_seconds: Optional[float],
+) -> dict[str, str]:
+  upload_headers = {
+      'X-Goog-Upload-Command': 'upload, finalize' if finalize else 'upload',
+      'X-Goog-Upload-Offset': str(offset),
+      'Content-Length': str(chunk_size),
+  }
+  populate_server_timeout_header(upload_headers, timeout_in_seconds)
+  return upload_headers
+
+
+def _upload_retry_delay(retry_count: int) -> float:
+  """Returns the backoff before retrying a chunk for the `retry_count` time."""
+  return float(INITIAL_RETRY_DELAY * (DELAY_MULTIPLIER ** (retry_count - 1)))
+
+
+def _upload_chunk_content(file_chunk: memoryview) -> list[bytes]:
+  # httpx sends any bytes-like part of the content as is, a chunk is sent
+  # without copying it although httpx only annotates bytes.
+  return [cast(bytes, file_chunk)]
+
+
+async def _async_upload_chunk_content(
+    file_chunk: memoryview,
+) -> AsyncIterator[bytes]:
+  # httpx iterates over any other content that isn't bytes, a chunk is sent
+  # as a single part of an async byte stream instead.
+  yield cast(bytes, file_chunk)
+
+
+
+class _DownloadWriter:
+  """Writes a streamed download to a path or a binary file object.
+
+  With `resume`, the data already in the file at `path` is kept and only the
+  rest is requested with a range request. Otherwise the data is written to a
+  temporary file next to `path`, which replaces it once the download
+  succeeds. With `sha256_hash`, the downloaded data is hashed as it is written
+  and verified when the download finishes.
+  """
+
+  def __init__(
+      self,
+      destination: Union[str, 'os.PathLike[str]', io.IOBase],
+      *,
+      resume: bool = False,
+      sha256_hash: Optional[str] = None,
+  ):
+    self.offset = 0
+    self._sha256_hash = sha256_hash
+    self._hash = hashlib.sha256() if sha256_hash else None
+    self._path: Optional[str] = None
+    self._temp_path: Optional[str] = None
+    if isinstance(destination, io.IOBase):
+      self._file = destination
+      self._start = destination.tell()
+      return
+    self._path = os.fspath(destination)
+    self._start = 0
+    if resume:
+      # The data of an interrupted download is kept, so it can be resumed.
+      if os.path.exists(self._path):
+        self._file = open(self._path, 'r+b')
+        self._skip_existing_data(self._path)
+      else:
+        self._file = open(self._path, 'wb')
+    else:
+      # The destination is only replaced once the download succeeds.
+      self._temp_path = f'{self._path}.{os.getpid()}.download'
+      self._file = open(self._temp_path, 'wb')
+
+  def _skip_existing_data(self, path: str) -> None:
+    if self._hash is None:
+      self.offset = os.path.getsize(path)
+      self._file.seek(0, os.SEEK_END)
+      return
+    while True:
+      data = self._file.read(DOWNLOAD_CHUNK_SIZE)
+      if not data:
+        break
+      self._hash.update(data)
+      self.offset += len(data)
+
+  @property
+  def range_headers(self) -> dict[str, str]:
+    return {'Range': f'bytes={self.offset}-'} if self.offset else {}
+
+  def start(self, status_code: int) -> bool:
+    """Returns whether the response status is the one of a valid download."""
+    if status_code == 200:
+      if self.offset:
+        # The server ignored the range, the download starts over.
+        self._file.seek(self._start, os.SEEK_SET)
+        self._file.truncate()
+        self._hash = hashlib.sha256() if self._sha256_hash else None
+        self.offset = 0
+      return True
+    # 416 is returned for a range starting at the end of a complete file.
+    return bool(self.offset) and status_code in (206, 416)
+
+  def write(self, data: bytes) -> None:
+    self._file.write(data)
+    if self._hash is not None:
+      self._hash.update(data)
+    self.offset += len(data)
+
+  def finish(self) -> int:
+    """Verifies the checksum and returns the size of the downloaded data."""
+    if self._hash is not None:
+      digest = self._hash.digest()
+      # The hash is base64 encoded, either from the digest or from its hex
+      # representation.
+      valid_hashes = (
+          base64.b64encode(digest).decode(),
+          base64.b64encode(digest.hex().encode()).decode(),
+          digest.hex(),
+      )
+      if self._sha256_hash not in valid_hashes:
+        # A resumed download is removed, a new one never replaces `path`.
+        resumed_path = self._path if self._temp_path is None else None
+        self.close()
+        if resumed_path is not None:
+          os.remove(resumed_path)
+        raise ValueError(
+            f'Downloaded data does not match the SHA-256 hash'
+            f' {self._sha256_hash}.'
+        )
+    if self._temp_path is not None and self._path is not None:
+      self._file.close()
+      os.replace(self._temp_path, self._path)
+      self._temp_path = None
+    return self.offset
+
+  def close(self) -> None:
+    """Closes the file, removing the data of an unfinished download."""
+    if self._path is None:
+      self._file.flush()
+      return
+    self._file.close()
+    if self._temp_path is not None:
+      try:
+        os.remove(self._temp_path)
+      except FileNotFoundError:
+        pass
+      self._temp_path = None
+
+
 # Default retry options.
 # The config is based on https://cloud.google.com/storage/docs/retry-strategy.
 # By default, the client will retry 4 times with approximately 1.0, 2.0, 4.0,
@@ -708,24 +974,43 @@ class BaseApiClient:
       self._async_httpx_client = self._http_options.httpx_async_client
     else:
       self._async_httpx_client = AsyncHttpxClient(**async_client_args)
-    if self._use_aiohttp():
-      try:
-        import aiohttp  # pylint: disable=g-import-not-at-top
-        # Do it once at the genai.Client level. Share among all requests.
-        self._async_client_session_request_args = self._ensure_aiohttp_ssl_ctx(
-            self._http_options
-        )
-      except ImportError:
-        pass
 
     # Initialize the aiohttp client session.
-    self._aiohttp_session: Optional[aiohttp.ClientSession] = None
+    self._aiohttp_session: Optional['aiohttp.ClientSession'] = None
 
-    retry_kwargs = retry_args(self._http_options.retry_options)
-    self._websocket_ssl_ctx = self._ensure_websocket_ssl_ctx(self._http_options)
+    self._rate_limiter = (
+        _rate_limiter.RateLimiter(self._http_options.rate_limits)
+        if self._http_options.rate_limits
+        else None
+    )
+    self._hedger = (
+        _hedging.Hedger(self._http_options.hedging)
+        if self._http_options.hedging
+        else None
+    )
+    self.instrumentation: Optional[_instrumentation.Instrumentation] = None
+    retry_kwargs = self._retry_args(self._http_options.retry_options)
     self._retry = tenacity.Retrying(**retry_kwargs)
     self._async_retry = tenacity.AsyncRetrying(**retry_kwargs)
 
+  def _retry_args(
+      self, options: Optional[HttpRetryOptions]
+  ) -> _common.StringDict:
+    retry_kwargs = retry_args(options)
+    if self._rate_limiter is not None:
+      retry_kwargs = self._rate_limiter.retry_args(retry_kwargs)
+    return retry_kwargs
+
+  @functools.cached_property
+  def _async_client_session_request_args(self) -> _common.StringDict:
+    # Computed once at the genai.Client level, on the first aiohttp request,
+    # and shared among all requests.
+    return self._ensure_aiohttp_ssl_ctx(self._http_options)
+
+  @functools.cached_property
+  def _websocket_ssl_ctx(self) -> _common.StringDict:
+    return self._ensure_websocket_ssl_ctx(self._http_options)
+
   async def _get_aiohttp_session(self) -> 'aiohttp.ClientSession':
     """Returns the aiohttp client session."""
     if self._aiohttp_session is None or self._aiohttp_session.closed:
@@ -906,6 +1191,12 @@ class BaseApiClient:
       if not args or not args.get(verify):
         args = (args or {}).copy()
         args[verify] = ctx
+      try:
+        from websockets.asyncio.client import connect as ws_connect  # pylint: disable=g-import-not-at-top
+      except ModuleNotFoundError:
+        # This try/except is for TAP, mypy complains about it which is why we have the type: ignore
+        from websockets.client import connect as ws_connect  # type: ignore  # pylint: disable=g-import-not-at-top
+
       # Drop the args that isn't in the aiohttp RequestOptions.
       copied_args = args.copy()
       for key in copied_args.copy():
@@ -919,7 +1210,7 @@ class BaseApiClient:
     # If the instantiator has passed a custom transport, they want httpx not
     # aiohttp.
     return (
-        has_aiohttp
+        _import_aiohttp()
         and (self._http_options.async_client_args or {}).get('transport')
         is None
         and (self._http_options.httpx_async_client is None)
@@ -1104,7 +1395,6 @@ class BaseApiClient:
       http_request: HttpRequest,
       stream: bool = False,
   ) -> HttpResponse:
-    data: Optional[Union[str, bytes]] = None
     # If using proj/location, fetch ADC
     if self.vertexai and (self.project or self.location):
       http_request.headers['Authorization'] = f'Bearer {self._access_token()}'
@@ -1112,20 +1402,16 @@ class BaseApiClient:
         http_request.headers['x-goog-user-project'] = (
             self._credentials.quota_project_id
         )
-      data = json.dumps(http_request.data) if http_request.data else None
-    else:
-      if http_request.data:
-        if not isinstance(http_request.data, bytes):
-          data = json.dumps(http_request.data) if http_request.data else None
-        else:
-          data = http_request.data
+    serialize_started = time.perf_counter()
+    data, headers = _encode_request_body(http_request)
+    _instrumentation._encoded(serialize_started, data)
 
     if stream:
       httpx_request = self._httpx_client.build_request(
           method=http_request.method,
           url=http_request.url,
           content=data,
-          headers=http_request.headers,
+          headers=headers,
           timeout=http_request.timeout,
       )
       response = self._httpx_client.send(httpx_request, stream=stream)
@@ -1137,7 +1423,7 @@ class BaseApiClient:
       response = self._httpx_client.request(
           method=http_request.method,
           url=http_request.url,
-          headers=http_request.headers,
+          headers=headers,
           content=data,
           timeout=http_request.timeout,
       )
@@ -1160,17 +1446,29 @@ class BaseApiClient:
       )
       # Support per request retry options.
       if parameter_model.retry_options:
-        retry_kwargs = retry_args(parameter_model.retry_options)
+        retry_kwargs = self._retry_args(parameter_model.retry_options)
         retry = tenacity.Retrying(**retry_kwargs)
-        return retry(self._request_once, http_request, stream)  # type: ignore[no-any-return]
+        return retry(self._hedged_request_once, http_request, stream)  # type: ignore[no-any-return]
 
-    return self._retry(self._request_once, http_request, stream)  # type: ignore[no-any-return]
+    return self._retry(self._hedged_request_once, http_request, stream)  # type: ignore[no-any-return]
 
-  async def _async_request_once(
+  def _hedged_request_once(
       self, http_request: HttpRequest, stream: bool = False
   ) -> HttpResponse:
-    data: Optional[Union[str, bytes]] = None
+    if self._hedger is None or stream:
+      return self._limited_request_once(http_request, stream)
+    return self._hedger.call(self._limited_request_once, http_request)  # type: ignore[no-any-return]
 
+  def _limited_request_once(
+      self, http_request: HttpRequest, stream: bool = False
+  ) -> HttpResponse:
+    if self._rate_limiter is None:
+      return self._request_once(http_request, stream)
+    return self._rate_limiter.call(self._request_once, http_request, stream)  # type: ignore[no-any-return]
+
+  async def _async_request_once(
+      self, http_request: HttpRequest, stream: bool = False
+  ) -> HttpResponse:
     # If using proj/location, fetch ADC
     if self.vertexai and (self.project or self.location):
       http_request.headers['Authorization'] = (
@@ -1180,13 +1478,15 @@ class BaseApiClient:
         http_request.headers['x-goog-user-project'] = (
             self._credentials.quota_project_id
         )
-      data = json.dumps(http_request.data) if http_request.data else None
-    else:
-      if http_request.data:
-        if not isinstance(http_request.data, bytes):
-          data = json.dumps(http_request.data) if http_request.data else None
-        else:
-          data = http_request.data
+    serialize_started = time.perf_counter()
+    data, headers = _encode_request_body(http_request)
+    _instrumentation._encoded(serialize_started, data)
+    # httpx only sends async iterators with its async client.
+    content = (
+        data.__aiter__()
+        if isinstance(data, _common.StreamingJsonBody)
+        else data
+    )
 
     if stream:
       if self._use_aiohttp():
@@ -1195,7 +1495,7 @@ class BaseApiClient:
           response = await self._aiohttp_session.request(
               method=http_request.method,
               url=http_request.url,
-              headers=http_request.headers,
+              headers=headers,
               data=data,
               timeout=aiohttp.ClientTimeout(connect=http_request.timeout),
               **self._async_client_session_request_args,
@@ -1217,7 +1517,7 @@ class BaseApiClient:
           response = await self._aiohttp_session.request(
               method=http_request.method,
               url=http_request.url,
-              headers=http_request.headers,
+              headers=headers,
               data=data,
               timeout=aiohttp.ClientTimeout(connect=http_request.timeout),
               **self._async_client_session_request_args,
@@ -1230,8 +1530,8 @@ class BaseApiClient:
         httpx_request = self._async_httpx_client.build_request(
             method=http_request.method,
             url=http_request.url,
-            content=data,
-            headers=http_request.headers,
+            content=content,
+            headers=headers,
             timeout=http_request.timeout,
         )
         client_response = await self._async_httpx_client.send(
@@ -1247,7 +1547,7 @@ class BaseApiClient:
           response = await self._aiohttp_session.request(
               method=http_request.method,
               url=http_request.url,
-              headers=http_request.headers,
+              headers=headers,
               data=data,
               timeout=aiohttp.ClientTimeout(connect=http_request.timeout),
               **self._async_client_session_request_args,
@@ -1271,7 +1571,7 @@ class BaseApiClient:
           response = await self._aiohttp_session.request(
               method=http_request.method,
               url=http_request.url,
-              headers=http_request.headers,
+              headers=headers,
               data=data,
               timeout=aiohttp.ClientTimeout(connect=http_request.timeout),
               **self._async_client_session_request_args,
@@ -1283,8 +1583,8 @@ class BaseApiClient:
         client_response = await self._async_httpx_client.request(
             method=http_request.method,
             url=http_request.url,
-            headers=http_request.headers,
-            content=data,
+            headers=headers,
+            content=content,
             timeout=http_request.timeout,
         )
         await errors.APIError.raise_for_async_response(client_response)
@@ -1304,10 +1604,28 @@ class BaseApiClient:
       )
       # Support per request retry options.
       if parameter_model.retry_options:
-        retry_kwargs = retry_args(parameter_model.retry_options)
+        retry_kwargs = self._retry_args(parameter_model.retry_options)
         retry = tenacity.AsyncRetrying(**retry_kwargs)
-        return await retry(self._async_request_once, http_request, stream)  # type: ignore[no-any-return]
+        return await retry(self._async_hedged_request_once, http_request, stream)  # type: ignore[no-any-return]
     return await self._async_retry(  # type: ignore[no-any-return]
+        self._async_hedged_request_once, http_request, stream
+    )
+
+  async def _async_hedged_request_once(
+      self, http_request: HttpRequest, stream: bool = False
+  ) -> HttpResponse:
+    if self._hedger is None or stream:
+      return await self._async_limited_request_once(http_request, stream)
+    return await self._hedger.async_call(  # type: ignore[no-any-return]
+        self._async_limited_request_once, http_request
+    )
+
+  async def _async_limited_request_once(
+      self, http_request: HttpRequest, stream: bool = False
+  ) -> HttpResponse:
+    if self._rate_limiter is None:
+      return await self._async_request_once(http_request, stream)
+    return await self._rate_limiter.async_call(  # type: ignore[no-any-return]
         self._async_request_once, http_request, stream
     )
 
@@ -1318,6 +1636,25 @@ class BaseApiClient:
       copied = self._http_options
     return copied
 
+  def _mark_build_start(self) -> None:
+    """Marks the start of the conversion of the arguments of a request."""
+    if self.instrumentation is not None:
+      _instrumentation._build_started.set(time.perf_counter())
+
+  def _build_started(self) -> Optional[float]:
+    if self.instrumentation is None:
+      return None
+    return _instrumentation._build_started.get() or time.perf_counter()
+
+  def _start_trace(
+      self, http_method: str, path: str, build_started: Optional[float]
+  ) -> Optional[_instrumentation._RequestTrace]:
+    if self.instrumentation is None or build_started is None:
+      return None
+    return _instrumentation._start(
+        self.instrumentation, http_method, path, build_started
+    )
+
   def request(
       self,
       http_method: str,
@@ -1325,13 +1662,22 @@ class BaseApiClient:
       request_dict: dict[str, object],
       http_options: Optional[HttpOptionsOrDict] = None,
   ) -> SdkHttpResponse:
+    build_started = self._build_started()
     http_request = self._build_request(
         http_method, path, request_dict, http_options
     )
-    response = self._request(http_request, http_options, stream=False)
+    trace = self._start_trace(http_method, path, build_started)
+    try:
+      response = self._request(http_request, http_options, stream=False)
+    except Exception as e:
+      if trace is not None:
+        _instrumentation._received(trace, None, e)
+      raise
     response_body = (
         response.response_stream[0] if response.response_stream else ''
     )
+    if trace is not None:
+      _instrumentation._received(trace, response_body)
     return SdkHttpResponse(headers=response.headers, body=response_body)
 
   def request_streamed(
@@ -1341,15 +1687,28 @@ class BaseApiClient:
       request_dict: dict[str, object],
       http_options: Optional[HttpOptionsOrDict] = None,
   ) -> Generator[SdkHttpResponse, None, None]:
+    build_started = self._build_started()
     http_request = self._build_request(
         http_method, path, request_dict, http_options
     )
-
-    session_response = self._request(http_request, http_options, stream=True)
-    for chunk in session_response.segments():
-      yield SdkHttpResponse(
-          headers=session_response.headers, body=json.dumps(chunk)
-      )
+    trace = self._start_trace(http_method, path, build_started)
+    try:
+      session_response = self._request(http_request, http_options, stream=True)
+    except Exception as e:
+      if trace is not None:
+        _instrumentation._received(trace, None, e)
+      raise
+    if trace is not None:
+      _instrumentation._received(trace, None, streamed=True)
+    try:
+      # Each event is passed through as text and parsed once by the caller.
+      for body in session_response._segment_bodies():
+        if trace is not None:
+          trace.parse_started = time.perf_counter()
+        yield SdkHttpResponse(headers=session_response.headers, body=body)
+    finally:
+      if trace is not None:
+        _instrumentation._parse_done(trace)
 
   async def async_request(
       self,
@@ -1358,14 +1717,22 @@ class BaseApiClient:
       request_dict: dict[str, object],
       http_options: Optional[HttpOptionsOrDict] = None,
   ) -> SdkHttpResponse:
+    build_started = self._build_started()
     http_request = self._build_request(
         http_method, path, request_dict, http_options
     )
-
-    result = await self._async_request(
-        http_request=http_request, http_options=http_options, stream=False
-    )
+    trace = self._start_trace(http_method, path, build_started)
+    try:
+      result = await self._async_request(
+          http_request=http_request, http_options=http_options, stream=False
+      )
+    except Exception as e:
+      if trace is not None:
+        _instrumentation._received(trace, None, e)
+      raise
     response_body = result.response_stream[0] if result.response_stream else ''
+    if trace is not None:
+      _instrumentation._received(trace, response_body)
     return SdkHttpResponse(headers=result.headers, body=response_body)
 
   async def async_request_streamed(
@@ -1375,18 +1742,53 @@ class BaseApiClient:
       request_dict: dict[str, object],
       http_options: Optional[HttpOptionsOrDict] = None,
   ) -> Any:
+    build_started = self._build_started()
     http_request = self._build_request(
         http_method, path, request_dict, http_options
     )
-
-    response = await self._async_request(http_request=http_request, stream=True)
+    trace = self._start_trace(http_method, path, build_started)
+    try:
+      response = await self._async_request(
+          http_request=http_request, stream=True
+      )
+    except Exception as e:
+      if trace is not None:
+        _instrumentation._received(trace, None, e)
+      raise
+    if trace is not None:
+      _instrumentation._received(trace, None, streamed=True)
 
     async def async_generator():  # type: ignore[no-untyped-def]
-      async for chunk in response:
-        yield SdkHttpResponse(headers=response.headers, body=json.dumps(chunk))
+      try:
+        # Each event is passed through as text and parsed once by the caller.
+        async for body in response._async_segment_bodies():
+          if trace is not None:
+            trace.parse_started = time.perf_counter()
+          yield SdkHttpResponse(headers=response.headers, body=body)
+      finally:
+        if trace is not None:
+          _instrumentation._parse_done(trace)
 
     return async_generator()  # type: ignore[no-untyped-call]
 
+  def _upload_timeout_in_seconds(
+      self, http_options: Optional[HttpOptionsOrDict]
+  ) -> Optional[float]:
+    http_options = http_options if http_options else self._http_options
+    timeout = (
+        http_options.get('timeout')
+        if isinstance(http_options, dict)
+        else http_options.timeout
+    )
+    if timeout is None:
+      # Per request timeout is not configured. Check the global timeout.
+      timeout = (
+          self._http_options.timeout
+          if isinstance(self._http_options, dict)
+          else self._http_options.timeout
+      )
+    return get_timeout_in_seconds(timeout)
+
   def upload_file(
       self,
       file_path: Union[str, io.IOBase],
@@ -1394,6 +1796,9 @@ class BaseApiClient:
       upload_size: int,
       *,
       http_options: Optional[HttpOptionsOrDict] = None,
+      chunk_size: Optional[int] = None,
+      offset: int = 0,
+      progress_callback: Optional[Callable[[int, int], None]] = None,
   ) -> HttpResponse:
     """Transfers a file to the given URL.
 
@@ -1405,18 +1810,36 @@ class BaseApiClient:
       upload_size: The size of file content to be uploaded, this will have to
         match the size requested in the resumable upload request.
       http_options: The http options to use for the request.
+      chunk_size: The number of bytes sent in each request. Defaults to
+        `CHUNK_SIZE`.
+      offset: The number of bytes the server has already received. The upload
+        resumes from this offset.
+      progress_callback: Called with the number of bytes the server has
+        received and `upload_size` after every chunk.
 
     returns:
           The HttpResponse object from the finalize request.
     """
     if isinstance(file_path, io.IOBase):
       return self._upload_fd(
-          file_path, upload_url, upload_size, http_options=http_options
+          file_path,
+          upload_url,
+          upload_size,
+          http_options=http_options,
+          chunk_size=chunk_size,
+          offset=offset,
+          progress_callback=progress_callback,
       )
     else:
       with open(file_path, 'rb') as file:
         return self._upload_fd(
-            file, upload_url, upload_size, http_options=http_options
+            file,
+            upload_url,
+            upload_size,
+            http_options=http_options,
+            chunk_size=chunk_size,
+            offset=offset,
+            progress_callback=progress_callback,
         )
 
   def _upload_fd(
@@ -1426,6 +1849,9 @@ class BaseApiClient:
       upload_size: int,
       *,
       http_options: Optional[HttpOptionsOrDict] = None,
+      chunk_size: Optional[int] = None,
+      offset: int = 0,
+      progress_callback: Optional[Callable[[int, int], None]] = None,
   ) -> HttpResponse:
     """Transfers a file to the given URL.
 
@@ -1435,67 +1861,108 @@ class BaseApiClient:
       upload_size: The size of file content to be uploaded, this will have to
         match the size requested in the resumable upload request.
       http_options: The http options to use for the request.
+      chunk_size: The number of bytes sent in each request.
+      offset: The number of bytes the server has already received.
+      progress_callback: Called with the number of bytes the server has
+        received and `upload_size` after every chunk.
 
     returns:
           The HttpResponse object from the finalize request.
     """
-    offset = 0
+    chunk_size = chunk_size or CHUNK_SIZE
+    if chunk_size < 0:
+      raise ValueError(f'chunk_size must be positive, got {chunk_size}.')
+    timeout_in_seconds = self._upload_timeout_in_seconds(http_options)
     # Upload the file in chunks
+    with _UploadChunkReader(file, chunk_size) as reader:
+      while True:
+        read_size = min(chunk_size, max(upload_size - offset, 0))
+        with reader.read(offset, read_size) as file_chunk:
+          sent = len(file_chunk)
+          # If last chunk, finalize the upload.
+          upload_headers = _upload_chunk_headers(
+              offset,
+              sent,
+              sent < read_size or sent + offset >= upload_size,
+              timeout_in_seconds,
+          )
+          response = self._send_upload_chunk(
+              upload_url, upload_headers, file_chunk, timeout_in_seconds
+          )
+        offset += sent
+        upload_status = response.headers.get('x-goog-upload-status')
+        if progress_callback and upload_status in ('active', 'final'):
+          progress_callback(offset, upload_size)
+        if upload_status != 'active':
+          break  # upload is complete or it has been interrupted.
+        if upload_size <= offset:  # Status is not finalized.
+          raise ValueError(
+              f'All content has been uploaded, but the upload status is not'
+              f' finalized.'
+          )
+
+    if response.headers.get('x-goog-upload-status') != 'final':
+      raise ValueError('Failed to upload file: Upload status is not finalized.')
+    return HttpResponse(response.headers, response_stream=[response.text])
+
+  def _send_upload_chunk(
+      self,
+      upload_url: str,
+      upload_headers: dict[str, str],
+      file_chunk: memoryview,
+      timeout_in_seconds: Optional[float],
+  ) -> httpx.Response:
+    """Sends one chunk, retrying until the server reports an upload status."""
+    retry_count = 0
     while True:
-      file_chunk = file.read(CHUNK_SIZE)
-      chunk_size = 0
-      if file_chunk:
-        chunk_size = len(file_chunk)
-      upload_command = 'upload'
-      # If last chunk, finalize the upload.
-      if chunk_size + offset >= upload_size:
-        upload_command += ', finalize'
-      http_options = http_options if http_options else self._http_options
-      timeout = (
-          http_options.get('timeout')
-          if isinstance(http_options, dict)
-          else http_options.timeout
-      )
-      if timeout is None:
-        # Per request timeout is not configured. Check the global timeout.
-        timeout = (
-            self._http_options.timeout
-            if isinstance(self._http_options, dict)
-            else self._http_options.timeout
-        )
-      timeout_in_seconds = get_timeout_in_seconds(timeout)
-      upload_headers = {
-          'X-Goog-Upload-Command': upload_command,
-          'X-Goog-Upload-Offset': str(offset),
-          'Content-Length': str(chunk_size),
-      }
-      populate_server_timeout_header(upload_headers, timeout_in_seconds)
-      retry_count = 0
-      while retry_count < MAX_RETRY_COUNT:
+      retry_count += 1
+      try:
         response = self._httpx_client.request(
             method='POST',
             url=upload_url,
             headers=upload_headers,
-            content=file_chunk,
+            content=_upload_chunk_content(file_chunk),
             timeout=timeout_in_seconds,
         )
-        if response.headers.get('x-goog-upload-status'):
-          break
-        delay_seconds = INITIAL_RETRY_DELAY * (DELAY_MULTIPLIER**retry_count)
-        retry_count += 1
-        time.sleep(delay_seconds)
-
-      offset += chunk_size
-      if response.headers.get('x-goog-upload-status') != 'active':
-        break  # upload is complete or it has been interrupted.
-      if upload_size <= offset:  # Status is not finalized.
-        raise ValueError(
-            f'All content has been uploaded, but the upload status is not'
-            f' finalized.'
-        )
+      except httpx.TransportError:
+        if retry_count >= MAX_RETRY_COUNT:
+          raise
+      else:
+        if (
+            response.headers.get('x-goog-upload-status')
+            or retry_count >= MAX_RETRY_COUNT
+        ):
+          return response
+      time.sleep(_upload_retry_delay(retry_count))
 
-    if response.headers.get('x-goog-upload-status') != 'final':
-      raise ValueError('Failed to upload file: Upload status is not finalized.')
+  def query_upload(
+      self,
+      upload_url: str,
+      *,
+      http_options: Optional[HttpOptionsOrDict] = None,
+  ) -> HttpResponse:
+    """Queries the status of a resumable upload.
+
+    The `x-goog-upload-status` header of the response is `active` while the
+    upload can be resumed, in which case `x-goog-upload-size-received` is the
+    offset to resume from.
+
+    Args:
+      upload_url: The URL returned when the upload was started.
+      http_options: The http options to use for the request.
+
+    returns:
+          The HttpResponse object from the query request.
+    """
+    timeout_in_seconds = self._upload_timeout_in_seconds(http_options)
+    query_headers = {'X-Goog-Upload-Command': 'query'}
+    populate_server_timeout_header(query_headers, timeout_in_seconds)
+    response = self._httpx_client.request(
+        method='POST',
+        url=upload_url,
+        headers=query_headers,
+        timeout=timeout_in_seconds,
+    )
     return HttpResponse(response.headers, response_stream=[response.text])
 
   def download_file(
@@ -1520,7 +1987,7 @@ class BaseApiClient:
     data: Optional[Union[str, bytes]] = None
     if http_request.data:
       if not isinstance(http_request.data, bytes):
-        data = json.dumps(http_request.data)
+        data = _common.json_dumps(http_request.data)
       else:
         data = http_request.data
 
@@ -1537,6 +2004,59 @@ class BaseApiClient:
         response.headers, byte_stream=[response.read()]
     ).byte_stream[0]
 
+  def download_file_to(
+      self,
+      path: str,
+      destination: Union[str, 'os.PathLike[str]', io.IOBase],
+      *,
+      http_options: Optional[HttpOptionsOrDict] = None,
+      chunk_size: Optional[int] = None,
+      resume: bool = False,
+      sha256_hash: Optional[str] = None,
+  ) -> int:
+    """Streams the file data to a path or a binary file object.
+
+    The data is written in chunks as it is received, so the file is never held
+    in memory.
+
+    Args:
+      path: The request path with query params.
+      destination: The path or the binary file object to write the data to.
+      http_options: The http options to use for the request.
+      chunk_size: The number of bytes written at a time. Defaults to
+        `DOWNLOAD_CHUNK_SIZE`.
+      resume: Whether to keep the data already at the `destination` path and
+        only download the rest of the file with a range request. Otherwise the
+        `destination` path is only replaced once the download succeeds.
+      sha256_hash: The base64 encoded SHA-256 hash of the file. The download
+        fails if the data doesn't match, and a resumed `destination` path is
+        removed.
+
+    returns:
+          The size of the file data.
+    """
+    http_request = self._build_request(
+        'get', path=path, request_dict={}, http_options=http_options
+    )
+    writer = _DownloadWriter(
+        destination, resume=resume, sha256_hash=sha256_hash
+    )
+    try:
+      with self._httpx_client.stream(
+          method=http_request.method,
+          url=http_request.url,
+          headers={**http_request.headers, **writer.range_headers},
+          timeout=http_request.timeout,
+      ) as response:
+        if not writer.start(response.status_code):
+          errors.APIError.raise_for_response(response)
+        if response.status_code != 416:
+          for data in response.iter_bytes(chunk_size or DOWNLOAD_CHUNK_SIZE):
+            writer.write(data)
+      return writer.finish()
+    finally:
+      writer.close()
+
   async def async_upload_file(
       self,
       file_path: Union[str, io.IOBase],
@@ -1544,6 +2064,9 @@ class BaseApiClient:
       upload_size: int,
       *,
       http_options: Optional[HttpOptionsOrDict] = None,
+      chunk_size: Optional[int] = None,
+      offset: int = 0,
+      progress_callback: Optional[Callable[[int, int], None]] = None,
   ) -> HttpResponse:
     """Transfers a file asynchronously to the given URL.
 
@@ -1554,29 +2077,50 @@ class BaseApiClient:
       upload_size: The size of file content to be uploaded, this will have to
         match the size requested in the resumable upload request.
       http_options: The http options to use for the request.
+      chunk_size: The number of bytes sent in each request. Defaults to
+        `CHUNK_SIZE`.
+      offset: The number of bytes the server has already received. The upload
+        resumes from this offset.
+      progress_callback: Called with the number of bytes the server has
+        received and `upload_size` after every chunk.
 
     returns:
           The HttpResponse object from the finalize request.
     """
     if isinstance(file_path, io.IOBase):
       return await self._async_upload_fd(
-          file_path, upload_url, upload_size, http_options=http_options
+          file_path,
+          upload_url,
+          upload_size,
+          http_options=http_options,
+          chunk_size=chunk_size,
+          offset=offset,
+          progress_callback=progress_callback,
       )
     else:
-      file = anyio.Path(file_path)
-      fd = await file.open('rb')
-      async with fd:
+      # Chunks are read from a memory mapping of the file, so the event loop
+      # isn't blocked on file reads.
+      with open(file_path, 'rb') as file:
         return await self._async_upload_fd(
-            fd, upload_url, upload_size, http_options=http_options
+            file,
+            upload_url,
+            upload_size,
+            http_options=http_options,
+            chunk_size=chunk_size,
+            offset=offset,
+            progress_callback=progress_callback,
         )
 
   async def _async_upload_fd(
       self,
-      file: Union[io.IOBase, anyio.AsyncFile[Any]],
+      file: io.IOBase,
       upload_url: str,
       upload_size: int,
       *,
       http_options: Optional[HttpOptionsOrDict] = None,
+      chunk_size: Optional[int] = None,
+      offset: int = 0,
+      progress_callback: Optional[Callable[[int, int], None]] = None,
   ) -> HttpResponse:
     """Transfers a file asynchronously to the given URL.
 
@@ -1586,163 +2130,141 @@ class BaseApiClient:
       upload_size: The size of file content to be uploaded, this will have to
         match the size requested in the resumable upload request.
       http_options: The http options to use for the request.
+      chunk_size: The number of bytes sent in each request.
+      offset: The number of bytes the server has already received.
+      progress_callback: Called with the number of bytes the server has
+        received and `upload_size` after every chunk.
 
     returns:
           The HttpResponse object from the finalized request.
     """
-    offset = 0
+    chunk_size = chunk_size or CHUNK_SIZE
+    if chunk_size < 0:
+      raise ValueError(f'chunk_size must be positive, got {chunk_size}.')
+    timeout_in_seconds = self._upload_timeout_in_seconds(http_options)
     # Upload the file in chunks
-    if self._use_aiohttp():  # pylint: disable=g-import-not-at-top
-      self._aiohttp_session = await self._get_aiohttp_session()
+    with _UploadChunkReader(file, chunk_size) as reader:
       while True:
-        if isinstance(file, io.IOBase):
-          file_chunk = file.read(CHUNK_SIZE)
-        else:
-          file_chunk = await file.read(CHUNK_SIZE)
-        chunk_size = 0
-        if file_chunk:
-          chunk_size = len(file_chunk)
-        upload_command = 'upload'
-        # If last chunk, finalize the upload.
-        if chunk_size + offset >= upload_size:
-          upload_command += ', finalize'
-        http_options = http_options if http_options else self._http_options
-        timeout = (
-            http_options.get('timeout')
-             if isinstance(http_options, dict)
-             else http_options.timeout
-        )
-        if timeout is None:
-          # Per request timeout is not configured. Check the global timeout.
-          timeout = (
-              self._http_options.timeout
-              if isinstance(self._http_options, dict)
-              else self._http_options.timeout
+        read_size = min(chunk_size, max(upload_size - offset, 0))
+        with reader.read(offset, read_size) as file_chunk:
+          sent = len(file_chunk)
+          # If last chunk, finalize the upload.
+          upload_headers = _upload_chunk_headers(
+              offset,
+              sent,
+              sent < read_size or sent + offset >= upload_size,
+              timeout_in_seconds,
           )
-        timeout_in_seconds = get_timeout_in_seconds(timeout)
-        upload_headers = {
-            'X-Goog-Upload-Command': upload_command,
-             'X-Goog-Upload-Offset': str(offset),
-            'Content-Length': str(chunk_size),
-        }
-        populate_server_timeout_header(upload_headers, timeout_in_seconds)
-
-        retry_count = 0
-        response = None
-        while retry_count < MAX_RETRY_COUNT:
-          response = await self._aiohttp_session.request(
+          response = await self._async_send_upload_chunk(
+              upload_url, upload_headers, file_chunk, timeout_in_seconds
+          )
+        offset += sent
+        upload_status = response.headers.get('x-goog-upload-status')
+        if progress_callback and upload_status in ('active', 'final'):
+          progress_callback(offset, upload_size)
+        if upload_status != 'active':
+          break  # upload is complete or it has been interrupted.
+        if upload_size <= offset:  # Status is not finalized.
+          raise ValueError(
+              'All content has been uploaded, but the upload status is not'
+              ' finalized.'
+          )
+
+    if response.headers.get('x-goog-upload-status') != 'final':
+      raise ValueError('Failed to upload file: Upload status is not finalized.')
+    if isinstance(response, httpx.Response):
+      return HttpResponse(response.headers, response_stream=[response.text])
+    return HttpResponse(
+        response.headers, response_stream=[await response.text()]
+    )
+
+  async def _async_send_upload_chunk(
+      self,
+      upload_url: str,
+      upload_headers: dict[str, str],
+      file_chunk: memoryview,
+      timeout_in_seconds: Optional[float],
+  ) -> Union[httpx.Response, 'aiohttp.ClientResponse']:
+    """Sends one chunk, retrying until the server reports an upload status."""
+    response: Union[httpx.Response, 'aiohttp.ClientResponse']
+    aiohttp_session = None
+    if self._use_aiohttp():  # pylint: disable=g-import-not-at-top
+      aiohttp_session = await self._get_aiohttp_session()
+      self._aiohttp_session = aiohttp_session
+    retried_errors: tuple[type[Exception], ...] = (
+        httpx.TransportError,
+        *_aiohttp_upload_errors(),
+    )
+    retry_count = 0
+    while True:
+      retry_count += 1
+      try:
+        if aiohttp_session is not None:
+          response = await aiohttp_session.request(
               method='POST',
               url=upload_url,
               data=file_chunk,
               headers=upload_headers,
               timeout=aiohttp.ClientTimeout(connect=timeout_in_seconds),
           )
-
-          if response.headers.get('X-Goog-Upload-Status'):
-            break
-          delay_seconds = INITIAL_RETRY_DELAY * (DELAY_MULTIPLIER**retry_count)
-          retry_count += 1
-          await asyncio.sleep(delay_seconds)
-
-        offset += chunk_size
-        if (
-            response is not None
-            and response.headers.get('X-Goog-Upload-Status') != 'active'
-        ):
-          break  # upload is complete or it has been interrupted.
-
-        if upload_size <= offset:  # Status is not finalized.
-          raise ValueError(
-              f'All content has been uploaded, but the upload status is not'
-              f' finalized.'
-          )
-      if (
-          response is not None
-          and response.headers.get('X-Goog-Upload-Status') != 'final'
-      ):
-        raise ValueError(
-            'Failed to upload file: Upload status is not finalized.'
-        )
-      return HttpResponse(
-          response.headers, response_stream=[await response.text()]
-      )
-    else:
-      # aiohttp is not available. Fall back to httpx.
-      while True:
-        if isinstance(file, io.IOBase):
-          file_chunk = file.read(CHUNK_SIZE)
         else:
-          file_chunk = await file.read(CHUNK_SIZE)
-        chunk_size = 0
-        if file_chunk:
-          chunk_size = len(file_chunk)
-        upload_command = 'upload'
-        # If last chunk, finalize the upload.
-        if chunk_size + offset >= upload_size:
-          upload_command += ', finalize'
-        http_options = http_options if http_options else self._http_options
-        timeout = (
-            http_options.get('timeout')
-            if isinstance(http_options, dict)
-            else http_options.timeout
-        )
-        if timeout is None:
-          # Per request timeout is not configured. Check the global timeout.
-          timeout = (
-              self._http_options.timeout
-              if isinstance(self._http_options, dict)
-              else self._http_options.timeout
-          )
-        timeout_in_seconds = get_timeout_in_seconds(timeout)
-        upload_headers = {
-            'X-Goog-Upload-Command': upload_command,
-            'X-Goog-Upload-Offset': str(offset),
-            'Content-Length': str(chunk_size),
-        }
-        populate_server_timeout_header(upload_headers, timeout_in_seconds)
-
-        retry_count = 0
-        client_response = None
-        while retry_count < MAX_RETRY_COUNT:
-          client_response = await self._async_httpx_client.request(
+          # aiohttp is not available. Fall back to httpx.
+          response = await self._async_httpx_client.request(
               method='POST',
               url=upload_url,
-              content=file_chunk,
+              content=_async_upload_chunk_content(file_chunk),
               headers=upload_headers,
               timeout=timeout_in_seconds,
           )
-          if (
-              client_response is not None
-              and client_response.headers
-              and client_response.headers.get('x-goog-upload-status')
-          ):
-            break
-          delay_seconds = INITIAL_RETRY_DELAY * (DELAY_MULTIPLIER**retry_count)
-          retry_count += 1
-          time.sleep(delay_seconds)
-
-        offset += chunk_size
+      except retried_errors:
+        if retry_count >= MAX_RETRY_COUNT:
+          raise
+      else:
         if (
-            client_response is not None
-            and client_response.headers.get('x-goog-upload-status') != 'active'
+            response.headers.get('x-goog-upload-status')
+            or retry_count >= MAX_RETRY_COUNT
         ):
-          break  # upload is complete or it has been interrupted.
+          return response
+      await asyncio.sleep(_upload_retry_delay(retry_count))
 
-        if upload_size <= offset:  # Status is not finalized.
-          raise ValueError(
-              'All content has been uploaded, but the upload status is not'
-              ' finalized.'
-          )
-      if (
-          client_response is not None
-          and client_response.headers.get('x-goog-upload-status') != 'final'
-      ):
-        raise ValueError(
-            'Failed to upload file: Upload status is not finalized.'
+  async def async_query_upload(
+      self,
+      upload_url: str,
+      *,
+      http_options: Optional[HttpOptionsOrDict] = None,
+  ) -> HttpResponse:
+    """Queries the status of a resumable upload asynchronously.
+
+    Args:
+      upload_url: The URL returned when the upload was started.
+      http_options: The http options to use for the request.
+
+    returns:
+          The HttpResponse object from the query request.
+    """
+    timeout_in_seconds = self._upload_timeout_in_seconds(http_options)
+    query_headers = {'X-Goog-Upload-Command': 'query'}
+    populate_server_timeout_header(query_headers, timeout_in_seconds)
+    if self._use_aiohttp():
+      self._aiohttp_session = await self._get_aiohttp_session()
+      async with self._aiohttp_session.request(
+          method='POST',
+          url=upload_url,
+          headers=query_headers,
+          timeout=aiohttp.ClientTimeout(connect=timeout_in_seconds),
+      ) as response:
+        return HttpResponse(
+            response.headers, response_stream=[await response.text()]
         )
-      return HttpResponse(
-          client_response.headers, response_stream=[client_response.text]
-      )
+    httpx_response = await self._async_httpx_client.request(
+        method='POST',
+        url=upload_url,
+        headers=query_headers,
+        timeout=timeout_in_seconds,
+    )
+    return HttpResponse(
+        httpx_response.headers, response_stream=[httpx_response.text]
+    )
 
   async def async_download_file(
       self,
@@ -1766,7 +2288,7 @@ class BaseApiClient:
     data: Optional[Union[str, bytes]] = None
     if http_request.data:
       if not isinstance(http_request.data, bytes):
-        data = json.dumps(http_request.data)
+        data = _common.json_dumps(http_request.data)
       else:
         data = http_request.data
 
@@ -1799,15 +2321,129 @@ class BaseApiClient:
           client_response.headers, byte_stream=[client_response.read()]
       ).byte_stream[0]
 
+  async def async_download_file_to(
+      self,
+      path: str,
+      destination: Union[str, 'os.PathLike[str]', io.IOBase],
+      *,
+      http_options: Optional[HttpOptionsOrDict] = None,
+      chunk_size: Optional[int] = None,
+      resume: bool = False,
+      sha256_hash: Optional[str] = None,
+  ) -> int:
+    """Streams the file data asynchronously to a path or a binary file object.
+
+    Args:
+      path: The request path with query params.
+      destination: The path or the binary file object to write the data to.
+      http_options: The http options to use for the request.
+      chunk_size: The number of bytes written at a time. Defaults to
+        `DOWNLOAD_CHUNK_SIZE`.
+      resume: Whether to keep the data already at the `destination` path and
+        only download the rest of the file with a range request. Otherwise the
+        `destination` path is only replaced once the download succeeds.
+      sha256_hash: The base64 encoded SHA-256 hash of the file. The download
+        fails if the data doesn't match, and a resumed `destination` path is
+        removed.
+
+    returns:
+          The size of the file data.
+    """
+    http_request = self._build_request(
+        'get', path=path, request_dict={}, http_options=http_options
+    )
+    chunk_size = chunk_size or DOWNLOAD_CHUNK_SIZE
+    writer = _DownloadWriter(
+        destination, resume=resume, sha256_hash=sha256_hash
+    )
+    try:
+      if self._use_aiohttp():
+        self._aiohttp_session = await self._get_aiohttp_session()
+        async with self._aiohttp_session.request(
+            method=http_request.method,
+            url=http_request.url,
+            headers={**http_request.headers, **writer.range_headers},
+            timeout=aiohttp.ClientTimeout(connect=http_request.timeout),
+        ) as response:
+          if not writer.start(response.status):
+            await errors.APIError.raise_for_async_response(response)
+          if response.status != 416:
+            async for data in response.content.iter_chunked(chunk_size):
+              writer.write(data)
+      else:
+        # aiohttp is not available. Fall back to httpx.
+        async with self._async_httpx_client.stream(
+            method=http_request.method,
+            url=http_request.url,
+            headers={**http_request.headers, **writer.range_headers},
+            timeout=http_request.timeout,
+        ) as client_response:
+          if not writer.start(client_response.status_code):
+            await errors.APIError.raise_for_async_response(client_response)
+          if client_response.status_code != 416:
+            async for data in client_response.aiter_bytes(chunk_size):
+              writer.write(data)
+      return writer.finish()
+    finally:
+      writer.close()
+
+  async def async_stream_file(
+      self,
+      path: str,
+      *,
+      http_options: Optional[HttpOptionsOrDict] = None,
+      chunk_size: Optional[int] = None,
+  ) -> AsyncIterator[bytes]:
+    """Streams the file data asynchronously, a chunk at a time.
+
+    Args:
+      path: The request path with query params.
+      http_options: The http options to use for the request.
+      chunk_size: The largest chunk to yield. Defaults to
+        `DOWNLOAD_CHUNK_SIZE`.
+
+    Yields:
+      The file data, in chunks as they are received.
+    """
+    http_request = self._build_request(
+        'get', path=path, request_dict={}, http_options=http_options
+    )
+    chunk_size = chunk_size or DOWNLOAD_CHUNK_SIZE
+    if self._use_aiohttp():
+      self._aiohttp_session = await self._get_aiohttp_session()
+      async with self._aiohttp_session.request(
+          method=http_request.method,
+          url=http_request.url,
+          headers=http_request.headers,
+          timeout=aiohttp.ClientTimeout(connect=http_request.timeout),
+      ) as response:
+        await errors.APIError.raise_for_async_response(response)
+        async for data in response.content.iter_chunked(chunk_size):
+          yield data
+    else:
+      # aiohttp is not available. Fall back to httpx.
+      async with self._async_httpx_client.stream(
+          method=http_request.method,
+          url=http_request.url,
+          headers=http_request.headers,
+          timeout=http_request.timeout,
+      ) as client_response:
+        await errors.APIError.raise_for_async_response(client_response)
+        async for data in client_response.aiter_bytes(chunk_size):
+          yield data
+
   # This method does nothing in the real api client. It is used in the
   # replay_api_client to verify the response from the SDK method matches the
   # recorded response.
   def _verify_response(self, response_model: _common.BaseModel) -> None:
-    pass
+    # Called by the API modules once a response is parsed.
+    _instrumentation._parsed(response_model)
 
   def close(self) -> None:
     """Closes the API client."""
     self._httpx_client.close()
+    if self._hedger is not None:
+      self._hedger.close()
 
   async def aclose(self) -> None:
     """Closes the API async client."""
@@ -20,20 +20,46 @@ import collections.abc
 import datetime
 import enum
 import functools
+import json
 import logging
+import mmap
+import os
 import re
 import typing
-from typing import Any, Callable, FrozenSet, Optional, Union, get_args, get_origin
+from typing import Any, AsyncIterator, Callable, FrozenSet, Iterator, Optional, Union, get_args, get_origin
 import uuid
 import warnings
 import pydantic
 from pydantic import alias_generators
 from typing_extensions import TypeAlias
 
+has_orjson = False
+has_msgspec = False
+try:
+  import orjson
+
+  has_orjson = True
+except ImportError:
+  pass
+try:
+  import msgspec
+
+  has_msgspec = True
+except ImportError:
+  pass
+
 logger = logging.getLogger('google_genai._common')
 
 StringDict: TypeAlias = dict[str, Any]
 
+# Inline data of at least this size is base64 encoded while the request body is
+# written, instead of when the request is built.
+LAZY_BASE64_MIN_SIZE = 1024 * 1024  # 1 MB
+# Number of bytes encoded at a time. A multiple of 3, so that the encoded chunks
+# can be concatenated.
+_BASE64_CHUNK_SIZE = 3 * 256 * 1024
+_BUFFER_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
 
 class ExperimentalWarning(Warning):
   """Warning for experimental features."""
@@ -145,13 +171,16 @@ def get_value_by_path(
         )
       else:
         return default_value
-    else:
-      if key in data:
-        data = data[key]
-      elif isinstance(data, BaseModel) and hasattr(data, key):
-        data = getattr(data, key)
-      else:
+    elif isinstance(data, BaseModel):
+      # `key in data` would iterate over the fields of the model, and never
+      # match the key.
+      if not hasattr(data, key):
         return default_value
+      data = getattr(data, key)
+    elif key in data:
+      data = data[key]
+    else:
+      return default_value
   return data
 
 
@@ -247,11 +276,18 @@ def _move_value_recursive(
       )
 
 
+@functools.lru_cache(maxsize=4096)
+def _snake_to_camel(snake_str: str) -> str:
+  return re.sub(r'_([a-zA-Z])', lambda match: match.group(1).upper(), snake_str)
+
+
 def maybe_snake_to_camel(snake_str: str, convert: bool = True) -> str:
   """Converts a snake_case string to CamelCase, if convert is True."""
   if not convert:
     return snake_str
-  return re.sub(r'_([a-zA-Z])', lambda match: match.group(1).upper(), snake_str)
+  # Keys come from a small, fixed vocabulary of field names, so the
+  # conversion is cached.
+  return _snake_to_camel(snake_str)
 
 
 def convert_to_dict(obj: object, convert_keys: bool = False) -> Any:
@@ -281,6 +317,43 @@ def convert_to_dict(obj: object, convert_keys: bool = False) -> Any:
     return obj
 
 
+def convert_to_json_dict(obj: object, lazy_base64: bool = True) -> Any:
+  """Recursively converts a given object to JSON compatible types.
+
+  This is `encode_unserializable_types(convert_to_dict(obj))` in a single walk:
+  Pydantic models are dumped, bytes are URL safe base64 encoded and datetimes
+  are converted to ISO 8601 strings, at any depth.
+
+  Args:
+    obj: The object to convert.
+    lazy_base64: Whether bytes of at least `LAZY_BASE64_MIN_SIZE` are wrapped
+      in `LazyBase64`, to be encoded while the request body is written.
+
+  Returns:
+    A copy of the object that can be passed to `json_dumps`, or to
+    `encode_json_body` if it contains `LazyBase64` values.
+  """
+  if obj is None or isinstance(obj, (str, int, float)):
+    return obj
+  elif isinstance(obj, dict):
+    return {
+        key: convert_to_json_dict(value, lazy_base64)
+        for key, value in obj.items()
+    }
+  elif isinstance(obj, list):
+    return [convert_to_json_dict(item, lazy_base64) for item in obj]
+  elif isinstance(obj, pydantic.BaseModel):
+    return convert_to_json_dict(obj.model_dump(exclude_none=True), lazy_base64)
+  elif isinstance(obj, _BUFFER_TYPES):
+    if lazy_base64 and len(obj) >= LAZY_BASE64_MIN_SIZE:
+      return LazyBase64(obj)
+    return base64.urlsafe_b64encode(obj).decode('ascii')
+  elif isinstance(obj, datetime.datetime):
+    return obj.isoformat()
+  else:
+    return obj
+
+
 def _is_struct_type(annotation: type) -> bool:
   """Checks if the given annotation is list[dict[str, typing.Any]]
 
@@ -314,45 +387,79 @@ def _is_struct_type(annotation: type) -> bool:
   return key_type is str and value_type is typing.Any
 
 
-def _remove_extra_fields(model: Any, response: dict[str, object]) -> None:
-  """Removes extra fields from the response that are not in the model.
-
-  Mutates the response in place.
-  """
+# A pruning plan maps every accepted response key (field name or alias) of a
+# model to the models to prune a dict value or the dict items of a list value
+# with. `None` means the value is kept as is.
+_PruningPlan: TypeAlias = dict[
+    str,
+    tuple[
+        Optional[type[pydantic.BaseModel]], Optional[type[pydantic.BaseModel]]
+    ],
+]
 
-  key_values = list(response.items())
 
-  for key, value in key_values:
-    # Need to convert to snake case to match model fields names
-    # ex: UsageMetadata
-    alias_map = {
-        field_info.alias: key for key, field_info in model.model_fields.items()
-    }
+def _as_model_class(annotation: Any) -> Optional[type[pydantic.BaseModel]]:
+  if isinstance(annotation, type) and issubclass(
+      annotation, pydantic.BaseModel
+  ):
+    return annotation
+  return None
 
-    if key not in model.model_fields and key not in alias_map:
-      response.pop(key)
-      continue
 
-    key = alias_map.get(key, key)
-
-    annotation = model.model_fields[key].annotation
+@functools.lru_cache(maxsize=None)
+def _get_pruning_plan(model: type[pydantic.BaseModel]) -> _PruningPlan:
+  """Compiles the pruning plan of a model class once."""
+  plan: _PruningPlan = {}
+  for field_name, field_info in model.model_fields.items():
+    annotation: Any = field_info.annotation
 
     # Get the BaseModel if Optional
     if typing.get_origin(annotation) is Union:
       annotation = typing.get_args(annotation)[0]
 
+    dict_child = None
+    list_child = None
     # if dict, assume BaseModel but also check that field type is not dict
     # example: FunctionCall.args
-    if isinstance(value, dict) and typing.get_origin(annotation) is not dict:
-      _remove_extra_fields(annotation, value)
-    elif isinstance(value, list):
-      if _is_struct_type(annotation):
-        continue
+    if typing.get_origin(annotation) is not dict:
+      dict_child = _as_model_class(annotation)
+    if typing.get_origin(annotation) is list and not _is_struct_type(
+        annotation
+    ):
+      # assume a list of dict is list of BaseModel
+      list_child = _as_model_class(typing.get_args(annotation)[0])
+    plan[field_name] = (dict_child, list_child)
 
+  # Need to convert to snake case to match model fields names
+  # ex: UsageMetadata
+  for field_name, field_info in model.model_fields.items():
+    if field_info.alias is not None:
+      plan[field_info.alias] = plan[field_name]
+  return plan
+
+
+def _remove_extra_fields(model: Any, response: dict[str, object]) -> None:
+  """Removes extra fields from the response that are not in the model.
+
+  Mutates the response in place.
+  """
+  plan = _get_pruning_plan(model)
+
+  for key in list(response):
+    children = plan.get(key)
+    if children is None:
+      response.pop(key)
+      continue
+
+    value = response[key]
+    dict_child, list_child = children
+    if isinstance(value, dict):
+      if dict_child is not None:
+        _remove_extra_fields(dict_child, value)
+    elif isinstance(value, list) and list_child is not None:
       for item in value:
-        # assume a list of dict is list of BaseModel
         if isinstance(item, dict):
-          _remove_extra_fields(typing.get_args(annotation)[0], item)
+          _remove_extra_fields(list_child, item)
 
 
 T = typing.TypeVar('T', bound='BaseModel')
@@ -633,6 +740,46 @@ def timestamped_unique_name() -> str:
   return f'{timestamp}_{unique_id}'
 
 
+# Request config fields read by `BaseModel._from_response` and its overrides.
+_RESPONSE_CONFIG_FIELDS = (
+    'include_all_fields',
+    'response_schema',
+    'response_json_schema',
+)
+
+
+def get_response_kwargs(parameter_model: object) -> StringDict:
+  """Returns the request fields needed to parse a response.
+
+  `_from_response` only reads a handful of config fields from the request,
+  so this avoids a full `model_dump()` of the request parameters, which
+  copies every content part (including inline bytes) on each call.
+
+  Args:
+    parameter_model: The request parameters model, or a dict.
+
+  Returns:
+    A dict of the form `{'config': {...}}` holding only the fields in
+    `_RESPONSE_CONFIG_FIELDS` that are set, or an empty dict if the request
+    has no config.
+  """
+  if isinstance(parameter_model, dict):
+    config = parameter_model.get('config')
+  else:
+    config = getattr(parameter_model, 'config', None)
+  if config is None:
+    return {}
+  response_config: StringDict = {}
+  for field_name in _RESPONSE_CONFIG_FIELDS:
+    if isinstance(config, dict):
+      value = config.get(field_name)
+    else:
+      value = getattr(config, field_name, None)
+    if value is not None:
+      response_config[field_name] = value
+  return {'config': response_config}
+
+
 def encode_unserializable_types(data: dict[str, object]) -> dict[str, object]:
   """Converts unserializable types in dict to json.dumps() compatible types.
 
@@ -671,6 +818,217 @@ def encode_unserializable_types(data: dict[str, object]) -> dict[str, object]:
   return processed_data
 
 
+class JsonCodec:
+  """A JSON backend used to encode request bodies and decode responses.
+
+  Attributes:
+    name: The name of the codec.
+    dumps: Serializes a JSON compatible object to a string.
+    loads: Deserializes a string or bytes. Raises `json.JSONDecodeError` on
+      invalid input.
+  """
+
+  def __init__(
+      self,
+      name: str,
+      dumps: Callable[[Any], str],
+      loads: Callable[[Union[str, bytes]], Any],
+  ):
+    self.name = name
+    self.dumps = dumps
+    self.loads = loads
+
+  def __repr__(self) -> str:
+    return f'JsonCodec(name={self.name!r})'
+
+
+def _orjson_dumps(obj: Any) -> str:
+  try:
+    return orjson.dumps(obj).decode('utf-8')
+  except TypeError:
+    # orjson rejects integers wider than 64 bits and non string keys, which
+    # the standard library accepts.
+    return json.dumps(obj)
+
+
+def _msgspec_dumps(obj: Any) -> str:
+  try:
+    encoded: bytes = msgspec.json.encode(obj)
+    return encoded.decode('utf-8')
+  except (TypeError, OverflowError):
+    return json.dumps(obj)
+
+
+def _msgspec_loads(data: Union[str, bytes]) -> Any:
+  try:
+    return msgspec.json.decode(data)
+  except msgspec.DecodeError as e:
+    if isinstance(data, bytes):
+      data = data.decode('utf-8', errors='replace')
+    raise json.JSONDecodeError(str(e), data, 0) from e
+
+
+def _create_json_codec(name: str) -> JsonCodec:
+  if name == 'json':
+    return JsonCodec('json', json.dumps, json.loads)
+  elif name == 'orjson':
+    if not has_orjson:
+      raise ValueError(
+          'The orjson JSON codec requires the orjson package. Install it with'
+          ' `pip install orjson`.'
+      )
+    return JsonCodec('orjson', _orjson_dumps, orjson.loads)
+  elif name == 'msgspec':
+    if not has_msgspec:
+      raise ValueError(
+          'The msgspec JSON codec requires the msgspec package. Install it'
+          ' with `pip install msgspec`.'
+      )
+    return JsonCodec('msgspec', _msgspec_dumps, _msgspec_loads)
+  raise ValueError(
+      f'Unsupported JSON codec: {name}. Supported codecs are json, orjson and'
+      ' msgspec.'
+  )
+
+
+def _default_json_codec() -> JsonCodec:
+  """Returns the codec set by `GOOGLE_GENAI_JSON_CODEC`, json by default."""
+  name = os.environ.get('GOOGLE_GENAI_JSON_CODEC', '').lower()
+  if name:
+    try:
+      return _create_json_codec(name)
+    except ValueError as e:
+      logger.warning('%s Falling back to the json codec.', e)
+  return _create_json_codec('json')
+
+
+_json_codec = _default_json_codec()
+
+
+def get_json_codec() -> JsonCodec:
+  """Returns the JSON codec used for request and response bodies."""
+  return _json_codec
+
+
+def set_json_codec(codec: Union[str, JsonCodec]) -> None:
+  """Sets the JSON codec used for request and response bodies.
+
+  The standard library json module is used by default. The default can also
+  be set with the `GOOGLE_GENAI_JSON_CODEC` environment variable. orjson and
+  msgspec are faster, but do not produce the same bytes as json, e.g. they
+  encode NaN and infinity as null.
+
+  Args:
+    codec: `json`, `orjson`, `msgspec` or a custom `JsonCodec`.
+  """
+  global _json_codec
+  if isinstance(codec, str):
+    codec = _create_json_codec(codec.lower())
+  _json_codec = codec
+
+
+def json_dumps(obj: Any) -> str:
+  """Serializes a JSON compatible object with the current JSON codec."""
+  return _json_codec.dumps(obj)
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+  """Deserializes JSON with the current JSON codec."""
+  return _json_codec.loads(data)
+
+
+class LazyBase64:
+  """Inline data that is URL safe base64 encoded when it is written.
+
+  Wraps bytes, or any object supporting the buffer protocol, e.g. a memoryview
+  or a memory mapped file, without copying it.
+  """
+
+  def __init__(self, data: Union[bytes, bytearray, memoryview, mmap.mmap]):
+    self.data = data
+
+  def __len__(self) -> int:
+    """Returns the size of the encoded data."""
+    with memoryview(self.data) as view:
+      return (view.nbytes + 2) // 3 * 4
+
+  def __repr__(self) -> str:
+    return f'LazyBase64(<{len(self)} encoded bytes>)'
+
+  def iter_encoded(self) -> Iterator[bytes]:
+    """Yields the encoded data in chunks."""
+    with memoryview(self.data) as data, data.cast('B') as view:
+      for start in range(0, view.nbytes, _BASE64_CHUNK_SIZE):
+        yield base64.urlsafe_b64encode(view[start : start + _BASE64_CHUNK_SIZE])
+
+  def encode(self) -> str:
+    """Returns all of the encoded data."""
+    return base64.urlsafe_b64encode(self.data).decode('ascii')
+
+
+class StreamingJsonBody:
+  """A JSON request body whose `LazyBase64` values are encoded as it is sent.
+
+  Only the JSON around the inline data is serialized up front. The inline data
+  is read from its source and encoded in chunks, so neither the encoded data
+  nor the whole body is held in memory. The body can be iterated over more than
+  once, e.g. when the request is retried.
+  """
+
+  def __init__(self, data: Any):
+    values: list[LazyBase64] = []
+    # Stands in for each value in the serialized JSON, in the order in which
+    # the values are serialized.
+    marker = f'lazy-base64-{uuid.uuid4().hex}'
+
+    def _default(obj: Any) -> str:
+      if isinstance(obj, LazyBase64):
+        values.append(obj)
+        return marker
+      raise TypeError(
+          f'Object of type {type(obj).__name__} is not JSON serializable'
+      )
+
+    head, *tails = json.dumps(data, default=_default).split(marker)
+    self._segments: list[Union[bytes, LazyBase64]] = [head.encode()]
+    for value, text in zip(values, tails):
+      self._segments.append(value)
+      self._segments.append(text.encode())
+    self.content_length = sum(len(segment) for segment in self._segments)
+
+  def __iter__(self) -> Iterator[bytes]:
+    for segment in self._segments:
+      if isinstance(segment, LazyBase64):
+        yield from segment.iter_encoded()
+      else:
+        yield segment
+
+  async def __aiter__(self) -> AsyncIterator[bytes]:
+    for chunk in self:
+      yield chunk
+
+
+def encode_json_body(data: Any) -> Union[str, StreamingJsonBody]:
+  """Serializes a request body, streaming the `LazyBase64` values it contains."""
+  try:
+    return json_dumps(data)
+  except TypeError:
+    # JSON codecs reject `LazyBase64` values, which are rare enough that
+    # bodies are not searched for them up front.
+    return StreamingJsonBody(data)
+
+
+def encode_lazy_base64(obj: Any) -> Any:
+  """Returns a copy of the object with its `LazyBase64` values encoded."""
+  if isinstance(obj, LazyBase64):
+    return obj.encode()
+  elif isinstance(obj, dict):
+    return {key: encode_lazy_base64(value) for key, value in obj.items()}
+  elif isinstance(obj, list):
+    return [encode_lazy_base64(item) for item in obj]
+  return obj
+
+
 def experimental_warning(
     message: str,
 ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
@@ -0,0 +1,271 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Hedging of slow requests with a duplicate request."""
+
+import asyncio
+import bisect
+import collections
+import concurrent.futures
+import contextvars
+import math
+import re
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional, TYPE_CHECKING
+
+from .types import HedgingOptions
+
+if TYPE_CHECKING:
+  from ._api_client import HttpRequest
+
+_HEDGED_REQUEST = re.compile(r'models/([^/:?]+):generateContent(\?|$)')
+_DEFAULT_PERCENTILE = 95.0
+_DEFAULT_MAX_HEDGES_PER_MINUTE = 60
+# The number of latencies of a model recorded before its percentile is used.
+_MIN_SAMPLES = 20
+# The number of recent latencies of a model that its percentile is taken from.
+_WINDOW = 1000
+# The number of threads that send duplicates.
+_MAX_THREADS = 128
+# Latency bucket upper bounds, from 1 ms to about 10 minutes, 10% apart.
+_BUCKET_BOUNDS = [0.001 * 1.1**i for i in range(140)]
+
+
+class _LatencyHistogram:
+  """The latencies of the recent requests to a model, in buckets."""
+
+  def __init__(self, window: int = _WINDOW):
+    self._window = window
+    self._counts = [0] * (len(_BUCKET_BOUNDS) + 1)
+    self._recent: collections.deque[int] = collections.deque()
+
+  def __len__(self) -> int:
+    return len(self._recent)
+
+  def add(self, seconds: float) -> None:
+    bucket = bisect.bisect_left(_BUCKET_BOUNDS, seconds)
+    self._counts[bucket] += 1
+    self._recent.append(bucket)
+    if len(self._recent) > self._window:
+      self._counts[self._recent.popleft()] -= 1
+
+  def percentile(self, percentile: float) -> float:
+    """Returns the upper bound of the bucket of the given percentile."""
+    rank = max(1, math.ceil(percentile / 100 * len(self._recent)))
+    for bucket, count in enumerate(self._counts):
+      rank -= count
+      if rank <= 0:
+        break
+    return _BUCKET_BOUNDS[min(bucket, len(_BUCKET_BOUNDS) - 1)]
+
+
+def _start_thread(
+    fn: Callable[..., Any], *args: Any
+) -> 'concurrent.futures.Future[Any]':
+  """Runs a function in a new thread, in the context of the caller."""
+  future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+  context = contextvars.copy_context()
+
+  def run() -> None:
+    if not future.set_running_or_notify_cancel():
+      return
+    try:
+      result = context.run(fn, *args)
+    except BaseException as e:  # pylint: disable=broad-except
+      future.set_exception(e)
+    else:
+      future.set_result(result)
+
+  threading.Thread(target=run, name='genai_hedging', daemon=True).start()
+  return future
+
+
+class Hedger:
+  """Sends a duplicate of a request that takes longer than usual.
+
+  The delay before the duplicate is a percentile of the recent latencies of
+  the model. The first successful response is returned.
+  """
+
+  def __init__(self, options: HedgingOptions):
+    self._percentile = options.percentile or _DEFAULT_PERCENTILE
+    self._initial_delay = options.initial_delay
+    self._max_hedges_per_minute = (
+        options.max_hedges_per_minute
+        if options.max_hedges_per_minute is not None
+        else _DEFAULT_MAX_HEDGES_PER_MINUTE
+    )
+    self._lock = threading.Lock()
+    self._histograms: dict[str, _LatencyHistogram] = {}
+    # The times of the hedges in the last minute.
+    self._hedges: collections.deque[float] = collections.deque()
+    self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+  def delay(self, model: str) -> Optional[float]:
+    """Returns how long to wait for a response before hedging, if at all."""
+    with self._lock:
+      histogram = self._histograms.get(model)
+      if histogram is None or len(histogram) < _MIN_SAMPLES:
+        return self._initial_delay
+      return histogram.percentile(self._percentile)
+
+  def _record(self, model: str, seconds: float) -> None:
+    with self._lock:
+      histogram = self._histograms.get(model)
+      if histogram is None:
+        histogram = self._histograms[model] = _LatencyHistogram()
+      histogram.add(seconds)
+
+  def _take_hedge(self) -> bool:
+    with self._lock:
+      now = time.monotonic()
+      while self._hedges and self._hedges[0] <= now - 60:
+        self._hedges.popleft()
+      if len(self._hedges) >= self._max_hedges_per_minute:
+        return False
+      self._hedges.append(now)
+      return True
+
+  def _timed(
+      self,
+      model: str,
+      request_once: Callable[['HttpRequest', bool], Any],
+      http_request: 'HttpRequest',
+  ) -> Any:
+    start = time.monotonic()
+    response = request_once(http_request, False)
+    self._record(model, time.monotonic() - start)
+    return response
+
+  async def _async_timed(
+      self,
+      model: str,
+      request_once: Callable[['HttpRequest', bool], Awaitable[Any]],
+      http_request: 'HttpRequest',
+  ) -> Any:
+    start = time.monotonic()
+    response = await request_once(http_request, False)
+    self._record(model, time.monotonic() - start)
+    return response
+
+  def call(
+      self,
+      request_once: Callable[['HttpRequest', bool], Any],
+      http_request: 'HttpRequest',
+  ) -> Any:
+    """Sends a request, and a duplicate if it is slow to respond.
+
+    A duplicate that loses the race runs to completion in the background, as
+    sync requests cannot be cancelled. The request runs in its own thread, so
+    that the caller can return the response of the duplicate first, and only
+    duplicates share the bounded thread pool: a busy pool never delays
+    requests or skews their latencies.
+    """
+    match = _HEDGED_REQUEST.search(http_request.url)
+    if match is None:
+      return request_once(http_request, False)
+    model = match.group(1)
+    delay = self.delay(model)
+    if delay is None:
+      return self._timed(model, request_once, http_request)
+    # The requests run in the context of the caller, e.g. to be instrumented.
+    primary = _start_thread(self._timed, model, request_once, http_request)
+    done, _ = concurrent.futures.wait([primary], timeout=delay)
+    if done or not self._take_hedge():
+      return primary.result()
+    with self._lock:
+      if self._executor is None:
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            _MAX_THREADS, thread_name_prefix='genai_hedging'
+        )
+      executor = self._executor
+    hedge = executor.submit(
+        contextvars.copy_context().run,
+        self._timed,
+        model,
+        request_once,
+        http_request,
+    )
+    pending = {primary, hedge}
+    error: Optional[BaseException] = None
+    while pending:
+      done, pending = concurrent.futures.wait(
+          pending, return_when=concurrent.futures.FIRST_COMPLETED
+      )
+      for future in done:
+        if future.exception() is None:
+          return future.result()
+        error = error or future.exception()
+    assert error is not None
+    raise error
+
+  async def async_call(
+      self,
+      request_once: Callable[['HttpRequest', bool], Awaitable[Any]],
+      http_request: 'HttpRequest',
+  ) -> Any:
+    """Sends a request, and a duplicate if it is slow to respond.
+
+    The request that loses the race is cancelled. A cancelled request is
+    recorded with its latency so far, so that the delay keeps following the
+    slow requests.
+    """
+    match = _HEDGED_REQUEST.search(http_request.url)
+    if match is None:
+      return await request_once(http_request, False)
+    model = match.group(1)
+    delay = self.delay(model)
+    if delay is None:
+      return await self._async_timed(model, request_once, http_request)
+    start = time.monotonic()
+    tasks = [
+        asyncio.ensure_future(
+            self._async_timed(model, request_once, http_request)
+        )
+    ]
+    try:
+      done, _ = await asyncio.wait(tasks, timeout=delay)
+      if done or not self._take_hedge():
+        return await tasks[0]
+      tasks.append(
+          asyncio.ensure_future(
+              self._async_timed(model, request_once, http_request)
+          )
+      )
+      pending = set(tasks)
+      error: Optional[BaseException] = None
+      while pending:
+        done, pending = await asyncio.wait(
+            pending, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in done:
+          if task.exception() is None:
+            return task.result()
+          error = error or task.exception()
+      assert error is not None
+      raise error
+    finally:
+      if len(tasks) > 1 and not tasks[0].done():
+        # The request lost the race to its duplicate. Without its latency the
+        # percentile would lose the slowest requests, and hedge ever sooner.
+        self._record(model, time.monotonic() - start)
+      for task in tasks:
+        task.cancel()
+
+  def close(self) -> None:
+    if self._executor is not None:
+      self._executor.shutdown(wait=False)
+      self._executor = None
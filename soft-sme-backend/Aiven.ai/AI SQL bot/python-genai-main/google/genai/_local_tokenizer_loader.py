@@ -16,6 +16,7 @@
 import dataclasses
 import functools
 import hashlib
+import json
 import os
 import tempfile
 from typing import Optional, cast
@@ -104,15 +105,66 @@ def _maybe_remove_file(file_path: str) -> None:
     pass
 
 
+def _hash_sidecar_path(file_path: str) -> str:
+  """Returns the path of the file recording the hash of the given file."""
+  return file_path + ".sha256"
+
+
+def _file_signature(file_path: str) -> Optional[dict[str, int]]:
+  """Returns the size and modification time identifying the file content."""
+  try:
+    stat = os.stat(file_path)
+  except OSError:
+    return None
+  return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _read_hash_sidecar(file_path: str) -> Optional[str]:
+  """Returns the recorded hash of the file if it is unchanged since then."""
+  signature = _file_signature(file_path)
+  if signature is None:
+    return None
+  try:
+    with open(_hash_sidecar_path(file_path), "r") as f:
+      sidecar = json.loads(f.read())
+  except (OSError, ValueError):
+    return None
+  if not isinstance(sidecar, dict) or sidecar.get("signature") != signature:
+    return None
+  return cast(Optional[str], sidecar.get("sha256"))
+
+
+def _maybe_write_hash_sidecar(file_path: str, file_hash: str) -> None:
+  """Records the hash of the file, keyed by its size and modification time."""
+  signature = _file_signature(file_path)
+  if signature is None:
+    return
+  try:
+    with open(_hash_sidecar_path(file_path), "w") as f:
+      f.write(json.dumps({"signature": signature, "sha256": file_hash}))
+  except OSError:
+    # Don't raise if we cannot write file, the file is hashed next time.
+    pass
+
+
 def _maybe_load_from_cache(
     *, file_path: str, expected_hash: str
 ) -> Optional[bytes]:
-  """Loads the content from the cache path."""
+  """Loads the content from the cache path.
+
+  The content is only hashed if the hash sidecar is missing or the file
+  changed since it was written.
+  """
   if not os.path.exists(file_path):
     return None
+  recorded_hash = _read_hash_sidecar(file_path)
   with open(file_path, "rb") as f:
     content = f.read()
-  if _is_valid_model(model_data=content, expected_hash=expected_hash):
+  if recorded_hash is None:
+    if _is_valid_model(model_data=content, expected_hash=expected_hash):
+      _maybe_write_hash_sidecar(file_path, expected_hash)
+      return content
+  elif recorded_hash == expected_hash:
     return content
 
   # Cached file corrupted.
@@ -121,9 +173,9 @@ def _maybe_load_from_cache(
 
 
 def _maybe_save_to_cache(
-    *, cache_dir: str, cache_path: str, content: bytes
+    *, cache_dir: str, cache_path: str, content: bytes, content_hash: str
 ) -> None:
-  """Saves the content to the cache path."""
+  """Saves the content and its hash sidecar to the cache path."""
   try:
     os.makedirs(cache_dir, exist_ok=True)
     tmp_path = cache_dir + "." + str(uuid.uuid4()) + ".tmp"
@@ -132,7 +184,8 @@ def _maybe_save_to_cache(
     os.rename(tmp_path, cache_path)
   except OSError:
     # Don't raise if we cannot write file.
-    pass
+    return
+  _maybe_write_hash_sidecar(cache_path, content_hash)
 
 
 def _load_from_url(*, file_url: str, expected_hash: str) -> bytes:
@@ -151,10 +204,11 @@ def _load(*, file_url: str, expected_hash: str) -> bytes:
   """Loads model bytes from the given file url.
 
   1. If the find local cached file for the given url and the cached file hash
-     matches the expected hash, the cached file is returned.
+     matches the expected hash, the cached file is returned. The hash is read
+     from the hash sidecar while the file is unchanged since it was hashed.
   2. If local cached file is not found or the hash does not match, the file is
      downloaded from the given url. And write to local cache and return the
-     file bytes.
+     file bytes. The cache is only written in this case.
   3. If the file downloaded from the given url does not match the expected
      hash, raise ValueError.
 
@@ -172,17 +226,24 @@ def _load(*, file_url: str, expected_hash: str) -> bytes:
   model_data = _maybe_load_from_cache(
       file_path=model_path, expected_hash=expected_hash
   )
-  if not model_data:
+  if model_data is None:
     model_data = _load_from_url(file_url=file_url, expected_hash=expected_hash)
-
-  _maybe_save_to_cache(
-      cache_dir=model_dir, cache_path=model_path, content=model_data
-  )
+    _maybe_save_to_cache(
+        cache_dir=model_dir,
+        cache_path=model_path,
+        content=model_data,
+        content_hash=expected_hash,
+    )
   return model_data
 
 
+@functools.lru_cache()
 def _load_model_proto_bytes(tokenizer_name: str) -> bytes:
-  """Loads model proto bytes from the given tokenizer name."""
+  """Loads model proto bytes from the given tokenizer name.
+
+  The bytes are shared by `load_model_proto` and `get_sentencepiece`, so the
+  model is read and verified once per process.
+  """
   if tokenizer_name not in _TOKENIZERS:
     raise ValueError(
         f"Tokenizer {tokenizer_name} is not supported."
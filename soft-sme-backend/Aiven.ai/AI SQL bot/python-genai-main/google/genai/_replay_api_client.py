@@ -24,11 +24,12 @@ import io
 import json
 import os
 import re
-from typing import Any, Literal, Optional, Union
+from typing import Any, Callable, Literal, Optional, Union
 
 import google.auth
 from requests.exceptions import HTTPError
 
+from . import _common
 from . import errors
 from ._api_client import BaseApiClient
 from ._api_client import HttpRequest
@@ -359,7 +360,7 @@ class ReplayApiClient(BaseApiClient):
         method=http_request.method,
         url=http_request.url,
         headers=http_request.headers,
-        body_segments=[http_request.data],
+        body_segments=[_common.encode_lazy_base64(http_request.data)],
     )
     if isinstance(http_response, HttpResponse):
       response = ReplayResponse(
@@ -411,7 +412,9 @@ class ReplayApiClient(BaseApiClient):
     assert http_request.method == interaction.request.method
 
     # Sanitize the request body, rewrite any fields that vary.
-    request_data_copy = copy.deepcopy(http_request.data)
+    request_data_copy = copy.deepcopy(
+        _common.encode_lazy_base64(http_request.data)
+    )
     # Both the request and recorded request must be redacted before comparing
     # so that the comparison is fair.
     if not isinstance(request_data_copy, bytes):
@@ -449,6 +452,7 @@ class ReplayApiClient(BaseApiClient):
     return http_response
 
   def _verify_response(self, response_model: BaseModel) -> None:
+    super()._verify_response(response_model)
     if self._mode == 'api':
       return
     if not self.replay_session:
@@ -570,11 +574,14 @@ class ReplayApiClient(BaseApiClient):
       upload_size: int,
       *,
       http_options: Optional[HttpOptionsOrDict] = None,
+      chunk_size: Optional[int] = None,
+      offset: int = 0,
+      progress_callback: Optional[Callable[[int, int], None]] = None,
   ) -> HttpResponse:
     if isinstance(file_path, io.IOBase):
-      offset = file_path.tell()
+      position = file_path.tell()
       content = file_path.read()
-      file_path.seek(offset, os.SEEK_SET)
+      file_path.seek(position, os.SEEK_SET)
       request = HttpRequest(
           method='POST',
           url='',
@@ -589,7 +596,13 @@ class ReplayApiClient(BaseApiClient):
       result: Union[str, HttpResponse]
       try:
         result = super().upload_file(
-            file_path, upload_url, upload_size, http_options=http_options
+            file_path,
+            upload_url,
+            upload_size,
+            http_options=http_options,
+            chunk_size=chunk_size,
+            offset=offset,
+            progress_callback=progress_callback,
         )
       except HTTPError as e:
         result = HttpResponse(
@@ -609,11 +622,14 @@ class ReplayApiClient(BaseApiClient):
       upload_size: int,
       *,
       http_options: Optional[HttpOptionsOrDict] = None,
+      chunk_size: Optional[int] = None,
+      offset: int = 0,
+      progress_callback: Optional[Callable[[int, int], None]] = None,
   ) -> HttpResponse:
     if isinstance(file_path, io.IOBase):
-      offset = file_path.tell()
+      position = file_path.tell()
       content = file_path.read()
-      file_path.seek(offset, os.SEEK_SET)
+      file_path.seek(position, os.SEEK_SET)
       request = HttpRequest(
           method='POST',
           url='',
@@ -628,7 +644,13 @@ class ReplayApiClient(BaseApiClient):
       result: HttpResponse
       try:
         result = await super().async_upload_file(
-            file_path, upload_url, upload_size, http_options=http_options
+            file_path,
+            upload_url,
+            upload_size,
+            http_options=http_options,
+            chunk_size=chunk_size,
+            offset=offset,
+            progress_callback=progress_callback,
         )
       except HTTPError as e:
         result = HttpResponse(
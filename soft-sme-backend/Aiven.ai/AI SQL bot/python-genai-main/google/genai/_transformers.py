@@ -23,9 +23,11 @@ import io
 import logging
 import re
 import sys
+import threading
 import time
 import types as builtin_types
 import typing
+import weakref
 from typing import Any, GenericAlias, List, Optional, Sequence, Union  # type: ignore[attr-defined]
 from ._mcp_utils import mcp_to_gemini_tool
 from ._common import get_value_by_path as getv
@@ -956,6 +958,69 @@ def t_live_speech_config(
   return speech_config  # type: ignore[return-value]
 
 
+# Function declarations derived from Python callables, keyed weakly by the
+# underlying function so that entries go away with the function. Each entry
+# maps (vertexai, is_method) to the fingerprint of the function the declaration
+# was built from and the declaration itself.
+_function_declaration_cache: 'weakref.WeakKeyDictionary[Any, dict[Any, Any]]' = (
+    weakref.WeakKeyDictionary()
+)
+_function_declaration_cache_lock = threading.Lock()
+
+
+def _function_fingerprint(function: Any) -> tuple[Any, ...]:
+  """Returns the attributes a function declaration is derived from."""
+  return (
+      getattr(function, '__code__', None),
+      getattr(function, '__doc__', None),
+      getattr(function, '__defaults__', None),
+      getattr(function, '__kwdefaults__', None),
+      getattr(function, '__annotations__', None),
+  )
+
+
+def clear_function_declaration_cache() -> None:
+  """Clears the cache of function declarations derived from callables."""
+  with _function_declaration_cache_lock:
+    _function_declaration_cache.clear()
+
+
+def t_function_declaration(
+    client: _api_client.BaseApiClient, origin: Any
+) -> types.FunctionDeclaration:
+  """Returns the function declaration of a Python function or method.
+
+  Declarations are memoized per function and API variant, and rebuilt if the
+  code, docstring, defaults or annotations of the function change. A shallow
+  copy is returned, nested schemas are shared and must not be modified.
+  """
+  is_method = inspect.ismethod(origin)
+  function = origin.__func__ if is_method else origin
+  key = (bool(client.vertexai), is_method)
+  fingerprint = _function_fingerprint(function)
+  try:
+    with _function_declaration_cache_lock:
+      entry = _function_declaration_cache.get(function, {}).get(key)
+  except TypeError:
+    # Not hashable or not weak referenceable, do not cache.
+    return types.FunctionDeclaration.from_callable(
+        client=client, callable=origin
+    )
+  if entry is None or any(
+      cached is not current for cached, current in zip(entry[0], fingerprint)
+  ):
+    declaration = types.FunctionDeclaration.from_callable(
+        client=client, callable=origin
+    )
+    with _function_declaration_cache_lock:
+      _function_declaration_cache.setdefault(function, {})[key] = (
+          fingerprint,
+          declaration,
+      )
+    entry = (fingerprint, declaration)
+  return entry[1].model_copy()
+
+
 def t_tool(
     client: _api_client.BaseApiClient, origin: Any
 ) -> Optional[Union[types.Tool, Any]]:
@@ -963,11 +1028,7 @@ def t_tool(
     return None
   if inspect.isfunction(origin) or inspect.ismethod(origin):
     return types.Tool(
-        function_declarations=[
-            types.FunctionDeclaration.from_callable(
-                client=client, callable=origin
-            )
-        ]
+        function_declarations=[t_function_declaration(client, origin)]
     )
   elif McpTool is not None and _is_duck_type_of(origin, McpTool):
     return mcp_to_gemini_tool(origin)
@@ -15,15 +15,22 @@
 
 # Code generated by the Google Gen AI SDK generator DO NOT EDIT.
 
-import json
+import asyncio
 import logging
-from typing import Any, Optional, Union
+import os
+import random
+import tempfile
+from typing import Any, AsyncIterator, Generator, Iterable, Iterator, Optional, Sequence, Union
 from urllib.parse import urlencode
 
+import httpx
+
+from . import _api_client
 from . import _api_module
 from . import _common
 from . import _extra_utils
 from . import _transformers as t
+from . import errors
 from . import types
 from ._api_client import BaseApiClient
 from ._common import get_value_by_path as getv
@@ -1105,6 +1112,9 @@ def _InlinedResponse_from_mldev(
   if getv(from_object, ['error']) is not None:
     setv(to_object, ['error'], getv(from_object, ['error']))
 
+  if getv(from_object, ['metadata']) is not None:
+    setv(to_object, ['metadata'], getv(from_object, ['metadata']))
+
   return to_object
 
 
@@ -1358,6 +1368,220 @@ def _Tool_to_mldev(
   return to_object
 
 
+# The largest JSONL file written per batch job by `create_from_requests`. The
+# Gemini Developer API accepts input files of up to 2 GB.
+_MAX_SHARD_BYTES = 1024**3
+
+
+def _request_line(
+    api_client: BaseApiClient,
+    request: types.InlinedRequestOrDict,
+    index: int,
+) -> bytes:
+  """Returns a request as a line of a batch input file."""
+  metadata = getv(request, ['metadata']) or {}
+  key = metadata.get('key', str(index))
+  request_dict = _InlinedRequest_to_mldev(api_client, request)
+  line = _common.json_dumps(
+      _common.convert_to_json_dict(
+          {'key': key, 'request': request_dict.get('request', {})},
+          lazy_base64=False,
+      )
+  )
+  return line.encode('utf-8') + b'\n'
+
+
+def _write_request_shards(
+    api_client: BaseApiClient,
+    requests: Iterable[types.InlinedRequestOrDict],
+    directory: str,
+    max_shard_bytes: int,
+) -> Generator[str, None, None]:
+  """Writes requests to JSONL files of up to `max_shard_bytes`.
+
+  Yields the path of each file once it is complete. The file is removed when
+  the next one is requested, so only one is on disk at a time.
+  """
+  shard = None
+  shard_bytes = 0
+  shards = 0
+  try:
+    for index, request in enumerate(requests):
+      line = _request_line(api_client, request, index)
+      if len(line) > max_shard_bytes:
+        raise ValueError(
+            f'Request {index} is {len(line)} bytes, which is more than'
+            f' max_shard_bytes ({max_shard_bytes}).'
+        )
+      if shard is not None and shard_bytes + len(line) > max_shard_bytes:
+        shard.close()
+        yield shard.name
+        os.remove(shard.name)
+        shard = None
+      if shard is None:
+        shard = open(
+            os.path.join(directory, f'requests-{shards:05d}.jsonl'), 'wb'
+        )
+        shards += 1
+        shard_bytes = 0
+      shard.write(line)
+      shard_bytes += len(line)
+    if shard is not None:
+      shard.close()
+      yield shard.name
+      os.remove(shard.name)
+      shard = None
+  finally:
+    if shard is not None:
+      shard.close()
+      os.remove(shard.name)
+
+
+def _shards_config(
+    config: Optional[types.CreateBatchJobConfigOrDict],
+) -> types.CreateBatchJobConfig:
+  """Returns the config of the batch jobs of all the shards of requests."""
+  if isinstance(config, dict):
+    config = types.CreateBatchJobConfig(**config)
+  config = config or types.CreateBatchJobConfig()
+  if config.display_name:
+    return config
+  return config.model_copy(
+      update={
+          'display_name': (
+              f'genai_batch_job_{_common.timestamped_unique_name()}'
+          )
+      }
+  )
+
+
+def _shard_config(
+    config: types.CreateBatchJobConfig, shard: int
+) -> types.CreateBatchJobConfig:
+  return config.model_copy(
+      update={'display_name': f'{config.display_name}_{shard:05d}'}
+  )
+
+
+def _shard_creation_error(
+    jobs: list[types.BatchJob], error: Exception
+) -> errors.BatchJobsCreationError:
+  return errors.BatchJobsCreationError(
+      f'Creating the batch job of shard {len(jobs)} failed after'
+      f' {len(jobs)} batch jobs were created: {error}',
+      jobs,
+  )
+
+
+def _inlined_response_from_line(line: bytes) -> types.InlinedResponse:
+  """Parses a line of a batch output file."""
+  response = _common.json_loads(line)
+  response_dict = _InlinedResponse_from_mldev(response)
+  if 'key' in response:
+    response_dict['metadata'] = {'key': response['key']}
+  return types.InlinedResponse._from_response(
+      response=response_dict, kwargs={}
+  )
+
+
+# Batch job states in which a job has results.
+_RESULT_JOB_STATES = frozenset({
+    types.JobState.JOB_STATE_SUCCEEDED,
+    types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+})
+
+
+def _job_results(
+    job: types.BatchJob,
+) -> Union[str, list[types.InlinedResponse]]:
+  """Returns the output file of a batch job, or its inlined responses.
+
+  Raises if the job has no results.
+  """
+  if job.state not in _RESULT_JOB_STATES:
+    raise ValueError(
+        f'Batch job {job.name} is {job.state}, its results can only be read'
+        ' once it has succeeded or partially succeeded.'
+    )
+  if job.dest is not None and job.dest.file_name is not None:
+    return job.dest.file_name
+  if job.dest is not None and job.dest.inlined_responses is not None:
+    return job.dest.inlined_responses
+  raise ValueError(f'Batch job {job.name} has no results.')
+
+def _job_error_response(job: types.BatchJob) -> types.InlinedResponse:
+  """Returns the result reported for a job that completed without results."""
+  error = job.error or types.JobError()
+  if error.message is None:
+    error = error.model_copy(
+        update={'message': f'Batch job {job.name} is {job.state}.'}
+    )
+  return types.InlinedResponse(
+      error=error, metadata={'batch_job': job.name or ''}
+  )
+
+
+# Batch job states after which a job does not change.
+_COMPLETED_JOB_STATES = frozenset({
+    types.JobState.JOB_STATE_SUCCEEDED,
+    types.JobState.JOB_STATE_FAILED,
+    types.JobState.JOB_STATE_CANCELLED,
+    types.JobState.JOB_STATE_EXPIRED,
+    types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+})
+# Factor by which the interval between polls of a job grows while its state
+# does not change.
+_POLL_BACKOFF = 1.5
+# Number of polls of a job in a row that may fail with a transient error before
+# the job yields the error as its result.
+_MAX_POLL_ERRORS = 5
+
+
+def _transient_poll_errors() -> tuple[type[Exception], ...]:
+  """Returns the errors after which a job is polled again."""
+  return (
+      errors.ServerError,
+      httpx.TransportError,
+      *_api_client._aiohttp_upload_errors(),
+  )
+
+
+def _poll_error_job(job: str, error: Exception) -> types.BatchJob:
+  """Returns a job without a state, that reports an error of its polls."""
+  return types.BatchJob(
+      name=job,
+      error=types.JobError(
+          code=error.code if isinstance(error, errors.APIError) else None,
+          message=f'Batch job {job} could not be polled: {error}',
+      ),
+  )
+
+
+def _next_poll_interval(
+    interval: float, state_changed: bool, initial: float, maximum: float
+) -> float:
+  """Returns how long to wait before polling a job again."""
+  if state_changed:
+    return initial
+  return min(interval * _POLL_BACKOFF, maximum)
+
+
+async def _aiter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+  """Splits streamed data into lines, without the line breaks."""
+  buffer = bytearray()
+  async for chunk in chunks:
+    buffer += chunk
+    start = 0
+    end = buffer.find(b'\n')
+    while end != -1:
+      yield bytes(buffer[start:end])
+      start = end + 1
+      end = buffer.find(b'\n', start)
+    del buffer[:start]
+  if buffer:
+    yield bytes(buffer)
+
+
 class Batches(_api_module.BaseModule):
 
   def _create(
@@ -1406,14 +1630,15 @@ class Batches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _BatchJob_from_vertex(response_dict)
@@ -1422,7 +1647,8 @@ class Batches(_api_module.BaseModule):
       response_dict = _BatchJob_from_mldev(response_dict)
 
     return_value = types.BatchJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -1469,20 +1695,22 @@ class Batches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _BatchJob_from_mldev(response_dict)
 
     return_value = types.BatchJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -1548,12 +1776,13 @@ class Batches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _BatchJob_from_vertex(response_dict)
@@ -1562,7 +1791,8 @@ class Batches(_api_module.BaseModule):
       response_dict = _BatchJob_from_mldev(response_dict)
 
     return_value = types.BatchJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -1629,8 +1859,7 @@ class Batches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
@@ -1672,12 +1901,13 @@ class Batches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ListBatchJobsResponse_from_vertex(response_dict)
@@ -1686,7 +1916,8 @@ class Batches(_api_module.BaseModule):
       response_dict = _ListBatchJobsResponse_from_mldev(response_dict)
 
     return_value = types.ListBatchJobsResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -1755,14 +1986,15 @@ class Batches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _DeleteResourceJob_from_vertex(response_dict)
@@ -1771,7 +2003,8 @@ class Batches(_api_module.BaseModule):
       response_dict = _DeleteResourceJob_from_mldev(response_dict)
 
     return_value = types.DeleteResourceJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -1824,6 +2057,131 @@ class Batches(_api_module.BaseModule):
     else:
       return self._create(model=model, src=src, config=config)
 
+  def create_from_requests(
+      self,
+      *,
+      model: str,
+      requests: Iterable[types.InlinedRequestOrDict],
+      config: Optional[types.CreateBatchJobConfigOrDict] = None,
+      max_shard_bytes: int = _MAX_SHARD_BYTES,
+      directory: Optional[str] = None,
+  ) -> list[types.BatchJob]:
+    """Creates batch jobs for more requests than fit in one request body.
+
+    The requests are written to JSONL files as they are read from `requests`,
+    so they are never all held in memory. Each file holds up to
+    `max_shard_bytes` of requests. It is uploaded with `files.upload`, and a
+    batch job is created for it, before the next file is written.
+
+    Each request is keyed by `metadata['key']`, or by its position in
+    `requests`. Other metadata is not sent. Read the results of all the jobs
+    with `iter_results`.
+
+    Args:
+      model (str): The model to use for the batch jobs.
+      requests: The requests, e.g. a generator that reads them from disk.
+      config (CreateBatchJobConfig): Optional configuration for the batch jobs.
+        The display name of each job is suffixed with its index.
+      max_shard_bytes (int): The largest file to write per batch job.
+      directory (str): Optional directory to write the files in. Defaults to
+        the temporary directory of the system.
+
+    Returns:
+      The batch jobs, one per file, in the order of the requests.
+
+    Raises:
+      BatchJobsCreationError: If creating a batch job fails after others were
+        created. The created batch jobs are in its `jobs`.
+
+    Usage:
+
+    .. code-block:: python
+
+      jobs = client.batches.create_from_requests(
+          model="gemini-2.5-flash",
+          requests=(
+              {"contents": f"Summarize this report: {report}"}
+              for report in reports
+          ),
+      )
+    """
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+    from .files import Files  # pylint: disable=g-import-not-at-top
+
+    files = Files(self._api_client)
+    shards_config = _shards_config(config)
+    jobs: list[types.BatchJob] = []
+    with tempfile.TemporaryDirectory(dir=directory) as shard_directory:
+      try:
+        for path in _write_request_shards(
+            self._api_client, requests, shard_directory, max_shard_bytes
+        ):
+          file = files.upload(
+              file=path,
+              config=types.UploadFileConfig(
+                  mime_type='jsonl', display_name=os.path.basename(path)
+              ),
+          )
+          jobs.append(
+              self.create(
+                  model=model,
+                  src=file.name,  # type: ignore[arg-type]
+                  config=_shard_config(shards_config, len(jobs)),
+              )
+          )
+      except Exception as e:
+        if not jobs:
+          raise
+        raise _shard_creation_error(jobs, e) from e
+    return jobs
+
+  def iter_results(
+      self, *, jobs: Sequence[Union[str, types.BatchJob]]
+  ) -> Iterator[types.InlinedResponse]:
+    """Reads the results of succeeded or partially succeeded batch jobs.
+
+    The results of the jobs are read in order. A result file is downloaded to
+    a temporary file, which is parsed a line at a time. The `metadata` of each
+    result read from a file holds the `key` of its request.
+
+    Args:
+      jobs: The batch jobs, or their names.
+
+    Yields:
+      The result of each request.
+
+    Usage:
+
+    .. code-block:: python
+
+      for result in client.batches.iter_results(jobs=jobs):
+        print(result.metadata["key"], result.response.text)
+    """
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+    from .files import Files  # pylint: disable=g-import-not-at-top
+
+    files = Files(self._api_client)
+    for job in jobs:
+      if isinstance(job, str):
+        job = self.get(name=job)
+      results = _job_results(job)
+      if not isinstance(results, str):
+        yield from results
+        continue
+      with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'results.jsonl')
+        files.download(file=results, destination=path)
+        with open(path, 'rb') as f:
+          for line in f:
+            if line.strip():
+              yield _inlined_response_from_line(line)
+
   def create_embeddings(
       self,
       *,
@@ -1952,14 +2310,15 @@ class AsyncBatches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _BatchJob_from_vertex(response_dict)
@@ -1968,7 +2327,8 @@ class AsyncBatches(_api_module.BaseModule):
       response_dict = _BatchJob_from_mldev(response_dict)
 
     return_value = types.BatchJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -2015,20 +2375,22 @@ class AsyncBatches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _BatchJob_from_mldev(response_dict)
 
     return_value = types.BatchJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -2094,14 +2456,15 @@ class AsyncBatches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _BatchJob_from_vertex(response_dict)
@@ -2110,7 +2473,8 @@ class AsyncBatches(_api_module.BaseModule):
       response_dict = _BatchJob_from_mldev(response_dict)
 
     return_value = types.BatchJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -2177,8 +2541,7 @@ class AsyncBatches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
@@ -2220,14 +2583,15 @@ class AsyncBatches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ListBatchJobsResponse_from_vertex(response_dict)
@@ -2236,7 +2600,8 @@ class AsyncBatches(_api_module.BaseModule):
       response_dict = _ListBatchJobsResponse_from_mldev(response_dict)
 
     return_value = types.ListBatchJobsResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -2305,14 +2670,15 @@ class AsyncBatches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _DeleteResourceJob_from_vertex(response_dict)
@@ -2321,7 +2687,8 @@ class AsyncBatches(_api_module.BaseModule):
       response_dict = _DeleteResourceJob_from_mldev(response_dict)
 
     return_value = types.DeleteResourceJob._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -2373,6 +2740,237 @@ class AsyncBatches(_api_module.BaseModule):
     else:
       return await self._create(model=model, src=src, config=config)
 
+  async def create_from_requests(
+      self,
+      *,
+      model: str,
+      requests: Iterable[types.InlinedRequestOrDict],
+      config: Optional[types.CreateBatchJobConfigOrDict] = None,
+      max_shard_bytes: int = _MAX_SHARD_BYTES,
+      directory: Optional[str] = None,
+  ) -> list[types.BatchJob]:
+    """Creates batch jobs for more requests than fit in one request body.
+
+    The requests are written to JSONL files as they are read from `requests`,
+    so they are never all held in memory. Each file holds up to
+    `max_shard_bytes` of requests. It is uploaded with `files.upload`, and a
+    batch job is created for it, before the next file is written. The
+    requests are read and written in a thread.
+
+    Each request is keyed by `metadata['key']`, or by its position in
+    `requests`. Other metadata is not sent. Read the results of all the jobs
+    with `iter_results`.
+
+    Args:
+      model (str): The model to use for the batch jobs.
+      requests: The requests, e.g. a generator that reads them from disk.
+      config (CreateBatchJobConfig): Optional configuration for the batch jobs.
+        The display name of each job is suffixed with its index.
+      max_shard_bytes (int): The largest file to write per batch job.
+      directory (str): Optional directory to write the files in. Defaults to
+        the temporary directory of the system.
+
+    Returns:
+      The batch jobs, one per file, in the order of the requests.
+
+    Raises:
+      BatchJobsCreationError: If creating a batch job fails after others were
+        created. The created batch jobs are in its `jobs`.
+
+    Usage:
+
+    .. code-block:: python
+
+      jobs = await client.aio.batches.create_from_requests(
+          model="gemini-2.5-flash",
+          requests=(
+              {"contents": f"Summarize this report: {report}"}
+              for report in reports
+          ),
+      )
+    """
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+    from .files import AsyncFiles  # pylint: disable=g-import-not-at-top
+
+    files = AsyncFiles(self._api_client)
+    shards_config = _shards_config(config)
+    jobs: list[types.BatchJob] = []
+    with tempfile.TemporaryDirectory(dir=directory) as shard_directory:
+      # The requests are read and written to files in a thread, so the event
+      # loop isn't blocked while a file is written.
+      shards = _write_request_shards(
+          self._api_client, requests, shard_directory, max_shard_bytes
+      )
+      try:
+        while (path := await asyncio.to_thread(next, shards, None)) is not None:
+          file = await files.upload(
+              file=path,
+              config=types.UploadFileConfig(
+                  mime_type='jsonl', display_name=os.path.basename(path)
+              ),
+          )
+          jobs.append(
+              await self.create(
+                  model=model,
+                  src=file.name,  # type: ignore[arg-type]
+                  config=_shard_config(shards_config, len(jobs)),
+              )
+          )
+      except Exception as e:
+        if not jobs:
+          raise
+        raise _shard_creation_error(jobs, e) from e
+      finally:
+        await asyncio.to_thread(shards.close)
+    return jobs
+
+  async def iter_results(
+      self, *, jobs: Sequence[Union[str, types.BatchJob]]
+  ) -> AsyncIterator[types.InlinedResponse]:
+    """Reads the results of succeeded or partially succeeded batch jobs.
+
+    The results of the jobs are read in order. A result file is streamed, and
+    parsed a line at a time. The `metadata` of each result read from a file
+    holds the `key` of its request.
+
+    Args:
+      jobs: The batch jobs, or their names.
+
+    Yields:
+      The result of each request.
+
+    Usage:
+
+    .. code-block:: python
+
+      async for result in client.aio.batches.iter_results(jobs=jobs):
+        print(result.metadata["key"], result.response.text)
+    """
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+    for job in jobs:
+      if isinstance(job, str):
+        job = await self.get(name=job)
+      async for response in self._iter_job_results(job):
+        yield response
+
+  async def wait_and_iter_results(
+      self,
+      *,
+      jobs: Sequence[Union[str, types.BatchJob]],
+      max_concurrency: int = 8,
+      initial_poll_interval: float = 10.0,
+      max_poll_interval: float = 300.0,
+      timeout: Optional[float] = None,
+  ) -> AsyncIterator[types.InlinedResponse]:
+    """Waits for batch jobs to complete, and reads their results as they do.
+
+    The jobs are polled concurrently. The interval between polls of a job
+    starts at `initial_poll_interval`, and grows up to `max_poll_interval`
+    while the state of the job does not change. When a job succeeds or
+    partially succeeds, its results are read as with `iter_results`, while the
+    other jobs are still polled. A poll that fails with a server or connection
+    error is retried with the same backoff.
+
+    Args:
+      jobs: The batch jobs, or their names.
+      max_concurrency: The largest number of jobs polled at a time.
+      initial_poll_interval: The seconds between the first polls of a job, and
+        after its state changes.
+      max_poll_interval: The most seconds between polls of a job.
+      timeout: Optional number of seconds to wait for the jobs, including
+        the time spent reading the results.
+
+    Yields:
+      The result of each request, job by job in the order they complete. A job
+      that fails, is cancelled or expires yields a single result with its
+      `error`, and its name as `metadata['batch_job']`, as does a job whose
+      polls keep failing with server or connection errors.
+
+    Raises:
+      asyncio.TimeoutError: If the jobs did not complete in `timeout` seconds.
+
+    Usage:
+
+    .. code-block:: python
+
+      async for result in client.aio.batches.wait_and_iter_results(
+          jobs=[job.name for job in jobs]
+      ):
+        print(result.metadata["key"], result.response.text)
+    """
+    if self._api_client.vertexai:
+      raise ValueError(
+          'This method is only supported in the Gemini Developer client.'
+      )
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def wait(job: Union[str, types.BatchJob]) -> types.BatchJob:
+      if isinstance(job, types.BatchJob):
+        if job.state in _COMPLETED_JOB_STATES:
+          return job
+        job = job.name  # type: ignore[assignment]
+      interval = initial_poll_interval
+      state = None
+      poll_errors = 0
+      while True:
+        try:
+          async with semaphore:
+            polled = await self.get(name=job)  # type: ignore[arg-type]
+        except _transient_poll_errors() as e:
+          poll_errors += 1
+          if poll_errors >= _MAX_POLL_ERRORS:
+            return _poll_error_job(job, e)  # type: ignore[arg-type]
+          logger.warning('Polling batch job %s failed, retrying: %s', job, e)
+          interval = _next_poll_interval(
+              interval, False, initial_poll_interval, max_poll_interval
+          )
+        else:
+          if polled.state in _COMPLETED_JOB_STATES:
+            return polled
+          poll_errors = 0
+          interval = _next_poll_interval(
+              interval,
+              polled.state != state,
+              initial_poll_interval,
+              max_poll_interval,
+          )
+          state = polled.state
+        # Jitter spreads out the polls of jobs created together.
+        await asyncio.sleep(interval * random.uniform(0.9, 1.1))
+
+    tasks = [asyncio.ensure_future(wait(job)) for job in jobs]
+    try:
+      for completed in asyncio.as_completed(tasks, timeout=timeout):
+        job = await completed
+        if job.state not in _RESULT_JOB_STATES:
+          yield _job_error_response(job)
+          continue
+        async for response in self._iter_job_results(job):
+          yield response
+    finally:
+      for task in tasks:
+        task.cancel()
+      await asyncio.gather(*tasks, return_exceptions=True)
+
+  async def _iter_job_results(
+      self, job: types.BatchJob
+  ) -> AsyncIterator[types.InlinedResponse]:
+    results = _job_results(job)
+    if not isinstance(results, str):
+      for response in results:
+        yield response
+      return
+    path = f'files/{t.t_file_name(results)}:download?alt=media'
+    async for line in _aiter_lines(self._api_client.async_stream_file(path)):
+      if line.strip():
+        yield _inlined_response_from_line(line)
+
   async def create_embeddings(
       self,
       *,
@@ -15,7 +15,6 @@
 
 # Code generated by the Google Gen AI SDK generator DO NOT EDIT.
 
-import json
 import logging
 from typing import Any, Optional, Union
 from urllib.parse import urlencode
@@ -803,17 +802,19 @@ class Caches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     return_value = types.CachedContent._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -870,15 +871,17 @@ class Caches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     return_value = types.CachedContent._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -937,14 +940,15 @@ class Caches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _DeleteCachedContentResponse_from_vertex(response_dict)
@@ -953,7 +957,8 @@ class Caches(_api_module.BaseModule):
       response_dict = _DeleteCachedContentResponse_from_mldev(response_dict)
 
     return_value = types.DeleteCachedContentResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -1017,17 +1022,19 @@ class Caches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'patch', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     return_value = types.CachedContent._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -1078,12 +1085,13 @@ class Caches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ListCachedContentsResponse_from_vertex(response_dict)
@@ -1092,7 +1100,8 @@ class Caches(_api_module.BaseModule):
       response_dict = _ListCachedContentsResponse_from_mldev(response_dict)
 
     return_value = types.ListCachedContentsResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -1175,17 +1184,19 @@ class AsyncCaches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     return_value = types.CachedContent._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -1243,17 +1254,19 @@ class AsyncCaches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     return_value = types.CachedContent._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -1313,14 +1326,15 @@ class AsyncCaches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _DeleteCachedContentResponse_from_vertex(response_dict)
@@ -1329,7 +1343,8 @@ class AsyncCaches(_api_module.BaseModule):
       response_dict = _DeleteCachedContentResponse_from_mldev(response_dict)
 
     return_value = types.DeleteCachedContentResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -1393,17 +1408,19 @@ class AsyncCaches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'patch', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     return_value = types.CachedContent._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -1454,14 +1471,15 @@ class AsyncCaches(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ListCachedContentsResponse_from_vertex(response_dict)
@@ -1470,7 +1488,8 @@ class AsyncCaches(_api_module.BaseModule):
       response_dict = _ListCachedContentsResponse_from_mldev(response_dict)
 
     return_value = types.ListCachedContentsResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
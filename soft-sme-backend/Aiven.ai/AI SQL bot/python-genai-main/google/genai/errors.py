@@ -23,6 +23,7 @@ from . import _common
 
 if TYPE_CHECKING:
   from .replay_api_client import ReplayResponse
+  from .types import BatchJob
   import aiohttp
 
 
@@ -199,4 +200,16 @@ class UnknownApiResponseError(ValueError):
   """Raised when the response from the API cannot be parsed as JSON."""
   pass
 
+
+class BatchJobsCreationError(Exception):
+  """Raised when creating batch jobs fails after some of them were created.
+
+  The created batch jobs are in `jobs`, and the error that stopped the
+  creation of the others is the `__cause__`.
+  """
+
+  def __init__(self, message: str, jobs: list['BatchJob']):
+    super().__init__(message)
+    self.jobs = jobs
+
 ExperimentalWarning = _common.ExperimentalWarning
@@ -16,10 +16,9 @@
 # Code generated by the Google Gen AI SDK generator DO NOT EDIT.
 
 import io
-import json
 import logging
 import os
-from typing import Any, Optional, Union
+from typing import Any, Optional, Union, overload
 from urllib.parse import urlencode
 
 from . import _api_module
@@ -201,18 +200,20 @@ class Files(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _ListFilesResponse_from_mldev(response_dict)
 
     return_value = types.ListFilesResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -257,8 +258,7 @@ class Files(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
@@ -271,13 +271,16 @@ class Files(_api_module.BaseModule):
       self._api_client._verify_response(return_value)
       return return_value
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _CreateFileResponse_from_mldev(response_dict)
 
     return_value = types.CreateFileResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -334,15 +337,17 @@ class Files(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     return_value = types.File._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -398,20 +403,22 @@ class Files(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _DeleteFileResponse_from_mldev(response_dict)
 
     return_value = types.DeleteFileResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -462,37 +469,87 @@ class Files(_api_module.BaseModule):
     )
     file_obj.size_bytes = size_bytes
     file_obj.mime_type = mime_type
-    response = self._create(
-        file=file_obj,
-        config=types.CreateFileConfig(
-            http_options=http_options, should_return_http_response=True
-        ),
-    )
-
-    if (
-        response.sdk_http_response is None
-        or response.sdk_http_response.headers is None
-        or 'x-goog-upload-url' not in response.sdk_http_response.headers
-    ):
-      raise KeyError(
-          'Failed to create file. Upload URL did not returned from the create'
-          ' file request.'
+    upload_state_file = config_model.upload_state_file
+    upload_url = None
+    upload_headers = None
+    offset = 0
+    if upload_state_file:
+      upload_url = _extra_utils.load_upload_state(
+          upload_state_file, file, size_bytes, config_model.upload_state_key
+      )
+    if upload_url is not None:
+      query_response = self._api_client.query_upload(
+          upload_url, http_options=http_options
       )
-    upload_url = response.sdk_http_response.headers['x-goog-upload-url']
+      resume_offset = _extra_utils.get_resume_offset(query_response.headers)
+      if resume_offset is None:
+        upload_url = None
+      else:
+        offset = resume_offset
+        upload_headers = query_response.headers
+
+    if upload_url is None:
+      response = self._create(
+          file=file_obj,
+          config=types.CreateFileConfig(
+              http_options=http_options, should_return_http_response=True
+          ),
+      )
+
+      if (
+          response.sdk_http_response is None
+          or response.sdk_http_response.headers is None
+          or 'x-goog-upload-url' not in response.sdk_http_response.headers
+      ):
+        raise KeyError(
+            'Failed to create file. Upload URL did not returned from the create'
+            ' file request.'
+        )
+      upload_url = response.sdk_http_response.headers['x-goog-upload-url']
+      upload_headers = response.sdk_http_response.headers
+      if upload_state_file:
+        _extra_utils.save_upload_state(
+            upload_state_file,
+            upload_url=upload_url,
+            file=file,
+            size_bytes=size_bytes,
+            offset=offset,
+            upload_state_key=config_model.upload_state_key,
+        )
 
+    chunk_size = _extra_utils.get_upload_chunk_size(
+        config_model.chunk_size, upload_headers
+    )
+    progress_callback = _extra_utils.get_upload_progress_callback(
+        config_model, upload_url=upload_url, file=file, size_bytes=size_bytes
+    )
     if isinstance(file, io.IOBase):
       return_file = self._api_client.upload_file(
-          file, upload_url, file_obj.size_bytes, http_options=http_options
+          file,
+          upload_url,
+          file_obj.size_bytes,
+          http_options=http_options,
+          chunk_size=chunk_size,
+          offset=offset,
+          progress_callback=progress_callback,
       )
     else:
       fs_path = os.fspath(file)
       return_file = self._api_client.upload_file(
-          fs_path, upload_url, file_obj.size_bytes, http_options=http_options
+          fs_path,
+          upload_url,
+          file_obj.size_bytes,
+          http_options=http_options,
+          chunk_size=chunk_size,
+          offset=offset,
+          progress_callback=progress_callback,
       )
+    if upload_state_file:
+      _extra_utils.clear_upload_state(upload_state_file)
 
     return types.File._from_response(
         response=return_file.json['file'],
-        kwargs=config_model.model_dump() if config else {},
+        kwargs={},
     )
 
   def list(
@@ -505,12 +562,33 @@ class Files(_api_module.BaseModule):
         config,
     )
 
+  @overload
   def download(
       self,
       *,
       file: Union[str, types.File, types.Video, types.GeneratedVideo],
       config: Optional[types.DownloadFileConfigOrDict] = None,
+      destination: None = None,
   ) -> bytes:
+    ...
+
+  @overload
+  def download(
+      self,
+      *,
+      file: Union[str, types.File, types.Video, types.GeneratedVideo],
+      config: Optional[types.DownloadFileConfigOrDict] = None,
+      destination: Union[str, os.PathLike[str], io.IOBase],
+  ) -> None:
+    ...
+
+  def download(
+      self,
+      *,
+      file: Union[str, types.File, types.Video, types.GeneratedVideo],
+      config: Optional[types.DownloadFileConfigOrDict] = None,
+      destination: Optional[Union[str, os.PathLike[str], io.IOBase]] = None,
+  ) -> Optional[bytes]:
     """Downloads a file's data from storage.
 
     Files created by `upload` can't be downloaded. You can tell which files are
@@ -520,14 +598,19 @@ class Files(_api_module.BaseModule):
     `GeneratedVideo` objects there is an additional side effect, that it also
     sets the `video_bytes` property on the `Video` object.
 
+    With a `destination`, the data is streamed to it in chunks instead, so
+    large files are never held in memory, and `video_bytes` is not set.
+
     Args:
       file (str): A file name, uri, or file object. Identifying which file to
         download.
       config (DownloadFileConfigOrDict): Optional, configuration for the get
         method.
+      destination: Optional, a path or a binary file object to write the data
+        to.
 
     Returns:
-      File: The file data as bytes.
+      File: The file data as bytes, or None with a `destination`.
 
     Usage:
 
@@ -545,6 +628,8 @@ class Files(_api_module.BaseModule):
       video = types.Video(uri=file.uri)
       video_bytes = client.files.download(file=video)
       video.video_bytes
+
+      client.files.download(file=video, destination='video.mp4')
     """
     if self._api_client.vertexai:
       raise ValueError(
@@ -574,6 +659,17 @@ class Files(_api_module.BaseModule):
     if getv(config_model, ['http_options']) is not None:
       http_options = getv(config_model, ['http_options'])
 
+    if destination is not None:
+      self._api_client.download_file_to(
+          path,
+          destination,
+          http_options=http_options,
+          chunk_size=getv(config_model, ['chunk_size']),
+          resume=bool(getv(config_model, ['resume'])),
+          sha256_hash=getv(config_model, ['sha256_hash']),
+      )
+      return None
+
     data = self._api_client.download_file(
         path,
         http_options=http_options,
@@ -639,20 +735,22 @@ class AsyncFiles(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _ListFilesResponse_from_mldev(response_dict)
 
     return_value = types.ListFilesResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -697,8 +795,7 @@ class AsyncFiles(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
@@ -711,13 +808,16 @@ class AsyncFiles(_api_module.BaseModule):
       self._api_client._verify_response(return_value)
       return return_value
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _CreateFileResponse_from_mldev(response_dict)
 
     return_value = types.CreateFileResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -774,17 +874,19 @@ class AsyncFiles(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     return_value = types.File._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -840,20 +942,22 @@ class AsyncFiles(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if not self._api_client.vertexai:
       response_dict = _DeleteFileResponse_from_mldev(response_dict)
 
     return_value = types.DeleteFileResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -904,42 +1008,92 @@ class AsyncFiles(_api_module.BaseModule):
     )
     file_obj.size_bytes = size_bytes
     file_obj.mime_type = mime_type
-    response = await self._create(
-        file=file_obj,
-        config=types.CreateFileConfig(
-            http_options=http_options, should_return_http_response=True
-        ),
-    )
-    if (
-        response.sdk_http_response is None
-        or response.sdk_http_response.headers is None
-        or (
-            'x-goog-upload-url' not in response.sdk_http_response.headers
-            and 'X-Goog-Upload-URL' not in response.sdk_http_response.headers
-        )
-    ):
-      raise KeyError(
-          'Failed to create file. Upload URL did not returned from the create'
-          ' file request.'
+    upload_state_file = config_model.upload_state_file
+    upload_url = None
+    upload_headers = None
+    offset = 0
+    if upload_state_file:
+      upload_url = _extra_utils.load_upload_state(
+          upload_state_file, file, size_bytes, config_model.upload_state_key
       )
-    elif 'x-goog-upload-url' in response.sdk_http_response.headers:
-      upload_url = response.sdk_http_response.headers['x-goog-upload-url']
-    else:
-      upload_url = response.sdk_http_response.headers['X-Goog-Upload-URL']
+    if upload_url is not None:
+      query_response = await self._api_client.async_query_upload(
+          upload_url, http_options=http_options
+      )
+      resume_offset = _extra_utils.get_resume_offset(query_response.headers)
+      if resume_offset is None:
+        upload_url = None
+      else:
+        offset = resume_offset
+        upload_headers = query_response.headers
+
+    if upload_url is None:
+      response = await self._create(
+          file=file_obj,
+          config=types.CreateFileConfig(
+              http_options=http_options, should_return_http_response=True
+          ),
+      )
+      if (
+          response.sdk_http_response is None
+          or response.sdk_http_response.headers is None
+          or (
+              'x-goog-upload-url' not in response.sdk_http_response.headers
+              and 'X-Goog-Upload-URL' not in response.sdk_http_response.headers
+          )
+      ):
+        raise KeyError(
+            'Failed to create file. Upload URL did not returned from the create'
+            ' file request.'
+        )
+      elif 'x-goog-upload-url' in response.sdk_http_response.headers:
+        upload_url = response.sdk_http_response.headers['x-goog-upload-url']
+      else:
+        upload_url = response.sdk_http_response.headers['X-Goog-Upload-URL']
+      upload_headers = response.sdk_http_response.headers
+      if upload_state_file:
+        _extra_utils.save_upload_state(
+            upload_state_file,
+            upload_url=upload_url,
+            file=file,
+            size_bytes=size_bytes,
+            offset=offset,
+            upload_state_key=config_model.upload_state_key,
+        )
 
+    chunk_size = _extra_utils.get_upload_chunk_size(
+        config_model.chunk_size, upload_headers
+    )
+    progress_callback = _extra_utils.get_upload_progress_callback(
+        config_model, upload_url=upload_url, file=file, size_bytes=size_bytes
+    )
     if isinstance(file, io.IOBase):
       return_file = await self._api_client.async_upload_file(
-          file, upload_url, file_obj.size_bytes, http_options=http_options
+          file,
+          upload_url,
+          file_obj.size_bytes,
+          http_options=http_options,
+          chunk_size=chunk_size,
+          offset=offset,
+          progress_callback=progress_callback,
       )
     else:
       fs_path = os.fspath(file)
       return_file = await self._api_client.async_upload_file(
-          fs_path, upload_url, file_obj.size_bytes, http_options=http_options
+          fs_path,
+          upload_url,
+          file_obj.size_bytes,
+          http_options=http_options,
+          chunk_size=chunk_size,
+          offset=offset,
+          progress_callback=progress_callback,
       )
+    if upload_state_file:
+      _extra_utils.clear_upload_state(upload_state_file)
 
     return types.File._from_response(
         response=return_file.json['file'],
-        kwargs=config_model.model_dump() if config else {},
+        kwargs={},
     )
 
   async def list(
@@ -952,12 +1106,33 @@ class AsyncFiles(_api_module.BaseModule):
         config,
     )
 
+  @overload
   async def download(
       self,
       *,
       file: Union[str, types.File],
       config: Optional[types.DownloadFileConfigOrDict] = None,
+      destination: None = None,
   ) -> bytes:
+    ...
+
+  @overload
+  async def download(
+      self,
+      *,
+      file: Union[str, types.File],
+      config: Optional[types.DownloadFileConfigOrDict] = None,
+      destination: Union[str, os.PathLike[str], io.IOBase],
+  ) -> None:
+    ...
+
+  async def download(
+      self,
+      *,
+      file: Union[str, types.File],
+      config: Optional[types.DownloadFileConfigOrDict] = None,
+      destination: Optional[Union[str, os.PathLike[str], io.IOBase]] = None,
+  ) -> Optional[bytes]:
     """Downloads a file's data from the file service.
 
     The Vertex-AI implementation of the API foes not include the file service.
@@ -965,14 +1140,19 @@ class AsyncFiles(_api_module.BaseModule):
     Files created by `upload` can't be downloaded. You can tell which files are
     downloadable by checking the `download_uri` property.
 
+    With a `destination`, the data is streamed to it in chunks instead, so
+    large files are never held in memory.
+
     Args:
       File (str): A file name, uri, or file object. Identifying which file to
         download.
       config (DownloadFileConfigOrDict): Optional, configuration for the get
         method.
+      destination: Optional, a path or a binary file object to write the data
+        to.
 
     Returns:
-      File: The file data as bytes.
+      File: The file data as bytes, or None with a `destination`.
 
     Usage:
 
@@ -986,6 +1166,7 @@ class AsyncFiles(_api_module.BaseModule):
       data = client.files.download(file=file)
       # data = client.files.download(file=file.name)
       # data = client.files.download(file=file.uri)
+      await client.aio.files.download(file=file, destination='video.mp4')
     """
     if self._api_client.vertexai:
       raise ValueError(
@@ -1011,6 +1192,17 @@ class AsyncFiles(_api_module.BaseModule):
     if query_params:
       path = f'{path}?{urlencode(query_params)}'
 
+    if destination is not None:
+      await self._api_client.async_download_file_to(
+          path,
+          destination,
+          http_options=http_options,
+          chunk_size=getv(config_model, ['chunk_size']),
+          resume=bool(getv(config_model, ['resume'])),
+          sha256_hash=getv(config_model, ['sha256_hash']),
+      )
+      return None
+
     data = await self._api_client.async_download_file(
         path,
         http_options=http_options,
@@ -17,17 +17,25 @@
 
 import asyncio
 import base64
+import collections
 import contextlib
+import dataclasses
+import inspect
 import json
 import logging
+import os
+import random
+import time
 import typing
-from typing import Any, AsyncIterator, Optional, Sequence, Union, get_args
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Optional, Sequence, Union, get_args
 import warnings
 
 import google.auth
 import pydantic
 from websockets import ConnectionClosed
+from websockets.exceptions import WebSocketException
 
+from . import _api_client
 from . import _api_module
 from . import _common
 from . import _live_converters as live_converters
@@ -77,6 +85,62 @@ _FUNCTION_RESPONSE_REQUIRES_ID = (
     ' response of a ToolCall.FunctionalCalls in Google AI.'
 )
 
+# Number of received messages held for the reader of a session by default.
+_MAX_QUEUED_MESSAGES = 256
+
+
+@dataclasses.dataclass
+class LiveReceiveStats:
+  """Statistics of the messages received by a live session.
+
+  Attributes:
+    messages: The number of messages parsed.
+    fast_parsed_messages: The number of messages parsed and validated in a
+      single pass.
+    parse_seconds: The total time spent parsing messages.
+    max_parse_seconds: The longest time spent parsing a message.
+    queue_depth: The number of messages received but not read yet.
+    max_queue_depth: The largest number of messages received but not read.
+  """
+
+  messages: int = 0
+  fast_parsed_messages: int = 0
+  parse_seconds: float = 0.0
+  max_parse_seconds: float = 0.0
+  queue_depth: int = 0
+  max_queue_depth: int = 0
+
+  @property
+  def mean_parse_seconds(self) -> float:
+    """The mean time spent parsing a message."""
+    return self.parse_seconds / self.messages if self.messages else 0.0
+
+
+def _validate_message_json(
+    raw_response: Union[str, bytes], vertexai: bool
+) -> Optional[types.LiveServerMessage]:
+  """Parses and validates a message in a single pass.
+
+  Most messages, e.g. each chunk of audio of a spoken response, have only known
+  fields. Validating their JSON directly skips decoding it to Python objects
+  and removing unknown fields before validation.
+
+  Returns:
+    The message, or None if it must be parsed by `_from_response`, e.g.
+    because it has fields unknown to this version of the SDK.
+  """
+  # Usage metadata is the only field converted for Vertex AI.
+  if vertexai and (
+      b'usageMetadata' in raw_response
+      if isinstance(raw_response, bytes)
+      else 'usageMetadata' in raw_response
+  ):
+    return None
+  try:
+    return types.LiveServerMessage.model_validate_json(raw_response)
+  except pydantic.ValidationError:
+    return None
+
 
 class AsyncSession:
   """[Preview] AsyncSession."""
@@ -86,10 +150,27 @@ class AsyncSession:
       api_client: BaseApiClient,
       websocket: ClientConnection,
       session_id: Optional[str] = None,
+      max_queued_messages: int = _MAX_QUEUED_MESSAGES,
   ):
+    """Initializes the session.
+
+    Args:
+      api_client: The API client of the session.
+      websocket: The connection of the session.
+      session_id: The ID of the session, if the server sent one.
+      max_queued_messages: How many received messages are held until they are
+        read. Once a session is read from, messages are received in the
+        background, and receiving pauses while this many are held.
+    """
     self._api_client = api_client
     self._ws = websocket
     self.session_id = session_id
+    self.receive_stats = LiveReceiveStats()
+    self._max_queued_messages = max_queued_messages
+    self._frames: Optional[
+        asyncio.Queue[Union[str, bytes, BaseException]]
+    ] = None
+    self._reader: Optional[asyncio.Task[None]] = None
 
   async def send(
       self,
@@ -140,7 +221,7 @@ class AsyncSession:
         stacklevel=2,
     )
     client_message = self._parse_client_message(input, end_of_turn)
-    await self._ws.send(json.dumps(client_message))
+    await self._ws.send(_common.json_dumps(client_message))
 
   async def send_client_content(
       self,
@@ -230,7 +311,9 @@ class AsyncSession:
           from_object=client_content
       )
 
-    await self._ws.send(json.dumps({'client_content': client_content_dict}))
+    await self._ws.send(
+        _common.json_dumps({'client_content': client_content_dict})
+    )
 
   async def send_realtime_input(
       self,
@@ -315,6 +398,9 @@ class AsyncSession:
           f'Only one argument can be set, got {len(kwargs)}:'
           f' {list(kwargs.keys())}'
       )
+    await self._ws.send(self._realtime_input_message(kwargs))
+
+  def _realtime_input_message(self, kwargs: _common.StringDict) -> str:
     realtime_input = types.LiveSendRealtimeInputParameters.model_validate(
         kwargs
     )
@@ -331,11 +417,131 @@ class AsyncSession:
               from_object=realtime_input
           )
       )
-    realtime_input_dict = _common.convert_to_dict(realtime_input_dict)
-    realtime_input_dict = _common.encode_unserializable_types(
-        realtime_input_dict
+    realtime_input_dict = _common.convert_to_json_dict(
+        realtime_input_dict, lazy_base64=False
     )
-    await self._ws.send(json.dumps({'realtime_input': realtime_input_dict}))
+    return _common.json_dumps({'realtime_input': realtime_input_dict})
+
+  async def stream_audio(
+      self,
+      stream: AsyncIterable[bytes],
+      *,
+      mime_type: str,
+      max_latency_ms: float = 0,
+      audio_stream_end: bool = False,
+  ) -> None:
+    """Sends a stream of audio chunks as realtime input.
+
+    This sends the same messages as calling `send_realtime_input(audio=...)`
+    for each chunk, with much less overhead per chunk: the message around the
+    audio is built once, and each chunk is only base64 encoded into it.
+
+    Args:
+      stream: The audio to send, e.g. 20 ms frames of PCM audio.
+      mime_type: The MIME type of the audio, e.g. `audio/pcm;rate=16000`.
+      max_latency_ms: How long a chunk may be held back, to be sent in one
+        message with the chunks that follow it. By default each chunk is sent
+        as soon as it is read.
+      audio_stream_end: Whether to send `audio_stream_end` once the stream is
+        exhausted.
+
+    Example:
+
+    .. code-block:: python
+
+      async def microphone():
+        while True:
+          yield await read_frame()  # 20 ms of 16 kHz PCM audio.
+
+      async with client.aio.live.connect(
+          model=MODEL_NAME,
+          config={'response_modalities': ['AUDIO']},
+      ) as session:
+        sender = asyncio.create_task(
+            session.stream_audio(
+                microphone(),
+                mime_type='audio/pcm;rate=16000',
+                max_latency_ms=40,
+            )
+        )
+        async for message in session.receive():
+          ...
+    """
+    # The message for a placeholder chunk, split around the encoded chunk. The
+    # placeholder's length is a multiple of 3, so its encoding isn't padded.
+    placeholder = os.urandom(18)
+    prefix, suffix = self._realtime_input_message(
+        {'audio': types.Blob(data=placeholder, mime_type=mime_type)}
+    ).split(base64.urlsafe_b64encode(placeholder).decode('ascii'))
+
+    if max_latency_ms <= 0:
+      async for chunk in stream:
+        if chunk:
+          await self._ws.send(
+              prefix + base64.urlsafe_b64encode(chunk).decode('ascii') + suffix
+          )
+    else:
+      await self._send_coalesced_audio(
+          stream, prefix, suffix, max_latency_ms / 1000
+      )
+    if audio_stream_end:
+      await self.send_realtime_input(audio_stream_end=True)
+
+  async def _send_coalesced_audio(
+      self,
+      stream: AsyncIterable[bytes],
+      prefix: str,
+      suffix: str,
+      max_latency: float,
+  ) -> None:
+    loop = asyncio.get_running_loop()
+    chunks = stream.__aiter__()
+    # Audio read since the last message was sent, and when it must be sent by.
+    pending = bytearray()
+    deadline = 0.0
+    next_chunk: Optional[asyncio.Future[bytes]] = None
+    try:
+      while True:
+        if pending:
+          if next_chunk is None:
+            next_chunk = asyncio.ensure_future(chunks.__anext__())
+          done, _ = await asyncio.wait(
+              (next_chunk,), timeout=deadline - loop.time()
+          )
+          if not done:
+            await self._ws.send(
+                prefix
+                + base64.urlsafe_b64encode(pending).decode('ascii')
+                + suffix
+            )
+            pending.clear()
+            continue
+          read, next_chunk = next_chunk, None
+          try:
+            chunk = read.result()
+          except StopAsyncIteration:
+            break
+        else:
+          # Nothing is held back, so there is no deadline to wait for.
+          started, next_chunk = next_chunk, None
+          try:
+            chunk = await (started or chunks.__anext__())
+          except StopAsyncIteration:
+            break
+          deadline = loop.time() + max_latency
+        pending += chunk
+        if pending and loop.time() >= deadline:
+          await self._ws.send(
+              prefix + base64.urlsafe_b64encode(pending).decode('ascii') + suffix
+          )
+          pending.clear()
+    finally:
+      if next_chunk is not None:
+        next_chunk.cancel()
+    if pending:
+      await self._ws.send(
+          prefix + base64.urlsafe_b64encode(pending).decode('ascii') + suffix
+      )
 
   async def send_tool_response(
       self,
@@ -420,7 +626,9 @@ class AsyncSession:
         if response.get('id') is None:
           raise ValueError(_FUNCTION_RESPONSE_REQUIRES_ID)
 
-    await self._ws.send(json.dumps({'tool_response': tool_response_dict}))
+    await self._ws.send(
+        _common.json_dumps({'tool_response': tool_response_dict})
+    )
 
   async def receive(self) -> AsyncIterator[types.LiveServerMessage]:
     """Receive model responses from the server.
@@ -523,28 +731,70 @@ class AsyncSession:
       except asyncio.CancelledError:
         pass
 
-  async def _receive(self) -> types.LiveServerMessage:
-    parameter_model = types.LiveServerMessage()
+  async def _recv_frame(self) -> Union[str, bytes]:
     try:
-      raw_response = await self._ws.recv(decode=False)
+      return await self._ws.recv(decode=False)
     except TypeError:
-      raw_response = await self._ws.recv()  # type: ignore[assignment]
-    if raw_response:
-      try:
-        response = json.loads(raw_response)
-      except json.decoder.JSONDecodeError:
-        raise ValueError(f'Failed to parse response: {raw_response!r}')
-    else:
-      response = {}
+      return await self._ws.recv()  # type: ignore[no-any-return]
 
-    if self._api_client.vertexai:
-      response_dict = live_converters._LiveServerMessage_from_vertex(response)
-    else:
-      response_dict = response
+  async def _read_frames(
+      self, frames: 'asyncio.Queue[Union[str, bytes, BaseException]]'
+  ) -> None:
+    """Receives messages until the connection fails or is closed."""
+    stats = self.receive_stats
+    try:
+      while True:
+        frame = await self._recv_frame()
+        await frames.put(frame)
+        stats.queue_depth = frames.qsize()
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+      # E.g. ConnectionClosed, raised to the reader after the messages before.
+      await frames.put(e)
+
+  async def _next_frame(self) -> Union[str, bytes]:
+    if self._frames is None:
+      self._frames = asyncio.Queue(self._max_queued_messages)
+      self._reader = asyncio.create_task(self._read_frames(self._frames))
+    frame = await self._frames.get()
+    self.receive_stats.queue_depth = self._frames.qsize()
+    if isinstance(frame, BaseException):
+      # The reader has stopped. The error is raised again by later calls.
+      self._frames.put_nowait(frame)
+      raise frame
+    return frame
 
-    return types.LiveServerMessage._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+  async def _receive(self) -> types.LiveServerMessage:
+    raw_response = await self._next_frame()
+    start = time.perf_counter()
+    stats = self.receive_stats
+    message = _validate_message_json(
+        raw_response, bool(self._api_client.vertexai)
     )
+    if message is not None:
+      stats.fast_parsed_messages += 1
+    else:
+      if raw_response:
+        try:
+          response = _common.json_loads(raw_response)
+        except json.decoder.JSONDecodeError:
+          raise ValueError(f'Failed to parse response: {raw_response!r}')
+      else:
+        response = {}
+      if self._api_client.vertexai:
+        response_dict = live_converters._LiveServerMessage_from_vertex(
+            response
+        )
+      else:
+        response_dict = response
+      message = types.LiveServerMessage._from_response(
+          response=response_dict, kwargs={}
+      )
+    elapsed = time.perf_counter() - start
+    stats.messages += 1
+    stats.parse_seconds += elapsed
+    stats.max_parse_seconds = max(stats.max_parse_seconds, elapsed)
+    return message
 
   async def _send_loop(
       self,
@@ -867,6 +1117,305 @@ class AsyncSession:
   async def close(self) -> None:
     # Close the websocket connection.
     await self._ws.close()
+    if self._reader is not None:
+      self._reader.cancel()
+
+
+@dataclasses.dataclass
+class LiveReconnectEvent:
+  """[Preview] A reconnection of a resilient live session.
+
+  Attributes:
+    reconnects: The number of times the session has reconnected so far.
+    resumed: Whether the session was resumed with a resumption handle. If not,
+      the server started a new session.
+    replayed_messages: The number of client messages sent again, because the
+      server may not have consumed them before the connection dropped.
+    downtime_seconds: How long the session was disconnected for.
+    error: The error the connection dropped with.
+  """
+
+  reconnects: int
+  resumed: bool
+  replayed_messages: int
+  downtime_seconds: float
+  error: Optional[BaseException] = None
+
+
+def _ends_turn(message: str) -> bool:
+  """Returns whether a client message asks the server to respond."""
+  if message.startswith('{"tool_response"'):
+    return True
+  if not message.startswith('{"client_content"'):
+    return False
+  client_content = _common.json_loads(message)['client_content']
+  return bool(
+      client_content.get('turnComplete') or client_content.get('turn_complete')
+  )
+
+
+# Errors that are retried when reconnecting.
+_RECONNECT_ERRORS = (OSError, asyncio.TimeoutError, WebSocketException)
+
+
+class _ResumableConnection:
+  """A websocket connection that is reopened when it drops.
+
+  The session is resumed with the latest resumption handle received from the
+  server, and the client messages the server may not have consumed are sent
+  again. `AsyncSession` uses it in place of the websocket connection.
+  """
+
+  def __init__(
+      self,
+      live: 'AsyncLive',
+      model: str,
+      config: types.LiveConnectConfig,
+      retry_options: types.HttpRetryOptions,
+      on_reconnect: Optional[Callable[[LiveReconnectEvent], Any]],
+  ):
+    self._live = live
+    self._model = model
+    self._config = config
+    self._retry_options = retry_options
+    self._on_reconnect = on_reconnect
+    self._ws: Optional[ClientConnection] = None
+    self._exit_stack: Optional[contextlib.AsyncExitStack] = None
+    self._lock = asyncio.Lock()
+    # Incremented for each new connection, so that a reader and a writer that
+    # both see a connection drop reconnect only once.
+    self._generation = 0
+    # Consecutive connections that failed or dropped before the server sent a
+    # message.
+    self._failures = 0
+    self._closed = False
+    self.reconnects = 0
+    resumption = config.session_resumption
+    self.handle = resumption.handle if resumption else None
+    self._transparent = bool(resumption and resumption.transparent)
+    # Client messages that the server may not have consumed yet, with their
+    # index on the current connection and whether they end a turn.
+    self._unacked: collections.deque[tuple[int, str, bool]] = (
+        collections.deque()
+    )
+    self._sent = 0
+    # The index of the last message the server has responded to.
+    self._answered = -1
+
+  async def open(self) -> Optional[str]:
+    """Connects and sets up the session, and returns the session ID."""
+    config = self._config
+    if self.handle and config.session_resumption:
+      config = config.model_copy(
+          update={
+              'session_resumption': config.session_resumption.model_copy(
+                  update={'handle': self.handle}
+              )
+          }
+      )
+    uri, headers, request = await self._live._connect_request(
+        self._model, config
+    )
+    exit_stack = contextlib.AsyncExitStack()
+    try:
+      ws = await exit_stack.enter_async_context(
+          ws_connect(
+              uri,
+              additional_headers=headers,
+              **self._live._api_client._websocket_ssl_ctx,
+          )
+      )
+      session_id = await self._live._setup(ws, request)
+    except BaseException:
+      await exit_stack.aclose()
+      raise
+    self._ws, self._exit_stack = ws, exit_stack
+    self._sent = 0
+    self._answered = -1
+    return session_id
+
+  async def send(self, message: str) -> None:
+    if self._lock.locked():
+      # Wait for the reconnection, which replays the messages buffered before
+      # it started.
+      async with self._lock:
+        pass
+    generation = self._generation
+    self._unacked.append((self._sent, message, _ends_turn(message)))
+    self._sent += 1
+    try:
+      await self._ws.send(message)  # type: ignore[union-attr]
+    except ConnectionClosed as e:
+      if self._closed:
+        raise
+      # The message is sent again when reconnecting.
+      await self._reconnect(generation, e)
+
+  async def recv(self, decode: Optional[bool] = None) -> Union[str, bytes]:
+    while True:
+      generation = self._generation
+      try:
+        try:
+          # websockets 14.0+
+          frame = await self._ws.recv(decode=decode)  # type: ignore[union-attr]
+        except TypeError:
+          frame = await self._ws.recv()  # type: ignore[union-attr]
+      except ConnectionClosed as e:
+        if self._closed:
+          raise
+        await self._reconnect(generation, e)
+        continue
+      self._failures = 0
+      self._update_resumption(frame)
+      return frame
+
+  def _update_resumption(self, frame: Union[str, bytes]) -> None:
+    # Most messages are neither turn completions nor resumption updates, so
+    # skip decoding them.
+    if isinstance(frame, bytes):
+      turn_complete = b'turnComplete' in frame
+      is_update = b'sessionResumptionUpdate' in frame
+    else:
+      turn_complete = 'turnComplete' in frame
+      is_update = 'sessionResumptionUpdate' in frame
+    if turn_complete:
+      self._answered = next(
+          (
+              index
+              for index, _, ends_turn in self._unacked
+              if ends_turn and index > self._answered
+          ),
+          # A turn of realtime input ends when the server detects it.
+          self._sent - 1,
+      )
+    if is_update:
+      self._parse_resumption_update(frame)
+
+  def _parse_resumption_update(self, frame: Union[str, bytes]) -> None:
+    update = _common.json_loads(frame).get('sessionResumptionUpdate')
+    if not isinstance(update, dict) or not (
+        update.get('resumable') and update.get('newHandle')
+    ):
+      return
+    self.handle = update['newHandle']
+    # The handle restores the messages the server consumed before the update.
+    # Without transparent resumption, the server does not say which, so assume
+    # it consumed the messages it responded to.
+    index = update.get('lastConsumedClientMessageIndex')
+    if self._transparent and index is not None:
+      consumed = int(index)
+    else:
+      consumed = self._answered
+    while self._unacked and self._unacked[0][0] <= consumed:
+      self._unacked.popleft()
+
+  def _delay(self, attempt: int) -> float:
+    options = self._retry_options
+    initial_delay = (
+        options.initial_delay
+        if options.initial_delay is not None
+        else _api_client._RETRY_INITIAL_DELAY
+    )
+    max_delay = (
+        options.max_delay
+        if options.max_delay is not None
+        else _api_client._RETRY_MAX_DELAY
+    )
+    exp_base = options.exp_base or _api_client._RETRY_EXP_BASE
+    jitter = (
+        options.jitter
+        if options.jitter is not None
+        else _api_client._RETRY_JITTER
+    )
+    return min(
+        initial_delay * exp_base ** (attempt - 1), max_delay
+    ) + random.uniform(0, jitter)
+
+  async def _reconnect(self, generation: int, error: BaseException) -> None:
+    """Reconnects, unless another task has reconnected since `generation`."""
+    async with self._lock:
+      if generation != self._generation:
+        return
+      dropped_at = time.monotonic()
+      await self._close_connection()
+      attempts = self._retry_options.attempts or _api_client._RETRY_ATTEMPTS
+      resumed = bool(self.handle)
+      while True:
+        self._failures += 1
+        if self._failures >= attempts:
+          raise error
+        await asyncio.sleep(self._delay(self._failures))
+        resumed = bool(self.handle)
+        try:
+          await self.open()
+          replay = [entry[1:] for entry in self._unacked]
+          self._unacked.clear()
+          for message, ends_turn in replay:
+            self._unacked.append((self._sent, message, ends_turn))
+            self._sent += 1
+            await self._ws.send(message)  # type: ignore[union-attr]
+        except _RECONNECT_ERRORS as e:
+          logger.info('Reconnecting live session failed: %r', e)
+          error = e
+          await self._close_connection()
+          continue
+        break
+      self._generation += 1
+      self.reconnects += 1
+      event = LiveReconnectEvent(
+          reconnects=self.reconnects,
+          resumed=resumed,
+          replayed_messages=len(replay),
+          downtime_seconds=time.monotonic() - dropped_at,
+          error=error,
+      )
+    logger.info('Reconnected live session: %s', event)
+    if self._on_reconnect is not None:
+      result = self._on_reconnect(event)
+      if inspect.isawaitable(result):
+        await result
+
+  async def _close_connection(self) -> None:
+    exit_stack, self._exit_stack = self._exit_stack, None
+    if exit_stack is not None:
+      try:
+        await exit_stack.aclose()
+      except _RECONNECT_ERRORS:
+        pass
+
+  async def close(self) -> None:
+    self._closed = True
+    await self._close_connection()
+
+
+class ResilientAsyncSession(AsyncSession):
+  """[Preview] A live session that reconnects when its connection drops.
+
+  Returned by `AsyncLive.connect_resilient`.
+  """
+
+  def __init__(
+      self,
+      api_client: BaseApiClient,
+      connection: _ResumableConnection,
+      session_id: Optional[str] = None,
+  ):
+    super().__init__(
+        api_client=api_client,
+        websocket=connection,  # type: ignore[arg-type]
+        session_id=session_id,
+    )
+    self._connection = connection
+
+  @property
+  def reconnects(self) -> int:
+    """The number of times the session has reconnected."""
+    return self._connection.reconnects
+
+  @property
+  def resumption_handle(self) -> Optional[str]:
+    """The latest handle to resume the session with."""
+    return self._connection.handle
 
 
 class AsyncLive(_api_module.BaseModule):
@@ -926,6 +1475,106 @@ class AsyncLive(_api_module.BaseModule):
           ' the client-level http_options configuration instead.'
       )
 
+    uri, headers, request = await self._connect_request(model, config)
+    async with ws_connect(
+        uri, additional_headers=headers, **self._api_client._websocket_ssl_ctx
+    ) as ws:
+      session_id = await self._setup(ws, request)
+      yield AsyncSession(
+          api_client=self._api_client,
+          websocket=ws,
+          session_id=session_id,
+      )
+
+  @contextlib.asynccontextmanager
+  async def connect_resilient(
+      self,
+      *,
+      model: str,
+      config: Optional[types.LiveConnectConfigOrDict] = None,
+      retry_options: Optional[types.HttpRetryOptionsOrDict] = None,
+      on_reconnect: Optional[Callable[[LiveReconnectEvent], Any]] = None,
+  ) -> AsyncIterator[ResilientAsyncSession]:
+    """[Preview] Connect to the live server, and reconnect when disconnected.
+
+    Session resumption is enabled, unless `config.session_resumption` is set.
+    The session tracks the resumption handles sent by the server. When the
+    connection drops, it reconnects with exponential backoff and resumes the
+    session with the latest handle, then sends again the client messages the
+    server has not consumed. On the Gemini Developer API, these are the
+    messages sent since the last resumption update; on Vertex AI, with
+    transparent resumption, the messages after the last consumed index.
+
+    Usage:
+
+    .. code-block:: python
+
+      async def on_reconnect(event):
+        print(f'Reconnected after {event.downtime_seconds:.1f}s')
+
+      async with client.aio.live.connect_resilient(
+          model='...', on_reconnect=on_reconnect
+      ) as session:
+        await session.send_client_content(
+          turns=types.Content(role='user', parts=[types.Part(text='hello!')])
+        )
+        async for message in session.receive():
+          print(message)
+
+    Args:
+      model: The model to use for the live session.
+      config: The configuration for the live session.
+      retry_options: The backoff between reconnection attempts. `attempts` is
+        the number of consecutive connections, including the one that dropped,
+        that may fail before the session gives up.
+      on_reconnect: A function, or coroutine function, called with a
+        `LiveReconnectEvent` after each reconnection.
+
+    Yields:
+      A ResilientAsyncSession object.
+    """
+    if isinstance(config, dict):
+      config = types.LiveConnectConfig(**config)
+    config = config or types.LiveConnectConfig()
+    if config.http_options:
+      raise ValueError(
+          'google.genai.client.aio.live.connect_resilient() does not support'
+          ' http_options at request-level in LiveConnectConfig yet. Please use'
+          ' the client-level http_options configuration instead.'
+      )
+    if config.session_resumption is None:
+      config = config.model_copy(
+          update={
+              'session_resumption': types.SessionResumptionConfig(
+                  # Transparent resumption is only supported by Vertex AI.
+                  transparent=True if self._api_client.vertexai else None
+              )
+          }
+      )
+    if isinstance(retry_options, dict):
+      retry_options = types.HttpRetryOptions(**retry_options)
+
+    connection = _ResumableConnection(
+        self,
+        model,
+        config,
+        retry_options or types.HttpRetryOptions(),
+        on_reconnect,
+    )
+    session_id = await connection.open()
+    try:
+      yield ResilientAsyncSession(
+          api_client=self._api_client,
+          connection=connection,
+          session_id=session_id,
+      )
+    finally:
+      await connection.close()
+
+  async def _connect_request(
+      self, model: str, config: Optional[types.LiveConnectConfig]
+  ) -> tuple[str, Optional[dict[str, str]], str]:
+    """Returns the URI and headers to connect with, and the setup message."""
     base_url = self._api_client._websocket_base_url()
     if isinstance(base_url, bytes):
       base_url = base_url.decode('utf-8')
@@ -974,7 +1623,7 @@ class AsyncLive(_api_module.BaseModule):
 
       setv(request_dict, ['setup', 'model'], transformed_model)
 
-      request = json.dumps(request_dict)
+      request = _common.json_dumps(request_dict)
     elif self._api_client.api_key and self._api_client.vertexai:
       # Headers already contains api key for express mode.
       api_key = self._api_client.api_key
@@ -996,7 +1645,7 @@ class AsyncLive(_api_module.BaseModule):
 
       setv(request_dict, ['setup', 'model'], transformed_model)
 
-      request = json.dumps(request_dict)
+      request = _common.json_dumps(request_dict)
     else:
       version = self._api_client._http_options.api_version
       has_sufficient_auth = (
@@ -1067,7 +1716,7 @@ class AsyncLive(_api_module.BaseModule):
             ['AUDIO'],
         )
 
-      request = json.dumps(request_dict)
+      request = _common.json_dumps(request_dict)
 
     if parameter_model.tools and _mcp_utils.has_mcp_tool_usage(
         parameter_model.tools
@@ -1075,41 +1724,35 @@ class AsyncLive(_api_module.BaseModule):
       if headers is None:
         headers = {}
       _mcp_utils.set_mcp_usage_header(headers)
+    return uri, headers, request
 
-    async with ws_connect(
-        uri, additional_headers=headers, **self._api_client._websocket_ssl_ctx
-    ) as ws:
-      await ws.send(request)
+  async def _setup(self, ws: ClientConnection, request: str) -> Optional[str]:
+    """Sets up a session on a new connection, and returns the session ID."""
+    await ws.send(request)
+    try:
+      # websockets 14.0+
+      raw_response = await ws.recv(decode=False)
+    except TypeError:
+      raw_response = await ws.recv()  # type: ignore[assignment]
+    if raw_response:
       try:
-        # websockets 14.0+
-        raw_response = await ws.recv(decode=False)
-      except TypeError:
-        raw_response = await ws.recv()  # type: ignore[assignment]
-      if raw_response:
-        try:
-          response = json.loads(raw_response)
-        except json.decoder.JSONDecodeError:
-          raise ValueError(f'Failed to parse response: {raw_response!r}')
-      else:
-        response = {}
+        response = _common.json_loads(raw_response)
+      except json.decoder.JSONDecodeError:
+        raise ValueError(f'Failed to parse response: {raw_response!r}')
+    else:
+      response = {}
 
-      if self._api_client.vertexai:
-        response_dict = live_converters._LiveServerMessage_from_vertex(response)
-      else:
-        response_dict = response
+    if self._api_client.vertexai:
+      response_dict = live_converters._LiveServerMessage_from_vertex(response)
+    else:
+      response_dict = response
 
-      setup_response = types.LiveServerMessage._from_response(
-          response=response_dict, kwargs=parameter_model.model_dump()
-      )
-      if setup_response.setup_complete:
-        session_id = setup_response.setup_complete.session_id
-      else:
-        session_id = None
-      yield AsyncSession(
-          api_client=self._api_client,
-          websocket=ws,
-          session_id=session_id,
-      )
+    setup_response = types.LiveServerMessage._from_response(
+        response=response_dict, kwargs={}
+    )
+    if setup_response.setup_complete:
+      return setup_response.setup_complete.session_id
+    return None
 
 
 async def _t_live_connect_config(
@@ -61,7 +61,9 @@ class AsyncMusicSession:
           ]
       }
 
-    await self._ws.send(json.dumps({'clientContent': client_content_dict}))
+    await self._ws.send(
+        _common.json_dumps({'clientContent': client_content_dict})
+    )
 
   async def set_music_generation_config(
       self, config: types.LiveMusicGenerationConfig
@@ -72,7 +74,9 @@ class AsyncMusicSession:
       )
     else:
       config_dict = _common.convert_to_dict(config, convert_keys=True)
-    await self._ws.send(json.dumps({'musicGenerationConfig': config_dict}))
+    await self._ws.send(
+        _common.json_dumps({'musicGenerationConfig': config_dict})
+    )
 
   async def _send_control_signal(
       self, playback_control: types.LiveMusicPlaybackControl
@@ -83,7 +87,7 @@ class AsyncMusicSession:
       )
     else:
       playback_control_dict = {'playbackControl': playback_control.value}
-      await self._ws.send(json.dumps(playback_control_dict))
+      await self._ws.send(_common.json_dumps(playback_control_dict))
 
   async def play(self) -> None:
     """Sends playback signal to start the music stream."""
@@ -117,14 +121,13 @@ class AsyncMusicSession:
       yield result
 
   async def _receive(self) -> types.LiveMusicServerMessage:
-    parameter_model = types.LiveMusicServerMessage()
     try:
       raw_response = await self._ws.recv(decode=False)
     except TypeError:
       raw_response = await self._ws.recv()  # type: ignore[assignment]
     if raw_response:
       try:
-        response = json.loads(raw_response)
+        response = _common.json_loads(raw_response)
       except json.decoder.JSONDecodeError:
         raise ValueError(f'Failed to parse response: {raw_response!r}')
     else:
@@ -136,7 +139,7 @@ class AsyncMusicSession:
       response_dict = response
 
     return types.LiveMusicServerMessage._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict, kwargs={}
     )
 
   async def close(self) -> None:
@@ -178,7 +181,7 @@ class AsyncLiveMusic(_api_module.BaseModule):
 
       setv(request_dict, ['setup', 'model'], transformed_model)
 
-      request = json.dumps(request_dict)
+      request = _common.json_dumps(request_dict)
     else:
       raise NotImplementedError('Live music generation is not supported in Vertex AI.')
 
@@ -15,8 +15,12 @@
 
 """[Experimental] Text Only Local Tokenizer."""
 
+import collections
+import concurrent.futures
+import functools
 import logging
-from typing import Any, Iterable
+import threading
+from typing import Any, Iterable, Sequence
 from typing import Optional, Union
 
 from sentencepiece import sentencepiece_model_pb2
@@ -28,6 +32,11 @@ from . import types
 
 logger = logging.getLogger("google_genai.local_tokenizer")
 
+# Number of texts whose token counts are kept by `count_tokens_batch`.
+_TOKEN_COUNT_CACHE_SIZE = 16384
+# Number of contents counted by one task when an executor is used.
+_EXECUTOR_TASK_SIZE = 512
+
 __all__ = [
     "_parse_hex_byte",
     "_token_str_to_bytes",
@@ -290,9 +299,17 @@ class LocalTokenizer:
   """
 
   def __init__(self, model_name: str):
+    self._model_name = model_name
     self._tokenizer_name = loader.get_tokenizer_name(model_name)
     self._model_proto = loader.load_model_proto(self._tokenizer_name)
     self._tokenizer = loader.get_sentencepiece(self._tokenizer_name)
+    # LRU cache of token counts by text, used by `count_tokens_batch`.
+    self._token_counts: collections.OrderedDict[str, int] = (
+        collections.OrderedDict()
+    )
+    # Guards `_token_counts`, the tokenizer is shared between threads, e.g. by
+    # a thread pool executor.
+    self._token_counts_lock = threading.Lock()
 
   @_common.experimental_warning(
       "The SDK's local tokenizer implementation is experimental and may change"
@@ -338,6 +355,132 @@ class LocalTokenizer:
         total_tokens=sum(len(tokens) for tokens in tokens_list)
     )
 
+  @_common.experimental_warning(
+      "The SDK's local tokenizer implementation is experimental and may change"
+      " in the future. It only supports text based tokenization."
+  )
+  def count_tokens_batch(
+      self,
+      contents_list: Sequence[
+          Union[types.ContentListUnion, types.ContentListUnionDict]
+      ],
+      *,
+      config: Optional[types.CountTokensConfigOrDict] = None,
+      num_threads: int = -1,
+      executor: Optional[concurrent.futures.Executor] = None,
+  ) -> list[types.CountTokensResult]:
+    """Counts the number of tokens in each of the given contents.
+
+    The texts of all the contents that were not counted recently are tokenized
+    in a single `encode` call, and their counts are cached.
+
+    Args:
+      contents_list: The contents to tokenize, e.g. prompts or chat histories.
+      config: The configuration for counting tokens, applied to every contents.
+      num_threads: The number of threads used by `encode`. -1 uses all cores.
+      executor: Optional, e.g. a `concurrent.futures.ProcessPoolExecutor`. Very
+        large batches are split into tasks counted by the executor, which also
+        parallelizes converting the contents.
+
+    Returns:
+      A `CountTokensResult` for each contents, in the same order.
+
+    Usage:
+
+    .. code-block:: python
+
+      from google import genai
+      tokenizer = genai.LocalTokenizer(model_name='gemini-2.0-flash-001')
+      results = tokenizer.count_tokens_batch(["Hi!", "What is your name?"])
+      print([result.total_tokens for result in results])
+      # [3, 5]
+    """
+    config = types.CountTokensConfig.model_validate(config or {})
+    if executor is not None and len(contents_list) > _EXECUTOR_TASK_SIZE:
+      tasks = [
+          contents_list[i : i + _EXECUTOR_TASK_SIZE]
+          for i in range(0, len(contents_list), _EXECUTOR_TASK_SIZE)
+      ]
+      totals: list[int] = []
+      for task_totals in executor.map(
+          functools.partial(
+              _count_tokens_batch_task,
+              self._model_name,
+              config=config,
+              num_threads=num_threads,
+          ),
+          tasks,
+      ):
+        totals.extend(task_totals)
+    else:
+      totals = self._count_tokens_batch(
+          contents_list, config=config, num_threads=num_threads
+      )
+    return [types.CountTokensResult(total_tokens=total) for total in totals]
+
+  def _count_tokens_batch(
+      self,
+      contents_list: Sequence[
+          Union[types.ContentListUnion, types.ContentListUnionDict]
+      ],
+      *,
+      config: types.CountTokensConfig,
+      num_threads: int,
+  ) -> list[int]:
+    config_accumulator = _TextsAccumulator()
+    if config.tools:
+      config_accumulator.add_tools(config.tools)
+    if config.generation_config and config.generation_config.response_schema:
+      config_accumulator.add_schema(config.generation_config.response_schema)
+    if config.system_instruction:
+      config_accumulator.add_contents(t.t_contents([config.system_instruction]))
+    config_texts = list(config_accumulator.get_texts())
+
+    texts_list = []
+    for contents in contents_list:
+      text_accumulator = _TextsAccumulator()
+      text_accumulator.add_contents(t.t_contents(contents))
+      texts_list.append(list(text_accumulator.get_texts()))
+
+    counts = self._count_texts(config_texts, texts_list, num_threads)
+    config_total = sum(counts[text] for text in config_texts)
+    return [
+        config_total + sum(counts[text] for text in texts)
+        for texts in texts_list
+    ]
+
+  def _count_texts(
+      self,
+      config_texts: list[str],
+      texts_list: list[list[str]],
+      num_threads: int,
+  ) -> dict[str, int]:
+    """Returns the token count of every text, encoding the uncached ones."""
+    counts: dict[str, int] = {}
+    misses: list[str] = []
+    with self._token_counts_lock:
+      for texts in (config_texts, *texts_list):
+        for text in texts:
+          if text in counts:
+            continue
+          count = self._token_counts.get(text)
+          if count is None:
+            misses.append(text)
+            count = 0
+          else:
+            self._token_counts.move_to_end(text)
+          counts[text] = count
+    if misses:
+      # Texts are encoded without holding the lock, so other threads keep
+      # using the cache in the meantime.
+      tokens_list = self._tokenizer.encode(misses, num_threads=num_threads)
+      with self._token_counts_lock:
+        for text, tokens in zip(misses, tokens_list):
+          counts[text] = self._token_counts[text] = len(tokens)
+        while len(self._token_counts) > _TOKEN_COUNT_CACHE_SIZE:
+          self._token_counts.popitem(last=False)
+    return counts
+
   @_common.experimental_warning(
       "The SDK's local tokenizer implementation is experimental and may change"
       " in the future. It only supports text based tokenization."
@@ -393,3 +536,23 @@ class LocalTokenizer:
           )
       )
     return types.ComputeTokensResult(tokens_info=token_infos)
+
+
+@functools.lru_cache()
+def _get_task_tokenizer(model_name: str) -> LocalTokenizer:
+  return LocalTokenizer(model_name)
+
+
+def _count_tokens_batch_task(
+    model_name: str,
+    contents_list: Sequence[
+        Union[types.ContentListUnion, types.ContentListUnionDict]
+    ],
+    *,
+    config: types.CountTokensConfig,
+    num_threads: int,
+) -> list[int]:
+  """Counts tokens of a part of a batch, e.g. in a worker process."""
+  return _get_task_tokenizer(model_name)._count_tokens_batch(
+      contents_list, config=config, num_threads=num_threads
+  )
@@ -15,7 +15,6 @@
 
 # Code generated by the Google Gen AI SDK generator DO NOT EDIT.
 
-import json
 import logging
 from typing import Any, AsyncIterator, Awaitable, Iterator, Optional, Union
 from urllib.parse import urlencode
@@ -3773,6 +3772,10 @@ class Models(_api_module.BaseModule):
       contents: Union[types.ContentListUnion, types.ContentListUnionDict],
       config: Optional[types.GenerateContentConfigOrDict] = None,
   ) -> types.GenerateContentResponse:
+    self._api_client._mark_build_start()
+    contents_cache, cached_contents, contents = _split_cached_contents(
+        contents
+    )
     parameter_model = types._GenerateContentParameters(
         model=model,
         contents=contents,
@@ -3812,8 +3815,10 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
+    if contents_cache is not None:
+      contents_cache.add(contents, request_dict['contents'])
+      request_dict['contents'] = cached_contents + request_dict['contents']
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
@@ -3826,7 +3831,9 @@ class Models(_api_module.BaseModule):
       self._api_client._verify_response(return_value)
       return return_value
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _GenerateContentResponse_from_vertex(response_dict)
@@ -3835,7 +3842,8 @@ class Models(_api_module.BaseModule):
       response_dict = _GenerateContentResponse_from_mldev(response_dict)
 
     return_value = types.GenerateContentResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -3850,6 +3858,10 @@ class Models(_api_module.BaseModule):
       contents: Union[types.ContentListUnion, types.ContentListUnionDict],
       config: Optional[types.GenerateContentConfigOrDict] = None,
   ) -> Iterator[types.GenerateContentResponse]:
+    self._api_client._mark_build_start()
+    contents_cache, cached_contents, contents = _split_cached_contents(
+        contents
+    )
     parameter_model = types._GenerateContentParameters(
         model=model,
         contents=contents,
@@ -3893,8 +3905,10 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
+    if contents_cache is not None:
+      contents_cache.add(contents, request_dict['contents'])
+      request_dict['contents'] = cached_contents + request_dict['contents']
 
     if config is not None and getattr(
         config, 'should_return_http_response', None
@@ -3908,7 +3922,9 @@ class Models(_api_module.BaseModule):
         'post', path, request_dict, http_options
     ):
 
-      response_dict = {} if not response.body else json.loads(response.body)
+      response_dict = (
+          {} if not response.body else _common.json_loads(response.body)
+      )
 
       if self._api_client.vertexai:
         response_dict = _GenerateContentResponse_from_vertex(response_dict)
@@ -3917,7 +3933,8 @@ class Models(_api_module.BaseModule):
         response_dict = _GenerateContentResponse_from_mldev(response_dict)
 
       return_value = types.GenerateContentResponse._from_response(
-          response=response_dict, kwargs=parameter_model.model_dump()
+          response=response_dict,
+          kwargs=_common.get_response_kwargs(parameter_model),
       )
       return_value.sdk_http_response = types.HttpResponse(
           headers=response.headers
@@ -3994,14 +4011,15 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _EmbedContentResponse_from_vertex(response_dict)
@@ -4010,7 +4028,8 @@ class Models(_api_module.BaseModule):
       response_dict = _EmbedContentResponse_from_mldev(response_dict)
 
     return_value = types.EmbedContentResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -4066,14 +4085,15 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _GenerateImagesResponse_from_vertex(response_dict)
@@ -4082,7 +4102,8 @@ class Models(_api_module.BaseModule):
       response_dict = _GenerateImagesResponse_from_mldev(response_dict)
 
     return_value = types.GenerateImagesResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -4133,20 +4154,22 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _EditImageResponse_from_vertex(response_dict)
 
     return_value = types.EditImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -4197,20 +4220,22 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _UpscaleImageResponse_from_vertex(response_dict)
 
     return_value = types.UpscaleImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -4305,20 +4330,22 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _RecontextImageResponse_from_vertex(response_dict)
 
     return_value = types.RecontextImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -4388,20 +4415,22 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _SegmentImageResponse_from_vertex(response_dict)
 
     return_value = types.SegmentImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -4448,12 +4477,13 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _Model_from_vertex(response_dict)
@@ -4462,7 +4492,8 @@ class Models(_api_module.BaseModule):
       response_dict = _Model_from_mldev(response_dict)
 
     return_value = types.Model._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -4508,12 +4539,13 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ListModelsResponse_from_vertex(response_dict)
@@ -4522,7 +4554,8 @@ class Models(_api_module.BaseModule):
       response_dict = _ListModelsResponse_from_mldev(response_dict)
 
     return_value = types.ListModelsResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -4574,14 +4607,15 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'patch', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _Model_from_vertex(response_dict)
@@ -4590,7 +4624,8 @@ class Models(_api_module.BaseModule):
       response_dict = _Model_from_mldev(response_dict)
 
     return_value = types.Model._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -4640,14 +4675,15 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _DeleteModelResponse_from_vertex(response_dict)
@@ -4656,7 +4692,8 @@ class Models(_api_module.BaseModule):
       response_dict = _DeleteModelResponse_from_mldev(response_dict)
 
     return_value = types.DeleteModelResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -4731,14 +4768,15 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _CountTokensResponse_from_vertex(response_dict)
@@ -4747,7 +4785,8 @@ class Models(_api_module.BaseModule):
       response_dict = _CountTokensResponse_from_mldev(response_dict)
 
     return_value = types.CountTokensResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -4817,20 +4856,22 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ComputeTokensResponse_from_vertex(response_dict)
 
     return_value = types.ComputeTokensResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -4892,14 +4933,15 @@ class Models(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _GenerateVideosOperation_from_vertex(response_dict)
@@ -4908,7 +4950,8 @@ class Models(_api_module.BaseModule):
       response_dict = _GenerateVideosOperation_from_mldev(response_dict)
 
     return_value = types.GenerateVideosOperation._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -4998,7 +5041,19 @@ class Models(_api_module.BaseModule):
     logger.info(
         f'AFC is enabled with max remote calls: {remaining_remote_calls_afc}.'
     )
+    function_response_hook = _extra_utils.get_function_response_hook(
+        parsed_config
+    )
+    max_concurrent_function_calls = (
+        _extra_utils.get_max_concurrent_function_calls(parsed_config)
+    )
+    function_call_timeout = _extra_utils.get_function_call_timeout(
+        parsed_config
+    )
+    instrumentation = _extra_utils.get_instrumentation(self._api_client)
     automatic_function_calling_history: list[types.Content] = []
+    # The function map only depends on the config, build it once.
+    function_map: Optional[dict[str, Any]] = None
     response = types.GenerateContentResponse()
     i = 0
     while remaining_remote_calls_afc > 0:
@@ -5007,7 +5062,8 @@ class Models(_api_module.BaseModule):
           model=model, contents=contents, config=parsed_config
       )
 
-      function_map = _extra_utils.get_function_map(parsed_config)
+      if function_map is None:
+        function_map = _extra_utils.get_function_map(parsed_config)
       if not function_map:
         break
       if not response:
@@ -5019,7 +5075,12 @@ class Models(_api_module.BaseModule):
       ):
         break
       func_response_parts = _extra_utils.get_function_response_parts(
-          response, function_map
+          response,
+          function_map,
+          function_response_hook,
+          max_concurrent_function_calls=max_concurrent_function_calls,
+          function_call_timeout=function_call_timeout,
+          instrumentation=instrumentation,
       )
       if not func_response_parts:
         break
@@ -5033,7 +5094,7 @@ class Models(_api_module.BaseModule):
           role='user',
           parts=func_response_parts,
       )
-      contents = t.t_contents(contents)  # type: ignore[assignment]
+      contents = _CachedContents.like(contents, t.t_contents(contents))
       if not automatic_function_calling_history:
         automatic_function_calling_history.extend(contents)  # type: ignore[arg-type]
       if isinstance(contents, list):
@@ -5050,6 +5111,35 @@ class Models(_api_module.BaseModule):
       )
     return response
 
+  def prepare(
+      self,
+      *,
+      model: str,
+      config: Optional[types.GenerateContentConfigOrDict] = None,
+  ) -> 'PreparedGenerateContent':
+    """Prepares a model and config for repeated generate_content calls.
+
+    The model and config are validated, converted and serialized once.
+    Calls on the returned object only convert the contents, which saves the
+    per-call config validation done by `generate_content`. Use it when the
+    same config is sent many times, for example with a fixed system
+    instruction and tools.
+
+    Usage:
+
+    .. code-block:: python
+
+      prepared = client.models.prepare(
+          model='gemini-2.0-flash',
+          config=types.GenerateContentConfig(
+              system_instruction='Answer in one sentence.',
+          ),
+      )
+      response = prepared.generate_content(contents='Why is the sky blue?')
+      print(response.text)
+    """
+    return PreparedGenerateContent(self, model=model, config=config)
+
   def generate_content_stream(
       self,
       *,
@@ -5136,7 +5226,19 @@ class Models(_api_module.BaseModule):
     logger.info(
         f'AFC is enabled with max remote calls: {remaining_remote_calls_afc}.'
     )
+    function_response_hook = _extra_utils.get_function_response_hook(
+        parsed_config
+    )
+    max_concurrent_function_calls = (
+        _extra_utils.get_max_concurrent_function_calls(parsed_config)
+    )
+    function_call_timeout = _extra_utils.get_function_call_timeout(
+        parsed_config
+    )
+    instrumentation = _extra_utils.get_instrumentation(self._api_client)
     automatic_function_calling_history: list[types.Content] = []
+    # The function map only depends on the config, build it once.
+    function_map: Optional[dict[str, Any]] = None
     chunk = None
     func_response_parts = None
     i = 0
@@ -5146,7 +5248,8 @@ class Models(_api_module.BaseModule):
           model=model, contents=contents, config=parsed_config
       )
 
-      function_map = _extra_utils.get_function_map(parsed_config)
+      if function_map is None:
+        function_map = _extra_utils.get_function_map(parsed_config)
 
       if i == 1:
         # First request gets a function call.
@@ -5164,7 +5267,12 @@ class Models(_api_module.BaseModule):
             ):
               break
             func_response_parts = _extra_utils.get_function_response_parts(
-                chunk, function_map
+                chunk,
+                function_map,
+                function_response_hook,
+                max_concurrent_function_calls=max_concurrent_function_calls,
+                function_call_timeout=function_call_timeout,
+                instrumentation=instrumentation,
             )
             if not func_response_parts:
               _extra_utils.append_chunk_contents(contents, chunk)
@@ -5187,7 +5295,12 @@ class Models(_api_module.BaseModule):
         ):
           break
         func_response_parts = _extra_utils.get_function_response_parts(
-            chunk, function_map
+            chunk,
+            function_map,
+            function_response_hook,
+            max_concurrent_function_calls=max_concurrent_function_calls,
+            function_call_timeout=function_call_timeout,
+            instrumentation=instrumentation,
         )
 
       if not function_map:
@@ -5206,7 +5319,7 @@ class Models(_api_module.BaseModule):
             role='user',
             parts=func_response_parts,
         )
-        contents = t.t_contents(contents)  # type: ignore[assignment]
+        contents = _CachedContents.like(contents, t.t_contents(contents))
         if not automatic_function_calling_history:
           automatic_function_calling_history.extend(contents)  # type: ignore[arg-type]
         if isinstance(contents, list) and func_call_content is not None:
@@ -5552,6 +5665,10 @@ class AsyncModels(_api_module.BaseModule):
       contents: Union[types.ContentListUnion, types.ContentListUnionDict],
       config: Optional[types.GenerateContentConfigOrDict] = None,
   ) -> types.GenerateContentResponse:
+    self._api_client._mark_build_start()
+    contents_cache, cached_contents, contents = _split_cached_contents(
+        contents
+    )
     parameter_model = types._GenerateContentParameters(
         model=model,
         contents=contents,
@@ -5591,8 +5708,10 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
+    if contents_cache is not None:
+      contents_cache.add(contents, request_dict['contents'])
+      request_dict['contents'] = cached_contents + request_dict['contents']
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
@@ -5605,7 +5724,9 @@ class AsyncModels(_api_module.BaseModule):
       self._api_client._verify_response(return_value)
       return return_value
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _GenerateContentResponse_from_vertex(response_dict)
@@ -5614,7 +5735,8 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _GenerateContentResponse_from_mldev(response_dict)
 
     return_value = types.GenerateContentResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -5629,6 +5751,10 @@ class AsyncModels(_api_module.BaseModule):
       contents: Union[types.ContentListUnion, types.ContentListUnionDict],
       config: Optional[types.GenerateContentConfigOrDict] = None,
   ) -> Awaitable[AsyncIterator[types.GenerateContentResponse]]:
+    self._api_client._mark_build_start()
+    contents_cache, cached_contents, contents = _split_cached_contents(
+        contents
+    )
     parameter_model = types._GenerateContentParameters(
         model=model,
         contents=contents,
@@ -5672,8 +5798,10 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
+    if contents_cache is not None:
+      contents_cache.add(contents, request_dict['contents'])
+      request_dict['contents'] = cached_contents + request_dict['contents']
 
     if config is not None and getattr(
         config, 'should_return_http_response', None
@@ -5690,7 +5818,9 @@ class AsyncModels(_api_module.BaseModule):
     async def async_generator():  # type: ignore[no-untyped-def]
       async for response in response_stream:
 
-        response_dict = {} if not response.body else json.loads(response.body)
+        response_dict = (
+            {} if not response.body else _common.json_loads(response.body)
+        )
 
         if self._api_client.vertexai:
           response_dict = _GenerateContentResponse_from_vertex(response_dict)
@@ -5699,7 +5829,8 @@ class AsyncModels(_api_module.BaseModule):
           response_dict = _GenerateContentResponse_from_mldev(response_dict)
 
         return_value = types.GenerateContentResponse._from_response(
-            response=response_dict, kwargs=parameter_model.model_dump()
+            response=response_dict,
+            kwargs=_common.get_response_kwargs(parameter_model),
         )
         return_value.sdk_http_response = types.HttpResponse(
             headers=response.headers
@@ -5778,14 +5909,15 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _EmbedContentResponse_from_vertex(response_dict)
@@ -5794,7 +5926,8 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _EmbedContentResponse_from_mldev(response_dict)
 
     return_value = types.EmbedContentResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -5850,14 +5983,15 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _GenerateImagesResponse_from_vertex(response_dict)
@@ -5866,7 +6000,8 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _GenerateImagesResponse_from_mldev(response_dict)
 
     return_value = types.GenerateImagesResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -5917,20 +6052,22 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _EditImageResponse_from_vertex(response_dict)
 
     return_value = types.EditImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -5981,20 +6118,22 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _UpscaleImageResponse_from_vertex(response_dict)
 
     return_value = types.UpscaleImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -6089,20 +6228,22 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _RecontextImageResponse_from_vertex(response_dict)
 
     return_value = types.RecontextImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -6175,20 +6316,22 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _SegmentImageResponse_from_vertex(response_dict)
 
     return_value = types.SegmentImageResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -6235,14 +6378,15 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _Model_from_vertex(response_dict)
@@ -6251,7 +6395,8 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _Model_from_mldev(response_dict)
 
     return_value = types.Model._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -6297,14 +6442,15 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ListModelsResponse_from_vertex(response_dict)
@@ -6313,7 +6459,8 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _ListModelsResponse_from_mldev(response_dict)
 
     return_value = types.ListModelsResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -6365,14 +6512,15 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'patch', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _Model_from_vertex(response_dict)
@@ -6381,7 +6529,8 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _Model_from_mldev(response_dict)
 
     return_value = types.Model._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -6431,14 +6580,15 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'delete', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _DeleteModelResponse_from_vertex(response_dict)
@@ -6447,7 +6597,8 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _DeleteModelResponse_from_mldev(response_dict)
 
     return_value = types.DeleteModelResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -6522,14 +6673,15 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _CountTokensResponse_from_vertex(response_dict)
@@ -6538,7 +6690,8 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _CountTokensResponse_from_mldev(response_dict)
 
     return_value = types.CountTokensResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -6607,20 +6760,22 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _ComputeTokensResponse_from_vertex(response_dict)
 
     return_value = types.ComputeTokensResponse._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
     return_value.sdk_http_response = types.HttpResponse(
         headers=response.headers
@@ -6682,14 +6837,15 @@ class AsyncModels(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     if self._api_client.vertexai:
       response_dict = _GenerateVideosOperation_from_vertex(response_dict)
@@ -6698,7 +6854,8 @@ class AsyncModels(_api_module.BaseModule):
       response_dict = _GenerateVideosOperation_from_mldev(response_dict)
 
     return_value = types.GenerateVideosOperation._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -6756,7 +6913,19 @@ class AsyncModels(_api_module.BaseModule):
     logger.info(
         f'AFC is enabled with max remote calls: {remaining_remote_calls_afc}.'
     )
+    function_response_hook = _extra_utils.get_function_response_hook(
+        parsed_config
+    )
+    max_concurrent_function_calls = (
+        _extra_utils.get_max_concurrent_function_calls(parsed_config)
+    )
+    function_call_timeout = _extra_utils.get_function_call_timeout(
+        parsed_config
+    )
+    instrumentation = _extra_utils.get_instrumentation(self._api_client)
     automatic_function_calling_history: list[types.Content] = []
+    # The function map only depends on the config, build it once.
+    function_map: Optional[dict[str, Any]] = None
     response = types.GenerateContentResponse()
     while remaining_remote_calls_afc > 0:
       response = await self._generate_content(
@@ -6766,9 +6935,12 @@ class AsyncModels(_api_module.BaseModule):
       if remaining_remote_calls_afc == 0:
         logger.info('Reached max remote calls for automatic function calling.')
 
-      function_map = _extra_utils.get_function_map(
-          parsed_config, mcp_to_genai_tool_adapters, is_caller_method_async=True
-      )
+      if function_map is None:
+        function_map = _extra_utils.get_function_map(
+            parsed_config,
+            mcp_to_genai_tool_adapters,
+            is_caller_method_async=True,
+        )
       if not function_map:
         break
       if not response:
@@ -6781,7 +6953,12 @@ class AsyncModels(_api_module.BaseModule):
         break
       func_response_parts = (
           await _extra_utils.get_function_response_parts_async(
-              response, function_map
+              response,
+              function_map,
+              function_response_hook,
+              max_concurrent_function_calls=max_concurrent_function_calls,
+              function_call_timeout=function_call_timeout,
+              instrumentation=instrumentation,
           )
       )
       if not func_response_parts:
@@ -6791,7 +6968,7 @@ class AsyncModels(_api_module.BaseModule):
           role='user',
           parts=func_response_parts,
       )
-      contents = t.t_contents(contents)  # type: ignore[assignment]
+      contents = _CachedContents.like(contents, t.t_contents(contents))
       if not automatic_function_calling_history:
         automatic_function_calling_history.extend(contents)  # type: ignore[arg-type]
       if isinstance(contents, list):
@@ -6809,6 +6986,36 @@ class AsyncModels(_api_module.BaseModule):
       )
     return response
 
+  def prepare(
+      self,
+      *,
+      model: str,
+      config: Optional[types.GenerateContentConfigOrDict] = None,
+  ) -> 'AsyncPreparedGenerateContent':
+    """Prepares a model and config for repeated generate_content calls.
+
+    The model and config are validated, converted and serialized once.
+    Calls on the returned object only convert the contents, which saves the
+    per-call config validation done by `generate_content`. MCP sessions are
+    not supported in prepared requests.
+
+    Usage:
+
+    .. code-block:: python
+
+      prepared = client.aio.models.prepare(
+          model='gemini-2.0-flash',
+          config=types.GenerateContentConfig(
+              system_instruction='Answer in one sentence.',
+          ),
+      )
+      response = await prepared.generate_content(
+          contents='Why is the sky blue?'
+      )
+      print(response.text)
+    """
+    return AsyncPreparedGenerateContent(self, model=model, config=config)
+
   async def generate_content_stream(
       self,
       *,
@@ -6894,7 +7101,15 @@ class AsyncModels(_api_module.BaseModule):
       logger.info(
           f'AFC is enabled with max remote calls: {remaining_remote_calls_afc}.'
       )
+      function_response_hook = _extra_utils.get_function_response_hook(config)
+      max_concurrent_function_calls = (
+          _extra_utils.get_max_concurrent_function_calls(config)
+      )
+      function_call_timeout = _extra_utils.get_function_call_timeout(config)
+      instrumentation = _extra_utils.get_instrumentation(self._api_client)
       automatic_function_calling_history: list[types.Content] = []
+      # The function map only depends on the config, build it once.
+      function_map: Optional[dict[str, Any]] = None
       func_response_parts = None
       chunk = None
       i = 0
@@ -6912,9 +7127,10 @@ class AsyncModels(_api_module.BaseModule):
               'Reached max remote calls for automatic function calling.'
           )
 
-        function_map = _extra_utils.get_function_map(
-            config, mcp_to_genai_tool_adapters, is_caller_method_async=True
-        )
+        if function_map is None:
+          function_map = _extra_utils.get_function_map(
+              config, mcp_to_genai_tool_adapters, is_caller_method_async=True
+          )
 
         if i == 1:
           # First request gets a function call.
@@ -6933,7 +7149,12 @@ class AsyncModels(_api_module.BaseModule):
                 break
               func_response_parts = (
                   await _extra_utils.get_function_response_parts_async(
-                      chunk, function_map
+                      chunk,
+                      function_map,
+                      function_response_hook,
+                      max_concurrent_function_calls=max_concurrent_function_calls,
+                      function_call_timeout=function_call_timeout,
+                      instrumentation=instrumentation,
                   )
               )
               if not func_response_parts:
@@ -6959,7 +7180,12 @@ class AsyncModels(_api_module.BaseModule):
             break
           func_response_parts = (
               await _extra_utils.get_function_response_parts_async(
-                  chunk, function_map
+                  chunk,
+                  function_map,
+                  function_response_hook,
+                  max_concurrent_function_calls=max_concurrent_function_calls,
+                  function_call_timeout=function_call_timeout,
+                  instrumentation=instrumentation,
               )
           )
         if not function_map:
@@ -6976,7 +7202,7 @@ class AsyncModels(_api_module.BaseModule):
             role='user',
             parts=func_response_parts,
         )
-        contents = t.t_contents(contents)
+        contents = _CachedContents.like(contents, t.t_contents(contents))
         if not automatic_function_calling_history:
           automatic_function_calling_history.extend(contents)
         if isinstance(contents, list) and func_call_content is not None:
@@ -7315,3 +7541,413 @@ class AsyncModels(_api_module.BaseModule):
         source=source,
         config=config,
     )
+
+
+class _ContentsCache:
+  """The wire format of contents that are sent again with every request.
+
+  A chat session sends its whole history with each message. The history
+  contents are validated and converted when first sent, and their wire format
+  is reused by the following requests. Contents are looked up by identity, so
+  a content must not be modified in place once sent.
+  """
+
+  def __init__(self) -> None:
+    self._entries: dict[int, tuple[types.Content, Any]] = {}
+
+  def split(self, contents: list[Any]) -> tuple[list[Any], list[Any]]:
+    """Returns the wire format of the leading cached contents, and the rest.
+
+    The contents that are no longer sent are dropped from the cache. The last
+    content is never taken from the cache, so the rest is not empty.
+    """
+    entries: dict[int, tuple[types.Content, Any]] = {}
+    serialized = []
+    for content in contents[:-1]:
+      entry = self._entries.get(id(content))
+      if entry is None or entry[0] is not content:
+        break
+      entries[id(content)] = entry
+      serialized.append(entry[1])
+    self._entries = entries
+    return serialized, contents[len(serialized) :]
+
+  def add(
+      self,
+      contents: Union[types.ContentListUnion, types.ContentListUnionDict],
+      serialized: Any,
+  ) -> None:
+    """Caches the wire format of the contents that followed the cached ones."""
+    if (
+        not isinstance(contents, list)
+        or not isinstance(serialized, list)
+        or len(serialized) != len(contents)
+    ):
+      # The contents were merged or split by `t_contents`.
+      return
+    entries: dict[int, tuple[types.Content, Any]] = {}
+    for content, item in zip(contents, serialized):
+      if not isinstance(content, types.Content):
+        return
+      entries[id(content)] = (content, item)
+    self._entries.update(entries)
+
+
+class _CachedContents(list):  # type: ignore[type-arg]
+  """Contents whose leading items may have a cached wire format."""
+
+  def __init__(self, contents: Any, cache: _ContentsCache):
+    super().__init__(contents)
+    self.cache = cache
+
+  @classmethod
+  def like(cls, original: Any, contents: Any) -> Any:
+    """Returns `contents` with the cache of `original`, if it has one."""
+    if isinstance(original, cls):
+      return cls(contents, original.cache)
+    return contents
+
+
+def _split_cached_contents(
+    contents: Union[types.ContentListUnion, types.ContentListUnionDict],
+) -> tuple[
+    Optional[_ContentsCache],
+    list[Any],
+    Union[types.ContentListUnion, types.ContentListUnionDict],
+]:
+  """Splits off the leading contents that have a cached wire format.
+
+  Returns:
+    The cache of the contents, or None if they have none, the wire format of
+    the leading cached contents, and the contents that are left to convert.
+  """
+  if not isinstance(contents, _CachedContents):
+    return None, [], contents
+  serialized, rest = contents.cache.split(contents)
+  return contents.cache, serialized, rest
+
+
+class _BasePreparedGenerateContent:
+  """The static part of a generate_content request, validated once.
+
+  The model and config are validated, converted to the wire format and
+  serialized when the object is created. Each call only converts the contents
+  and merges them into a copy of the prepared request body.
+  """
+
+  def __init__(
+      self,
+      api_client: BaseApiClient,
+      *,
+      model: str,
+      config: Optional[types.GenerateContentConfigOrDict] = None,
+  ):
+    self._api_client = api_client
+    parsed_config = _extra_utils.parse_config_for_mcp_usage(config)
+    if (
+        parsed_config
+        and parsed_config.tools
+        and _mcp_utils.has_mcp_session_usage(parsed_config.tools)
+    ):
+      raise errors.UnsupportedFunctionError(
+          'MCP sessions are not supported in prepared requests.'
+      )
+    self._model = model
+    self._config = parsed_config
+    parameter_model = types._GenerateContentParameters(
+        model=model, config=parsed_config
+    )
+
+    if api_client.vertexai:
+      request_dict = _GenerateContentParameters_to_vertex(
+          api_client, parameter_model
+      )
+    else:
+      request_dict = _GenerateContentParameters_to_mldev(
+          api_client, parameter_model
+      )
+    request_url_dict = request_dict.get('_url')
+    if request_url_dict:
+      path = '{model}:generateContent'.format_map(request_url_dict)
+    else:
+      path = '{model}:generateContent'
+    query_params = request_dict.get('_query')
+    if query_params:
+      path = f'{path}?{urlencode(query_params)}'
+    request_dict.pop('config', None)
+    self._path = path
+
+    self._http_options: Optional[types.HttpOptions] = None
+    if (
+        parameter_model.config is not None
+        and parameter_model.config.http_options is not None
+    ):
+      self._http_options = parameter_model.config.http_options
+
+    self._request_dict = _common.convert_to_json_dict(request_dict)
+    self._response_kwargs = _common.get_response_kwargs(parameter_model)
+    self._should_return_http_response = bool(
+        parsed_config is not None and parsed_config.should_return_http_response
+    )
+
+    self._disable_afc = _extra_utils.should_disable_afc(parsed_config)
+    if not self._disable_afc:
+      self._max_remote_calls_afc = _extra_utils.get_max_remote_calls_afc(
+          parsed_config
+      )
+      self._function_response_hook = (
+          _extra_utils.get_function_response_hook(parsed_config)
+      )
+      self._max_concurrent_function_calls = (
+          _extra_utils.get_max_concurrent_function_calls(parsed_config)
+      )
+      self._function_call_timeout = _extra_utils.get_function_call_timeout(
+          parsed_config
+      )
+      self._instrumentation = _extra_utils.get_instrumentation(api_client)
+      self._should_append_afc_history = (
+          _extra_utils.should_append_afc_history(parsed_config)
+      )
+
+  @property
+  def model(self) -> str:
+    return self._model
+
+  @property
+  def config(self) -> Optional[types.GenerateContentConfig]:
+    return self._config
+
+  def _convert_contents(self, contents: list[types.Content]) -> list[Any]:
+    """Converts contents to their serialized wire format."""
+    if self._api_client.vertexai:
+      items: list[Any] = list(contents)
+    else:
+      items = [_Content_to_mldev(item) for item in contents]
+    return _common.convert_to_json_dict(items)  # type: ignore[no-any-return]
+
+  def _request_dict_with_contents(
+      self, converted_contents: list[Any]
+  ) -> dict[str, Any]:
+    request_dict = dict(self._request_dict)
+    request_dict['contents'] = converted_contents
+    return request_dict
+
+  def _parse_response(
+      self, response: types.HttpResponse
+  ) -> types.GenerateContentResponse:
+    if self._should_return_http_response:
+      return_value = types.GenerateContentResponse(sdk_http_response=response)
+      self._api_client._verify_response(return_value)
+      return return_value
+
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
+
+    if self._api_client.vertexai:
+      response_dict = _GenerateContentResponse_from_vertex(response_dict)
+    else:
+      response_dict = _GenerateContentResponse_from_mldev(response_dict)
+
+    return_value = types.GenerateContentResponse._from_response(
+        response=response_dict, kwargs=self._response_kwargs
+    )
+    return_value.sdk_http_response = types.HttpResponse(
+        headers=response.headers
+    )
+    self._api_client._verify_response(return_value)
+    return return_value
+
+  @staticmethod
+  def _get_function_call_content(
+      response: types.GenerateContentResponse,
+  ) -> Optional[types.Content]:
+    if (
+        not response.candidates
+        or not response.candidates[0].content
+        or not response.candidates[0].content.parts
+    ):
+      return None
+    return response.candidates[0].content
+
+
+class PreparedGenerateContent(_BasePreparedGenerateContent):
+  """A generate_content request with a prepared model and config.
+
+  Created with `client.models.prepare`.
+  """
+
+  def __init__(
+      self,
+      models: 'Models',
+      *,
+      model: str,
+      config: Optional[types.GenerateContentConfigOrDict] = None,
+  ):
+    super().__init__(models._api_client, model=model, config=config)
+    self._function_map: dict[str, Any] = {}
+    if not self._disable_afc:
+      self._function_map = _extra_utils.get_function_map(self._config)
+
+  def generate_content(
+      self,
+      *,
+      contents: Union[types.ContentListUnion, types.ContentListUnionDict],
+  ) -> types.GenerateContentResponse:
+    """Makes a generate_content request with the prepared model and config.
+
+    Automatic function calling behaves as in `Models.generate_content`.
+    """
+    self._api_client._mark_build_start()
+    request_contents = t.t_contents(contents)
+    converted_contents = self._convert_contents(request_contents)
+    if self._disable_afc:
+      return self._parse_response(
+          self._api_client.request(
+              'post',
+              self._path,
+              self._request_dict_with_contents(converted_contents),
+              self._http_options,
+          )
+      )
+
+    automatic_function_calling_history: list[types.Content] = []
+    response = types.GenerateContentResponse()
+    remaining_remote_calls_afc = self._max_remote_calls_afc
+    while remaining_remote_calls_afc > 0:
+      response = self._parse_response(
+          self._api_client.request(
+              'post',
+              self._path,
+              self._request_dict_with_contents(converted_contents),
+              self._http_options,
+          )
+      )
+      if not self._function_map:
+        break
+      func_call_content = self._get_function_call_content(response)
+      if func_call_content is None:
+        break
+      func_response_parts = _extra_utils.get_function_response_parts(
+          response,
+          self._function_map,
+          self._function_response_hook,
+          max_concurrent_function_calls=self._max_concurrent_function_calls,
+          function_call_timeout=self._function_call_timeout,
+          instrumentation=self._instrumentation,
+      )
+      if not func_response_parts:
+        break
+      remaining_remote_calls_afc -= 1
+      func_response_content = types.Content(
+          role='user', parts=func_response_parts
+      )
+      if not automatic_function_calling_history:
+        automatic_function_calling_history.extend(request_contents)
+      automatic_function_calling_history.append(func_call_content)
+      automatic_function_calling_history.append(func_response_content)
+      # Only the new turns are converted, the history is already serialized.
+      converted_contents = converted_contents + self._convert_contents(
+          [func_call_content, func_response_content]
+      )
+      if remaining_remote_calls_afc == 0:
+        logger.info('Reached max remote calls for automatic function calling.')
+
+    if self._should_append_afc_history:
+      response.automatic_function_calling_history = (
+          automatic_function_calling_history
+      )
+    return response
+
+
+class AsyncPreparedGenerateContent(_BasePreparedGenerateContent):
+  """An async generate_content request with a prepared model and config.
+
+  Created with `client.aio.models.prepare`.
+  """
+
+  def __init__(
+      self,
+      models: 'AsyncModels',
+      *,
+      model: str,
+      config: Optional[types.GenerateContentConfigOrDict] = None,
+  ):
+    super().__init__(models._api_client, model=model, config=config)
+    self._function_map: dict[str, Any] = {}
+    if not self._disable_afc:
+      self._function_map = _extra_utils.get_function_map(
+          self._config, is_caller_method_async=True
+      )
+
+  async def generate_content(
+      self,
+      *,
+      contents: Union[types.ContentListUnion, types.ContentListUnionDict],
+  ) -> types.GenerateContentResponse:
+    """Makes a generate_content request with the prepared model and config.
+
+    Automatic function calling behaves as in `AsyncModels.generate_content`.
+    """
+    self._api_client._mark_build_start()
+    request_contents = t.t_contents(contents)
+    converted_contents = self._convert_contents(request_contents)
+    if self._disable_afc:
+      return self._parse_response(
+          await self._api_client.async_request(
+              'post',
+              self._path,
+              self._request_dict_with_contents(converted_contents),
+              self._http_options,
+          )
+      )
+
+    automatic_function_calling_history: list[types.Content] = []
+    response = types.GenerateContentResponse()
+    remaining_remote_calls_afc = self._max_remote_calls_afc
+    while remaining_remote_calls_afc > 0:
+      response = self._parse_response(
+          await self._api_client.async_request(
+              'post',
+              self._path,
+              self._request_dict_with_contents(converted_contents),
+              self._http_options,
+          )
+      )
+      if not self._function_map:
+        break
+      func_call_content = self._get_function_call_content(response)
+      if func_call_content is None:
+        break
+      func_response_parts = (
+          await _extra_utils.get_function_response_parts_async(
+              response,
+              self._function_map,
+              self._function_response_hook,
+              max_concurrent_function_calls=self._max_concurrent_function_calls,
+              function_call_timeout=self._function_call_timeout,
+              instrumentation=self._instrumentation,
+          )
+      )
+      if not func_response_parts:
+        break
+      remaining_remote_calls_afc -= 1
+      func_response_content = types.Content(
+          role='user', parts=func_response_parts
+      )
+      if not automatic_function_calling_history:
+        automatic_function_calling_history.extend(request_contents)
+      automatic_function_calling_history.append(func_call_content)
+      automatic_function_calling_history.append(func_response_content)
+      # Only the new turns are converted, the history is already serialized.
+      converted_contents = converted_contents + self._convert_contents(
+          [func_call_content, func_response_content]
+      )
+      if remaining_remote_calls_afc == 0:
+        logger.info('Reached max remote calls for automatic function calling.')
+
+    if self._should_append_afc_history:
+      response.automatic_function_calling_history = (
+          automatic_function_calling_history
+      )
+    return response
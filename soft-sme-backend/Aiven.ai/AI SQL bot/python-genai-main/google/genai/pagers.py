@@ -17,8 +17,10 @@
 
 # pylint: disable=protected-access
 
-import copy
-from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Iterator, Literal, TypeVar, Union
+import asyncio
+import collections
+import concurrent.futures
+from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Iterator, Literal, Optional, TypeVar, Union
 from . import _common
 from . import types
 
@@ -47,16 +49,13 @@ class _BasePager(Generic[T]):
 
     self._sdk_http_response = getattr(response, 'sdk_http_response', None)
 
-    if not config:
-      request_config = {}
-    elif isinstance(config, dict):
-      request_config = copy.deepcopy(config)
-    else:
-      request_config = dict(config)
+    # Only the page token changes between pages, so a shallow copy is enough.
+    request_config = dict(config) if config else {}
     request_config['page_token'] = getattr(response, 'next_page_token')
     self._config = request_config
 
     self._page_size: int = request_config.get('page_size', len(self._page))
+    self._prefetch_pages: int = request_config.get('prefetch_pages') or 0
 
   def __init__(
       self,
@@ -65,6 +64,8 @@ class _BasePager(Generic[T]):
       response: Any,
       config: Any,
   ):
+    # Responses of the next pages, fetched ahead when `prefetch_pages` is set.
+    self._prefetched: collections.deque[Any] = collections.deque()
     self._init_page(name, request, response, config)
 
   @property
@@ -160,7 +161,25 @@ class _BasePager(Generic[T]):
 
 
 class Pager(_BasePager[T]):
-  """Pager class for iterating through paginated results."""
+  """Pager class for iterating through paginated results.
+
+  If ``prefetch_pages`` is set in the config, the next pages are fetched in a
+  background thread while the current page is consumed.
+  """
+
+  def __init__(
+      self,
+      name: PagedItem,
+      request: Callable[..., Any],
+      response: Any,
+      config: Any,
+  ):
+    self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+    super().__init__(name, request, response, config)
+    self._prefetch()
+
+  def __del__(self) -> None:
+    self._close_prefetch()
 
   def __next__(self) -> T:
     """Returns the next item."""
@@ -197,13 +216,88 @@ class Pager(_BasePager[T]):
     if not self.config.get('page_token'):
       raise IndexError('No more pages to fetch.')
 
-    response = self._request(config=self.config)
+    if self._prefetched:
+      try:
+        response = self._prefetched.popleft().result()
+      except Exception:
+        # The next call fetches the page again.
+        self._cancel_prefetch()
+        raise
+    else:
+      response = self._request(config=self.config)
     self._init_next_page(response)
+    self._prefetch()
     return self.page
 
+  def all_items(self) -> Iterator[T]:
+    """Returns an iterator over all the items, starting from the current page.
+
+    The items of each page are yielded in bulk, and the next pages are fetched
+    as needed, ahead of time if ``prefetch_pages`` is set in the config.
+
+    Usage:
+
+    .. code-block:: python
+
+      files = client.files.list(config={'page_size': 100, 'prefetch_pages': 2})
+      for file in files.all_items():
+        print(file.name)
+    """
+    while True:
+      yield from self.page
+      self._idx = len(self.page)
+      try:
+        self.next_page()
+      except IndexError:
+        return
+
+  def _prefetch(self) -> None:
+    """Fetches up to `prefetch_pages` pages ahead in a background thread."""
+    if not self._prefetch_pages or not self.config.get('page_token'):
+      self._close_prefetch()
+      return
+    if self._executor is None:
+      self._executor = concurrent.futures.ThreadPoolExecutor(
+          max_workers=1, thread_name_prefix='genai_pager'
+      )
+    while len(self._prefetched) < self._prefetch_pages:
+      previous = self._prefetched[-1] if self._prefetched else None
+      self._prefetched.append(
+          self._executor.submit(self._fetch_after, previous, self.config)
+      )
+
+  def _fetch_after(
+      self,
+      previous: Optional['concurrent.futures.Future[Any]'],
+      config: _common.StringDict,
+  ) -> Any:
+    """Fetches the page after `previous`, or the page of `config`."""
+    if previous is None:
+      return self._request(config=config)
+    # The executor has a single thread, so `previous` is already done.
+    page_token = getattr(previous.result(), 'next_page_token', None)
+    if not page_token:
+      return None
+    return self._request(config={**config, 'page_token': page_token})
+
+  def _cancel_prefetch(self) -> None:
+    for future in self._prefetched:
+      future.cancel()
+    self._prefetched.clear()
+
+  def _close_prefetch(self) -> None:
+    self._cancel_prefetch()
+    if self._executor is not None:
+      self._executor.shutdown(wait=False)
+      self._executor = None
+
 
 class AsyncPager(_BasePager[T]):
-  """AsyncPager class for iterating through paginated results."""
+  """AsyncPager class for iterating through paginated results.
+
+  If ``prefetch_pages`` is set in the config, the next pages are fetched in
+  asyncio tasks while the current page is consumed.
+  """
 
   def __init__(
       self,
@@ -213,6 +307,13 @@ class AsyncPager(_BasePager[T]):
       config: Any,
   ):
     super().__init__(name, request, response, config)
+    self._prefetch()
+
+  def __del__(self) -> None:
+    try:
+      self._cancel_prefetch()
+    except Exception:
+      pass
 
   def __aiter__(self) -> AsyncIterator[T]:
     """Returns an async iterator over the items."""
@@ -257,6 +358,73 @@ class AsyncPager(_BasePager[T]):
     if not self.config.get('page_token'):
       raise IndexError('No more pages to fetch.')
 
-    response = await self._request(config=self.config)
+    if self._prefetched:
+      try:
+        response = await self._prefetched.popleft()
+      except Exception:
+        # The next call fetches the page again.
+        self._cancel_prefetch()
+        raise
+    else:
+      response = await self._request(config=self.config)
     self._init_next_page(response)
+    self._prefetch()
     return self.page
+
+  async def all_items(self) -> AsyncIterator[T]:
+    """Returns an async iterator over all the items, from the current page on.
+
+    The items of each page are yielded in bulk, and the next pages are fetched
+    as needed, ahead of time if ``prefetch_pages`` is set in the config.
+
+    Usage:
+
+    .. code-block:: python
+
+      files = await client.aio.files.list(
+          config={'page_size': 100, 'prefetch_pages': 2}
+      )
+      async for file in files.all_items():
+        print(file.name)
+    """
+    while True:
+      for item in self.page:
+        yield item
+      self._idx = len(self.page)
+      try:
+        await self.next_page()
+      except IndexError:
+        return
+
+  def _prefetch(self) -> None:
+    """Fetches up to `prefetch_pages` pages ahead in asyncio tasks."""
+    if not self._prefetch_pages or not self.config.get('page_token'):
+      self._cancel_prefetch()
+      return
+    while len(self._prefetched) < self._prefetch_pages:
+      previous = self._prefetched[-1] if self._prefetched else None
+      self._prefetched.append(
+          asyncio.create_task(self._fetch_after(previous, self.config))
+      )
+
+  async def _fetch_after(
+      self,
+      previous: Optional['asyncio.Task[Any]'],
+      config: _common.StringDict,
+  ) -> Any:
+    """Fetches the page after `previous`, or the page of `config`."""
+    if previous is None:
+      return await self._request(config=config)
+    page_token = getattr(await previous, 'next_page_token', None)
+    if not page_token:
+      return None
+    return await self._request(config={**config, 'page_token': page_token})
+
+  def _cancel_prefetch(self) -> None:
+    for task in self._prefetched:
+      if not task.done():
+        task.cancel()
+      elif not task.cancelled():
+        # Retrieves the exception of a failed page, which is not raised.
+        task.exception()
+    self._prefetched.clear()
@@ -0,0 +1,308 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for waiting on batch jobs and streaming their results."""
+
+import asyncio
+import collections
+import http.server
+import json
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from ... import _api_client as api_client
+from ... import batches
+from ... import Client
+from ... import types
+
+
+class _JobServer(http.server.ThreadingHTTPServer):
+  """Stand-in for polling batch jobs and downloading their results.
+
+  Each job goes through a list of states, one per poll, where the state
+  `ERROR` answers the poll with a 500. The result file of a job repeats one
+  line, and is generated as it is sent.
+  """
+
+  def __init__(self):
+    super().__init__(('127.0.0.1', 0), _JobHandler)
+    self.states: dict[str, list[str]] = {}
+    self.results: dict[str, tuple[bytes, int]] = {}
+    self.polls: collections.Counter[str] = collections.Counter()
+    self.in_flight = 0
+    self.max_in_flight = 0
+    self.lock = threading.Lock()
+
+  @property
+  def base_url(self) -> str:
+    return f'http://127.0.0.1:{self.server_address[1]}/'
+
+  def add_job(self, name, states, text='ok', lines=1):
+    self.states[f'batches/{name}'] = states
+    line = json.dumps({
+        'key': name,
+        'response': {
+            'candidates': [
+                {'content': {'role': 'model', 'parts': [{'text': text}]}}
+            ]
+        },
+    })
+    self.results[f'files/{name}'] = (line.encode() + b'\n', lines)
+
+
+class _JobHandler(http.server.BaseHTTPRequestHandler):
+
+  def log_message(self, *args):
+    pass
+
+  def do_GET(self):
+    server = self.server
+    path = self.path.split('?')[0][len('/v1beta/') :]
+    if path.endswith(':download'):
+      line, lines = server.results[path[: -len(':download')]]
+      self.send_response(200)
+      self.send_header('Content-Length', str(len(line) * lines))
+      self.end_headers()
+      for _ in range(lines):
+        self.wfile.write(line)
+      return
+    with server.lock:
+      server.in_flight += 1
+      server.max_in_flight = max(server.max_in_flight, server.in_flight)
+      server.polls[path] += 1
+      states = server.states[path]
+      state = states[min(server.polls[path], len(states)) - 1]
+    # Polls take a while, so that concurrent polls overlap.
+    time.sleep(0.005)
+    with server.lock:
+      server.in_flight -= 1
+    if state == 'ERROR':
+      self._reply(
+          {'error': {'code': 500, 'message': 'Failed.', 'status': 'INTERNAL'}},
+          500,
+      )
+      return
+    job = {'name': path, 'metadata': {'state': state}}
+    if state == 'BATCH_STATE_SUCCEEDED':
+      job['metadata']['output'] = {
+          'responsesFile': f'files/{path[len("batches/"):]}'
+      }
+    self._reply(job)
+
+  def _reply(self, body, status=200):
+    body = json.dumps(body).encode()
+    self.send_response(status)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+  job_server = _JobServer()
+  thread = threading.Thread(target=job_server.serve_forever, daemon=True)
+  thread.start()
+  yield job_server
+  job_server.shutdown()
+  job_server.server_close()
+
+
+def _client(server):
+  return Client(
+      api_key='test-api-key',
+      http_options=types.HttpOptions(base_url=server.base_url),
+  )
+
+
+def test_poll_interval_grows_until_the_state_changes():
+  intervals = [1.0]
+  for changed in (False, False, False, True, False):
+    intervals.append(batches._next_poll_interval(intervals[-1], changed, 1, 3))
+
+  assert intervals == [1.0, 1.5, 2.25, 3, 1, 1.5]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('use_aiohttp', [True, False])
+async def test_jobs_are_polled_concurrently(server, use_aiohttp):
+  for i in range(6):
+    server.add_job(
+        f'job-{i}',
+        ['BATCH_STATE_PENDING'] * i
+        + ['BATCH_STATE_RUNNING'] * 2
+        + ['BATCH_STATE_SUCCEEDED'],
+        lines=3,
+    )
+
+  with mock.patch.object(api_client, 'has_aiohttp', use_aiohttp):
+    client = _client(server)
+    keys = [
+        result.metadata['key']
+        async for result in client.aio.batches.wait_and_iter_results(
+            jobs=[f'batches/job-{i}' for i in range(6)],
+            max_concurrency=2,
+            initial_poll_interval=0.001,
+            max_poll_interval=0.01,
+        )
+    ]
+
+  assert sorted(keys) == sorted(f'job-{i}' for i in range(6) for _ in range(3))
+  assert server.polls == {f'batches/job-{i}': i + 3 for i in range(6)}
+  assert server.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_completed_jobs_are_not_polled(server):
+  server.add_job('done', ['BATCH_STATE_SUCCEEDED'], lines=2)
+  job = types.BatchJob(
+      name='batches/done',
+      state=types.JobState.JOB_STATE_SUCCEEDED,
+      dest=types.BatchJobDestination(file_name='files/done'),
+  )
+
+  results = [
+      result
+      async for result in _client(server).aio.batches.wait_and_iter_results(
+          jobs=[job]
+      )
+  ]
+
+  assert [result.response.text for result in results] == ['ok', 'ok']
+  assert not server.polls
+
+
+@pytest.mark.asyncio
+async def test_failed_job_yields_its_error(server):
+  server.add_job('failed', ['BATCH_STATE_RUNNING', 'BATCH_STATE_FAILED'])
+  server.add_job(
+      'succeeded', ['BATCH_STATE_RUNNING'] * 3 + ['BATCH_STATE_SUCCEEDED']
+  )
+
+  results = [
+      result
+      async for result in _client(server).aio.batches.wait_and_iter_results(
+          jobs=['batches/failed', 'batches/succeeded'],
+          initial_poll_interval=0.001,
+      )
+  ]
+
+  assert [result.metadata for result in results] == [
+      {'batch_job': 'batches/failed'},
+      {'key': 'succeeded'},
+  ]
+  assert 'JOB_STATE_FAILED' in results[0].error.message
+  assert results[0].response is None
+  assert results[1].response.text == 'ok'
+
+
+@pytest.mark.asyncio
+async def test_failed_poll_is_retried(server):
+  server.add_job('flaky', ['ERROR', 'BATCH_STATE_SUCCEEDED'])
+  server.add_job(
+      'succeeded', ['BATCH_STATE_RUNNING'] * 3 + ['BATCH_STATE_SUCCEEDED']
+  )
+
+  results = [
+      result
+      async for result in _client(server).aio.batches.wait_and_iter_results(
+          jobs=['batches/flaky', 'batches/succeeded'],
+          initial_poll_interval=0.001,
+      )
+  ]
+
+  assert sorted(result.metadata['key'] for result in results) == [
+      'flaky',
+      'succeeded',
+  ]
+  assert server.polls['batches/flaky'] == 2
+
+
+@pytest.mark.asyncio
+async def test_job_whose_polls_keep_failing_yields_the_error(server):
+  server.add_job('broken', ['ERROR'])
+  server.add_job('succeeded', ['BATCH_STATE_SUCCEEDED'])
+
+  results = [
+      result
+      async for result in _client(server).aio.batches.wait_and_iter_results(
+          jobs=['batches/broken', 'batches/succeeded'],
+          initial_poll_interval=0.001,
+      )
+  ]
+
+  assert [result.metadata for result in results] == [
+      {'key': 'succeeded'},
+      {'batch_job': 'batches/broken'},
+  ]
+  assert results[1].error.code == 500
+  assert server.polls['batches/broken'] == batches._MAX_POLL_ERRORS
+
+
+@pytest.mark.asyncio
+async def test_partially_succeeded_job_yields_its_results(server):
+  server.add_job('partial', [], lines=2)
+  job = types.BatchJob(
+      name='batches/partial',
+      state=types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+      dest=types.BatchJobDestination(file_name='files/partial'),
+  )
+
+  results = [
+      result
+      async for result in _client(server).aio.batches.wait_and_iter_results(
+          jobs=[job]
+      )
+  ]
+
+  assert [result.metadata for result in results] == [{'key': 'partial'}] * 2
+
+
+@pytest.mark.asyncio
+async def test_timeout(server):
+  server.add_job('stuck', ['BATCH_STATE_RUNNING'])
+
+  with pytest.raises(asyncio.TimeoutError):
+    async for _ in _client(server).aio.batches.wait_and_iter_results(
+        jobs=['batches/stuck'], initial_poll_interval=0.001, timeout=0.05
+    ):
+      pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    "not config.getoption('--run-slow')",
+    reason='Streams 1 GB of results, run with --run-slow.',
+)
+async def test_large_result_file_is_streamed(server, peak_rss):
+  text = 'The quarter closed with revenue up in every region. ' * 2000
+  lines = 1024**3 // (len(text) + 100)
+  server.add_job('large', ['BATCH_STATE_SUCCEEDED'], text=text, lines=lines)
+  client = _client(server)
+
+  results = 0
+  with peak_rss() as rss:
+    async for result in client.aio.batches.wait_and_iter_results(
+        jobs=['batches/large']
+    ):
+      assert result.metadata == {'key': 'large'}
+      results += 1
+
+  assert results == lines
+  assert rss.growth < 64 * 1024 * 1024
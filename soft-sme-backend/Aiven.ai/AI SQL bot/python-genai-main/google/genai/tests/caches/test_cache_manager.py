@@ -0,0 +1,340 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for the cache manager against a local stand-in of the API."""
+
+import asyncio
+import collections
+import datetime
+import http.server
+import json
+import os
+import stat
+import threading
+import time
+
+import pytest
+
+from ... import cache_manager
+from ... import Client
+from ... import types
+
+
+_MODEL = 'gemini-2.5-flash'
+_DOCUMENT = 'Quarterly revenue by product line and region. ' * 100
+
+
+def _timestamp(seconds: float) -> str:
+  return datetime.datetime.fromtimestamp(
+      seconds, datetime.timezone.utc
+  ).isoformat()
+
+
+class _CacheServer(http.server.ThreadingHTTPServer):
+  """Stand-in for the cachedContents endpoints of the Gemini API."""
+
+  def __init__(self):
+    super().__init__(('127.0.0.1', 0), _CacheHandler)
+    self.caches: dict[str, dict] = {}
+    self.calls: collections.Counter[str] = collections.Counter()
+    self.lock = threading.Lock()
+
+  @property
+  def base_url(self) -> str:
+    return f'http://127.0.0.1:{self.server_address[1]}/'
+
+  def add(self, display_name: str, ttl: float = 3600, age: float = 0) -> str:
+    with self.lock:
+      name = f'cachedContents/{len(self.calls) + len(self.caches)}'
+      now = time.time()
+      self.caches[name] = {
+          'name': name,
+          'model': f'models/{_MODEL}',
+          'displayName': display_name,
+          'createTime': _timestamp(now - age),
+          'expireTime': _timestamp(now + ttl),
+      }
+      return name
+
+
+class _CacheHandler(http.server.BaseHTTPRequestHandler):
+
+  def log_message(self, *args):
+    pass
+
+  def _reply(self, body, status=200):
+    data = json.dumps(body).encode()
+    self.send_response(status)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(data)))
+    self.end_headers()
+    self.wfile.write(data)
+
+  def _body(self):
+    return json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+
+  def _name(self):
+    return self.path.split('?')[0][len('/v1beta/') :]
+
+  def _cache(self, method):
+    server = self.server
+    server.calls[method] += 1
+    cache = server.caches.get(self._name())
+    if cache is None:
+      error = {'code': 404, 'message': 'Not found', 'status': 'NOT_FOUND'}
+      self._reply({'error': error}, 404)
+    return cache
+
+  def do_POST(self):
+    body = self._body()
+    name = self.server.add(body['displayName'], ttl=float(body['ttl'][:-1]))
+    self.server.calls['create'] += 1
+    self._reply(self.server.caches[name])
+
+  def do_GET(self):
+    if self._name() == 'cachedContents':
+      self.server.calls['list'] += 1
+      self._reply({'cachedContents': list(self.server.caches.values())})
+    elif cache := self._cache('get'):
+      self._reply(cache)
+
+  def do_PATCH(self):
+    body = self._body()
+    if cache := self._cache('update'):
+      cache['expireTime'] = _timestamp(time.time() + float(body['ttl'][:-1]))
+      self._reply(cache)
+
+  def do_DELETE(self):
+    if self._cache('delete'):
+      del self.server.caches[self._name()]
+      self._reply({})
+
+
+@pytest.fixture
+def server():
+  cache_server = _CacheServer()
+  thread = threading.Thread(target=cache_server.serve_forever, daemon=True)
+  thread.start()
+  yield cache_server
+  cache_server.shutdown()
+  cache_server.server_close()
+
+
+@pytest.fixture
+def index_file(tmp_path):
+  return str(tmp_path / 'index.json')
+
+
+def _client(server):
+  return Client(
+      api_key='test-api-key',
+      http_options=types.HttpOptions(base_url=server.base_url),
+  )
+
+
+def _config(text=_DOCUMENT):
+  return {'contents': [text], 'system_instruction': 'Answer briefly.'}
+
+
+def test_cache_key_depends_on_contents_and_credentials():
+  api_client = Client(api_key='test-api-key')._api_client
+  config = types.CreateCachedContentConfig(**_config())
+  same_config = types.CreateCachedContentConfig(
+      contents=types.Content(role='user', parts=[types.Part(text=_DOCUMENT)]),
+      system_instruction=types.Content(
+          role='user', parts=[types.Part(text='Answer briefly.')]
+      ),
+      display_name='ignored',
+  )
+  other_api_client = Client(api_key='other')._api_client
+
+  key = cache_manager._cache_key(api_client, _MODEL, config)
+
+  assert cache_manager._cache_key(api_client, _MODEL, same_config) == key
+  assert cache_manager._cache_key(api_client, 'gemini-2.0-flash', config) != key
+  assert (
+      cache_manager._cache_key(
+          api_client, _MODEL, types.CreateCachedContentConfig(**_config('x'))
+      )
+      != key
+  )
+  assert cache_manager._cache_key(other_api_client, _MODEL, config) != key
+
+
+def test_managers_sharing_an_index_reuse_caches(server, index_file):
+  client = _client(server)
+  with cache_manager.CacheManager(
+      caches=client.caches, index_file=index_file
+  ) as manager:
+    cached = manager.get_or_create(model=_MODEL, config=_config())
+    assert manager.get_or_create(model=_MODEL, config=_config()) == cached
+
+  # Another process reads the same index file.
+  client = _client(server)
+  with cache_manager.CacheManager(
+      caches=client.caches, index_file=index_file
+  ) as manager:
+    assert manager.get_or_create(model=_MODEL, config=_config()) == cached
+    other = manager.get_or_create(model=_MODEL, config=_config('Other text.'))
+
+  assert other.name != cached.name
+  assert cached.display_name.startswith('genai-cache-')
+  assert server.calls == {'create': 2, 'get': 1}
+
+
+def test_deleted_cache_is_created_again(server, index_file):
+  client = _client(server)
+  with cache_manager.CacheManager(
+      caches=client.caches, index_file=index_file
+  ) as manager:
+    cached = manager.get_or_create(model=_MODEL, config=_config())
+  del server.caches[cached.name]
+
+  client = _client(server)
+  with cache_manager.CacheManager(
+      caches=client.caches, index_file=index_file
+  ) as manager:
+    recreated = manager.get_or_create(model=_MODEL, config=_config())
+
+  assert recreated.name != cached.name
+  assert server.calls == {'create': 2, 'get': 1}
+
+
+def _wait_for(condition, timeout=5.0):
+  deadline = time.time() + timeout
+  while not condition():
+    assert time.time() < deadline
+    time.sleep(0.01)
+
+
+def test_ttl_is_refreshed_before_expiry(server, index_file):
+  client = _client(server)
+  with cache_manager.CacheManager(
+      caches=client.caches,
+      index_file=index_file,
+      ttl=1.0,
+      refresh_margin=0.8,
+  ) as manager:
+    cached = manager.get_or_create(model=_MODEL, config=_config())
+    _wait_for(lambda: server.calls['update'] >= 3)
+
+  updates = server.calls['update']
+  time.sleep(0.5)
+  # The cache is no longer refreshed once the manager is closed.
+  assert server.calls['update'] == updates
+  with open(index_file) as f:
+    [entry] = json.load(f).values()
+  assert entry['name'] == cached.name
+  assert entry['expire_time'] > cached.expire_time.timestamp()
+
+
+def test_collect_garbage(server, index_file, tmp_path):
+  client = _client(server)
+  other_manager = cache_manager.CacheManager(
+      caches=client.caches, index_file=str(tmp_path / 'other.json')
+  )
+  other = other_manager.get_or_create(model=_MODEL, config=_config('Other'))
+  other_manager.close()
+  with cache_manager.CacheManager(
+      caches=client.caches, index_file=index_file
+  ) as manager:
+    prefix = manager._display_name_prefix
+    cached = manager.get_or_create(model=_MODEL, config=_config())
+    orphan = server.add(f'{prefix}orphan', age=120)
+    recent = server.add(f'{prefix}recent')
+    unmanaged = server.add('unmanaged', age=120)
+    stale = server.add(f'{prefix}stale', age=120)
+    with manager._index._locked() as entries:
+      entries['stale'] = {'name': stale, 'expire_time': time.time() - 1}
+
+    deleted = manager.collect_garbage()
+
+  assert sorted(deleted) == sorted([orphan, stale])
+  # The caches of another index file are not garbage of this one.
+  assert sorted(server.caches) == sorted(
+      [cached.name, other.name, recent, unmanaged]
+  )
+  with open(index_file) as f:
+    assert [entry['name'] for entry in json.load(f).values()] == [cached.name]
+
+
+@pytest.mark.skipif(os.name != 'posix', reason='Checks POSIX permissions.')
+def test_default_index_file_is_private(server, tmp_path, monkeypatch):
+  monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+  client = _client(server)
+  with cache_manager.CacheManager(caches=client.caches) as manager:
+    manager.get_or_create(model=_MODEL, config=_config())
+
+  directory = tmp_path / 'cache' / 'google_genai'
+  assert sorted(os.listdir(directory)) == [
+      'cache_index.json',
+      'cache_index.json.lock',
+  ]
+  assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+  for name in os.listdir(directory):
+    assert stat.S_IMODE(os.stat(directory / name).st_mode) == 0o600
+
+
+def test_record_usage():
+  client = Client(api_key='test-api-key')
+  manager = cache_manager.CacheManager(caches=client.caches)
+  for prompt, cached in ((1000, 800), (500, 0)):
+    manager.record_usage(
+        types.GenerateContentResponse(
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=prompt, cached_content_token_count=cached
+            )
+        )
+    )
+  manager.record_usage(types.GenerateContentResponse())
+
+  savings = manager.savings
+  assert savings == cache_manager.CacheSavings(
+      requests=2, prompt_token_count=1500, cached_content_token_count=800
+  )
+  assert savings.cached_fraction == pytest.approx(800 / 1500)
+
+
+def test_refresh_margin_must_be_shorter_than_ttl():
+  with pytest.raises(ValueError, match='refresh_margin'):
+    cache_manager.CacheManager(
+        caches=Client(api_key='test-api-key').caches,
+        ttl=60,
+        refresh_margin=60,
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_cache_manager(server, index_file):
+  client = _client(server)
+  async with cache_manager.AsyncCacheManager(
+      caches=client.aio.caches,
+      index_file=index_file,
+      ttl=1.0,
+      refresh_margin=0.8,
+  ) as manager:
+    cached, again = await asyncio.gather(
+        manager.get_or_create(model=_MODEL, config=_config()),
+        manager.get_or_create(model=_MODEL, config=_config()),
+    )
+    while server.calls['update'] < 2:
+      await asyncio.sleep(0.01)
+    server.add(f'{manager._display_name_prefix}orphan', age=120)
+    deleted = await manager.collect_garbage()
+
+  assert again == cached
+  assert len(deleted) == 1
+  assert server.calls['create'] == 1
@@ -35,45 +35,38 @@ import httpx
 from ... import _api_client as api_client
 
 
+def _encode_lines(lines: List[str], chunk_size: int = 7) -> List[bytes]:
+  """Encodes lines as a byte stream split into small, unaligned reads."""
+  data = "".join(line + "\n" for line in lines).encode("utf-8")
+  return [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+
+
 class MockHTTPXResponse(httpx.Response):
   """Mock httpx.Response class for testing."""
 
   def __init__(self, lines: List[str]):
-    self.aiter_lines = MagicMock()
-    self.aiter_lines.return_value.__aiter__ = MagicMock(
-        return_value=self._async_line_iterator(lines)
+    self.aiter_bytes = MagicMock(
+        return_value=self._async_byte_iterator(_encode_lines(lines))
     )
     self.aclose = AsyncMock()
 
-  async def _async_line_iterator(self, lines: List[str]):
-    for line in lines:
-      yield line
+  async def _async_byte_iterator(self, chunks: List[bytes]):
+    for chunk in chunks:
+      yield chunk
 
 
 class MockAIOHTTPResponse(aiohttp.ClientResponse):
 
   def __init__(self, lines: List[str]):
     self.content = MagicMock()
-    self.content.readline = AsyncMock()
-    # Simulate reading lines, each ending with newline bytes for readline behavior
-    self._read_data = b"\n".join(line.encode("utf-8") for line in lines) + b"\n"
-    self._read_pos = 0
-    self.content.readline.side_effect = self._async_read_line
+    self.content.iter_any = MagicMock(
+        return_value=self._async_byte_iterator(_encode_lines(lines))
+    )
     self.release = MagicMock()
 
-  async def _async_read_line(self) -> bytes:
-    if self._read_pos >= len(self._read_data):
-      return b""  # End of stream
-
-    newline_pos = self._read_data.find(b"\n", self._read_pos)
-    if newline_pos == -1:  # Should not happen with the appended '\n'
-      line = self._read_data[self._read_pos :]
-      self._read_pos = len(self._read_data)
-      return line
-    else:
-      line = self._read_data[self._read_pos : newline_pos + 1]
-      self._read_pos = newline_pos + 1
-      return line
+  async def _async_byte_iterator(self, chunks: List[bytes]):
+    for chunk in chunks:
+      yield chunk
 
 
 @pytest.fixture
@@ -119,7 +112,7 @@ async def test_httpx_simple_lines(responses: api_client.HttpResponse):
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == lines
-  mock_response.aiter_lines.assert_called_once()
+  mock_response.aiter_bytes.assert_called_once()
   mock_response.aclose.assert_called_once()
 
 
@@ -132,7 +125,7 @@ async def test_httpx_data_prefix(responses: api_client.HttpResponse):
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == ["{ 'message': 'hello' }", "{ 'status': 'ok' }"]
-  mock_response.aiter_lines.assert_called_once()
+  mock_response.aiter_bytes.assert_called_once()
   mock_response.aclose.assert_called_once()
 
 
@@ -150,7 +143,7 @@ async def test_httpx_multiple_json_chunk(responses: api_client.HttpResponse):
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == ['{ "id": 1 }', '{ "id": 2 }', '{ "id": 3 }']
-  mock_response.aiter_lines.assert_called_once()
+  mock_response.aiter_bytes.assert_called_once()
   mock_response.aclose.assert_called_once()
 
 
@@ -164,7 +157,7 @@ async def test_httpx_incomplete_json_at_end(responses: api_client.HttpResponse):
 
   # The remaining chunk is yielded
   assert results == ['{ "partial": "data"']
-  mock_response.aiter_lines.assert_called_once()
+  mock_response.aiter_bytes.assert_called_once()
   mock_response.aclose.assert_called_once()
 
 
@@ -177,7 +170,7 @@ async def test_httpx_empty_stream(responses: api_client.HttpResponse):
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == []
-  mock_response.aiter_lines.assert_called_once()
+  mock_response.aiter_bytes.assert_called_once()
   mock_response.aclose.assert_called_once()
 
 
@@ -194,7 +187,7 @@ async def test_aiohttp_simple_lines(responses: api_client.HttpResponse):
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == lines
-  mock_response.content.readline.assert_any_call()
+  mock_response.content.iter_any.assert_called_once()
   mock_response.release.assert_called_once()
 
 
@@ -210,7 +203,7 @@ async def test_aiohttp_data_prefix(responses: api_client.HttpResponse):
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == ["{ 'message': 'hello' }", "{ 'status': 'ok' }"]
-  mock_response.content.readline.assert_any_call()
+  mock_response.content.iter_any.assert_called_once()
   mock_response.release.assert_called_once()
 
 
@@ -231,7 +224,7 @@ async def test_aiohttp_multiple_json_chunks(responses: api_client.HttpResponse):
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == ['{ "id": 1 }', '{ "id": 2 }', '{ "id": 3 }']
-  mock_response.content.readline.assert_any_call()
+  mock_response.content.iter_any.assert_called_once()
   mock_response.release.assert_called_once()
 
 
@@ -249,5 +242,5 @@ async def test_aiohttp_incomplete_json_at_end(
   results = [line async for line in responses._aiter_response_stream()]
 
   assert results == ['{ "partial": "data"']
-  mock_response.content.readline.assert_any_call()
+  mock_response.content.iter_any.assert_called_once()
   mock_response.release.assert_called_once()
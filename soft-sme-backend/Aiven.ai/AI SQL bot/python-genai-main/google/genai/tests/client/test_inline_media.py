@@ -0,0 +1,234 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for sending large inline data without copying it."""
+
+import base64
+import http.server
+import json
+import mmap
+import threading
+from unittest import mock
+
+import httpx
+import pytest
+
+from ... import _api_client as api_client
+from ... import _common
+from ... import Client
+from ... import types
+
+
+_DATA = bytes(range(256)) * (_common.LAZY_BASE64_MIN_SIZE // 256) + b'tail'
+_RESPONSE = {
+    'candidates': [{'content': {'role': 'model', 'parts': [{'text': 'ok'}]}}]
+}
+
+
+def _encoded(data):
+  return base64.urlsafe_b64encode(data).decode('ascii')
+
+
+def _inline_data(body):
+  return json.loads(body)['contents'][0]['parts'][1]['inlineData']['data']
+
+
+@pytest.fixture
+def mapped_file(tmp_path):
+  path = tmp_path / 'document.pdf'
+  path.write_bytes(_DATA)
+  with open(path, 'rb') as f, mmap.mmap(
+      f.fileno(), 0, access=mmap.ACCESS_READ
+  ) as mapped:
+    yield mapped
+
+
+def test_lazy_base64_encodes_in_chunks():
+  data = bytes(range(256)) * 10_000
+  value = _common.LazyBase64(memoryview(data))
+
+  with mock.patch.object(_common, '_BASE64_CHUNK_SIZE', 3 * 1000):
+    chunks = list(value.iter_encoded())
+
+  assert len(chunks) > 1
+  assert b''.join(chunks).decode() == value.encode() == _encoded(data)
+  assert len(value) == len(value.encode())
+
+
+def test_convert_to_json_dict_defers_large_buffers():
+  converted = _common.convert_to_json_dict(
+      {'large': _DATA, 'small': bytearray(b'\xfb\xf6')}
+  )
+
+  assert isinstance(converted['large'], _common.LazyBase64)
+  assert converted['large'].data is _DATA
+  assert converted['small'] == '-_Y='
+  assert _common.convert_to_json_dict(_DATA, lazy_base64=False) == _encoded(
+      _DATA
+  )
+
+
+def test_streaming_body_matches_eager_encoding():
+  data = {
+      'contents': [{
+          'parts': [
+              {'text': 'Summarize "this" document.'},
+              {'inlineData': {'data': _DATA, 'mimeType': 'application/pdf'}},
+              {'inlineData': {'data': _DATA[::-1], 'mimeType': 'image/png'}},
+          ]
+      }]
+  }
+
+  body = _common.encode_json_body(_common.convert_to_json_dict(data))
+
+  assert isinstance(body, _common.StreamingJsonBody)
+  content = b''.join(body)
+  assert json.loads(content) == _common.convert_to_json_dict(
+      data, lazy_base64=False
+  )
+  assert body.content_length == len(content)
+  # The body can be sent again, e.g. when the request is retried.
+  assert b''.join(body) == content
+
+
+def test_small_bodies_are_serialized_up_front():
+  body = _common.encode_json_body(
+      _common.convert_to_json_dict({'data': b'small'})
+  )
+
+  assert body == _common.json_dumps({'data': 'c21hbGw='})
+
+
+def test_blob_keeps_buffers(mapped_file):
+  part = types.Part.from_bytes(data=mapped_file, mime_type='application/pdf')
+
+  assert part.inline_data.data is mapped_file
+  assert part.model_dump()['inline_data']['data'] is mapped_file
+  assert json.loads(part.model_dump_json())['inline_data']['data'] == (
+      _encoded(_DATA)
+  )
+
+
+@pytest.mark.parametrize('source', ['bytes', 'mmap', 'memoryview'])
+def test_generate_content_streams_inline_data(mapped_file, source):
+  requests = []
+
+  def handler(request: httpx.Request) -> httpx.Response:
+    requests.append(request)
+    request.read()
+    return httpx.Response(200, json=_RESPONSE)
+
+  data = {
+      'bytes': _DATA,
+      'mmap': mapped_file,
+      'memoryview': memoryview(_DATA),
+  }[source]
+  client = Client(
+      api_key='test-api-key',
+      http_options=types.HttpOptions(
+          client_args={'transport': httpx.MockTransport(handler)}
+      ),
+  )
+  response = client.models.generate_content(
+      model='gemini-2.5-flash',
+      contents=[
+          'Summarize this document.',
+          types.Part.from_bytes(data=data, mime_type='application/pdf'),
+      ],
+  )
+
+  assert response.text == 'ok'
+  [request] = requests
+  assert _inline_data(request.content) == _encoded(_DATA)
+  assert request.headers['Content-Length'] == str(len(request.content))
+  assert 'Transfer-Encoding' not in request.headers
+
+
+@pytest.mark.asyncio
+async def test_async_httpx_streams_inline_data(mapped_file):
+  requests = []
+
+  async def handler(request: httpx.Request) -> httpx.Response:
+    requests.append(request)
+    await request.aread()
+    return httpx.Response(200, json=_RESPONSE)
+
+  with mock.patch.object(api_client, 'has_aiohttp', False):
+    client = Client(
+        api_key='test-api-key',
+        http_options=types.HttpOptions(
+            async_client_args={'transport': httpx.MockTransport(handler)}
+        ),
+    )
+    response = await client.aio.models.generate_content(
+        model='gemini-2.5-flash',
+        contents=[
+            'Summarize this document.',
+            types.Part.from_bytes(data=mapped_file, mime_type='application/pdf'),
+        ],
+    )
+
+  assert response.text == 'ok'
+  [request] = requests
+  assert _inline_data(request.content) == _encoded(_DATA)
+  assert request.headers['Content-Length'] == str(len(request.content))
+
+
+class _EchoHandler(http.server.BaseHTTPRequestHandler):
+
+  def log_message(self, *args):
+    pass
+
+  def do_POST(self):
+    self.server.requests.append((
+        self.headers,
+        self.rfile.read(int(self.headers['Content-Length'])),
+    ))
+    body = json.dumps(_RESPONSE).encode()
+    self.send_response(200)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_streams_inline_data(mapped_file):
+  server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _EchoHandler)
+  server.requests = []
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  try:
+    client = Client(
+        api_key='test-api-key',
+        http_options=types.HttpOptions(
+            base_url=f'http://127.0.0.1:{server.server_address[1]}/'
+        ),
+    )
+    response = await client.aio.models.generate_content(
+        model='gemini-2.5-flash',
+        contents=[
+            'Summarize this document.',
+            types.Part.from_bytes(data=mapped_file, mime_type='application/pdf'),
+        ],
+    )
+    await client.aio.aclose()
+  finally:
+    server.shutdown()
+    server.server_close()
+
+  assert response.text == 'ok'
+  [(headers, body)] = server.requests
+  assert _inline_data(body) == _encoded(_DATA)
+  assert 'Transfer-Encoding' not in headers
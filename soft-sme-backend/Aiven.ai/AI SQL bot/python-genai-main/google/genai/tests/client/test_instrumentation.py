@@ -0,0 +1,379 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for the instrumentation hooks against a local stand-in of the API."""
+
+import http.server
+import importlib.util
+import json
+import sys
+import threading
+
+import pytest
+
+from ... import Client
+from ... import errors
+from ... import instrumentation
+from ... import types
+
+
+_MODEL = 'gemini-2.5-flash'
+
+
+def _response(parts, prompt_tokens=10, candidates_tokens=3):
+  return {
+      'candidates': [{'content': {'role': 'model', 'parts': parts}}],
+      'usageMetadata': {
+          'promptTokenCount': prompt_tokens,
+          'candidatesTokenCount': candidates_tokens,
+          'totalTokenCount': prompt_tokens + candidates_tokens,
+      },
+  }
+
+
+class _Server(http.server.ThreadingHTTPServer):
+  """Stand-in for generateContent that answers with queued responses.
+
+  Each response is a status and a body, or a list of bodies for a streamed
+  response. Requests after the queue runs out get the last response.
+  """
+
+  def __init__(self, responses):
+    super().__init__(('127.0.0.1', 0), _Handler)
+    self.responses = list(responses)
+    self.lock = threading.Lock()
+
+  @property
+  def base_url(self) -> str:
+    return f'http://127.0.0.1:{self.server_address[1]}/'
+
+  def next_response(self):
+    with self.lock:
+      if len(self.responses) > 1:
+        return self.responses.pop(0)
+      return self.responses[0]
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+
+  def log_message(self, *args):
+    pass
+
+  def do_POST(self):
+    self.rfile.read(int(self.headers['Content-Length']))
+    status, body = self.server.next_response()
+    if isinstance(body, list):
+      data = b''.join(
+          b'data: ' + json.dumps(chunk).encode() + b'\n\n' for chunk in body
+      )
+    else:
+      data = json.dumps(body).encode()
+    self.send_response(status)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(data)))
+    self.end_headers()
+    self.wfile.write(data)
+
+
+@pytest.fixture
+def server_factory():
+  servers = []
+
+  def start(*responses):
+    server = _Server(responses)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    servers.append(server)
+    return server
+
+  yield start
+  for server in servers:
+    server.shutdown()
+    server.server_close()
+
+
+class _Recorder(instrumentation.Instrumentation):
+
+  def __init__(self):
+    self.events = []
+
+  def on_request_start(self, event):
+    self.events.append(event)
+
+  def on_response(self, event):
+    self.events.append(event)
+
+  def on_parse_done(self, event):
+    self.events.append(event)
+
+  def on_tool_call(self, event):
+    self.events.append(event)
+
+  def kinds(self):
+    return [type(event).__name__ for event in self.events]
+
+
+def _client(server, recorder, **http_options):
+  return Client(
+      api_key='test-api-key',
+      http_options=types.HttpOptions(base_url=server.base_url, **http_options),
+      instrumentation=recorder,
+  )
+
+
+def test_request_phases(server_factory):
+  server = server_factory((200, _response([{'text': 'ok'}])))
+  recorder = _Recorder()
+  client = _client(server, recorder)
+
+  client.models.generate_content(model=_MODEL, contents='Hi')
+
+  start, response, parsed = recorder.events
+  assert recorder.kinds() == [
+      'RequestStartEvent',
+      'ResponseEvent',
+      'ParseDoneEvent',
+  ]
+  assert start.model == response.model == parsed.model == _MODEL
+  assert start.path == f'models/{_MODEL}:generateContent'
+  assert start.build_seconds > 0
+  assert response.network_seconds > 0
+  assert response.attempts == 1
+  assert response.request_bytes > len('Hi')
+  assert response.response_bytes == len(
+      json.dumps(_response([{'text': 'ok'}]))
+  )
+  assert response.error is None
+  assert parsed.parse_seconds > 0
+  assert parsed.usage_metadata.prompt_token_count == 10
+
+
+def test_streamed_response_is_parsed_once(server_factory):
+  chunks = [
+      _response([{'text': 'a'}], candidates_tokens=1),
+      _response([{'text': 'b'}], candidates_tokens=2),
+  ]
+  server = server_factory((200, chunks))
+  recorder = _Recorder()
+  client = _client(server, recorder)
+
+  text = ''.join(
+      chunk.text
+      for chunk in client.models.generate_content_stream(
+          model=_MODEL, contents='Hi'
+      )
+  )
+
+  assert text == 'ab'
+  assert recorder.kinds() == [
+      'RequestStartEvent',
+      'ResponseEvent',
+      'ParseDoneEvent',
+  ]
+  response, parsed = recorder.events[1:]
+  assert response.response_bytes is None
+  assert parsed.usage_metadata.candidates_token_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_request_phases(server_factory):
+  server = server_factory(
+      (200, _response([{'text': 'ok'}])),
+      (200, [_response([{'text': 'a'}]), _response([{'text': 'b'}])]),
+  )
+  recorder = _Recorder()
+  client = _client(server, recorder)
+
+  await client.aio.models.generate_content(model=_MODEL, contents='Hi')
+  async for _ in await client.aio.models.generate_content_stream(
+      model=_MODEL, contents='Hi'
+  ):
+    pass
+
+  assert recorder.kinds() == [
+      'RequestStartEvent',
+      'ResponseEvent',
+      'ParseDoneEvent',
+  ] * 2
+
+
+def test_failed_request(server_factory):
+  error = {'error': {'code': 500, 'message': 'Failed.', 'status': 'INTERNAL'}}
+  server = server_factory((500, error))
+  recorder = _Recorder()
+  client = _client(
+      server,
+      recorder,
+      retry_options=types.HttpRetryOptions(attempts=2, initial_delay=0.01),
+  )
+
+  with pytest.raises(errors.ServerError):
+    client.models.generate_content(model=_MODEL, contents='Hi')
+
+  assert recorder.kinds() == ['RequestStartEvent', 'ResponseEvent']
+  response = recorder.events[1]
+  assert response.attempts == 2
+  assert isinstance(response.error, errors.ServerError)
+
+
+def _add(a: int, b: int) -> int:
+  """Adds two numbers."""
+  return a + b
+
+
+def test_tool_calls(server_factory):
+  function_call = {'functionCall': {'name': '_add', 'args': {'a': 1, 'b': 2}}}
+  server = server_factory(
+      (200, _response([function_call])), (200, _response([{'text': '3'}]))
+  )
+  recorder = _Recorder()
+  client = _client(server, recorder)
+
+  response = client.models.generate_content(
+      model=_MODEL, contents='1 + 2?', config={'tools': [_add]}
+  )
+
+  assert response.text == '3'
+  assert recorder.kinds() == [
+      'RequestStartEvent',
+      'ResponseEvent',
+      'ParseDoneEvent',
+      'ToolCallEvent',
+      'RequestStartEvent',
+      'ResponseEvent',
+      'ParseDoneEvent',
+  ]
+  tool_call = recorder.events[3]
+  assert tool_call.name == '_add'
+  assert tool_call.error is None
+
+
+def test_failing_callback_does_not_fail_request(server_factory):
+  class _Failing(instrumentation.Instrumentation):
+
+    def on_response(self, event):
+      raise RuntimeError('Callback failed.')
+
+  server = server_factory((200, _response([{'text': 'ok'}])))
+  client = _client(server, _Failing())
+
+  response = client.models.generate_content(model=_MODEL, contents='Hi')
+
+  assert response.text == 'ok'
+
+
+def test_latency_aggregator():
+  aggregator = instrumentation.LatencyAggregator(window=100)
+  for i in range(200):
+    aggregator.on_response(
+        instrumentation.ResponseEvent(
+            method='post',
+            path=f'models/{_MODEL}:generateContent',
+            model=_MODEL,
+            network_seconds=(i % 100 + 1) / 100,
+            serialize_seconds=0.001,
+            request_bytes=100,
+            response_bytes=200,
+            attempts=1,
+        )
+    )
+  aggregator.on_parse_done(
+      instrumentation.ParseDoneEvent(
+          path=f'models/{_MODEL}:generateContent',
+          model=_MODEL,
+          parse_seconds=0.002,
+          usage_metadata=types.GenerateContentResponseUsageMetadata(
+              prompt_token_count=10, cached_content_token_count=4
+          ),
+      )
+  )
+
+  stats = aggregator.phase_stats()
+  assert stats['network'] == instrumentation.PhaseStats(
+      count=100, p50=0.5, p95=0.95, p99=0.99, max=1.0
+  )
+  assert stats['parse'].count == 1
+  assert 'tool' not in stats
+  usage = aggregator.usage()[_MODEL]
+  assert usage.requests == 200
+  assert usage.request_bytes == 20_000
+  assert usage.prompt_token_count == 10
+  assert usage.cached_content_token_count == 4
+  aggregator.reset()
+  assert not aggregator.phase_stats()
+
+
+class _Instrument:
+
+  def __init__(self, name):
+    self.name = name
+    self.points = []
+
+  def record(self, value, attributes):
+    self.points.append((value, attributes))
+
+  add = record
+
+
+class _Meter:
+  """Records the points of the instruments it creates."""
+
+  def __init__(self):
+    self.instruments = {}
+
+  def create_histogram(self, name, unit='', description=''):
+    return self.instruments.setdefault(name, _Instrument(name))
+
+  create_counter = create_histogram
+
+
+def test_opentelemetry_instrumentation(server_factory):
+  server = server_factory((200, _response([{'text': 'ok'}])))
+  meter = _Meter()
+  client = _client(
+      server, instrumentation.OpenTelemetryInstrumentation(meter=meter)
+  )
+
+  client.models.generate_content(model=_MODEL, contents='Hi')
+
+  durations = meter.instruments['google_genai.client.phase.duration']
+  assert [attributes['phase'] for _, attributes in durations.points] == [
+      'build',
+      'serialize',
+      'network',
+      'parse',
+  ]
+  tokens = meter.instruments['gen_ai.client.token.usage']
+  assert tokens.points == [
+      (10, {'gen_ai.token.type': 'input', 'gen_ai.request.model': _MODEL}),
+      (3, {'gen_ai.token.type': 'output', 'gen_ai.request.model': _MODEL}),
+  ]
+
+
+@pytest.mark.parametrize('installed', [True, False])
+def test_opentelemetry_instrumentation_default_meter(
+    server_factory, monkeypatch, installed
+):
+  if not installed:
+    # Importing a module that is None in sys.modules raises ImportError.
+    monkeypatch.setitem(sys.modules, 'opentelemetry', None)
+  elif importlib.util.find_spec('opentelemetry') is None:
+    pytest.skip('opentelemetry-api is not installed.')
+  server = server_factory((200, _response([{'text': 'ok'}])))
+  client = _client(server, instrumentation.OpenTelemetryInstrumentation())
+
+  response = client.models.generate_content(model=_MODEL, contents='Hi')
+
+  assert response.text == 'ok'
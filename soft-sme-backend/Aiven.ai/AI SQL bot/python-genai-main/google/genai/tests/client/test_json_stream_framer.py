@@ -0,0 +1,117 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for framing streamed responses into JSON payloads."""
+
+import json
+from unittest import mock
+
+import httpx
+
+from ... import _api_client as api_client
+
+
+def _frame(chunks):
+  framer = api_client._JsonStreamFramer()
+  payloads = []
+  for chunk in chunks:
+    payloads.extend(framer.feed(chunk))
+  payloads.extend(framer.flush())
+  return payloads
+
+
+def test_sse_events():
+  body = b'data: {"a": 1}\r\n\r\ndata: {"b": 2}\r\n\r\n'
+
+  assert _frame([body]) == ['{"a": 1}', '{"b": 2}']
+
+
+def test_event_split_across_reads():
+  body = 'data: {"text": "héllo"}\r\n\r\ndata: {"text": "world"}\r\n\r\n'
+  encoded = body.encode('utf-8')
+
+  for size in (1, 2, 3, 5, 8, 13):
+    chunks = [encoded[i : i + size] for i in range(0, len(encoded), size)]
+    assert _frame(chunks) == [
+        '{"text": "héllo"}',
+        '{"text": "world"}',
+    ], size
+
+
+def test_multi_line_error_is_buffered_until_braces_balance():
+  body = (
+      b'{\n'
+      b'  "error": {\n'
+      b'    "code": 400,\n'
+      b'    "message": "bad"\n'
+      b'  }\n'
+      b'}\n'
+  )
+
+  payloads = _frame([body])
+
+  assert len(payloads) == 1
+  assert json.loads(payloads[0]) == {'error': {'code': 400, 'message': 'bad'}}
+
+
+def test_last_line_without_newline():
+  assert _frame([b'data: {"a": 1}\n', b'data: {"b": 2}']) == [
+      '{"a": 1}',
+      '{"b": 2}',
+  ]
+
+
+def test_incomplete_json_at_end_is_returned():
+  assert _frame([b'{ "partial": "data"']) == ['{ "partial": "data"']
+
+
+def test_iter_response_stream_reads_bytes():
+  response = api_client.HttpResponse(
+      headers={},
+      response_stream=httpx.Response(
+          200,
+          content=b'data: {"a": 1}\r\n\r\ndata: {"b": 2}\r\n\r\n',
+      ),
+  )
+
+  assert list(response._iter_response_stream()) == ['{"a": 1}', '{"b": 2}']
+  assert list(
+      api_client.HttpResponse(
+          headers={},
+          response_stream=httpx.Response(200, content=b'data: {"a": 1}\n'),
+      ).segments()
+  ) == [{'a': 1}]
+
+
+def test_request_streamed_passes_event_text_through():
+  client = api_client.BaseApiClient(api_key='test-api-key')
+  events = ['{"candidates": [{"index": 0}]}', '', '{"candidates": []}']
+  with mock.patch.object(
+      client,
+      '_request',
+      return_value=api_client.HttpResponse(
+          headers={'x': 'y'}, response_stream=events
+      ),
+  ):
+    bodies = [
+        response.body
+        for response in client.request_streamed('post', 'path', {})
+    ]
+
+  assert bodies == [
+      '{"candidates": [{"index": 0}]}',
+      '{}',
+      '{"candidates": []}',
+  ]
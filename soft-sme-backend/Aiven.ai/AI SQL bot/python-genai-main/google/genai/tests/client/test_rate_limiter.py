@@ -0,0 +1,399 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for client-side rate limits against a stand-in that returns 429s."""
+
+import asyncio
+import collections
+import concurrent.futures
+import email.utils
+import http.server
+import json
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from ... import _api_client as api_client
+from ... import _rate_limiter
+from ... import Client
+from ... import errors
+from ... import types
+
+
+_MODEL = 'gemini-2.5-flash'
+_RESPONSE = json.dumps({
+    'candidates': [
+        {'content': {'role': 'model', 'parts': [{'text': 'ok'}]}}
+    ]
+}).encode()
+
+
+class _QuotaServer(http.server.ThreadingHTTPServer):
+  """Stand-in for generateContent with a quota of requests per second.
+
+  The quota is a token bucket that holds a second's worth of requests.
+  Requests over quota get a 429 with the time until a request is allowed in
+  `Retry-After`.
+  """
+
+  # Bursts of connections are queued rather than refused.
+  request_queue_size = 128
+
+  def __init__(self, per_second: float, latency: float = 0.0):
+    super().__init__(('127.0.0.1', 0), _QuotaHandler)
+    self.per_second = per_second
+    self.latency = latency
+    self.allowed = per_second
+    self.updated = time.monotonic()
+    self.responses: collections.Counter[int] = collections.Counter()
+    self.in_flight = 0
+    self.max_in_flight = 0
+    self.lock = threading.Lock()
+
+  @property
+  def base_url(self) -> str:
+    return f'http://127.0.0.1:{self.server_address[1]}/'
+
+  def admit(self) -> float:
+    """Returns 0 if a request is allowed, or else how long to wait."""
+    with self.lock:
+      now = time.monotonic()
+      self.allowed = min(
+          self.per_second,
+          self.allowed + (now - self.updated) * self.per_second,
+      )
+      self.updated = now
+      if self.allowed >= 1:
+        self.allowed -= 1
+        return 0.0
+      return (1 - self.allowed) / self.per_second
+
+
+class _QuotaHandler(http.server.BaseHTTPRequestHandler):
+
+  def log_message(self, *args):
+    pass
+
+  def do_POST(self):
+    server = self.server
+    self.rfile.read(int(self.headers['Content-Length']))
+    with server.lock:
+      server.in_flight += 1
+      server.max_in_flight = max(server.max_in_flight, server.in_flight)
+    wait = server.admit()
+    time.sleep(server.latency)
+    with server.lock:
+      server.in_flight -= 1
+    if wait:
+      server.responses[429] += 1
+      body = json.dumps({
+          'error': {
+              'code': 429,
+              'message': 'Quota exceeded.',
+              'status': 'RESOURCE_EXHAUSTED',
+          }
+      }).encode()
+      self.send_response(429)
+      self.send_header('Retry-After', f'{wait:.3f}')
+    else:
+      server.responses[200] += 1
+      body = _RESPONSE
+      self.send_response(200)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+
+@pytest.fixture
+def server_factory():
+  servers = []
+
+  def start(per_second, latency=0.0):
+    server = _QuotaServer(per_second, latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    servers.append(server)
+    return server
+
+  yield start
+  for server in servers:
+    server.shutdown()
+    server.server_close()
+
+
+def _client(server, **http_options):
+  return Client(
+      api_key='test-api-key',
+      http_options=types.HttpOptions(base_url=server.base_url, **http_options),
+  )
+
+
+async def _burst(client, count):
+  start = time.monotonic()
+  responses = await asyncio.gather(*(
+      client.aio.models.generate_content(model=_MODEL, contents=f'Hi {i}')
+      for i in range(count)
+  ))
+  assert all(response.text == 'ok' for response in responses)
+  return time.monotonic() - start
+
+
+@pytest.mark.asyncio
+async def test_burst_is_paced_instead_of_retried(server_factory):
+  count = 80
+  # The limit is a little under the quota of the server.
+  retry_options = types.HttpRetryOptions(attempts=10, max_delay=4)
+  retried = server_factory(per_second=20)
+  limited = server_factory(per_second=20)
+
+  retried_seconds = await _burst(
+      _client(retried, retry_options=retry_options), count
+  )
+  limited_seconds = await _burst(
+      _client(
+          limited,
+          retry_options=retry_options,
+          rate_limits={'*': types.RateLimitOptions(requests_per_minute=1140)},
+      ),
+      count,
+  )
+
+  # Retried requests come back in waves after exponential backoff. Limited
+  # requests are sent at the rate of the quota, and only the odd one that
+  # arrives early is told to retry after a short while.
+  assert limited.responses[200] == retried.responses[200] == count
+  assert limited.responses[429] < retried.responses[429]
+  assert limited_seconds < retried_seconds
+
+
+def test_max_in_flight(server_factory):
+  server = server_factory(per_second=1000, latency=0.05)
+  client = _client(
+      server, rate_limits={_MODEL: types.RateLimitOptions(max_in_flight=3)}
+  )
+
+  with concurrent.futures.ThreadPoolExecutor(12) as executor:
+    responses = list(
+        executor.map(
+            lambda i: client.models.generate_content(
+                model=_MODEL, contents=f'Hi {i}'
+            ),
+            range(12),
+        )
+    )
+
+  assert [response.text for response in responses] == ['ok'] * 12
+  assert server.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('use_aiohttp', [True, False])
+async def test_async_max_in_flight(server_factory, use_aiohttp):
+  server = server_factory(per_second=1000, latency=0.05)
+
+  with mock.patch.object(api_client, 'has_aiohttp', use_aiohttp):
+    client = _client(
+        server, rate_limits={'*': types.RateLimitOptions(max_in_flight=3)}
+    )
+    await _burst(client, 12)
+
+  assert server.max_in_flight == 3
+
+
+def _request(path, data=None):
+  return api_client.HttpRequest(
+      headers={},
+      url=f'https://generativelanguage.googleapis.com/v1beta/{path}',
+      method='post',
+      data=data or {},
+  )
+
+
+def test_limits_by_model():
+  limiter = _rate_limiter.RateLimiter({
+      _MODEL: types.RateLimitOptions(requests_per_minute=60),
+      '*': types.RateLimitOptions(requests_per_minute=30),
+  })
+
+  limits = limiter.limits_for(_request(f'models/{_MODEL}:generateContent'))
+  other = limiter.limits_for(_request('models/gemini-2.0-flash:countTokens'))
+
+  assert limits is limiter.limits_for(
+      _request(f'models/{_MODEL}:streamGenerateContent?alt=sse')
+  )
+  assert other is not None and other is not limits
+  assert limiter.limits_for(_request('cachedContents')) is None
+  assert (
+      _rate_limiter.RateLimiter({_MODEL: types.RateLimitOptions()}).limits_for(
+          _request('models/gemini-2.0-flash:generateContent')
+      )
+      is None
+  )
+
+
+def test_estimated_tokens():
+  limits = _rate_limiter._ModelLimits(
+      _MODEL, types.RateLimitOptions(tokens_per_minute=60_000)
+  )
+  data = {
+      'contents': [{
+          'role': 'user',
+          'parts': [
+              {'text': 'a' * 400},
+              {'inlineData': {'mimeType': 'image/png', 'data': 'AAAA'}},
+          ],
+      }],
+      'systemInstruction': {'parts': [{'text': 'b' * 40}]},
+  }
+
+  assert limits._estimate_tokens(
+      _request(f'models/{_MODEL}:generateContent', data)
+  ) == 100 + 10 + 258
+  assert (
+      limits._estimate_tokens(_request(f'models/{_MODEL}:countTokens', data))
+      == 0
+  )
+
+
+class _Tokenizer:
+  """Counts a token per character, and records the threads it runs in."""
+
+  def __init__(self):
+    self.threads = set()
+
+  def count_tokens_batch(self, contents_list, *, num_threads=-1):
+    self.threads.add(threading.get_ident())
+    return [
+        types.CountTokensResult(total_tokens=sum(len(text) for text in texts))
+        for texts in contents_list
+    ]
+
+
+def _tokenizer_limits(tokenizer, load_delay=0.0):
+  limits = _rate_limiter._ModelLimits(
+      _MODEL,
+      types.RateLimitOptions(
+          tokens_per_minute=60_000, use_local_tokenizer=True
+      ),
+  )
+
+  def load():
+    time.sleep(load_delay)
+    tokenizer.threads.add(threading.get_ident())
+    return tokenizer
+
+  return limits, mock.Mock(wraps=load)
+
+
+def test_tokenizer_is_loaded_once():
+  tokenizer = _Tokenizer()
+  limits, load = _tokenizer_limits(tokenizer, load_delay=0.05)
+  data = {'contents': [{'role': 'user', 'parts': [{'text': 'abc'}]}]}
+
+  with mock.patch.object(limits, '_load_tokenizer', load):
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+      estimates = list(
+          executor.map(
+              lambda _: limits._estimate_tokens(
+                  _request(f'models/{_MODEL}:generateContent', data)
+              ),
+              range(8),
+          )
+      )
+
+  assert estimates == [3] * 8
+  assert load.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_tokenizer_runs_outside_the_event_loop():
+  tokenizer = _Tokenizer()
+  limits, load = _tokenizer_limits(tokenizer)
+  data = {'contents': [{'role': 'user', 'parts': [{'text': 'abc'}]}]}
+
+  with mock.patch.object(limits, '_load_tokenizer', load):
+    async with limits.async_acquire(
+        _request(f'models/{_MODEL}:generateContent', data)
+    ):
+      pass
+
+  assert load.call_count == 1
+  assert tokenizer.threads
+  assert threading.get_ident() not in tokenizer.threads
+
+
+def test_token_bucket():
+  bucket = _rate_limiter._TokenBucket(per_minute=600)
+
+  assert [bucket.reserve(1, now=bucket._updated) for _ in range(12)] == (
+      [0.0] * 10 + [pytest.approx(0.1), pytest.approx(0.2)]
+  )
+  now = bucket._updated + 1.2
+  assert bucket.reserve(1, now) == 0.0
+  bucket.pause(0.5, now)
+  assert bucket.reserve(1, now) == pytest.approx(0.6)
+
+
+def _error(headers=None, details=None):
+  response = mock.Mock(headers=headers or {})
+  error = {'code': 429, 'message': 'Quota exceeded.', 'details': details or []}
+  return errors.ClientError(429, {'error': error}, response)
+
+
+def test_retry_after():
+  date = email.utils.formatdate(time.time() + 30, usegmt=True)
+  retry_info = {
+      '@type': 'type.googleapis.com/google.rpc.RetryInfo',
+      'retryDelay': '12s',
+  }
+
+  assert _rate_limiter.retry_after(_error({'retry-after': '2.5'})) == 2.5
+  assert _rate_limiter.retry_after(
+      _error({'retry-after': date})
+  ) == pytest.approx(30, abs=1.5)
+  assert _rate_limiter.retry_after(_error(details=[retry_info])) == 12
+  assert _rate_limiter.retry_after(_error()) is None
+
+
+def test_retry_after_pauses_requests():
+  limits = _rate_limiter._ModelLimits(
+      _MODEL, types.RateLimitOptions(requests_per_minute=6000)
+  )
+  request = _request(f'models/{_MODEL}:generateContent')
+
+  limits.on_error(_error({'retry-after': '0.2'}))
+  start = time.monotonic()
+  with limits.acquire(request):
+    pass
+
+  assert time.monotonic() - start >= 0.2
+
+
+def test_429_without_retry_after_is_backed_off():
+  limiter = _rate_limiter.RateLimiter(
+      {_MODEL: types.RateLimitOptions(max_in_flight=1)}
+  )
+  wait = limiter.retry_args({'wait': lambda retry_state: 1.5})['wait']
+
+  def retry_state(error):
+    state = mock.Mock(args=(_request(f'models/{_MODEL}:generateContent'),))
+    state.outcome.exception.return_value = error
+    return state
+
+  assert wait(retry_state(_error())) == 1.5
+  assert wait(retry_state(_error({'retry-after': '2'}))) == 0.0
@@ -0,0 +1,74 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests recording and matching requests with the replay client."""
+
+import base64
+
+from ... import _api_client
+from ... import _common
+from ... import _replay_api_client
+
+
+_REPLAY_ID = 'tests/replay_client/test_lazy_base64/mldev'
+
+
+def _client(mode, replays_directory):
+  client = _replay_api_client.ReplayApiClient(
+      mode=mode,
+      replay_id=_REPLAY_ID,
+      replays_directory=str(replays_directory),
+      api_key='test-api-key',
+  )
+  client.initialize_replay_session(_REPLAY_ID)
+  return client
+
+
+def _request():
+  return _api_client.HttpRequest(
+      headers={'Content-Type': 'application/json'},
+      url='https://generativelanguage.googleapis.com/v1beta/models/m:generate',
+      method='post',
+      data={
+          'contents': [{
+              'parts': [{
+                  'inlineData': {
+                      'mimeType': 'image/png',
+                      'data': _common.LazyBase64(b'image bytes'),
+                  }
+              }]
+          }]
+      },
+  )
+
+
+def test_records_and_matches_lazy_base64_data(tmp_path):
+  recording_client = _client('record', tmp_path)
+  recording_client._record_interaction(
+      _request(), _api_client.HttpResponse(headers={}, response_stream=['{}'])
+  )
+  recording_client.close()
+
+  replay_client = _client('replay', tmp_path)
+  interaction = replay_client.replay_session.interactions[0]
+  recorded_part = interaction.request.body_segments[0]['contents'][0]['parts'][0]
+  assert recorded_part['inlineData']['data'] == (
+      base64.urlsafe_b64encode(b'image bytes').decode()
+  )
+  # Requests are redacted before they are matched, as they are when recorded.
+  request = _request()
+  _replay_api_client.redact_http_request(request)
+  replay_client._match_request(request, interaction)
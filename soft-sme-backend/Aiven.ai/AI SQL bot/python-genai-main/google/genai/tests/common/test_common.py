@@ -16,8 +16,10 @@
 
 """Tests tools in the _common module."""
 
+import datetime
 from enum import Enum
 import inspect
+import json
 import logging
 import textwrap
 import typing
@@ -765,3 +767,220 @@ def test_move_value_by_path():
   }
 
   assert data == expected
+
+
+def test_get_response_kwargs_no_config():
+  parameter_model = types._GenerateContentParameters(
+      model='gemini-2.0-flash', contents='Hello'
+  )
+  assert _common.get_response_kwargs(parameter_model) == {}
+  assert _common.get_response_kwargs({'model': 'gemini-2.0-flash'}) == {}
+
+
+def test_get_response_kwargs_keeps_only_response_fields():
+  class Answer(pydantic.BaseModel):
+    value: int
+
+  parameter_model = types._GenerateContentParameters(
+      model='gemini-2.0-flash',
+      contents=types.Part.from_bytes(
+          data=b'\x00' * 1024, mime_type='application/pdf'
+      ),
+      config=types.GenerateContentConfig(
+          temperature=0.5,
+          response_mime_type='application/json',
+          response_schema=Answer,
+      ),
+  )
+
+  assert _common.get_response_kwargs(parameter_model) == {
+      'config': {'response_schema': Answer}
+  }
+
+
+def test_get_response_kwargs_dict_config():
+  kwargs = _common.get_response_kwargs(
+      {'config': {'include_all_fields': True, 'http_options': None}}
+  )
+  assert kwargs == {'config': {'include_all_fields': True}}
+
+
+def test_from_response_parses_with_response_kwargs():
+  class Answer(pydantic.BaseModel):
+    value: int
+
+  parameter_model = types._GenerateContentParameters(
+      model='gemini-2.0-flash',
+      contents='What is 1 + 1?',
+      config=types.GenerateContentConfig(response_schema=Answer),
+  )
+  response = types.GenerateContentResponse._from_response(
+      response={
+          'candidates': [
+              {'content': {'parts': [{'text': '{"value": 2}'}]}}
+          ]
+      },
+      kwargs=_common.get_response_kwargs(parameter_model),
+  )
+  assert response.parsed == Answer(value=2)
+
+
+def test_remove_extra_fields_prunes_nested_models():
+  response = {
+      'candidates': [{
+          'content': {
+              'role': 'model',
+              'parts': [{
+                  'text': 'hi',
+                  'unknownPartField': 1,
+                  'functionCall': {
+                      'name': 'f',
+                      'args': {'anyKey': {'nested': 1}},
+                  },
+              }],
+          },
+          'unknownCandidateField': 'x',
+      }],
+      'usageMetadata': {'promptTokenCount': 1, 'unknownUsageField': 2},
+      'unknownTopLevelField': True,
+  }
+
+  _common._remove_extra_fields(types.GenerateContentResponse, response)
+
+  assert response == {
+      'candidates': [{
+          'content': {
+              'role': 'model',
+              'parts': [{
+                  'text': 'hi',
+                  'functionCall': {
+                      'name': 'f',
+                      'args': {'anyKey': {'nested': 1}},
+                  },
+              }],
+          },
+      }],
+      'usageMetadata': {'promptTokenCount': 1},
+  }
+
+
+def test_remove_extra_fields_keeps_struct_lists():
+  class Model(_common.BaseModel):
+    rows: Optional[list[dict[str, typing.Any]]] = None
+
+  response = {'rows': [{'a': 1}, {'b': 2}], 'extra': 1}
+
+  _common._remove_extra_fields(Model, response)
+
+  assert response == {'rows': [{'a': 1}, {'b': 2}]}
+
+
+def test_pruning_plan_is_cached_per_model():
+  plan = _common._get_pruning_plan(types.Candidate)
+
+  assert _common._get_pruning_plan(types.Candidate) is plan
+  assert plan['content'] == (types.Content, None)
+  assert plan['safetyRatings'] == (None, types.SafetyRating)
+  assert plan['safety_ratings'] is plan['safetyRatings']
+
+
+def test_convert_to_json_dict_matches_two_pass_conversion():
+  request = {
+      'contents': [
+          types.Content(
+              role='user',
+              parts=[
+                  types.Part.from_bytes(
+                      data=b'\xfb\xf6\x9b', mime_type='image/png'
+                  ),
+                  types.Part(text='hello'),
+              ],
+          )
+      ],
+      'nested': {'data': b'\x00\x01', 'when': datetime.datetime(2025, 1, 2)},
+      'flag': True,
+      'count': 3,
+  }
+
+  assert _common.convert_to_json_dict(
+      request
+  ) == _common.encode_unserializable_types(_common.convert_to_dict(request))
+
+
+def test_convert_to_json_dict_encodes_bytes_in_lists():
+  assert _common.convert_to_json_dict({'chunks': [b'\xfb\xf6', b'a']}) == {
+      'chunks': ['-_Y=', 'YQ==']
+  }
+
+
+def test_maybe_snake_to_camel():
+  assert _common.maybe_snake_to_camel('inline_data') == 'inlineData'
+  assert _common.maybe_snake_to_camel('inline_data', False) == 'inline_data'
+  assert _common.maybe_snake_to_camel('_self') == 'Self'
+
+
+@pytest.fixture
+def restore_json_codec():
+  codec = _common.get_json_codec()
+  yield
+  _common.set_json_codec(codec)
+
+
+@pytest.mark.usefixtures('restore_json_codec')
+def test_set_json_codec_json():
+  _common.set_json_codec('json')
+
+  assert _common.get_json_codec().name == 'json'
+  assert _common.json_dumps({'a': [1, 'b']}) == '{"a": [1, "b"]}'
+  assert _common.json_loads(b'{"a": 1}') == {'a': 1}
+
+
+@pytest.mark.usefixtures('restore_json_codec')
+def test_set_json_codec_orjson():
+  pytest.importorskip('orjson')
+  _common.set_json_codec('orjson')
+
+  assert _common.json_loads(_common.json_dumps({'a': 'é'})) == {'a': 'é'}
+  # Falls back to the standard library for values orjson does not support.
+  assert _common.json_dumps({'big': 2**70}) == json.dumps({'big': 2**70})
+  with pytest.raises(json.JSONDecodeError):
+    _common.json_loads('{not json')
+
+
+@pytest.mark.usefixtures('restore_json_codec')
+def test_set_json_codec_custom():
+  calls = []
+
+  def dumps(obj):
+    calls.append(obj)
+    return json.dumps(obj)
+
+  _common.set_json_codec(_common.JsonCodec('custom', dumps, json.loads))
+
+  assert _common.json_dumps({'a': 1}) == '{"a": 1}'
+  assert calls == [{'a': 1}]
+
+
+def test_default_json_codec(monkeypatch):
+  monkeypatch.delenv('GOOGLE_GENAI_JSON_CODEC', raising=False)
+
+  # Faster codecs are opt-in, even when they are installed.
+  assert _common._default_json_codec().name == 'json'
+
+
+def test_default_json_codec_from_environment(monkeypatch):
+  pytest.importorskip('orjson')
+  monkeypatch.setenv('GOOGLE_GENAI_JSON_CODEC', 'orjson')
+
+  assert _common._default_json_codec().name == 'orjson'
+
+
+def test_default_json_codec_unknown(monkeypatch):
+  monkeypatch.setenv('GOOGLE_GENAI_JSON_CODEC', 'yaml')
+
+  assert _common._default_json_codec().name == 'json'
+
+
+def test_set_json_codec_unknown():
+  with pytest.raises(ValueError, match='Unsupported JSON codec'):
+    _common.set_json_codec('yaml')
@@ -0,0 +1,266 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for streaming file downloads to a destination."""
+
+import base64
+import hashlib
+import http.server
+import io
+import os
+import threading
+from unittest import mock
+
+import pytest
+
+from ... import _api_client as api_client
+from ... import Client
+from ... import errors
+from ... import types
+
+
+_CONTENT = bytes(range(256)) * 40
+
+
+class _DownloadServer(http.server.ThreadingHTTPServer):
+  """Serves `_CONTENT` for every download, honoring range requests."""
+
+  def __init__(self):
+    super().__init__(('127.0.0.1', 0), _DownloadHandler)
+    self.ranges: list[str] = []
+    self.ignore_ranges = False
+    self.status = 200
+
+  @property
+  def base_url(self) -> str:
+    return f'http://127.0.0.1:{self.server_address[1]}/'
+
+
+class _DownloadHandler(http.server.BaseHTTPRequestHandler):
+
+  def log_message(self, *args):
+    pass
+
+  def _reply(self, status, body, headers=None):
+    self.send_response(status)
+    for key, value in (headers or {}).items():
+      self.send_header(key, value)
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def do_GET(self):
+    server = self.server
+    if server.status != 200:
+      self._reply(
+          server.status,
+          b'{"error": {"code": 404, "message": "Not found."}}',
+          {'Content-Type': 'application/json'},
+      )
+      return
+    requested_range = self.headers.get('Range')
+    server.ranges.append(requested_range)
+    if not requested_range or server.ignore_ranges:
+      self._reply(200, _CONTENT)
+      return
+    start = int(requested_range[len('bytes=') : -1])
+    if start >= len(_CONTENT):
+      self._reply(416, b'')
+      return
+    self._reply(
+        206,
+        _CONTENT[start:],
+        {'Content-Range': f'bytes {start}-{len(_CONTENT) - 1}/{len(_CONTENT)}'},
+    )
+
+
+@pytest.fixture
+def server():
+  download_server = _DownloadServer()
+  thread = threading.Thread(target=download_server.serve_forever, daemon=True)
+  thread.start()
+  yield download_server
+  download_server.shutdown()
+  download_server.server_close()
+
+
+@pytest.fixture
+def client(server):
+  return Client(
+      api_key='test-api-key',
+      http_options=types.HttpOptions(base_url=server.base_url),
+  )
+
+
+def _sha256_hash(data):
+  return base64.b64encode(hashlib.sha256(data).digest()).decode()
+
+
+def test_download_to_path(client, server, tmp_path):
+  destination = tmp_path / 'video.mp4'
+
+  result = client.files.download(
+      file='files/abc',
+      config=types.DownloadFileConfig(chunk_size=1000),
+      destination=destination,
+  )
+
+  assert result is None
+  assert destination.read_bytes() == _CONTENT
+  assert server.ranges == [None]
+
+
+def test_download_to_file_object(client):
+  buffer = io.BytesIO()
+
+  client.files.download(file='files/abc', destination=buffer)
+
+  assert buffer.getvalue() == _CONTENT
+
+
+def test_download_without_destination_returns_bytes(client):
+  assert client.files.download(file='files/abc') == _CONTENT
+
+
+def test_resume_requests_the_rest_of_the_file(client, server, tmp_path):
+  destination = tmp_path / 'video.mp4'
+  destination.write_bytes(_CONTENT[:1000])
+
+  client.files.download(
+      file='files/abc',
+      config=types.DownloadFileConfig(
+          resume=True, sha256_hash=_sha256_hash(_CONTENT)
+      ),
+      destination=str(destination),
+  )
+
+  assert server.ranges == ['bytes=1000-']
+  assert destination.read_bytes() == _CONTENT
+
+
+def test_resume_of_a_complete_file(client, server, tmp_path):
+  destination = tmp_path / 'video.mp4'
+  destination.write_bytes(_CONTENT)
+
+  client.files.download(
+      file='files/abc',
+      config=types.DownloadFileConfig(resume=True),
+      destination=str(destination),
+  )
+
+  assert server.ranges == [f'bytes={len(_CONTENT)}-']
+  assert destination.read_bytes() == _CONTENT
+
+
+def test_resume_restarts_if_range_is_ignored(client, server, tmp_path):
+  destination = tmp_path / 'video.mp4'
+  destination.write_bytes(b'stale data')
+  server.ignore_ranges = True
+
+  client.files.download(
+      file='files/abc',
+      config={'resume': True, 'sha256_hash': _sha256_hash(_CONTENT)},
+      destination=str(destination),
+  )
+
+  assert destination.read_bytes() == _CONTENT
+
+
+def test_checksum_mismatch_removes_the_file(client, tmp_path):
+  destination = tmp_path / 'video.mp4'
+
+  with pytest.raises(ValueError, match='SHA-256'):
+    client.files.download(
+        file='files/abc',
+        config=types.DownloadFileConfig(sha256_hash=_sha256_hash(b'other')),
+        destination=str(destination),
+    )
+
+  assert not destination.exists()
+
+
+def test_error_response_raises(client, server, tmp_path):
+  server.status = 404
+
+  with pytest.raises(errors.ClientError):
+    client.files.download(
+        file='files/abc', destination=str(tmp_path / 'video.mp4')
+    )
+
+
+def test_failed_download_keeps_the_destination(client, server, tmp_path):
+  destination = tmp_path / 'video.mp4'
+  destination.write_bytes(b'previous data')
+
+  with pytest.raises(ValueError, match='SHA-256'):
+    client.files.download(
+        file='files/abc',
+        config=types.DownloadFileConfig(sha256_hash=_sha256_hash(b'other')),
+        destination=str(destination),
+    )
+  server.status = 404
+  with pytest.raises(errors.ClientError):
+    client.files.download(file='files/abc', destination=str(destination))
+
+  assert destination.read_bytes() == b'previous data'
+  assert os.listdir(tmp_path) == ['video.mp4']
+
+
+def test_resume_without_checksum_skips_reading_the_file(
+    client, server, tmp_path
+):
+  destination = tmp_path / 'video.mp4'
+  destination.write_bytes(_CONTENT[:1000])
+
+  with mock.patch.object(
+      api_client._DownloadWriter, '_skip_existing_data', autospec=True,
+      side_effect=api_client._DownloadWriter._skip_existing_data,
+  ) as skip, mock.patch('os.path.getsize', wraps=os.path.getsize) as getsize:
+    client.files.download(
+        file='files/abc',
+        config=types.DownloadFileConfig(resume=True),
+        destination=str(destination),
+    )
+
+  skip.assert_called_once()
+  getsize.assert_any_call(str(destination))
+  assert server.ranges == ['bytes=1000-']
+  assert destination.read_bytes() == _CONTENT
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('use_aiohttp', [True, False])
+async def test_async_download_to_path(server, tmp_path, use_aiohttp):
+  destination = tmp_path / 'video.mp4'
+  destination.write_bytes(_CONTENT[:300])
+
+  with mock.patch.object(api_client, 'has_aiohttp', use_aiohttp):
+    client = Client(
+        api_key='test-api-key',
+        http_options=types.HttpOptions(base_url=server.base_url),
+    )
+    result = await client.aio.files.download(
+        file='files/abc',
+        config=types.DownloadFileConfig(
+            chunk_size=1000, resume=True, sha256_hash=_sha256_hash(_CONTENT)
+        ),
+        destination=str(destination),
+    )
+
+  assert result is None
+  assert server.ranges == ['bytes=300-']
+  assert destination.read_bytes() == _CONTENT
+  assert os.path.getsize(destination) == len(_CONTENT)
@@ -0,0 +1,334 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for chunked and resumable uploads against a local upload server."""
+
+import http.server
+import io
+import json
+import os
+import threading
+from unittest import mock
+
+import pytest
+
+from ... import _api_client as api_client
+from ... import _extra_utils
+from ... import Client
+from ... import types
+
+
+_GRANULARITY = 128
+
+
+class _UploadServer(http.server.ThreadingHTTPServer):
+  """Stand-in for the resumable upload protocol of the Files API."""
+
+  def __init__(self):
+    super().__init__(('127.0.0.1', 0), _UploadHandler)
+    self.sessions: dict[str, bytearray] = {}
+    self.commands: list[tuple[str, int]] = []
+    # Number of chunks accepted before every chunk request fails.
+    self.fail_after: int = -1
+
+  @property
+  def base_url(self) -> str:
+    return f'http://127.0.0.1:{self.server_address[1]}/'
+
+
+class _UploadHandler(http.server.BaseHTTPRequestHandler):
+
+  def log_message(self, *args):
+    pass
+
+  def _reply(self, status, headers, body=b''):
+    self.send_response(status)
+    for key, value in headers.items():
+      self.send_header(key, value)
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def do_POST(self):
+    server = self.server
+    body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+    command = self.headers['X-Goog-Upload-Command']
+    offset = int(self.headers.get('X-Goog-Upload-Offset', -1))
+    server.commands.append((command, offset))
+    if command == 'start':
+      session = f'session-{len(server.sessions)}'
+      server.sessions[session] = bytearray()
+      self._reply(
+          200,
+          {
+              'x-goog-upload-url': f'{server.base_url}{session}',
+              'x-goog-upload-status': 'active',
+              'x-goog-upload-chunk-granularity': str(_GRANULARITY),
+          },
+          b'{}',
+      )
+      return
+    session = self.path.lstrip('/')
+    received = server.sessions[session]
+    if command == 'query':
+      self._reply(
+          200,
+          {
+              'x-goog-upload-status': 'active',
+              'x-goog-upload-size-received': str(len(received)),
+          },
+      )
+      return
+    accepted = sum(1 for c, _ in server.commands if c.startswith('upload'))
+    if server.fail_after >= 0 and accepted > server.fail_after:
+      self._reply(503, {})
+      return
+    if offset != len(received):
+      self._reply(400, {'x-goog-upload-status': 'active'})
+      return
+    received.extend(body)
+    if command == 'upload':
+      self._reply(200, {'x-goog-upload-status': 'active'})
+      return
+    file = {
+        'name': f'files/{session}',
+        'sizeBytes': str(len(received)),
+        'mimeType': 'text/plain',
+    }
+    self._reply(
+        200,
+        {'x-goog-upload-status': 'final'},
+        json.dumps({'file': file}).encode(),
+    )
+
+
+@pytest.fixture
+def server():
+  upload_server = _UploadServer()
+  thread = threading.Thread(target=upload_server.serve_forever, daemon=True)
+  thread.start()
+  yield upload_server
+  upload_server.shutdown()
+  upload_server.server_close()
+
+
+def _client(server):
+  return Client(
+      api_key='test-api-key',
+      http_options=types.HttpOptions(base_url=server.base_url),
+  )
+
+
+@pytest.fixture
+def content():
+  return bytes(range(256)) * 4 + b'tail'
+
+
+@pytest.fixture
+def path(tmp_path, content):
+  file_path = tmp_path / 'upload.txt'
+  file_path.write_bytes(content)
+  return str(file_path)
+
+
+def test_chunk_reader_maps_files(path, content):
+  with open(path, 'rb') as file:
+    file.seek(4)
+    with api_client._UploadChunkReader(file, 100) as reader:
+      assert reader._mmap is not None
+      with reader.read(10, 100) as chunk:
+        assert isinstance(chunk, memoryview)
+        assert chunk == content[14:114]
+      with reader.read(len(content) - 10, 100) as chunk:
+        assert chunk == content[-6:]
+
+
+def test_chunk_reader_reads_streams_into_one_buffer(content):
+  with api_client._UploadChunkReader(io.BytesIO(content), 100) as reader:
+    assert reader._mmap is None
+    first = reader.read(0, 100)
+    assert first == content[:100]
+    second = reader.read(100, 100)
+    assert second == content[100:200]
+    assert second.obj is first.obj
+
+
+def test_upload_in_chunks_reports_progress(server, path, content):
+  progress = []
+
+  client = _client(server)
+  file = client.files.upload(
+      file=path,
+      config=types.UploadFileConfig(
+          chunk_size=300, progress_callback=lambda *p: progress.append(p)
+      ),
+  )
+
+  assert file.size_bytes == len(content)
+  assert bytes(server.sessions['session-0']) == content
+  # The chunk size is rounded down to the granularity of the server.
+  assert progress == [
+      (256, 1028),
+      (512, 1028),
+      (768, 1028),
+      (1024, 1028),
+      (1028, 1028),
+  ]
+  assert server.commands[-1] == ('upload, finalize', 1024)
+
+
+def test_upload_stream_in_chunks(server, content):
+  buffer = io.BytesIO(b'skipped' + content)
+  buffer.seek(len(b'skipped'))
+
+  client = _client(server)
+  client.files.upload(
+      file=buffer,
+      config=types.UploadFileConfig(mime_type='text/plain', chunk_size=512),
+  )
+
+  assert bytes(server.sessions['session-0']) == content
+
+
+def test_interrupted_upload_resumes_from_saved_state(server, path, content):
+  state_file = os.path.join(os.path.dirname(path), 'upload.state')
+  config = types.UploadFileConfig(
+      chunk_size=256, upload_state_file=state_file
+  )
+  server.fail_after = 2
+
+  client = _client(server)
+  with mock.patch.object(api_client, 'INITIAL_RETRY_DELAY', 0):
+    with pytest.raises(ValueError):
+      client.files.upload(file=path, config=config)
+
+  with open(state_file) as f:
+    state = json.load(f)
+  assert state['upload_url'] == f'{server.base_url}session-0'
+  assert state['offset'] == 512
+
+  # A new client, e.g. after a restart, resumes the saved upload.
+  server.fail_after = -1
+  progress = []
+  restarted_client = _client(server)
+  file = restarted_client.files.upload(
+      file=path,
+      config=config.model_copy(
+          update={'progress_callback': lambda *p: progress.append(p)}
+      ),
+  )
+
+  assert file.name == 'files/session-0'
+  assert bytes(server.sessions['session-0']) == content
+  assert [c for c, _ in server.commands].count('start') == 1
+  assert ('query', -1) in server.commands
+  assert progress[0] == (768, len(content))
+  assert not os.path.exists(state_file)
+
+
+def test_state_of_a_changed_file_is_ignored(server, path):
+  state_file = os.path.join(os.path.dirname(path), 'upload.state')
+  with open(state_file, 'w') as f:
+    json.dump(
+        {
+            'upload_url': f'{server.base_url}session-0',
+            'source': {'path': path, 'mtime_ns': 0},
+            'size_bytes': os.path.getsize(path),
+            'offset': 256,
+        },
+        f,
+    )
+
+  client = _client(server)
+  client.files.upload(
+      file=path, config=types.UploadFileConfig(upload_state_file=state_file)
+  )
+
+  assert server.commands[0] == ('start', -1)
+
+
+def test_stream_requires_upload_state_key(server, tmp_path, content):
+  state_file = str(tmp_path / 'upload.state')
+
+  client = _client(server)
+  with pytest.raises(ValueError, match='upload_state_key'):
+    client.files.upload(
+        file=io.BytesIO(content),
+        config=types.UploadFileConfig(
+            mime_type='text/plain', upload_state_file=state_file
+        ),
+    )
+
+  assert not server.commands
+
+
+def test_interrupted_stream_resumes_with_the_same_key(
+    server, tmp_path, content
+):
+  state_file = str(tmp_path / 'upload.state')
+  config = types.UploadFileConfig(
+      mime_type='text/plain',
+      chunk_size=256,
+      upload_state_file=state_file,
+      upload_state_key='report-1',
+  )
+  server.fail_after = 2
+
+  client = _client(server)
+  with mock.patch.object(api_client, 'INITIAL_RETRY_DELAY', 0):
+    with pytest.raises(ValueError):
+      client.files.upload(file=io.BytesIO(content), config=config)
+  server.fail_after = -1
+
+  # Another stream of the same size doesn't resume the saved upload.
+  other = io.BytesIO(bytes(reversed(content)))
+  assert not _extra_utils.load_upload_state(
+      state_file, other, len(content), 'report-2'
+  )
+
+  buffer = io.BytesIO(b'skipped' + content)
+  buffer.seek(len(b'skipped'))
+  file = client.files.upload(file=buffer, config=config)
+
+  assert file.name == 'files/session-0'
+  assert bytes(server.sessions['session-0']) == content
+  assert [c for c, _ in server.commands].count('start') == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('use_aiohttp', [True, False])
+async def test_async_interrupted_upload_resumes(
+    server, path, content, use_aiohttp
+):
+  state_file = os.path.join(os.path.dirname(path), 'upload.state')
+  config = types.UploadFileConfig(
+      chunk_size=256, upload_state_file=state_file
+  )
+  server.fail_after = 1
+
+  with mock.patch.object(api_client, 'has_aiohttp', use_aiohttp):
+    client = _client(server)
+    with mock.patch.object(api_client, 'INITIAL_RETRY_DELAY', 0):
+      with pytest.raises(ValueError):
+        await client.aio.files.upload(file=path, config=config)
+    server.fail_after = -1
+    restarted_client = _client(server)
+    file = await restarted_client.aio.files.upload(file=path, config=config)
+
+  assert file.size_bytes == len(content)
+  assert bytes(server.sessions['session-0']) == content
+  assert [c for c, _ in server.commands].count('start') == 1
+  assert not os.path.exists(state_file)
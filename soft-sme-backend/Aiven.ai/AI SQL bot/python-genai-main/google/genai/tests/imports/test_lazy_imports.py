@@ -0,0 +1,70 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Regression tests for the modules imported with the SDK."""
+
+import json
+import os
+import subprocess
+import sys
+
+
+_SCRIPT = """
+import json
+import sys
+from google import genai
+client = genai.Client(api_key='test-api-key')
+{statements}
+print(json.dumps([name for name in {modules!r} if name in sys.modules]))
+"""
+
+
+def _imported(modules, statements=''):
+  """Returns which of the modules are imported after creating a client."""
+  # The directory that contains the google package.
+  root = os.path.abspath(__file__)
+  for _ in range(5):
+    root = os.path.dirname(root)
+  env = dict(os.environ, PYTHONPATH=root)
+  script = _SCRIPT.format(modules=modules, statements=statements)
+  result = subprocess.run(
+      [sys.executable, '-c', script],
+      capture_output=True,
+      check=True,
+      cwd=root,
+      env=env,
+      text=True,
+  )
+  return json.loads(result.stdout)
+
+
+def test_client_does_not_import_api_modules():
+  assert not _imported((
+      'google.genai.models',
+      'google.genai.live',
+      'google.genai.files',
+      'google.genai.batches',
+      'google.genai._replay_api_client',
+      'websockets',
+      'requests',
+  ))
+
+
+def test_aiohttp_is_imported_on_first_use():
+  assert not _imported(('aiohttp',))
+  assert _imported(
+      ('aiohttp',), statements='client._api_client._use_aiohttp()'
+  ) == ['aiohttp']
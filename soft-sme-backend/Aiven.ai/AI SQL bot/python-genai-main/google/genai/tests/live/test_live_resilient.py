@@ -0,0 +1,167 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Tests for live sessions that reconnect when their connection drops."""
+
+import json
+import random
+from unittest import mock
+
+import pytest
+from websockets.asyncio.server import serve
+
+from ... import Client
+from ... import live
+from ... import types
+
+
+_TURNS = 30
+
+
+class _FlakyServer:
+  """A live server stand-in that drops connections at random points.
+
+  The session state is the list of texts the server consumed. Each resumption
+  update stores a snapshot of it under a new handle.
+  """
+
+  def __init__(self, seed: int):
+    self._random = random.Random(seed)
+    self.snapshots: dict[str, list[str]] = {}
+    self.handle = None
+    self.connections = 0
+    self.drops = 0
+
+  async def _drop(self, websocket, text: str = '') -> bool:
+    # The last turn is not dropped, so that the session is saved after it.
+    if text != f'turn {_TURNS - 1}' and self._random.random() < 0.1:
+      self.drops += 1
+      await websocket.close(code=1011, reason='dropped')
+      return True
+    return False
+
+  async def __call__(self, websocket):
+    self.connections += 1
+    setup = json.loads(await websocket.recv())['setup']
+    handle = setup.get('sessionResumption', {}).get('handle')
+    state = list(self.snapshots[handle]) if handle else []
+    await websocket.send(json.dumps({'setupComplete': {}}))
+    async for raw in websocket:
+      if await self._drop(websocket):
+        return
+      [turn] = json.loads(raw)['client_content']['turns']
+      text = turn['parts'][0]['text']
+      state.append(text)
+      if await self._drop(websocket, text):
+        return
+      await websocket.send(json.dumps({
+          'serverContent': {
+              'modelTurn': {'role': 'model', 'parts': [{'text': f'ack {text}'}]}
+          }
+      }))
+      await websocket.send(
+          json.dumps({'serverContent': {'turnComplete': True}})
+      )
+      if await self._drop(websocket, text):
+        return
+      self.handle = f'handle-{len(self.snapshots)}'
+      self.snapshots[self.handle] = list(state)
+      await websocket.send(json.dumps({
+          'sessionResumptionUpdate': {
+              'newHandle': self.handle,
+              'resumable': True,
+          }
+      }))
+
+
+@pytest.mark.asyncio
+async def test_session_survives_dropped_connections():
+  server = _FlakyServer(seed=4)
+  events = []
+  async with serve(server, '127.0.0.1', 0) as websocket_server:
+    port = websocket_server.sockets[0].getsockname()[1]
+    client = Client(api_key='test-api-key')
+    # The client connects over TLS to the API endpoints only.
+    with mock.patch.object(
+        client._api_client,
+        '_websocket_base_url',
+        return_value=f'ws://127.0.0.1:{port}',
+    ), mock.patch.object(
+        type(client._api_client),
+        '_websocket_ssl_ctx',
+        new_callable=mock.PropertyMock,
+        return_value={},
+    ):
+      async with client.aio.live.connect_resilient(
+          model='gemini-live-2.5-flash-preview',
+          retry_options=types.HttpRetryOptions(
+              attempts=10, initial_delay=0.001, jitter=0
+          ),
+          on_reconnect=events.append,
+      ) as session:
+        acks = []
+        for i in range(_TURNS):
+          await session.send_client_content(
+              turns=types.Content(
+                  role='user', parts=[types.Part(text=f'turn {i}')]
+              )
+          )
+          # Turns sent again after a reconnection are answered again, so
+          # responses to earlier turns may arrive first.
+          while f'ack turn {i}' not in acks:
+            async for message in session.receive():
+              if message.text:
+                acks.append(message.text)
+        reconnects = session.reconnects
+        handle = session.resumption_handle
+
+  assert server.drops > 0
+  assert reconnects == len(events) == server.connections - 1 > 0
+  assert all(isinstance(event, live.LiveReconnectEvent) for event in events)
+  assert any(event.resumed and event.replayed_messages for event in events)
+  expected = [f'ack turn {i}' for i in range(_TURNS)]
+  assert list(dict.fromkeys(acks)) == expected
+  # Each saved session consumed every turn before it exactly once.
+  turns = [f'turn {i}' for i in range(_TURNS)]
+  for snapshot in server.snapshots.values():
+    assert snapshot == turns[: len(snapshot)]
+  assert server.snapshots[server.handle] == turns
+  assert handle in server.snapshots
+
+
+def test_transparent_resumption_keeps_unconsumed_messages():
+  config = types.LiveConnectConfig(
+      session_resumption=types.SessionResumptionConfig(transparent=True)
+  )
+  connection = live._ResumableConnection(
+      mock.MagicMock(), 'model', config, types.HttpRetryOptions(), None
+  )
+  connection._unacked.extend((i, f'message {i}', True) for i in range(4))
+
+  connection._update_resumption(
+      json.dumps({
+          'sessionResumptionUpdate': {
+              'newHandle': 'handle',
+              'resumable': True,
+              'lastConsumedClientMessageIndex': 1,
+          }
+      }).encode()
+  )
+
+  assert connection.handle == 'handle'
+  assert list(connection._unacked) == [
+      (2, 'message 2', True),
+      (3, 'message 3', True),
+  ]
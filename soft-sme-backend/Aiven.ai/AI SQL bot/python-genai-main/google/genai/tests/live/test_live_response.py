@@ -14,6 +14,7 @@
 #
 
 """Tests for live response handling."""
+import asyncio
 import json
 from typing import cast
 from unittest import mock
@@ -161,3 +162,129 @@ async def test_receive_server_content_with_turn_reason(mock_websocket, vertexai)
   assert result.server_content.turn_complete is True
   assert result.server_content.turn_complete_reason == types.TurnCompleteReason.NEED_MORE_INPUT
   assert result.server_content.waiting_for_input is True
+
+
+_AUDIO_MESSAGES = [
+    {
+        'serverContent': {
+            'modelTurn': {
+                'role': 'model',
+                'parts': [{
+                    'inlineData': {
+                        'data': '+/8AAQ==',
+                        'mimeType': 'audio/pcm;rate=24000',
+                    }
+                }],
+            }
+        }
+    },
+    {
+        'serverContent': {
+            'modelTurn': {
+                'parts': [
+                    {'inlineData': {'data': '-_8AAQ=='}},
+                    {'inlineData': {'mimeType': 'audio/pcm'}},
+                ]
+            }
+        }
+    },
+]
+
+
+@pytest.mark.parametrize('vertexai', [True, False])
+@pytest.mark.parametrize('message', _AUDIO_MESSAGES)
+@pytest.mark.asyncio
+async def test_receive_validates_json_directly(mock_websocket, vertexai, message):
+  mock_websocket.recv.return_value = json.dumps(message)
+  session = live.AsyncSession(
+      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+  )
+
+  result = await session._receive()
+  await session.close()
+
+  assert session.receive_stats.fast_parsed_messages == 1
+  expected = types.LiveServerMessage._from_response(
+      response=json.loads(json.dumps(message)), kwargs={}
+  )
+  assert result.model_dump() == expected.model_dump()
+  assert result.data == expected.data
+
+
+@pytest.mark.parametrize('vertexai', [True, False])
+@pytest.mark.parametrize(
+    'message',
+    [
+        {
+            'serverContent': {'modelTurn': {'parts': [{'text': 'Hi'}]}},
+            'unknownField': {'added': 'later'},
+        },
+        {
+            'serverContent': {'turnComplete': True},
+            'usageMetadata': {
+                'totalTokenCount': 2,
+                'candidatesTokenCount': 1,
+            },
+        },
+    ],
+)
+@pytest.mark.asyncio
+async def test_receive_falls_back_to_full_parsing(
+    mock_websocket, vertexai, message
+):
+  mock_websocket.recv.return_value = json.dumps(message)
+  session = live.AsyncSession(
+      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+  )
+
+  result = await session._receive()
+  await session.close()
+
+  if 'unknownField' in message or vertexai:
+    assert session.receive_stats.fast_parsed_messages == 0
+  response = json.loads(json.dumps(message))
+  if vertexai:
+    response = live.live_converters._LiveServerMessage_from_vertex(response)
+  assert result == types.LiveServerMessage._from_response(
+      response=response, kwargs={}
+  )
+
+
+@pytest.mark.asyncio
+async def test_receive_reads_in_background(mock_websocket):
+  mock_websocket.recv = AsyncMock(
+      side_effect=[json.dumps(m) for m in _AUDIO_MESSAGES]
+      + [
+          '{"serverContent": {"turnComplete": true}}',
+          live.ConnectionClosed(None, None),
+      ]
+  )
+  session = live.AsyncSession(
+      api_client=mock_api_client(),
+      websocket=mock_websocket,
+      max_queued_messages=2,
+  )
+
+  first = await session._receive()
+  # The reader fills the queue, and waits for it to be read.
+  for _ in range(10):
+    await asyncio.sleep(0)
+  assert session.receive_stats.max_queue_depth == 2
+  assert mock_websocket.recv.call_count == 4
+  messages = [first] + [message async for message in session.receive()]
+  with pytest.raises(live.ConnectionClosed):
+    await session._receive()
+  # Later calls raise the same error.
+  with pytest.raises(live.ConnectionClosed):
+    await session._receive()
+
+  assert [m.server_content.turn_complete for m in messages] == [
+      None,
+      None,
+      True,
+  ]
+  stats = session.receive_stats
+  assert stats.messages == 3
+  assert stats.fast_parsed_messages == 3
+  assert stats.queue_depth == 0
+  assert 0 < stats.mean_parse_seconds <= stats.max_parse_seconds
@@ -15,6 +15,7 @@
 
 
 """Tests for live.py."""
+import asyncio
 import json
 import os
 from unittest import mock
@@ -266,3 +267,73 @@ async def test_send_multiple_args(mock_websocket, vertexai):
     await session.send_realtime_input(
         text='Hello?', activity_start=types.ActivityStart()
     )
+
+
+async def _frames(*frames, delay=0):
+  for frame in frames:
+    await asyncio.sleep(delay)
+    yield frame
+
+
+@pytest.mark.parametrize('vertexai', [True, False])
+@pytest.mark.asyncio
+async def test_stream_audio_sends_same_messages(mock_websocket, vertexai):
+  session = live.AsyncSession(
+      api_client=mock_api_client(vertexai=vertexai), websocket=mock_websocket
+  )
+  frames = [bytes(range(10)), b'\xfb\xff', b'', b'\x00' * 640]
+
+  await session.stream_audio(_frames(*frames), mime_type='audio/pcm')
+  streamed = [call.args[0] for call in mock_websocket.send.call_args_list]
+  mock_websocket.send.reset_mock()
+  for frame in frames:
+    if frame:
+      await session.send_realtime_input(
+          audio=types.Blob(data=frame, mime_type='audio/pcm')
+      )
+  sent = [call.args[0] for call in mock_websocket.send.call_args_list]
+
+  assert len(streamed) == 3
+  assert [json.loads(m) for m in streamed] == [json.loads(m) for m in sent]
+
+
+@pytest.mark.asyncio
+async def test_stream_audio_coalesces_frames(mock_websocket):
+  session = live.AsyncSession(
+      api_client=mock_api_client(), websocket=mock_websocket
+  )
+
+  async def frames():
+    yield b'\x01\x02'
+    yield b'\x03'
+    await asyncio.sleep(0.2)
+    yield b'\x04'
+
+  await session.stream_audio(
+      frames(),
+      mime_type='audio/pcm;rate=16000',
+      max_latency_ms=50,
+      audio_stream_end=True,
+  )
+  sent = [
+      json.loads(call.args[0])['realtime_input']
+      for call in mock_websocket.send.call_args_list
+  ]
+
+  # The first frames are sent within the latency budget, not with the last.
+  assert sent == [
+      {'audio': {'data': 'AQID', 'mimeType': 'audio/pcm;rate=16000'}},
+      {'audio': {'data': 'BA==', 'mimeType': 'audio/pcm;rate=16000'}},
+      {'audioStreamEnd': True},
+  ]
+
+
+@pytest.mark.asyncio
+async def test_stream_audio_rejects_other_media(mock_websocket):
+  session = live.AsyncSession(
+      api_client=mock_api_client(), websocket=mock_websocket
+  )
+
+  with pytest.raises(ValueError, match='.*Unsupported mime type.*'):
+    await session.stream_audio(_frames(b'\x00'), mime_type='image/png')
+  mock_websocket.send.assert_not_called()
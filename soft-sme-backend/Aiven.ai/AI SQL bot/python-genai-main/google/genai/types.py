@@ -16,11 +16,13 @@
 # Code generated by the Google Gen AI SDK generator DO NOT EDIT.
 
 from abc import ABC, abstractmethod
+import base64
 import datetime
 from enum import Enum, EnumMeta
 import inspect
 import json
 import logging
+import mmap
 import sys
 import types as builtin_types
 import typing
@@ -907,6 +909,30 @@ class Blob(_common.BaseModel):
       description="""Required. The IANA standard MIME type of the source data.""",
   )
 
+  @pydantic.field_validator('data', mode='wrap')
+  @classmethod
+  def _keep_buffers(
+      cls, value: Any, handler: pydantic.ValidatorFunctionWrapHandler
+  ) -> Any:
+    # Buffers, e.g. a memory mapped file, are kept rather than copied to bytes.
+    # The data is read from them when the request is sent.
+    if isinstance(value, (bytearray, memoryview, mmap.mmap)):
+      return value
+    return handler(value)
+
+  @pydantic.field_serializer('data', mode='wrap')
+  def _serialize_buffers(
+      self,
+      value: Any,
+      handler: pydantic.SerializerFunctionWrapHandler,
+      info: pydantic.FieldSerializationInfo,
+  ) -> Any:
+    if isinstance(value, (bytearray, memoryview, mmap.mmap)):
+      if info.mode_is_json():
+        return base64.urlsafe_b64encode(value).decode('ascii')
+      return value
+    return handler(value)
+
   def as_image(self) -> Optional['Image']:
     """Returns the Blob as a Image, or None if the Blob is not an image."""
     if (
@@ -1361,7 +1387,21 @@ class Part(_common.BaseModel):
     return cls(text=text)
 
   @classmethod
-  def from_bytes(cls, *, data: bytes, mime_type: str) -> 'Part':
+  def from_bytes(
+      cls,
+      *,
+      data: Union[bytes, bytearray, memoryview, mmap.mmap],
+      mime_type: str,
+  ) -> 'Part':
+    """Creates a Part from bytes and mime type.
+
+    The data is not copied. Large data, e.g. a memory mapped file, is base64
+    encoded in chunks while the request is sent.
+
+    Args:
+      data: The bytes of the data, or a buffer such as a memory mapped file.
+      mime_type: The MIME type of the data.
+    """
     inline_data = Blob(
         data=data,
         mime_type=mime_type,
@@ -1532,6 +1572,79 @@ class HttpRetryOptionsDict(TypedDict, total=False):
 HttpRetryOptionsOrDict = Union[HttpRetryOptions, HttpRetryOptionsDict]
 
 
+class RateLimitOptions(_common.BaseModel):
+  """Client-side rate limits for the requests to a model."""
+
+  requests_per_minute: Optional[float] = Field(
+      default=None,
+      description="""Maximum number of requests per minute. Up to a second's worth of requests is sent at once.""",
+  )
+  tokens_per_minute: Optional[float] = Field(
+      default=None,
+      description="""Maximum number of estimated input tokens per minute.""",
+  )
+  max_in_flight: Optional[int] = Field(
+      default=None,
+      description="""Maximum number of requests waiting for a response. A streamed request is in flight until its response starts.""",
+  )
+  use_local_tokenizer: Optional[bool] = Field(
+      default=None,
+      description="""Whether to estimate input tokens with `LocalTokenizer`, if it supports the model. Otherwise tokens are estimated from the length of the texts.""",
+  )
+
+
+class RateLimitOptionsDict(TypedDict, total=False):
+  """Client-side rate limits for the requests to a model."""
+
+  requests_per_minute: Optional[float]
+  """Maximum number of requests per minute. Up to a second's worth of requests is sent at once."""
+
+  tokens_per_minute: Optional[float]
+  """Maximum number of estimated input tokens per minute."""
+
+  max_in_flight: Optional[int]
+  """Maximum number of requests waiting for a response. A streamed request is in flight until its response starts."""
+
+  use_local_tokenizer: Optional[bool]
+  """Whether to estimate input tokens with `LocalTokenizer`, if it supports the model. Otherwise tokens are estimated from the length of the texts."""
+
+
+RateLimitOptionsOrDict = Union[RateLimitOptions, RateLimitOptionsDict]
+
+
+class HedgingOptions(_common.BaseModel):
+  """Options to hedge slow generate content requests with a duplicate."""
+
+  percentile: Optional[float] = Field(
+      default=None,
+      description="""The percentile of the recent latencies of a model after which a duplicate request is sent. Defaults to 95.""",
+  )
+  initial_delay: Optional[float] = Field(
+      default=None,
+      description="""The delay in seconds after which a duplicate request is sent, until enough latencies of the model are recorded. If not set, requests are not hedged until then.""",
+  )
+  max_hedges_per_minute: Optional[int] = Field(
+      default=None,
+      description="""Maximum number of duplicate requests per minute. Defaults to 60.""",
+  )
+
+
+class HedgingOptionsDict(TypedDict, total=False):
+  """Options to hedge slow generate content requests with a duplicate."""
+
+  percentile: Optional[float]
+  """The percentile of the recent latencies of a model after which a duplicate request is sent. Defaults to 95."""
+
+  initial_delay: Optional[float]
+  """The delay in seconds after which a duplicate request is sent, until enough latencies of the model are recorded. If not set, requests are not hedged until then."""
+
+  max_hedges_per_minute: Optional[int]
+  """Maximum number of duplicate requests per minute. Defaults to 60."""
+
+
+HedgingOptionsOrDict = Union[HedgingOptions, HedgingOptionsDict]
+
+
 class HttpOptions(_common.BaseModel):
   """HTTP options to be used in each of the requests."""
 
@@ -1565,6 +1678,14 @@ class HttpOptions(_common.BaseModel):
   retry_options: Optional[HttpRetryOptions] = Field(
       default=None, description="""HTTP retry options for the request."""
   )
+  rate_limits: Optional[dict[str, RateLimitOptions]] = Field(
+      default=None,
+      description="""Client-side rate limits by model name, e.g. `gemini-2.5-flash`. The limits under `*` apply to each other model. Only set on the client.""",
+  )
+  hedging: Optional[HedgingOptions] = Field(
+      default=None,
+      description="""Sends a duplicate of a slow, non-streamed generate content request, and returns the first response. Only set on the client.""",
+  )
 
   httpx_client: Optional['HttpxClient'] = Field(
       default=None,
@@ -1606,6 +1727,12 @@ class HttpOptionsDict(TypedDict, total=False):
   retry_options: Optional[HttpRetryOptionsDict]
   """HTTP retry options for the request."""
 
+  rate_limits: Optional[dict[str, RateLimitOptionsDict]]
+  """Client-side rate limits by model name, e.g. `gemini-2.5-flash`. The limits under `*` apply to each other model. Only set on the client."""
+
+  hedging: Optional[HedgingOptionsDict]
+  """Sends a duplicate of a slow, non-streamed generate content request, and returns the first response. Only set on the client."""
+
 
 HttpOptionsOrDict = Union[HttpOptions, HttpOptionsDict]
 
@@ -4052,6 +4179,33 @@ class AutomaticFunctionCallingConfig(_common.BaseModel):
       GenerateContentResponse.automatic_function_calling_history.
       """,
   )
+  function_response_hook: Optional[Callable[..., Any]] = Field(
+      default=None,
+      description="""If automatic function calling is enabled,
+      a callable invoked as `hook(function_call, function_response)` after
+      the SDK executes each function. `function_response` is the
+      FunctionResponse sent back to the model, so callers can observe tool
+      results without executing the function a second time.
+      """,
+  )
+  max_concurrent_function_calls: Optional[int] = Field(
+      default=None,
+      description="""If automatic function calling is enabled,
+      maximum number of function calls from the same model turn that the SDK
+      executes concurrently. Coroutine functions are gathered on the event
+      loop and sync functions run on a thread pool of this size.
+      If not set or set to 1, function calls are executed one by one.
+      Function responses are always returned in the order of the calls.
+      """,
+  )
+  function_call_timeout: Optional[float] = Field(
+      default=None,
+      description="""If automatic function calling is enabled,
+      maximum number of seconds to wait for each function call. A function
+      that does not return in time gets an error function response.
+      If not set, the SDK waits for every function to return.
+      """,
+  )
 
 
 class AutomaticFunctionCallingConfigDict(TypedDict, total=False):
@@ -4078,6 +4232,30 @@ class AutomaticFunctionCallingConfigDict(TypedDict, total=False):
       GenerateContentResponse.automatic_function_calling_history.
       """
 
+  function_response_hook: Optional[Callable[..., Any]]
+  """If automatic function calling is enabled,
+      a callable invoked as `hook(function_call, function_response)` after
+      the SDK executes each function. `function_response` is the
+      FunctionResponse sent back to the model, so callers can observe tool
+      results without executing the function a second time.
+      """
+
+  max_concurrent_function_calls: Optional[int]
+  """If automatic function calling is enabled,
+      maximum number of function calls from the same model turn that the SDK
+      executes concurrently. Coroutine functions are gathered on the event
+      loop and sync functions run on a thread pool of this size.
+      If not set or set to 1, function calls are executed one by one.
+      Function responses are always returned in the order of the calls.
+      """
+
+  function_call_timeout: Optional[float]
+  """If automatic function calling is enabled,
+      maximum number of seconds to wait for each function call. A function
+      that does not return in time gets an error function response.
+      If not set, the SDK waits for every function to return.
+      """
+
 
 AutomaticFunctionCallingConfigOrDict = Union[
     AutomaticFunctionCallingConfig, AutomaticFunctionCallingConfigDict
@@ -8321,6 +8499,10 @@ class ListModelsConfig(_common.BaseModel):
   )
   page_size: Optional[int] = Field(default=None, description="""""")
   page_token: Optional[str] = Field(default=None, description="""""")
+  prefetch_pages: Optional[int] = Field(
+      default=None,
+      description="""Number of pages that the pager fetches ahead, in the background, while the current page is consumed. Defaults to 0, which fetches each page when it is needed.""",
+  )
   filter: Optional[str] = Field(default=None, description="""""")
   query_base: Optional[bool] = Field(
       default=None,
@@ -8339,6 +8521,9 @@ class ListModelsConfigDict(TypedDict, total=False):
   page_token: Optional[str]
   """"""
 
+  prefetch_pages: Optional[int]
+  """Number of pages that the pager fetches ahead, in the background, while the current page is consumed. Defaults to 0, which fetches each page when it is needed."""
+
   filter: Optional[str]
   """"""
 
@@ -10994,6 +11179,10 @@ class ListTuningJobsConfig(_common.BaseModel):
   )
   page_size: Optional[int] = Field(default=None, description="""""")
   page_token: Optional[str] = Field(default=None, description="""""")
+  prefetch_pages: Optional[int] = Field(
+      default=None,
+      description="""Number of pages that the pager fetches ahead, in the background, while the current page is consumed. Defaults to 0, which fetches each page when it is needed.""",
+  )
   filter: Optional[str] = Field(default=None, description="""""")
 
 
@@ -11009,6 +11198,9 @@ class ListTuningJobsConfigDict(TypedDict, total=False):
   page_token: Optional[str]
   """"""
 
+  prefetch_pages: Optional[int]
+  """Number of pages that the pager fetches ahead, in the background, while the current page is consumed. Defaults to 0, which fetches each page when it is needed."""
+
   filter: Optional[str]
   """"""
 
@@ -11829,6 +12021,10 @@ class ListCachedContentsConfig(_common.BaseModel):
   )
   page_size: Optional[int] = Field(default=None, description="""""")
   page_token: Optional[str] = Field(default=None, description="""""")
+  prefetch_pages: Optional[int] = Field(
+      default=None,
+      description="""Number of pages that the pager fetches ahead, in the background, while the current page is consumed. Defaults to 0, which fetches each page when it is needed.""",
+  )
 
 
 class ListCachedContentsConfigDict(TypedDict, total=False):
@@ -11843,6 +12039,9 @@ class ListCachedContentsConfigDict(TypedDict, total=False):
   page_token: Optional[str]
   """"""
 
+  prefetch_pages: Optional[int]
+  """Number of pages that the pager fetches ahead, in the background, while the current page is consumed. Defaults to 0, which fetches each page when it is needed."""
+
 
 ListCachedContentsConfigOrDict = Union[
     ListCachedContentsConfig, ListCachedContentsConfigDict
@@ -11911,6 +12110,10 @@ class ListFilesConfig(_common.BaseModel):
   )
   page_size: Optional[int] = Field(default=None, description="""""")
   page_token: Optional[str] = Field(default=None, description="""""")
+  prefetch_pages: Optional[int] = Field(
+      default=None,
+      description="""Number of pages that the pager fetches ahead, in the background, while the current page is consumed. Defaults to 0, which fetches each page when it is needed.""",
+  )
 
 
 class ListFilesConfigDict(TypedDict, total=False):
@@ -11925,6 +12128,9 @@ class ListFilesConfigDict(TypedDict, total=False):
   page_token: Optional[str]
   """"""
 
+  prefetch_pages: Optional[int]
+  """Number of pages that the pager fetches ahead, in the background, while the current page is consumed. Defaults to 0, which fetches each page when it is needed."""
+
 
 ListFilesConfigOrDict = Union[ListFilesConfig, ListFilesConfigDict]
 
@@ -12320,6 +12526,11 @@ class InlinedResponse(_common.BaseModel):
       description="""The error encountered while processing the request.
       """,
   )
+  metadata: Optional[dict[str, str]] = Field(
+      default=None,
+      description="""The metadata associated with the request. For results
+      read from a file, the `key` of the request.""",
+  )
 
 
 class InlinedResponseDict(TypedDict, total=False):
@@ -12333,6 +12544,10 @@ class InlinedResponseDict(TypedDict, total=False):
   """The error encountered while processing the request.
       """
 
+  metadata: Optional[dict[str, str]]
+  """The metadata associated with the request. For results
+      read from a file, the `key` of the request."""
+
 
 InlinedResponseOrDict = Union[InlinedResponse, InlinedResponseDict]
 
@@ -12965,6 +13180,10 @@ class ListBatchJobsConfig(_common.BaseModel):
   )
   page_size: Optional[int] = Field(default=None, description="""""")
   page_token: Optional[str] = Field(default=None, description="""""")
+  prefetch_pages: Optional[int] = Field(
+      default=None,
+      description="""Number of pages that the pager fetches ahead, in the background, while the current page is consumed. Defaults to 0, which fetches each page when it is needed.""",
+  )
   filter: Optional[str] = Field(default=None, description="""""")
 
 
@@ -12980,6 +13199,9 @@ class ListBatchJobsConfigDict(TypedDict, total=False):
   page_token: Optional[str]
   """"""
 
+  prefetch_pages: Optional[int]
+  """Number of pages that the pager fetches ahead, in the background, while the current page is consumed. Defaults to 0, which fetches each page when it is needed."""
+
   filter: Optional[str]
   """"""
 
@@ -13499,6 +13721,22 @@ class UploadFileConfig(_common.BaseModel):
   display_name: Optional[str] = Field(
       default=None, description="""Optional display name of the file."""
   )
+  chunk_size: Optional[int] = Field(
+      default=None,
+      description="""The number of bytes sent in each upload request. Defaults to 8 MB. It is rounded down to a multiple of the chunk granularity reported by the server.""",
+  )
+  upload_state_file: Optional[str] = Field(
+      default=None,
+      description="""Path of a JSON file where the upload URL and the number of bytes received by the server are saved after every chunk. If the upload is interrupted, calling upload again for the same file with the same `upload_state_file` resumes it from the last received byte. The file is removed once the upload completes.""",
+  )
+  upload_state_key: Optional[str] = Field(
+      default=None,
+      description="""Identifies the uploaded content in `upload_state_file`. An upload is only resumed if its key matches the saved one. Required with `upload_state_file` when uploading a stream, which can't otherwise be told apart from another stream of the same size.""",
+  )
+  progress_callback: Optional[Callable[[int, int], None]] = Field(
+      default=None,
+      description="""Called with the number of bytes received by the server and the total number of bytes after every uploaded chunk.""",
+  )
 
 
 class UploadFileConfigDict(TypedDict, total=False):
@@ -13516,6 +13754,18 @@ class UploadFileConfigDict(TypedDict, total=False):
   display_name: Optional[str]
   """Optional display name of the file."""
 
+  chunk_size: Optional[int]
+  """The number of bytes sent in each upload request. Defaults to 8 MB. It is rounded down to a multiple of the chunk granularity reported by the server."""
+
+  upload_state_file: Optional[str]
+  """Path of a JSON file where the upload URL and the number of bytes received by the server are saved after every chunk. If the upload is interrupted, calling upload again for the same file with the same `upload_state_file` resumes it from the last received byte. The file is removed once the upload completes."""
+
+  upload_state_key: Optional[str]
+  """Identifies the uploaded content in `upload_state_file`. An upload is only resumed if its key matches the saved one. Required with `upload_state_file` when uploading a stream, which can't otherwise be told apart from another stream of the same size."""
+
+  progress_callback: Optional[Callable[[int, int], None]]
+  """Called with the number of bytes received by the server and the total number of bytes after every uploaded chunk."""
+
 
 UploadFileConfigOrDict = Union[UploadFileConfig, UploadFileConfigDict]
 
@@ -13526,6 +13776,18 @@ class DownloadFileConfig(_common.BaseModel):
   http_options: Optional[HttpOptions] = Field(
       default=None, description="""Used to override HTTP request options."""
   )
+  chunk_size: Optional[int] = Field(
+      default=None,
+      description="""The number of bytes written to the destination at a time. Defaults to 1 MB. Only used when downloading to a destination.""",
+  )
+  resume: Optional[bool] = Field(
+      default=None,
+      description="""Whether to keep the data already in the destination file and only download the rest of the file. Only used when downloading to a destination path.""",
+  )
+  sha256_hash: Optional[str] = Field(
+      default=None,
+      description="""The base64 encoded SHA-256 hash of the file, e.g. `File.sha256_hash`. The download fails if the data doesn't match. Only used when downloading to a destination.""",
+  )
 
 
 class DownloadFileConfigDict(TypedDict, total=False):
@@ -13534,6 +13796,15 @@ class DownloadFileConfigDict(TypedDict, total=False):
   http_options: Optional[HttpOptionsDict]
   """Used to override HTTP request options."""
 
+  chunk_size: Optional[int]
+  """The number of bytes written to the destination at a time. Defaults to 1 MB. Only used when downloading to a destination."""
+
+  resume: Optional[bool]
+  """Whether to keep the data already in the destination file and only download the rest of the file. Only used when downloading to a destination path."""
+
+  sha256_hash: Optional[str]
+  """The base64 encoded SHA-256 hash of the file, e.g. `File.sha256_hash`. The download fails if the data doesn't match. Only used when downloading to a destination."""
+
 
 DownloadFileConfigOrDict = Union[DownloadFileConfig, DownloadFileConfigDict]
 
@@ -0,0 +1,93 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmarks per-turn CPU overhead of a chat session with a long history.
+
+Compares chat.send_message, which reuses the wire format of the history, with
+generate_content on the same contents, which converts the whole history on
+every turn. The network is replaced by a canned response, so the numbers are
+SDK CPU time only.
+
+Usage: python benchmarks/bench_chat_history.py
+"""
+
+import json
+import time
+from unittest import mock
+
+from google import genai
+from google.genai import types
+
+_MODEL = 'gemini-2.5-flash'
+_RESPONSE = types.HttpResponse(
+    headers={},
+    body=json.dumps({
+        'candidates': [{
+            'content': {'role': 'model', 'parts': [{'text': 'Noted.'}]},
+            'finishReason': 'STOP',
+        }]
+    }),
+)
+
+
+def _history(turns: int) -> list[types.Content]:
+  return [
+      types.Content(
+          role='user' if i % 2 == 0 else 'model',
+          parts=[types.Part(text=f'turn {i} ' * 20)],
+      )
+      for i in range(turns)
+  ]
+
+
+def _cpu_per_turn(send, calls: int) -> float:
+  send()  # The first turn converts the history.
+  start = time.process_time()
+  for _ in range(calls):
+    send()
+  return (time.process_time() - start) / calls
+
+
+def main() -> None:
+  client = genai.Client(api_key='bench-api-key')
+  calls = 20
+  print(f'{"turns":>5} {"generate_content us":>20} {"chat us":>12}')
+  with mock.patch.object(
+      client._api_client, 'request', return_value=_RESPONSE
+  ):
+    for turns in (10, 100, 500):
+      history = _history(turns)
+      message = types.Content(role='user', parts=[types.Part(text='Next.')])
+      baseline = _cpu_per_turn(
+          lambda: client.models.generate_content(
+              model=_MODEL, contents=history + [message]
+          ),
+          calls,
+      )
+
+      chat = client.chats.create(model=_MODEL, history=history)
+
+      def send_message() -> None:
+        chat.send_message('Next.')
+        # Keeps the history at the same length across calls.
+        del chat.get_history(curated=True)[turns:]
+        del chat.get_history()[turns:]
+
+      chat_cpu = _cpu_per_turn(send_message, calls)
+      print(f'{turns:>5} {baseline * 1e6:>20.0f} {chat_cpu * 1e6:>12.0f}')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,105 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmarks peak memory of `files.download` for a large file.
+
+A local server streams a file of the given size (1 GB by default). Each mode
+runs in a fresh process, which reports how much its peak RSS grew during the
+download:
+  * bytes: `files.download(file=...)`, which returns the data in memory;
+  * destination: `files.download(file=..., destination=path)`, which streams
+    the data to a file in chunks.
+
+Usage: python benchmarks/bench_download_rss.py [size in MB]
+"""
+
+import http.server
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from google import genai
+from google.genai import types
+
+
+_BLOCK = os.urandom(1024 * 1024)
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+
+  def log_message(self, *args):
+    pass
+
+  def do_GET(self):
+    blocks = self.server.size_mb  # type: ignore[attr-defined]
+    self.send_response(200)
+    self.send_header('Content-Length', str(blocks * len(_BLOCK)))
+    self.end_headers()
+    for _ in range(blocks):
+      self.wfile.write(_BLOCK)
+
+
+def _peak_rss_mb() -> float:
+  # ru_maxrss is in kilobytes on Linux.
+  return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run(mode: str, size_mb: int) -> None:
+  server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+  server.size_mb = size_mb  # type: ignore[attr-defined]
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  client = genai.Client(
+      api_key='bench-api-key',
+      http_options=types.HttpOptions(
+          base_url=f'http://127.0.0.1:{server.server_address[1]}/',
+          timeout=600_000,
+      ),
+  )
+  before = _peak_rss_mb()
+  start = time.perf_counter()
+  if mode == 'bytes':
+    size = len(client.files.download(file='files/large'))
+  else:
+    with tempfile.TemporaryDirectory() as directory:
+      destination = os.path.join(directory, 'large.bin')
+      client.files.download(file='files/large', destination=destination)
+      size = os.path.getsize(destination)
+  elapsed = time.perf_counter() - start
+  assert size == size_mb * len(_BLOCK), size
+  print(
+      f'{mode:>12} {size_mb:>8} {_peak_rss_mb() - before:>14.1f}'
+      f' {size_mb / elapsed:>8.0f}'
+  )
+  server.shutdown()
+
+
+def main() -> None:
+  if len(sys.argv) == 3:
+    _run(sys.argv[1], int(sys.argv[2]))
+    return
+  size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 1024
+  print(f'{"mode":>12} {"MB":>8} {"peak RSS +MB":>14} {"MB/s":>8}')
+  for mode in ('destination', 'bytes'):
+    subprocess.run(
+        [sys.executable, __file__, mode, str(size_mb)], check=True
+    )
+
+
+if __name__ == '__main__':
+  main()
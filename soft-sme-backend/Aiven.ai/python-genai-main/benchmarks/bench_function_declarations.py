@@ -0,0 +1,90 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmarks config-to-request conversion with Python callable tools.
+
+Usage: python benchmarks/bench_function_declarations.py
+"""
+
+import timeit
+from typing import Optional
+
+from google.genai import _api_client
+from google.genai import _transformers as t
+from google.genai import models
+from google.genai import types
+
+
+def _make_tool(index: int):
+  def tool(
+      table: str,
+      limit: int = 10,
+      columns: Optional[list[str]] = None,
+      include_comments: bool = False,
+  ) -> dict[str, object]:
+    """Returns a slice of the schema for the given table.
+
+    Args:
+      table: Name of the table.
+      limit: Maximum number of rows.
+      columns: Columns to include, all columns if unset.
+      include_comments: Whether to include column comments.
+    """
+    return {}
+
+  tool.__name__ = tool.__qualname__ = f'tool_{index}'
+  return tool
+
+
+def _convert(api_client, parameters) -> None:
+  models._GenerateContentParameters_to_mldev(api_client, parameters)
+
+
+def main() -> None:
+  api_client = _api_client.BaseApiClient(api_key='bench-api-key')
+  print(f'{"tools":>5} {"uncached ms":>12} {"cached ms":>10} {"speedup":>8}')
+  for tool_count in (3, 10, 50):
+    tools = [_make_tool(i) for i in range(tool_count)]
+    parameters = types._GenerateContentParameters(
+        model='gemini-2.5-flash',
+        contents='How many open sales orders are there?',
+        config=types.GenerateContentConfig(tools=tools),
+    )
+    number = 50
+
+    def uncached():
+      t.clear_function_declaration_cache()
+      _convert(api_client, parameters)
+
+    uncached_s = min(timeit.repeat(uncached, number=number, repeat=5)) / number
+    _convert(api_client, parameters)
+    cached_s = (
+        min(
+            timeit.repeat(
+                lambda: _convert(api_client, parameters),
+                number=number,
+                repeat=5,
+            )
+        )
+        / number
+    )
+    print(
+        f'{tool_count:>5} {uncached_s * 1e3:>12.3f} {cached_s * 1e3:>10.3f}'
+        f' {uncached_s / cached_s:>7.1f}x'
+    )
+
+
+if __name__ == '__main__':
+  main()
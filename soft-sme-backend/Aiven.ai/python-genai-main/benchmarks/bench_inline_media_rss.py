@@ -0,0 +1,141 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmarks peak memory of `generate_content` with a large inline document.
+
+A local server reads and discards the request body. Each mode runs in a fresh
+process, which reports how much its peak RSS grew from before the document was
+read until the response was returned (Linux only):
+  * previous: the document is read into bytes, which are base64 encoded and
+    serialized with the rest of the request before it is sent;
+  * bytes: the document is read into bytes, which are base64 encoded in chunks
+    while the request is sent;
+  * mmap: the document is memory mapped and encoded in chunks while the request
+    is sent. Pages of the mapped file that were read count towards RSS.
+
+Usage: python benchmarks/bench_inline_media_rss.py [size in MB]
+"""
+
+import http.server
+import json
+import mmap
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from unittest import mock
+
+from google import genai
+from google.genai import _common
+from google.genai import types
+
+
+_RESPONSE = json.dumps({
+    'candidates': [{'content': {'role': 'model', 'parts': [{'text': 'ok'}]}}]
+}).encode()
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+
+  def log_message(self, *args):
+    pass
+
+  def do_POST(self):
+    remaining = int(self.headers['Content-Length'])
+    while remaining:
+      remaining -= len(self.rfile.read(min(remaining, 1024 * 1024)))
+    self.send_response(200)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(_RESPONSE)))
+    self.end_headers()
+    self.wfile.write(_RESPONSE)
+
+
+def _peak_rss_mb() -> float:
+  # ru_maxrss is in kilobytes on Linux.
+  return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _rss_mb() -> float:
+  # The second field of statm is the resident set size in pages.
+  with open('/proc/self/statm') as f:
+    return int(f.read().split()[1]) * resource.getpagesize() / 2**20
+
+
+def _generate(client: genai.Client, data) -> None:
+  response = client.models.generate_content(
+      model='gemini-2.5-flash',
+      contents=[
+          'Summarize this document.',
+          types.Part.from_bytes(data=data, mime_type='application/pdf'),
+      ],
+  )
+  assert response.text == 'ok'
+
+
+def _run(mode: str, path: str) -> None:
+  server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  client = genai.Client(
+      api_key='bench-api-key',
+      http_options=types.HttpOptions(
+          base_url=f'http://127.0.0.1:{server.server_address[1]}/'
+      ),
+  )
+  # Warm up, so that only the document is measured.
+  _generate(client, b'warm up')
+  before = _rss_mb()
+  start = time.perf_counter()
+  if mode == 'mmap':
+    with open(path, 'rb') as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+      _generate(client, data)
+  else:
+    with open(path, 'rb') as f:
+      data = f.read()
+    if mode == 'previous':
+      with mock.patch.object(_common, 'LAZY_BASE64_MIN_SIZE', float('inf')):
+        _generate(client, data)
+    else:
+      _generate(client, data)
+  elapsed = time.perf_counter() - start
+  size_mb = os.path.getsize(path) / 2**20
+  print(
+      f'{mode:>10} {size_mb:>6.0f} {_peak_rss_mb() - before:>14.1f}'
+      f' {elapsed * 1e3:>8.0f}'
+  )
+  server.shutdown()
+
+
+def main() -> None:
+  if len(sys.argv) == 3:
+    _run(sys.argv[1], sys.argv[2])
+    return
+  size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+  with tempfile.TemporaryDirectory() as directory:
+    path = os.path.join(directory, 'document.pdf')
+    with open(path, 'wb') as f:
+      f.write(os.urandom(size_mb * 2**20))
+    print(f'{"mode":>10} {"MB":>6} {"peak RSS +MB":>14} {"ms":>8}')
+    for mode in ('previous', 'bytes', 'mmap'):
+      subprocess.run([sys.executable, __file__, mode, path], check=True)
+
+
+if __name__ == '__main__':
+  main()
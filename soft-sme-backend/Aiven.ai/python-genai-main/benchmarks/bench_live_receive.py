@@ -0,0 +1,129 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmarks receiving audio messages over a live session.
+
+Reports microseconds per message to parse messages that carry 40 ms of 24 kHz
+PCM audio, the shape of most messages of a spoken response, and small turn
+complete messages:
+  * previous: JSON decoding, removal of unknown fields and validation with
+    `LiveServerMessage._from_response`, the path used for every message before;
+  * single pass: `_validate_message_json`, which validates the JSON directly;
+  * receive: `session.receive()` over a websocket stand-in, which includes the
+    background reader. The session's receive statistics are reported too.
+
+Usage: python benchmarks/bench_live_receive.py [messages]
+"""
+
+import asyncio
+import base64
+import json
+import sys
+import time
+
+from google.genai import _common
+from google.genai import live
+from google.genai import types
+
+
+_MESSAGE = json.dumps({
+    'serverContent': {
+        'modelTurn': {
+            'role': 'model',
+            'parts': [{
+                'inlineData': {
+                    'data': base64.b64encode(bytes(1920)).decode(),
+                    'mimeType': 'audio/pcm;rate=24000',
+                }
+            }],
+        }
+    }
+})
+_TURN_COMPLETE = '{"serverContent": {"turnComplete": true}}'
+
+
+class _ApiClient:
+  vertexai = False
+
+
+class _WebSocket:
+
+  def __init__(self, messages: int):
+    self._frames = iter([_MESSAGE] * (messages - 1) + [_TURN_COMPLETE])
+
+  async def recv(self, decode=None) -> str:
+    return next(self._frames)
+
+  async def close(self) -> None:
+    pass
+
+
+def _us(run, messages: int) -> float:
+  start = time.perf_counter()
+  run()
+  return (time.perf_counter() - start) / messages * 1e6
+
+
+def _parse_all(parse, raw: bytes, messages: int) -> None:
+  for _ in range(messages):
+    parse(raw)
+
+
+def _previous(raw: bytes) -> types.LiveServerMessage:
+  return types.LiveServerMessage._from_response(
+      response=_common.json_loads(raw), kwargs={}
+  )
+
+
+async def _receive(session: live.AsyncSession) -> int:
+  count = 0
+  async for _ in session.receive():
+    count += 1
+  await session.close()
+  return count
+
+
+def main(messages: int) -> None:
+  print(f'{"":>12} {"audio us":>10} {"small us":>10}')
+  for name, parse in (
+      ('previous', _previous),
+      (
+          'single pass',
+          lambda raw: live._validate_message_json(raw, vertexai=False),
+      ),
+  ):
+    audio, small = (
+        _us(lambda: _parse_all(parse, raw, messages), messages)
+        for raw in (_MESSAGE.encode(), _TURN_COMPLETE.encode())
+    )
+    print(f'{name:>12} {audio:>10.1f} {small:>10.1f}')
+  session = live.AsyncSession(
+      api_client=_ApiClient(),  # type: ignore[arg-type]
+      websocket=_WebSocket(messages),  # type: ignore[arg-type]
+  )
+  receive = _us(lambda: asyncio.run(_receive(session)), messages)
+  print(f'{"receive":>12} {receive:>10.1f}')
+  stats = session.receive_stats
+  print(
+      f'receive stats: {stats.messages} messages,'
+      f' {stats.fast_parsed_messages} fast parsed,'
+      f' mean parse {stats.mean_parse_seconds * 1e6:.1f} us,'
+      f' max parse {stats.max_parse_seconds * 1e6:.1f} us,'
+      f' max queue depth {stats.max_queue_depth}'
+  )
+
+
+if __name__ == '__main__':
+  main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
@@ -0,0 +1,145 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmarks `LocalTokenizer(...)` construction from the model cache.
+
+A synthetic sentencepiece model with as many pieces as the gemma3 tokenizer is
+placed in the local model cache, so no download happens. Reports:
+  * previous: the previous loader, which read and hashed the cached model once
+    for the model proto and once for the processor, rewriting the cache both
+    times;
+  * cold start: the model is read and hashed once, and the hash sidecar is
+    written (first start after a download or an upgrade);
+  * warm start: the hash sidecar is valid, so the model is read once and not
+    hashed.
+Building the sentencepiece processor dominates the construction time, so the
+time to load the model bytes alone is reported too. The in-process caches are
+cleared before each run.
+
+Usage: python benchmarks/bench_local_tokenizer_load.py
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from unittest import mock
+
+import sentencepiece as spm
+from sentencepiece import sentencepiece_model_pb2
+
+from google.genai import _local_tokenizer_loader as loader
+from google.genai import local_tokenizer
+
+
+_MODEL_URL = 'https://example.com/bench.model'
+
+
+def _model(pieces: int) -> bytes:
+  piece_type = sentencepiece_model_pb2.ModelProto.SentencePiece.Type
+  model = sentencepiece_model_pb2.ModelProto()
+  model.pieces.add(piece='<unk>', score=0, type=piece_type.UNKNOWN)
+  model.pieces.add(piece='<s>', score=0, type=piece_type.CONTROL)
+  model.pieces.add(piece='</s>', score=0, type=piece_type.CONTROL)
+  for i in range(pieces):
+    model.pieces.add(piece=f'▁w{i}', score=-float(i), type=piece_type.NORMAL)
+  return model.SerializeToString()
+
+
+def _previous_load(model_path: str, expected_hash: str) -> bytes:
+  with open(model_path, 'rb') as f:
+    content = f.read()
+  assert hashlib.sha256(content).hexdigest() == expected_hash
+  tmp_path = f'{model_path}.tmp'
+  with open(tmp_path, 'wb') as f:
+    f.write(content)
+  os.rename(tmp_path, model_path)
+  return content
+
+
+def _previous_tokenizer(model_path: str, expected_hash: str) -> None:
+  model_proto = sentencepiece_model_pb2.ModelProto()
+  model_proto.ParseFromString(_previous_load(model_path, expected_hash))
+  processor = spm.SentencePieceProcessor()
+  processor.LoadFromSerializedProto(_previous_load(model_path, expected_hash))
+
+
+def _clear_caches() -> None:
+  loader._load_model_proto_bytes.cache_clear()
+  loader.load_model_proto.cache_clear()
+  loader.get_sentencepiece.cache_clear()
+
+
+def _ms(fn, setup, calls: int = 10) -> float:
+  total = 0.0
+  for _ in range(calls):
+    setup()
+    start = time.perf_counter()
+    fn()
+    total += time.perf_counter() - start
+  return total / calls * 1e3
+
+
+def main() -> None:
+  content = _model(262_144)
+  expected_hash = hashlib.sha256(content).hexdigest()
+  with tempfile.TemporaryDirectory() as tempdir, mock.patch(
+      'tempfile.gettempdir', return_value=tempdir
+  ), mock.patch.dict(
+      loader._TOKENIZERS,
+      {'bench': loader._TokenizerConfig(_MODEL_URL, expected_hash)},
+  ), mock.patch.dict(
+      loader._GEMINI_MODELS_TO_TOKENIZER_NAMES, {'bench-model': 'bench'}
+  ):
+    model_dir = os.path.join(tempdir, 'vertexai_tokenizer_model')
+    model_path = os.path.join(
+        model_dir, hashlib.sha1(_MODEL_URL.encode()).hexdigest()
+    )
+    os.makedirs(model_dir)
+    with open(model_path, 'wb') as f:
+      f.write(content)
+    sidecar_path = loader._hash_sidecar_path(model_path)
+
+    def cold_setup() -> None:
+      _clear_caches()
+      if os.path.exists(sidecar_path):
+        os.remove(sidecar_path)
+
+    def previous_load() -> None:
+      _previous_load(model_path, expected_hash)
+      _previous_load(model_path, expected_hash)
+
+    construct = lambda: local_tokenizer.LocalTokenizer('bench-model')
+    load = lambda: loader._load_model_proto_bytes('bench')
+    print(f'model size: {len(content) / 2**20:.1f} MB')
+    print(f'{"":>12} {"LocalTokenizer ms":>18} {"model load ms":>14}')
+    for name, tokenizer_fn, load_fn, setup in (
+        (
+            'previous',
+            lambda: _previous_tokenizer(model_path, expected_hash),
+            previous_load,
+            _clear_caches,
+        ),
+        ('cold start', construct, load, cold_setup),
+        ('warm start', construct, load, _clear_caches),
+    ):
+      print(
+          f'{name:>12} {_ms(tokenizer_fn, setup):>18.1f}'
+          f' {_ms(load_fn, setup, calls=50):>14.2f}'
+      )
+
+
+if __name__ == '__main__':
+  main()
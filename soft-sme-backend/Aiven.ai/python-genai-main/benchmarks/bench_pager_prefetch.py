@@ -0,0 +1,145 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmarks listing 10k files with and without prefetching pages.
+
+A local server serves `files.list` pages of 100 files, each after an injected
+latency (50ms by default). The consumer spends 0.5ms on every item, so about
+as long on a page as it takes to fetch one, and with prefetching the requests
+for the next pages overlap with consuming the current one. Reports the wall
+time and items per second for:
+  * iterating over the pager, which fetches each page when it is needed;
+  * `all_items()`, without and with `prefetch_pages`;
+  * the same for `client.aio.files.list`.
+
+Usage: python benchmarks/bench_pager_prefetch.py [latency in ms]
+"""
+
+import asyncio
+import http.server
+import json
+import sys
+import threading
+import time
+import urllib.parse
+
+from google import genai
+from google.genai import types
+
+
+_ITEMS = 10_000
+_PAGE_SIZE = 100
+# Time spent by the consumer on each item.
+_WORK_PER_ITEM = 0.0005
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+
+  def log_message(self, *args):
+    pass
+
+  def do_GET(self):
+    url = urllib.parse.urlparse(self.path)
+    query = dict(urllib.parse.parse_qsl(url.query))
+    page = int(query.get('pageToken', 0))
+    start = page * _PAGE_SIZE
+    body = {
+        'files': [
+            {'name': f'files/{i}', 'mimeType': 'text/plain', 'sizeBytes': '1'}
+            for i in range(start, min(start + _PAGE_SIZE, _ITEMS))
+        ]
+    }
+    if start + _PAGE_SIZE < _ITEMS:
+      body['nextPageToken'] = str(page + 1)
+    data = json.dumps(body).encode()
+    time.sleep(self.server.latency)  # type: ignore[attr-defined]
+    self.send_response(200)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(data)))
+    self.end_headers()
+    self.wfile.write(data)
+
+
+def _consume(items) -> int:
+  count = 0
+  for _ in items:
+    time.sleep(_WORK_PER_ITEM)
+    count += 1
+  return count
+
+
+async def _aconsume(items) -> int:
+  count = 0
+  async for _ in items:
+    await asyncio.sleep(_WORK_PER_ITEM)
+    count += 1
+  return count
+
+
+def _print(name: str, count: int, elapsed: float) -> None:
+  assert count == _ITEMS, (name, count)
+  print(f'{name:>30} {elapsed:>8.2f} {count / elapsed:>10.0f}')
+
+
+def _report(name: str, run) -> None:
+  start = time.perf_counter()
+  count = run()
+  _print(name, count, time.perf_counter() - start)
+
+
+def main() -> None:
+  latency_ms = float(sys.argv[1]) if len(sys.argv) > 1 else 50
+  server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+  server.latency = latency_ms / 1000  # type: ignore[attr-defined]
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  client = genai.Client(
+      api_key='bench-api-key',
+      http_options=types.HttpOptions(
+          base_url=f'http://127.0.0.1:{server.server_address[1]}/'
+      ),
+  )
+
+  def pager(**config):
+    return client.files.list(config={'page_size': _PAGE_SIZE, **config})
+
+  async def async_report(name: str, **config) -> None:
+    start = time.perf_counter()
+    async_pager = await client.aio.files.list(
+        config={'page_size': _PAGE_SIZE, **config}
+    )
+    count = await _aconsume(async_pager.all_items())
+    _print(name, count, time.perf_counter() - start)
+
+  async def async_main() -> None:
+    # The async requests share one event loop, and so one aiohttp session.
+    await async_report('async all_items')
+    await async_report('async all_items, prefetch=2', prefetch_pages=2)
+    await client.aio.aclose()
+
+  print(f'{_ITEMS} items, {_PAGE_SIZE} per page, {latency_ms:.0f}ms latency')
+  print(f'{"":>30} {"seconds":>8} {"items/s":>10}')
+  _report('iterate', lambda: _consume(pager()))
+  _report('all_items', lambda: _consume(pager().all_items()))
+  for prefetch_pages in (1, 2, 4):
+    _report(
+        f'all_items, prefetch_pages={prefetch_pages}',
+        lambda: _consume(pager(prefetch_pages=prefetch_pages).all_items()),
+    )
+  asyncio.run(async_main())
+  server.shutdown()
+
+
+if __name__ == '__main__':
+  main()
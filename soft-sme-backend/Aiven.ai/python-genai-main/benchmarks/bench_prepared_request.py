@@ -0,0 +1,107 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmarks per-call CPU overhead of generate_content vs models.prepare.
+
+The network is replaced by a canned response, so the numbers are SDK CPU time
+only.
+
+Usage: python benchmarks/bench_prepared_request.py
+"""
+
+import json
+import time
+from typing import Optional
+from unittest import mock
+
+from google import genai
+from google.genai import types
+
+_RESPONSE = types.HttpResponse(
+    headers={},
+    body=json.dumps({
+        'candidates': [{
+            'content': {'role': 'model', 'parts': [{'text': 'There are 3.'}]},
+            'finishReason': 'STOP',
+        }]
+    }),
+)
+
+
+def list_tables() -> list[str]:
+  """Lists the tables of the database."""
+  return []
+
+
+def get_schema_slice(tables: list[str]) -> dict[str, object]:
+  """Returns the columns of the given tables."""
+  return {}
+
+
+def run_select_readonly(
+    sql: str, params: Optional[list[str]] = None
+) -> dict[str, object]:
+  """Runs a read-only SELECT query."""
+  return {}
+
+
+def _cpu_per_call(fn, calls: int) -> float:
+  start = time.process_time()
+  for _ in range(calls):
+    fn()
+  return (time.process_time() - start) / calls
+
+
+def main() -> None:
+  client = genai.Client(api_key='bench-api-key')
+  config = types.GenerateContentConfig(
+      system_instruction='You are a read-only Postgres data analyst.',
+      tools=[list_tables, get_schema_slice, run_select_readonly],
+      tool_config=types.ToolConfig(
+          function_calling_config=types.FunctionCallingConfig(mode='AUTO')
+      ),
+      temperature=0,
+      thinking_config=types.ThinkingConfig(thinking_budget=0),
+  )
+  calls = 300
+  print(f'{"turns":>5} {"generate_content us":>20} {"prepared us":>12}')
+  with mock.patch.object(
+      client._api_client, 'request', return_value=_RESPONSE
+  ):
+    prepared = client.models.prepare(model='gemini-2.5-flash', config=config)
+    for turns in (1, 10):
+      contents = [
+          types.Content(
+              role='user' if i % 2 == 0 else 'model',
+              parts=[types.Part(text=f'turn {i} ' * 20)],
+          )
+          for i in range(turns)
+      ]
+      baseline = _cpu_per_call(
+          lambda: client.models.generate_content(
+              model='gemini-2.5-flash', contents=contents, config=config
+          ),
+          calls,
+      )
+      prepared_cpu = _cpu_per_call(
+          lambda: prepared.generate_content(contents=contents), calls
+      )
+      print(
+          f'{turns:>5} {baseline * 1e6:>20.0f} {prepared_cpu * 1e6:>12.0f}'
+      )
+
+
+if __name__ == '__main__':
+  main()
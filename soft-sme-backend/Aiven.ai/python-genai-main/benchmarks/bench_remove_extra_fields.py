@@ -0,0 +1,146 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmarks response field pruning with compiled per-model plans.
+
+Prunes large GenerateContentResponse payloads (many candidates, parts and
+grounding chunks, each with unknown fields) with `_common._remove_extra_fields`
+and with the previous implementation, which rebuilt the alias map for every
+key. Both must produce the same result.
+
+Usage: python benchmarks/bench_remove_extra_fields.py
+"""
+
+import copy
+import time
+import typing
+from typing import Any, Union
+
+from google.genai import _common
+from google.genai import types
+
+
+def _remove_extra_fields_uncompiled(
+    model: Any, response: dict[str, Any]
+) -> None:
+  for key, value in list(response.items()):
+    alias_map = {
+        field_info.alias: key for key, field_info in model.model_fields.items()
+    }
+    if key not in model.model_fields and key not in alias_map:
+      response.pop(key)
+      continue
+    key = alias_map.get(key, key)
+    annotation = model.model_fields[key].annotation
+    if typing.get_origin(annotation) is Union:
+      annotation = typing.get_args(annotation)[0]
+    if isinstance(value, dict) and typing.get_origin(annotation) is not dict:
+      _remove_extra_fields_uncompiled(annotation, value)
+    elif isinstance(value, list):
+      if _common._is_struct_type(annotation):
+        continue
+      for item in value:
+        if isinstance(item, dict):
+          _remove_extra_fields_uncompiled(typing.get_args(annotation)[0], item)
+
+
+def _response(candidates: int, parts: int, chunks: int) -> dict[str, Any]:
+  return {
+      'candidates': [
+          {
+              'content': {
+                  'role': 'model',
+                  'parts': [
+                      {
+                          'text': f'part {p}',
+                          'thoughtSignature': 'c2lnbmF0dXJl',
+                          'unknownPartField': p,
+                      }
+                      for p in range(parts)
+                  ],
+              },
+              'finishReason': 'STOP',
+              'index': c,
+              'safetyRatings': [
+                  {'category': 'HARM_CATEGORY_HARASSMENT', 'probability': 'LOW'}
+              ],
+              'groundingMetadata': {
+                  'groundingChunks': [
+                      {
+                          'web': {
+                              'uri': f'https://example.com/{g}',
+                              'title': f'Result {g}',
+                              'unknownWebField': g,
+                          }
+                      }
+                      for g in range(chunks)
+                  ],
+                  'groundingSupports': [
+                      {
+                          'segment': {'startIndex': g, 'endIndex': g + 1},
+                          'groundingChunkIndices': [g],
+                          'confidenceScores': [0.9],
+                      }
+                      for g in range(chunks)
+                  ],
+                  'webSearchQueries': ['query'],
+              },
+              'unknownCandidateField': {'nested': True},
+          }
+          for c in range(candidates)
+      ],
+      'usageMetadata': {
+          'promptTokenCount': 10,
+          'candidatesTokenCount': 20,
+          'totalTokenCount': 30,
+          'unknownUsageField': 1,
+      },
+      'modelVersion': 'gemini-2.5-flash',
+      'responseId': 'abc',
+  }
+
+
+def _cpu_per_call(fn, response: dict[str, Any], calls: int) -> float:
+  copies = [copy.deepcopy(response) for _ in range(calls)]
+  start = time.process_time()
+  for item in copies:
+    fn(types.GenerateContentResponse, item)
+  return (time.process_time() - start) / calls
+
+
+def main() -> None:
+  print(
+      f'{"candidates":>10} {"parts":>6} {"chunks":>6}'
+      f' {"uncompiled ms":>14} {"compiled ms":>12}'
+  )
+  for candidates, parts, chunks in ((1, 1, 0), (1, 20, 20), (4, 50, 100)):
+    response = _response(candidates, parts, chunks)
+    expected = copy.deepcopy(response)
+    _remove_extra_fields_uncompiled(types.GenerateContentResponse, expected)
+    actual = copy.deepcopy(response)
+    _common._remove_extra_fields(types.GenerateContentResponse, actual)
+    assert actual == expected
+
+    calls = 50
+    uncompiled = _cpu_per_call(_remove_extra_fields_uncompiled, response, calls)
+    compiled = _cpu_per_call(_common._remove_extra_fields, response, calls)
+    print(
+        f'{candidates:>10} {parts:>6} {chunks:>6}'
+        f' {uncompiled * 1e3:>14.3f} {compiled * 1e3:>12.3f}'
+    )
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,97 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Benchmarks the response-parsing kwargs built for a 5 MB inline PDF request.
+
+Compares a full `model_dump()` of the request parameters, which is what
+`_from_response` used to receive, with `_common.get_response_kwargs`, for the
+PDF alone and with a 100 turn chat history in front of it.
+
+Usage: python benchmarks/bench_response_kwargs.py
+"""
+
+import time
+import tracemalloc
+
+import pydantic
+
+from google.genai import _common
+from google.genai import types
+
+
+class Invoice(pydantic.BaseModel):
+  number: str
+  total: float
+
+
+def _measure(fn, calls: int) -> tuple[float, int]:
+  start = time.process_time()
+  for _ in range(calls):
+    fn()
+  cpu = (time.process_time() - start) / calls
+  tracemalloc.start()
+  fn()
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  return cpu, peak
+
+
+def main() -> None:
+  pdf = b'%PDF-1.7\n' + b'\x00' * (5 * 1024 * 1024)
+  config = types.GenerateContentConfig(
+      response_mime_type='application/json',
+      response_schema=Invoice,
+  )
+  calls = 20
+  print(
+      f'{"history":>7} {"":>20} {"cpu ms":>8} {"peak alloc KiB":>15}'
+  )
+  for turns in (0, 100):
+    history = [
+        types.Content(
+            role='user' if i % 2 == 0 else 'model',
+            parts=[types.Part(text=f'turn {i} ' * 20)],
+        )
+        for i in range(turns)
+    ]
+    parameter_model = types._GenerateContentParameters(
+        model='gemini-2.5-flash',
+        contents=history
+        + [
+            types.Content(
+                role='user',
+                parts=[
+                    types.Part.from_bytes(
+                        data=pdf, mime_type='application/pdf'
+                    ),
+                    types.Part(text='Extract the invoice number and total.'),
+                ],
+            )
+        ],
+        config=config,
+    )
+    for name, fn in (
+        ('model_dump', parameter_model.model_dump),
+        (
+            'get_response_kwargs',
+            lambda: _common.get_response_kwargs(parameter_model),
+        ),
+    ):
+      cpu, peak = _measure(fn, calls)
+      print(f'{turns:>7} {name:>20} {cpu * 1e3:>8.3f} {peak / 1024:>15.1f}')
+
+
+if __name__ == '__main__':
+  main()
@@ -15,20 +15,28 @@
 
 """Extra utils depending on types that are shared between sync and async modules."""
 
+import asyncio
+import concurrent.futures
+import functools
 import inspect
 import io
 import logging
+import math
 import sys
+import threading
+import time
 import typing
 from typing import Any, Callable, Dict, Optional, Union, get_args, get_origin
 import mimetypes
 import os
+import queue
 import pydantic
 
 from . import _common
 from . import _mcp_utils
 from . import _transformers as t
 from . import errors
+from . import instrumentation as _instrumentation
 from . import types
 from ._adapters import McpToGenAiToolAdapter
 
@@ -300,12 +308,31 @@ async def invoke_function_from_dict_args_async(
     )
 
 
-def get_function_response_parts(
+def _call_function_response_hook(
+    function_response_hook: Optional[Callable[..., Any]],
+    function_call: types.FunctionCall,
+    function_response_part: types.Part,
+) -> Any:
+  """Invokes the user provided hook, logging instead of raising on failure."""
+  if function_response_hook is None:
+    return None
+  try:
+    return function_response_hook(
+        function_call, function_response_part.function_response
+    )
+  except Exception as e:  # pylint: disable=broad-except
+    logger.warning(
+        f'function_response_hook failed for function {function_call.name}'
+        f' with error: {e}'
+    )
+    return None
+
+
+def _get_function_calls(
     response: types.GenerateContentResponse,
-    function_map: dict[str, Union[Callable[..., Any], McpToGenAiToolAdapter]],
-) -> list[types.Part]:
-  """Returns the function response parts from the response."""
-  func_response_parts = []
+) -> list[types.FunctionCall]:
+  """Returns the function calls of the first candidate, in order."""
+  function_calls: list[types.FunctionCall] = []
   if (
       response.candidates is not None
       and isinstance(response.candidates[0].content, types.Content)
@@ -314,71 +341,331 @@ def get_function_response_parts(
     for part in response.candidates[0].content.parts:
       if not part.function_call:
         continue
-      func_name = part.function_call.name
-      if func_name is not None and part.function_call.args is not None:
-        func = function_map[func_name]
-        args = convert_number_values_for_dict_function_call_args(
-            part.function_call.args
-        )
-        func_response: _common.StringDict
-        try:
-          if not isinstance(func, McpToGenAiToolAdapter):
-            func_response = {
-                'result': invoke_function_from_dict_args(args, func)
-            }
-        except Exception as e:  # pylint: disable=broad-except
-          func_response = {'error': str(e)}
-        func_response_part = types.Part.from_function_response(
-            name=func_name, response=func_response
+      if (
+          part.function_call.name is not None
+          and part.function_call.args is not None
+      ):
+        function_calls.append(part.function_call)
+  return function_calls
+
+
+def _function_call_timeout_response(
+    function_call: types.FunctionCall, timeout: Optional[float]
+) -> _common.StringDict:
+  return {
+      'error': (
+          f'Function {function_call.name} did not return within'
+          f' {timeout} seconds.'
+      )
+  }
+
+
+def _invoke_function_call(
+    function_call: types.FunctionCall,
+    func: Union[Callable[..., Any], McpToGenAiToolAdapter],
+    instrumentation: Optional[_instrumentation.Instrumentation] = None,
+) -> _common.StringDict:
+  """Invokes a sync function for a function call and returns its response."""
+  if isinstance(func, McpToGenAiToolAdapter):
+    raise errors.UnsupportedFunctionError(
+        'MCP tools are not supported in synchronous methods.'
+    )
+  args = convert_number_values_for_dict_function_call_args(
+      function_call.args  # type: ignore[arg-type]
+  )
+  started = time.perf_counter()
+  try:
+    func_response = {'result': invoke_function_from_dict_args(args, func)}
+  except Exception as e:  # pylint: disable=broad-except
+    func_response = {'error': str(e)}
+  _instrumentation._tool_called(
+      instrumentation, function_call.name, started, func_response
+  )
+  return func_response
+
+
+async def _invoke_function_call_async(
+    function_call: types.FunctionCall,
+    func: Union[Callable[..., Any], McpToGenAiToolAdapter],
+    executor: Optional[concurrent.futures.Executor] = None,
+) -> _common.StringDict:
+  """Invokes a function for a function call and returns its response.
+
+  Sync functions run on `executor` when one is given, so that they do not block
+  the event loop while other function calls are in flight.
+  """
+  args = convert_number_values_for_dict_function_call_args(
+      function_call.args  # type: ignore[arg-type]
+  )
+  try:
+    if isinstance(func, McpToGenAiToolAdapter):
+      mcp_tool_response = await func.call_tool(
+          types.FunctionCall(name=function_call.name, args=args)
+      )
+      if mcp_tool_response.isError:
+        return {'error': mcp_tool_response}
+      return {'result': mcp_tool_response}
+    elif inspect.iscoroutinefunction(func):
+      return {'result': await invoke_function_from_dict_args_async(args, func)}
+    elif executor is not None:
+      return {
+          'result': await asyncio.get_running_loop().run_in_executor(
+              executor,
+              functools.partial(invoke_function_from_dict_args, args, func),
+          )
+      }
+    else:
+      return {'result': invoke_function_from_dict_args(args, func)}
+  except Exception as e:  # pylint: disable=broad-except
+    return {'error': str(e)}
+
+
+class _ThreadPerCallExecutor(concurrent.futures.Executor):
+  """Runs each call on a new daemon thread.
+
+  Function calls that can time out run on it: a function that times out is
+  abandoned on its thread, so it holds up neither the function calls queued
+  behind it nor the exit of the interpreter.
+  """
+
+  def submit(  # type: ignore[override]
+      self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any
+  ) -> 'concurrent.futures.Future[Any]':
+    future: concurrent.futures.Future[Any] = concurrent.futures.Future()
+
+    def run() -> None:
+      if not future.set_running_or_notify_cancel():
+        return
+      try:
+        result = fn(*args, **kwargs)
+      except BaseException as e:  # pylint: disable=broad-except
+        future.set_exception(e)
+      else:
+        future.set_result(result)
+
+    threading.Thread(target=run, name='genai_afc', daemon=True).start()
+    return future
+
+
+def _invoke_function_calls_in_threads(
+    function_calls: list[types.FunctionCall],
+    function_map: dict[str, Union[Callable[..., Any], McpToGenAiToolAdapter]],
+    max_workers: int,
+    timeout: Optional[float],
+    instrumentation: Optional[_instrumentation.Instrumentation] = None,
+) -> list[_common.StringDict]:
+  """Runs up to `max_workers` function calls at once, preserving order.
+
+  The timeout of a function call counts from when it starts running, not from
+  when it is queued behind other function calls. A function call that timed
+  out no longer counts towards `max_workers`.
+  """
+  executor = _ThreadPerCallExecutor()
+  done: queue.Queue[int] = queue.Queue()
+  futures: dict[int, 'concurrent.futures.Future[Any]'] = {}
+  # The deadlines of the running function calls, by index.
+  deadlines: dict[int, float] = {}
+  func_responses: dict[int, _common.StringDict] = {}
+  next_index = 0
+  while len(func_responses) < len(function_calls):
+    while next_index < len(function_calls) and len(deadlines) < max_workers:
+      function_call = function_calls[next_index]
+      future = executor.submit(
+          _invoke_function_call,
+          function_call,
+          function_map[function_call.name],  # type: ignore[index]
+          instrumentation,
+      )
+      future.add_done_callback(functools.partial(_put_index, done, next_index))
+      futures[next_index] = future
+      deadlines[next_index] = (
+          time.monotonic() + timeout if timeout is not None else math.inf
+      )
+      next_index += 1
+    deadline = min(deadlines.values())
+    wait = (
+        max(0.0, deadline - time.monotonic()) if deadline != math.inf else None
+    )
+    try:
+      index = done.get(timeout=wait)
+    except queue.Empty:
+      now = time.monotonic()
+      for index, deadline in list(deadlines.items()):
+        if deadline <= now:
+          del deadlines[index]
+          func_responses[index] = _function_call_timeout_response(
+              function_calls[index], timeout
+          )
+      continue
+    if index in deadlines:
+      # Function calls that return after they timed out are ignored.
+      del deadlines[index]
+      func_responses[index] = futures[index].result()
+  return [func_responses[index] for index in range(len(function_calls))]
+
+
+def _put_index(
+    done: 'queue.Queue[int]', index: int, _: 'concurrent.futures.Future[Any]'
+) -> None:
+  done.put(index)
+
+
+def get_function_response_parts(
+    response: types.GenerateContentResponse,
+    function_map: dict[str, Union[Callable[..., Any], McpToGenAiToolAdapter]],
+    function_response_hook: Optional[Callable[..., Any]] = None,
+    *,
+    max_concurrent_function_calls: int = 1,
+    function_call_timeout: Optional[float] = None,
+    instrumentation: Optional[_instrumentation.Instrumentation] = None,
+) -> list[types.Part]:
+  """Returns the function response parts from the response.
+
+  If `function_response_hook` is set, it is called with the function call and
+  the computed function response of every executed function. If
+  `instrumentation` is set, its `on_tool_call` is called as each function
+  returns.
+
+  When `max_concurrent_function_calls` is greater than 1, up to that many
+  function calls of the response run concurrently, each on a thread of its
+  own. When `function_call_timeout` is set, a function that does not return
+  within that many seconds of starting gets an error response instead of a
+  result, and is left running on its thread while the next function calls
+  start. The function response parts are always in the order of the function
+  calls.
+  """
+  function_calls = _get_function_calls(response)
+  if function_call_timeout is not None or (
+      max_concurrent_function_calls > 1 and len(function_calls) > 1
+  ):
+    func_responses = _invoke_function_calls_in_threads(
+        function_calls,
+        function_map,
+        max(1, min(max_concurrent_function_calls, len(function_calls))),
+        function_call_timeout,
+        instrumentation,
+    )
+  else:
+    func_responses = [
+        _invoke_function_call(
+            function_call,
+            function_map[function_call.name],  # type: ignore[index]
+            instrumentation,
         )
-        func_response_parts.append(func_response_part)
+        for function_call in function_calls
+    ]
+  func_response_parts = []
+  for function_call, func_response in zip(function_calls, func_responses):
+    func_response_part = types.Part.from_function_response(
+        name=function_call.name, response=func_response  # type: ignore[arg-type]
+    )
+    _call_function_response_hook(
+        function_response_hook, function_call, func_response_part
+    )
+    func_response_parts.append(func_response_part)
   return func_response_parts
 
 
 async def get_function_response_parts_async(
     response: types.GenerateContentResponse,
     function_map: dict[str, Union[Callable[..., Any], McpToGenAiToolAdapter]],
+    function_response_hook: Optional[Callable[..., Any]] = None,
+    *,
+    max_concurrent_function_calls: int = 1,
+    function_call_timeout: Optional[float] = None,
+    instrumentation: Optional[_instrumentation.Instrumentation] = None,
 ) -> list[types.Part]:
-  """Returns the function response parts from the response."""
-  func_response_parts = []
-  if (
-      response.candidates is not None
-      and isinstance(response.candidates[0].content, types.Content)
-      and response.candidates[0].content.parts is not None
-  ):
-    for part in response.candidates[0].content.parts:
-      if not part.function_call:
-        continue
-      func_name = part.function_call.name
-      if func_name is not None and part.function_call.args is not None:
-        func = function_map[func_name]
-        args = convert_number_values_for_dict_function_call_args(
-            part.function_call.args
-        )
-        func_response: _common.StringDict
+  """Returns the function response parts from the response.
+
+  If `function_response_hook` is set, it is called with the function call and
+  the computed function response of every executed function. Coroutine hooks
+  are awaited. If `instrumentation` is set, its `on_tool_call` is called as
+  each function returns or times out.
+
+  When `max_concurrent_function_calls` is greater than 1, coroutine functions
+  and MCP tools are gathered concurrently and sync functions run on a thread
+  pool of that size. When `function_call_timeout` is set, a function that does
+  not return within that many seconds of starting gets an error response
+  instead of a result, and sync functions run on threads of their own so that
+  they can time out without holding up the other function calls. The function
+  response parts are always in the order of the function calls.
+  """
+  function_calls = _get_function_calls(response)
+  concurrent_calls = (
+      max_concurrent_function_calls > 1 and len(function_calls) > 1
+  )
+  max_workers = max(1, min(max_concurrent_function_calls, len(function_calls)))
+  executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+  if concurrent_calls and function_call_timeout is None:
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix='genai_afc'
+    )
+  # Bounds the running function calls when a timeout is set.
+  slots = asyncio.Semaphore(max_workers)
+
+  async def invoke(function_call: types.FunctionCall) -> _common.StringDict:
+    started = time.perf_counter()
+    if function_call_timeout is None:
+      func_response = await _invoke_function_call_async(
+          function_call,
+          function_map[function_call.name],  # type: ignore[index]
+          executor,
+      )
+    else:
+      # The timeout counts from when the function starts running, not from
+      # when it is queued behind other function calls. Sync functions run on
+      # a thread of their own: inline on the event loop they could not time
+      # out, and on a shared executor one that timed out would hold up the
+      # function calls queued behind it.
+      async with slots:
         try:
-          if isinstance(func, McpToGenAiToolAdapter):
-            mcp_tool_response = await func.call_tool(
-                types.FunctionCall(name=func_name, args=args)
-            )
-            if mcp_tool_response.isError:
-              func_response = {'error': mcp_tool_response}
-            else:
-              func_response = {'result': mcp_tool_response}
-          elif inspect.iscoroutinefunction(func):
-            func_response = {
-                'result': await invoke_function_from_dict_args_async(args, func)
-            }
-          else:
-            func_response = {
-                'result': invoke_function_from_dict_args(args, func)
-            }
-        except Exception as e:  # pylint: disable=broad-except
-          func_response = {'error': str(e)}
-        func_response_part = types.Part.from_function_response(
-            name=func_name, response=func_response
+          func_response = await asyncio.wait_for(
+              _invoke_function_call_async(
+                  function_call,
+                  function_map[function_call.name],  # type: ignore[index]
+                  _ThreadPerCallExecutor(),
+              ),
+              timeout=function_call_timeout,
+          )
+        except asyncio.TimeoutError:
+          func_response = _function_call_timeout_response(
+              function_call, function_call_timeout
+          )
+    _instrumentation._tool_called(
+        instrumentation, function_call.name, started, func_response
+    )
+    return func_response
+
+  try:
+    if concurrent_calls or function_call_timeout is not None:
+      func_responses = await asyncio.gather(
+          *[invoke(function_call) for function_call in function_calls]
+      )
+    else:
+      func_responses = [
+          await invoke(function_call) for function_call in function_calls
+      ]
+  finally:
+    if executor is not None:
+      executor.shutdown(wait=False, cancel_futures=True)
+
+  func_response_parts = []
+  for function_call, func_response in zip(function_calls, func_responses):
+    func_response_part = types.Part.from_function_response(
+        name=function_call.name, response=func_response  # type: ignore[arg-type]
+    )
+    hook_result = _call_function_response_hook(
+        function_response_hook, function_call, func_response_part
+    )
+    if inspect.isawaitable(hook_result):
+      try:
+        await hook_result
+      except Exception as e:  # pylint: disable=broad-except
+        logger.warning(
+            'function_response_hook failed for function'
+            f' {function_call.name} with error: {e}'
         )
-        func_response_parts.append(func_response_part)
+    func_response_parts.append(func_response_part)
   return func_response_parts
 
 
@@ -468,6 +755,56 @@ def should_append_afc_history(
   return not config_model.automatic_function_calling.ignore_call_history
 
 
+def get_function_response_hook(
+    config: Optional[types.GenerateContentConfigOrDict] = None,
+) -> Optional[Callable[..., Any]]:
+  """Returns the function response hook for automatic function calling."""
+  if not config:
+    return None
+  config_model = _create_generate_content_config_model(config)
+  if not config_model.automatic_function_calling:
+    return None
+  return config_model.automatic_function_calling.function_response_hook
+
+
+def get_instrumentation(
+    api_client: Any,
+) -> Optional[_instrumentation.Instrumentation]:
+  """Returns the instrumentation of an API client, if it has one."""
+  instrumentation = getattr(api_client, 'instrumentation', None)
+  if isinstance(instrumentation, _instrumentation.Instrumentation):
+    return instrumentation
+  return None
+
+
+def get_max_concurrent_function_calls(
+    config: Optional[types.GenerateContentConfigOrDict] = None,
+) -> int:
+  """Returns how many function calls of a model turn may run concurrently."""
+  if not config:
+    return 1
+  config_model = _create_generate_content_config_model(config)
+  afc_config = config_model.automatic_function_calling
+  if not afc_config or not afc_config.max_concurrent_function_calls:
+    return 1
+  return max(1, int(afc_config.max_concurrent_function_calls))
+
+
+def get_function_call_timeout(
+    config: Optional[types.GenerateContentConfigOrDict] = None,
+) -> Optional[float]:
+  """Returns the per function call timeout in seconds, if any."""
+  if not config:
+    return None
+  config_model = _create_generate_content_config_model(config)
+  if (
+      not config_model.automatic_function_calling
+      or config_model.automatic_function_calling.function_call_timeout is None
+  ):
+    return None
+  return float(config_model.automatic_function_calling.function_call_timeout)
+
+
 def parse_config_for_mcp_usage(
     config: Optional[types.GenerateContentConfigOrDict] = None,
 ) -> Optional[types.GenerateContentConfig]:
@@ -612,3 +949,149 @@ def prepare_resumable_upload(
         },
     )
   return http_options, size_bytes, mime_type
+
+
+def get_upload_header(
+    headers: Optional[dict[str, str]], name: str
+) -> Optional[str]:
+  """Returns the value of an upload header, ignoring the case of its name."""
+  if not headers:
+    return None
+  name = name.lower()
+  for key, value in headers.items():
+    if key.lower() == name:
+      return value
+  return None
+
+
+def get_upload_chunk_size(
+    chunk_size: Optional[int], headers: Optional[dict[str, str]]
+) -> Optional[int]:
+  """Rounds the chunk size down to the granularity the upload server reports."""
+  granularity = get_upload_header(headers, 'x-goog-upload-chunk-granularity')
+  if not chunk_size or not granularity:
+    return chunk_size
+  return max(chunk_size // int(granularity), 1) * int(granularity)
+
+
+def get_resume_offset(headers: Optional[dict[str, str]]) -> Optional[int]:
+  """Returns the offset to resume an upload from, given its query response.
+
+  Returns None if the upload can't be resumed, e.g. it was finalized,
+  cancelled or has expired.
+  """
+  if get_upload_header(headers, 'x-goog-upload-status') != 'active':
+    return None
+  size_received = get_upload_header(headers, 'x-goog-upload-size-received')
+  return int(size_received) if size_received is not None else None
+
+
+def _upload_source(
+    file: Union[str, os.PathLike[str], io.IOBase],
+    upload_state_key: Optional[str],
+) -> dict[str, Any]:
+  # A path is only resumed while the file is unchanged. A stream has no
+  # identity of its own, so it is only resumed with an explicit key.
+  if isinstance(file, io.IOBase):
+    return {'key': upload_state_key}
+  fs_path = os.path.abspath(os.fspath(file))
+  source: dict[str, Any] = {
+      'path': fs_path,
+      'mtime_ns': os.stat(fs_path).st_mtime_ns,
+  }
+  if upload_state_key is not None:
+    source['key'] = upload_state_key
+  return source
+
+
+def load_upload_state(
+    upload_state_file: str,
+    file: Union[str, os.PathLike[str], io.IOBase],
+    size_bytes: int,
+    upload_state_key: Optional[str] = None,
+) -> Optional[str]:
+  """Returns the URL of an interrupted upload of the file, if one was saved.
+
+  Raises:
+    ValueError: If the file is a stream and `upload_state_key` is not set.
+  """
+  if isinstance(file, io.IOBase) and upload_state_key is None:
+    raise ValueError(
+        'upload_state_key is required to use upload_state_file with a stream,'
+        ' otherwise the upload of another stream of the same size could be'
+        ' resumed.'
+    )
+  try:
+    with open(upload_state_file, 'r') as f:
+      state = _common.json_loads(f.read())
+  except (OSError, ValueError):
+    return None
+  if (
+      not isinstance(state, dict)
+      or state.get('size_bytes') != size_bytes
+      or state.get('source') != _upload_source(file, upload_state_key)
+  ):
+    return None
+  upload_url = state.get('upload_url')
+  return upload_url if isinstance(upload_url, str) else None
+
+
+def save_upload_state(
+    upload_state_file: str,
+    *,
+    upload_url: str,
+    file: Union[str, os.PathLike[str], io.IOBase],
+    size_bytes: int,
+    offset: int,
+    upload_state_key: Optional[str] = None,
+) -> None:
+  """Saves the upload URL and the offset received by the server.
+
+  The state file is replaced atomically, so an interrupted write leaves the
+  previous state in place.
+  """
+  state = {
+      'upload_url': upload_url,
+      'source': _upload_source(file, upload_state_key),
+      'size_bytes': size_bytes,
+      'offset': offset,
+  }
+  temp_file = f'{upload_state_file}.tmp'
+  with open(temp_file, 'w') as f:
+    f.write(_common.json_dumps(state))
+  os.replace(temp_file, upload_state_file)
+
+
+def clear_upload_state(upload_state_file: str) -> None:
+  try:
+    os.remove(upload_state_file)
+  except FileNotFoundError:
+    pass
+
+
+def get_upload_progress_callback(
+    config: types.UploadFileConfig,
+    *,
+    upload_url: str,
+    file: Union[str, os.PathLike[str], io.IOBase],
+    size_bytes: int,
+) -> Optional[Callable[[int, int], None]]:
+  """Returns the callback that saves the upload state and reports progress."""
+  upload_state_file = config.upload_state_file
+  progress_callback = config.progress_callback
+  if not upload_state_file:
+    return progress_callback
+
+  def callback(offset: int, total: int) -> None:
+    save_upload_state(
+        upload_state_file,
+        upload_url=upload_url,
+        file=file,
+        size_bytes=size_bytes,
+        offset=offset,
+        upload_state_key=config.upload_state_key,
+    )
+    if progress_callback:
+      progress_callback(offset, total)
+
+  return callback
@@ -0,0 +1,366 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Client-side rate limits for the requests to models."""
+
+import asyncio
+import contextlib
+import email.utils
+import logging
+import re
+import threading
+import time
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+from typing import TYPE_CHECKING
+import weakref
+
+import tenacity
+
+from . import errors
+from .types import RateLimitOptions
+
+if TYPE_CHECKING:
+  from ._api_client import HttpRequest
+  from .local_tokenizer import LocalTokenizer
+
+logger = logging.getLogger('google_genai._rate_limiter')
+
+_MODEL_METHOD = re.compile(r'models/([^/:?]+):(\w+)')
+# Methods that do not use the input token quota of a model.
+_TOKENLESS_METHODS = frozenset(['countTokens', 'computeTokens'])
+_CHARS_PER_TOKEN = 4
+# The tokens of an image. Other media are estimated the same way.
+_TOKENS_PER_MEDIA_PART = 258
+_RETRY_INFO_TYPE = 'type.googleapis.com/google.rpc.RetryInfo'
+
+
+def retry_after(error: errors.APIError) -> Optional[float]:
+  """Returns how many seconds the server asked to wait before retrying.
+
+  The `Retry-After` header is read first, then the `RetryInfo` error detail of
+  the Gemini API.
+  """
+  headers = getattr(error.response, 'headers', None)
+  value = headers.get('retry-after') if headers is not None else None
+  if value:
+    try:
+      return max(0.0, float(value))
+    except ValueError:
+      pass
+    try:
+      date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+      return None
+    return max(0.0, date.timestamp() - time.time())
+  details = error.details
+  if isinstance(details, dict) and isinstance(details.get('error'), dict):
+    details = details['error']
+  if not isinstance(details, dict):
+    return None
+  for detail in details.get('details') or ():
+    if isinstance(detail, dict) and detail.get('@type') == _RETRY_INFO_TYPE:
+      delay = str(detail.get('retryDelay', ''))
+      try:
+        return max(0.0, float(delay.rstrip('s')))
+      except ValueError:
+        return None
+  return None
+
+
+class _TokenBucket:
+  """Allows `per_minute` units per minute, up to a second's worth at once.
+
+  Units are reserved ahead: a reservation larger than the bucket holds puts
+  it in debt, and returns how long to wait for the debt to be paid.
+  """
+
+  def __init__(self, per_minute: float):
+    self._rate = per_minute / 60
+    self._capacity = max(self._rate, 1.0)
+    self._units = self._capacity
+    # The time up to which the bucket was refilled. It is in the future while
+    # the bucket is paused.
+    self._updated = time.monotonic()
+
+  def _refill(self, now: float) -> None:
+    if now > self._updated:
+      self._units = min(
+          self._capacity, self._units + (now - self._updated) * self._rate
+      )
+      self._updated = now
+
+  def reserve(self, units: float, now: float) -> float:
+    """Takes units from the bucket, and returns how long to wait for them."""
+    self._refill(now)
+    self._units -= units
+    return max(0.0, self._updated - now) + max(0.0, -self._units) / self._rate
+
+  def pause(self, seconds: float, now: float) -> None:
+    """Empties the bucket, and refills it only after `seconds`."""
+    self._refill(now)
+    self._units = min(self._units, 0.0)
+    self._updated = max(self._updated, now + seconds)
+
+
+class _ModelLimits:
+  """The rate limits of the requests to one model."""
+
+  def __init__(self, model: str, options: RateLimitOptions):
+    self._model = model
+    self._options = options
+    self._lock = threading.Lock()
+    self._requests = (
+        _TokenBucket(options.requests_per_minute)
+        if options.requests_per_minute
+        else None
+    )
+    self._tokens = (
+        _TokenBucket(options.tokens_per_minute)
+        if options.tokens_per_minute
+        else None
+    )
+    self._paused_until = 0.0
+    self._semaphore = (
+        threading.BoundedSemaphore(options.max_in_flight)
+        if options.max_in_flight
+        else None
+    )
+    # asyncio semaphores are bound to the event loop they are first used in.
+    self._async_semaphores: weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, asyncio.Semaphore
+    ] = weakref.WeakKeyDictionary()
+    self._tokenizer: Optional['LocalTokenizer'] = None
+    self._tokenizer_loaded = False
+    self._tokenizer_lock = threading.Lock()
+
+  def _estimate_tokens(self, http_request: 'HttpRequest') -> int:
+    """Estimates the input tokens of a request.
+
+    This may load and run the local tokenizer, so async callers run it in a
+    thread.
+    """
+    match = _MODEL_METHOD.search(http_request.url)
+    if match and match.group(2) in _TOKENLESS_METHODS:
+      return 0
+    texts: list[str] = []
+    media = 0
+    data = http_request.data
+    if isinstance(data, dict):
+      contents = data.get('contents')
+      contents = list(contents) if isinstance(contents, list) else []
+      if data.get('systemInstruction'):
+        contents.append(data['systemInstruction'])
+      for content in contents:
+        if not isinstance(content, dict):
+          continue
+        for part in content.get('parts') or ():
+          if isinstance(part, dict) and isinstance(part.get('text'), str):
+            texts.append(part['text'])
+          else:
+            media += 1
+    elif isinstance(data, (bytes, str)):
+      texts.append(data if isinstance(data, str) else data.decode('latin-1'))
+    tokenizer = self._get_tokenizer()
+    if tokenizer is not None:
+      tokens = 0
+      if texts:
+        (result,) = tokenizer.count_tokens_batch([texts], num_threads=1)
+        tokens = result.total_tokens or 0
+    else:
+      tokens = sum(len(text) for text in texts) // _CHARS_PER_TOKEN
+    return tokens + media * _TOKENS_PER_MEDIA_PART
+
+  def _get_tokenizer(self) -> Optional['LocalTokenizer']:
+    """Returns the local tokenizer, loading it on first use."""
+    if not self._options.use_local_tokenizer:
+      return None
+    with self._tokenizer_lock:
+      if not self._tokenizer_loaded:
+        self._tokenizer = self._load_tokenizer()
+        self._tokenizer_loaded = True
+    return self._tokenizer
+
+  def _load_tokenizer(self) -> Optional['LocalTokenizer']:
+    try:
+      from .local_tokenizer import LocalTokenizer  # pylint: disable=g-import-not-at-top
+
+      return LocalTokenizer(self._model)
+    except Exception as e:  # pylint: disable=broad-except
+      logger.warning(
+          'Estimating tokens of %s from text lengths, since the local'
+          ' tokenizer is not available: %s',
+          self._model,
+          e,
+      )
+      return None
+
+  def _reserve(self, tokens: int) -> float:
+    with self._lock:
+      now = time.monotonic()
+      delay = 0.0
+      if self._requests is not None:
+        delay = self._requests.reserve(1, now)
+      if self._tokens is not None and tokens:
+        delay = max(delay, self._tokens.reserve(tokens, now))
+      return delay
+
+  def _pause_remaining(self) -> float:
+    return self._paused_until - time.monotonic()
+
+  def on_error(self, error: errors.APIError) -> None:
+    """Pauses the requests after the server rejected one for quota."""
+    if error.code not in (429, 503):
+      return
+    delay = retry_after(error)
+    if delay is None:
+      if error.code != 429:
+        return
+      delay = 0.0
+    with self._lock:
+      now = time.monotonic()
+      self._paused_until = max(self._paused_until, now + delay)
+      for bucket in (self._requests, self._tokens):
+        if bucket is not None:
+          bucket.pause(delay, now)
+
+  @contextlib.contextmanager
+  def acquire(self, http_request: 'HttpRequest') -> Iterator[None]:
+    """Waits until the request is allowed, and holds an in-flight slot."""
+    tokens = self._estimate_tokens(http_request) if self._tokens else 0
+    if self._semaphore is not None:
+      self._semaphore.acquire()
+    try:
+      time.sleep(self._reserve(tokens))
+      # Requests that reserved before a pause wait for the end of the pause.
+      while (remaining := self._pause_remaining()) > 0:
+        time.sleep(remaining)
+      yield
+    finally:
+      if self._semaphore is not None:
+        self._semaphore.release()
+
+  @contextlib.asynccontextmanager
+  async def async_acquire(
+      self, http_request: 'HttpRequest'
+  ) -> AsyncIterator[None]:
+    """Waits until the request is allowed, and holds an in-flight slot."""
+    tokens = 0
+    if self._tokens is not None:
+      if self._options.use_local_tokenizer:
+        # Loading the tokenizer and tokenizing would block the event loop.
+        tokens = await asyncio.to_thread(self._estimate_tokens, http_request)
+      else:
+        tokens = self._estimate_tokens(http_request)
+    semaphore = None
+    if self._options.max_in_flight:
+      loop = asyncio.get_running_loop()
+      semaphore = self._async_semaphores.get(loop)
+      if semaphore is None:
+        semaphore = asyncio.Semaphore(self._options.max_in_flight)
+        self._async_semaphores[loop] = semaphore
+      await semaphore.acquire()
+    try:
+      await asyncio.sleep(self._reserve(tokens))
+      while (remaining := self._pause_remaining()) > 0:
+        await asyncio.sleep(remaining)
+      yield
+    finally:
+      if semaphore is not None:
+        semaphore.release()
+
+
+class RateLimiter:
+  """Applies the rate limits of `HttpOptions.rate_limits` to requests."""
+
+  def __init__(self, rate_limits: dict[str, RateLimitOptions]):
+    self._options = rate_limits
+    self._lock = threading.Lock()
+    self._limits: dict[str, _ModelLimits] = {}
+
+  def limits_for(
+      self, http_request: 'HttpRequest'
+  ) -> Optional[_ModelLimits]:
+    """Returns the limits of the model of a request, if it has any."""
+    match = _MODEL_METHOD.search(http_request.url)
+    if match is None:
+      return None
+    model = match.group(1)
+    limits = self._limits.get(model)
+    if limits is None:
+      options = self._options.get(model) or self._options.get('*')
+      if options is None:
+        return None
+      with self._lock:
+        limits = self._limits.setdefault(model, _ModelLimits(model, options))
+    return limits
+
+  def retry_args(self, retry_kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Returns tenacity args that do not wait again after a 429 with a delay.
+
+    The limits of the model already wait for as long as the server asked. A
+    429 that does not say how long to wait is backed off as usual.
+    """
+    wait = retry_kwargs.get('wait')
+    if wait is None:
+      return retry_kwargs
+
+    def _wait(retry_state: tenacity.RetryCallState) -> float:
+      outcome = retry_state.outcome
+      error = outcome.exception() if outcome is not None else None
+      if (
+          isinstance(error, errors.APIError)
+          and error.code == 429
+          and retry_after(error) is not None
+          and retry_state.args
+          and self.limits_for(retry_state.args[0]) is not None
+      ):
+        return 0.0
+      return wait(retry_state)  # type: ignore[no-any-return]
+
+    return {**retry_kwargs, 'wait': _wait}
+
+  def call(
+      self,
+      request_once: Callable[['HttpRequest', bool], Any],
+      http_request: 'HttpRequest',
+      stream: bool = False,
+  ) -> Any:
+    """Sends a request once it is allowed by the limits of its model."""
+    limits = self.limits_for(http_request)
+    if limits is None:
+      return request_once(http_request, stream)
+    with limits.acquire(http_request):
+      try:
+        return request_once(http_request, stream)
+      except errors.APIError as e:
+        limits.on_error(e)
+        raise
+
+  async def async_call(
+      self,
+      request_once: Callable[['HttpRequest', bool], Any],
+      http_request: 'HttpRequest',
+      stream: bool = False,
+  ) -> Any:
+    """Sends a request once it is allowed by the limits of its model."""
+    limits = self.limits_for(http_request)
+    if limits is None:
+      return await request_once(http_request, stream)
+    async with limits.async_acquire(http_request):
+      try:
+        return await request_once(http_request, stream)
+      except errors.APIError as e:
+        limits.on_error(e)
+        raise
@@ -0,0 +1,673 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Reuse of cached contents by content hash, with TTL refresh."""
+
+import asyncio
+import contextlib
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Iterator, Optional
+
+from . import _common
+from . import _transformers as t
+from . import errors
+from . import types
+from ._api_client import BaseApiClient
+from .caches import AsyncCaches, Caches
+
+try:
+  import fcntl
+except ImportError:
+  # The index file is not locked on platforms without fcntl.
+  fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger('google_genai.cache_manager')
+
+_DISPLAY_NAME_PREFIX = 'genai-cache-'
+# How long to wait before refreshing a cache again after a failed refresh.
+_REFRESH_RETRY_DELAY = 30.0
+# The lock file of an index is never opened through a symbolic link.
+_O_NOFOLLOW = getattr(os, 'O_NOFOLLOW', 0)
+
+
+def _default_index_file() -> str:
+  """Returns the index file in the cache directory of the user."""
+  cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+      os.path.expanduser('~'), '.cache'
+  )
+  return os.path.join(cache_home, 'google_genai', 'cache_index.json')
+
+
+@dataclasses.dataclass
+class CacheSavings:
+  """Token counts of the responses recorded by a cache manager."""
+
+  requests: int = 0
+  prompt_token_count: int = 0
+  cached_content_token_count: int = 0
+
+  @property
+  def cached_fraction(self) -> float:
+    """The fraction of prompt tokens that were read from caches."""
+    if not self.prompt_token_count:
+      return 0.0
+    return self.cached_content_token_count / self.prompt_token_count
+
+
+def _cache_key(
+    api_client: BaseApiClient,
+    model: str,
+    config: types.CreateCachedContentConfig,
+) -> str:
+  """Returns a hash of what a cached content holds, and of who can read it."""
+  material = {
+      'scope': [
+          api_client.vertexai,
+          api_client.project,
+          api_client.location,
+          api_client.api_key,
+      ],
+      'model': t.t_caches_model(api_client, model),
+      'system_instruction': (
+          t.t_contents(config.system_instruction)
+          if config.system_instruction
+          else None
+      ),
+      'contents': t.t_contents(config.contents) if config.contents else None,
+      'tools': config.tools,
+      'tool_config': config.tool_config,
+  }
+  data = json.dumps(
+      _common.convert_to_json_dict(material, lazy_base64=False),
+      sort_keys=True,
+      separators=(',', ':'),
+  )
+  return hashlib.sha256(data.encode()).hexdigest()
+
+
+def _expire_time(cached: types.CachedContent, ttl: float) -> float:
+  if cached.expire_time is not None:
+    return cached.expire_time.timestamp()
+  return time.time() + ttl
+
+
+def _is_gone(error: errors.ClientError) -> bool:
+  # The Gemini API answers PERMISSION_DENIED for caches that do not exist.
+  return error.code in (403, 404)
+
+
+class _CacheIndex:
+  """Maps cache keys to cached contents in a JSON file.
+
+  Processes that share the file reuse each other's caches. Each change reads
+  the file, updates it and replaces it atomically under a file lock. The
+  directory of the file is created readable by the user only, and so are the
+  files written in it.
+  """
+
+  def __init__(self, path: str):
+    self.path = os.path.abspath(path)
+    # Identifies the index in the display names of its caches, so that the
+    # caches of other indexes are never collected as garbage.
+    self.id = hashlib.sha256(
+        os.path.realpath(self.path).encode()
+    ).hexdigest()[:12]
+
+  def _write(self, entries: dict[str, Any]) -> None:
+    directory, name = os.path.split(self.path)
+    # A new file, so that a file planted at a predictable name is never
+    # written to.
+    fd, temp_file = tempfile.mkstemp(dir=directory, prefix=f'.{name}.')
+    try:
+      with open(fd, 'w') as f:
+        f.write(_common.json_dumps(entries))
+      os.replace(temp_file, self.path)
+    except BaseException:
+      os.remove(temp_file)
+      raise
+
+  @contextlib.contextmanager
+  def _locked(self) -> Iterator[dict[str, Any]]:
+    os.makedirs(os.path.dirname(self.path), mode=0o700, exist_ok=True)
+    fd = os.open(
+        f'{self.path}.lock', os.O_RDWR | os.O_CREAT | _O_NOFOLLOW, 0o600
+    )
+    with open(fd, 'a') as lock_file:
+      if fcntl is not None:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+      try:
+        entries = self._read()
+        before = dict(entries)
+        yield entries
+        if entries != before:
+          self._write(entries)
+      finally:
+        if fcntl is not None:
+          fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+  def _read(self) -> dict[str, Any]:
+    try:
+      with open(self.path) as f:
+        entries = _common.json_loads(f.read())
+    except (OSError, ValueError):
+      return {}
+    return entries if isinstance(entries, dict) else {}
+
+  def get(self, key: str) -> Optional[dict[str, Any]]:
+    entry = self._read().get(key)
+    return entry if isinstance(entry, dict) else None
+
+  def put(self, key: str, cached: types.CachedContent, ttl: float) -> None:
+    with self._locked() as entries:
+      entries[key] = {
+          'name': cached.name,
+          'model': cached.model,
+          'expire_time': _expire_time(cached, ttl),
+      }
+
+  def remove(self, key: str) -> None:
+    with self._locked() as entries:
+      entries.pop(key, None)
+
+  def prune(self, now: float) -> set[str]:
+    """Removes expired entries and returns the names of the others."""
+    with self._locked() as entries:
+      for key, entry in list(entries.items()):
+        if not isinstance(entry, dict) or entry.get('expire_time', 0) <= now:
+          del entries[key]
+      return {entry['name'] for entry in entries.values()}
+
+
+class _BaseCacheManager:
+  """Base cache manager."""
+
+  def __init__(
+      self,
+      *,
+      api_client: BaseApiClient,
+      index_file: Optional[str],
+      ttl: float,
+      refresh_margin: float,
+      display_name_prefix: str,
+  ):
+    if not 0 < refresh_margin < ttl:
+      raise ValueError(
+          'refresh_margin must be positive and shorter than ttl, got'
+          f' refresh_margin={refresh_margin} and ttl={ttl}.'
+      )
+    self._api_client = api_client
+    self._index = _CacheIndex(index_file or _default_index_file())
+    self._ttl = ttl
+    self._refresh_margin = refresh_margin
+    # The display names of the caches of this index start with this prefix.
+    self._display_name_prefix = f'{display_name_prefix}{self._index.id}-'
+    self._lock = threading.Lock()
+    # The caches that this manager keeps alive, by key.
+    self._active: dict[str, types.CachedContent] = {}
+    self._savings = CacheSavings()
+    self._closed = False
+
+  def _prepare(
+      self, model: str, config: types.CreateCachedContentConfigOrDict
+  ) -> tuple[str, types.CreateCachedContentConfig]:
+    if isinstance(config, dict):
+      config = types.CreateCachedContentConfig(**config)
+    key = _cache_key(self._api_client, model, config)
+    config = config.model_copy(
+        update={
+            'display_name': f'{self._display_name_prefix}{key}',
+            'ttl': f'{self._ttl}s',
+            'expire_time': None,
+        }
+    )
+    return key, config
+
+  def _reusable_entry(self, key: str) -> Optional[dict[str, Any]]:
+    entry = self._index.get(key)
+    if entry and entry.get('expire_time', 0) > time.time():
+      return entry
+    return None
+
+  def _keep_alive(self, key: str, cached: types.CachedContent) -> None:
+    with self._lock:
+      self._active[key] = cached
+    self._index.put(key, cached, self._ttl)
+
+  def _forget(self, key: str) -> None:
+    with self._lock:
+      self._active.pop(key, None)
+    self._index.remove(key)
+
+  def _refresh_at(self, cached: types.CachedContent) -> float:
+    return _expire_time(cached, self._ttl) - self._refresh_margin
+
+  def _next_refresh_delay(self) -> Optional[float]:
+    with self._lock:
+      if not self._active:
+        return None
+      refresh_at = min(map(self._refresh_at, self._active.values()))
+    return max(0.0, refresh_at - time.time())
+
+  def _due(self) -> list[tuple[str, types.CachedContent]]:
+    now = time.time()
+    with self._lock:
+      return [
+          (key, cached)
+          for key, cached in self._active.items()
+          if self._refresh_at(cached) <= now
+      ]
+
+  def _is_orphan(
+      self, cached: types.CachedContent, indexed: set[str], min_age: float
+  ) -> bool:
+    if not (cached.display_name or '').startswith(self._display_name_prefix):
+      return False
+    with self._lock:
+      active = {cached.name for cached in self._active.values()}
+    if cached.name in indexed or cached.name in active:
+      return False
+    # A cache that another process just created may not be indexed yet.
+    return (
+        cached.create_time is None
+        or cached.create_time.timestamp() <= time.time() - min_age
+    )
+
+  def record_usage(self, response: types.GenerateContentResponse) -> None:
+    """Records the cached tokens of a response in `savings`.
+
+    Args:
+      response: A response to a request that used a cached content.
+    """
+    usage = response.usage_metadata
+    if usage is None:
+      return
+    with self._lock:
+      self._savings.requests += 1
+      self._savings.prompt_token_count += usage.prompt_token_count or 0
+      self._savings.cached_content_token_count += (
+          usage.cached_content_token_count or 0
+      )
+
+  @property
+  def savings(self) -> CacheSavings:
+    """The token counts of the responses passed to `record_usage`."""
+    with self._lock:
+      return dataclasses.replace(self._savings)
+
+
+class CacheManager(_BaseCacheManager):
+  """Creates cached contents once and keeps them alive while in use.
+
+  Caches are keyed by a hash of the model, system instruction, contents, tools
+  and tool config. Managers that share an index file, in this process or in
+  others, reuse the same caches. Each cache that a manager returns has its TTL
+  extended in a background thread before it expires, until the manager is
+  closed.
+
+  Usage:
+
+  .. code-block:: python
+
+    with CacheManager(caches=client.caches) as manager:
+      cached = manager.get_or_create(
+          model='gemini-2.5-flash',
+          config={'contents': [document], 'system_instruction': 'Be brief.'},
+      )
+      response = client.models.generate_content(
+          model='gemini-2.5-flash',
+          contents='Summarize the document.',
+          config={'cached_content': cached.name},
+      )
+      manager.record_usage(response)
+  """
+
+  def __init__(
+      self,
+      *,
+      caches: Caches,
+      index_file: Optional[str] = None,
+      ttl: float = 3600.0,
+      refresh_margin: float = 300.0,
+      display_name_prefix: str = _DISPLAY_NAME_PREFIX,
+  ):
+    """Initializes the cache manager.
+
+    Args:
+      caches: The caches module of a client.
+      index_file: The JSON file that maps cache keys to cached contents.
+        Defaults to `google_genai/cache_index.json` in the cache directory of
+        the user, `XDG_CACHE_HOME` or `~/.cache`.
+      ttl: The TTL of the caches, in seconds.
+      refresh_margin: How long before a cache expires to extend its TTL, in
+        seconds.
+      display_name_prefix: The prefix of the display names of the caches,
+        followed by an id of the index file and the cache key.
+        `collect_garbage` only deletes caches with this prefix and index file.
+    """
+    super().__init__(
+        api_client=caches._api_client,
+        index_file=index_file,
+        ttl=ttl,
+        refresh_margin=refresh_margin,
+        display_name_prefix=display_name_prefix,
+    )
+    self._caches = caches
+    self._create_lock = threading.Lock()
+    self._wake = threading.Event()
+    self._thread: Optional[threading.Thread] = None
+
+  def get_or_create(
+      self,
+      *,
+      model: str,
+      config: types.CreateCachedContentConfigOrDict,
+  ) -> types.CachedContent:
+    """Returns a live cached content with the given contents.
+
+    Args:
+      model: The model of the cached content.
+      config: The contents to cache. The display name, TTL and expire time are
+        set by the manager.
+
+    Returns:
+      A cached content that is reused if it exists, and created otherwise.
+    """
+    key, config = self._prepare(model, config)
+    with self._create_lock:
+      with self._lock:
+        cached = self._active.get(key)
+      if cached is not None:
+        return cached
+      entry = self._reusable_entry(key)
+      cached = None
+      if entry is not None:
+        try:
+          cached = self._caches.get(name=entry['name'])
+        except errors.ClientError as e:
+          if not _is_gone(e):
+            raise
+      if cached is None:
+        cached = self._caches.create(model=model, config=config)
+      self._keep_alive(key, cached)
+    self._start_refresh()
+    return cached
+
+  def _start_refresh(self) -> None:
+    if self._thread is None:
+      self._thread = threading.Thread(target=self._refresh_loop, daemon=True)
+      self._thread.start()
+    self._wake.set()
+
+  def _refresh_loop(self) -> None:
+    delay = self._next_refresh_delay()
+    while not self._closed:
+      self._wake.wait(delay)
+      self._wake.clear()
+      if self._closed:
+        return
+      delay = None
+      for key, cached in self._due():
+        if not self._refresh(key, cached):
+          delay = _REFRESH_RETRY_DELAY
+      next_delay = self._next_refresh_delay()
+      if delay is None or (next_delay is not None and next_delay > delay):
+        delay = next_delay
+
+  def _refresh(self, key: str, cached: types.CachedContent) -> bool:
+    """Extends the TTL of a cache, and returns whether it succeeded."""
+    assert cached.name is not None
+    try:
+      updated = self._caches.update(
+          name=cached.name, config={'ttl': f'{self._ttl}s'}
+      )
+    except errors.ClientError as e:
+      if _is_gone(e):
+        self._forget(key)
+        return True
+      logger.warning('Failed to refresh cached content %s: %s', cached.name, e)
+      return False
+    except Exception as e:  # pylint: disable=broad-except
+      logger.warning('Failed to refresh cached content %s: %s', cached.name, e)
+      return False
+    self._keep_alive(key, updated)
+    return True
+
+  def collect_garbage(self, *, min_age: float = 60.0) -> list[str]:
+    """Deletes the caches of managers that no index entry refers to.
+
+    Expired entries are removed from the index first. Caches of managers with
+    other display name prefixes or index files are left alone.
+
+    Args:
+      min_age: Caches created less than this many seconds ago are kept, since
+        the process that created them may not have indexed them yet.
+
+    Returns:
+      The names of the deleted caches.
+    """
+    indexed = self._index.prune(time.time())
+    deleted = []
+    for cached in self._caches.list():
+      if not self._is_orphan(cached, indexed, min_age):
+        continue
+      assert cached.name is not None
+      try:
+        self._caches.delete(name=cached.name)
+      except errors.ClientError as e:
+        if not _is_gone(e):
+          raise
+        continue
+      deleted.append(cached.name)
+    return deleted
+
+  def close(self) -> None:
+    """Stops extending the TTL of the caches.
+
+    The caches stay alive until their TTL runs out, so that other processes can
+    keep using them.
+    """
+    self._closed = True
+    self._wake.set()
+    if self._thread is not None:
+      self._thread.join()
+      self._thread = None
+
+  def __enter__(self) -> 'CacheManager':
+    return self
+
+  def __exit__(self, *args: Any) -> None:
+    self.close()
+
+
+class AsyncCacheManager(_BaseCacheManager):
+  """Creates cached contents once and keeps them alive while in use.
+
+  See `CacheManager`. The TTL of the caches is extended in a task on the event
+  loop.
+  """
+
+  def __init__(
+      self,
+      *,
+      caches: AsyncCaches,
+      index_file: Optional[str] = None,
+      ttl: float = 3600.0,
+      refresh_margin: float = 300.0,
+      display_name_prefix: str = _DISPLAY_NAME_PREFIX,
+  ):
+    """Initializes the cache manager.
+
+    Args:
+      caches: The async caches module of a client.
+      index_file: The JSON file that maps cache keys to cached contents.
+        Defaults to `google_genai/cache_index.json` in the cache directory of
+        the user, `XDG_CACHE_HOME` or `~/.cache`.
+      ttl: The TTL of the caches, in seconds.
+      refresh_margin: How long before a cache expires to extend its TTL, in
+        seconds.
+      display_name_prefix: The prefix of the display names of the caches,
+        followed by an id of the index file and the cache key.
+        `collect_garbage` only deletes caches with this prefix and index file.
+    """
+    super().__init__(
+        api_client=caches._api_client,
+        index_file=index_file,
+        ttl=ttl,
+        refresh_margin=refresh_margin,
+        display_name_prefix=display_name_prefix,
+    )
+    self._caches = caches
+    self._create_lock: Optional[asyncio.Lock] = None
+    self._wake: Optional[asyncio.Event] = None
+    self._task: Optional['asyncio.Task[None]'] = None
+
+  async def get_or_create(
+      self,
+      *,
+      model: str,
+      config: types.CreateCachedContentConfigOrDict,
+  ) -> types.CachedContent:
+    """Returns a live cached content with the given contents.
+
+    Args:
+      model: The model of the cached content.
+      config: The contents to cache. The display name, TTL and expire time are
+        set by the manager.
+
+    Returns:
+      A cached content that is reused if it exists, and created otherwise.
+    """
+    key, config = self._prepare(model, config)
+    if self._create_lock is None:
+      self._create_lock = asyncio.Lock()
+    async with self._create_lock:
+      with self._lock:
+        cached = self._active.get(key)
+      if cached is not None:
+        return cached
+      entry = self._reusable_entry(key)
+      cached = None
+      if entry is not None:
+        try:
+          cached = await self._caches.get(name=entry['name'])
+        except errors.ClientError as e:
+          if not _is_gone(e):
+            raise
+      if cached is None:
+        cached = await self._caches.create(model=model, config=config)
+      self._keep_alive(key, cached)
+    self._start_refresh()
+    return cached
+
+  def _start_refresh(self) -> None:
+    if self._wake is None:
+      self._wake = asyncio.Event()
+    if self._task is None:
+      self._task = asyncio.create_task(self._refresh_loop())
+    self._wake.set()
+
+  async def _refresh_loop(self) -> None:
+    assert self._wake is not None
+    delay = self._next_refresh_delay()
+    while not self._closed:
+      try:
+        await asyncio.wait_for(self._wake.wait(), delay)
+      except asyncio.TimeoutError:
+        pass
+      self._wake.clear()
+      if self._closed:
+        return
+      delay = None
+      for key, cached in self._due():
+        if not await self._refresh(key, cached):
+          delay = _REFRESH_RETRY_DELAY
+      next_delay = self._next_refresh_delay()
+      if delay is None or (next_delay is not None and next_delay > delay):
+        delay = next_delay
+
+  async def _refresh(self, key: str, cached: types.CachedContent) -> bool:
+    """Extends the TTL of a cache, and returns whether it succeeded."""
+    assert cached.name is not None
+    try:
+      updated = await self._caches.update(
+          name=cached.name, config={'ttl': f'{self._ttl}s'}
+      )
+    except errors.ClientError as e:
+      if _is_gone(e):
+        self._forget(key)
+        return True
+      logger.warning('Failed to refresh cached content %s: %s', cached.name, e)
+      return False
+    except Exception as e:  # pylint: disable=broad-except
+      logger.warning('Failed to refresh cached content %s: %s', cached.name, e)
+      return False
+    self._keep_alive(key, updated)
+    return True
+
+  async def collect_garbage(self, *, min_age: float = 60.0) -> list[str]:
+    """Deletes the caches of managers that no index entry refers to.
+
+    Expired entries are removed from the index first. Caches of managers with
+    other display name prefixes or index files are left alone.
+
+    Args:
+      min_age: Caches created less than this many seconds ago are kept, since
+        the process that created them may not have indexed them yet.
+
+    Returns:
+      The names of the deleted caches.
+    """
+    indexed = self._index.prune(time.time())
+    deleted = []
+    async for cached in await self._caches.list():
+      if not self._is_orphan(cached, indexed, min_age):
+        continue
+      assert cached.name is not None
+      try:
+        await self._caches.delete(name=cached.name)
+      except errors.ClientError as e:
+        if not _is_gone(e):
+          raise
+        continue
+      deleted.append(cached.name)
+    return deleted
+
+  async def aclose(self) -> None:
+    """Stops extending the TTL of the caches.
+
+    The caches stay alive until their TTL runs out, so that other processes can
+    keep using them.
+    """
+    self._closed = True
+    if self._task is not None:
+      self._task.cancel()
+      try:
+        await self._task
+      except asyncio.CancelledError:
+        pass
+      self._task = None
+
+  async def __aenter__(self) -> 'AsyncCacheManager':
+    return self
+
+  async def __aexit__(self, *args: Any) -> None:
+    await self.aclose()
@@ -19,7 +19,7 @@ from typing import AsyncIterator, Awaitable, Optional, Union, get_args
 
 from . import _transformers as t
 from . import types
-from .models import AsyncModels, Models
+from .models import AsyncModels, Models, _CachedContents, _ContentsCache
 from .types import Content, ContentOrDict, GenerateContentConfigOrDict, GenerateContentResponse, Part, PartUnionDict
 
 
@@ -129,6 +129,9 @@ class _BaseChat:
     self._curated_history = _extract_curated_history(content_models)
     """Curated history is the set of valid turns that will be used in the subsequent send requests.
     """
+    self._contents_cache = _ContentsCache()
+    """The wire format of the history contents already sent, so that each request only converts its new turns.
+    """
 
   def record_history(
       self,
@@ -170,6 +173,12 @@ class _BaseChat:
       self._curated_history.extend(input_contents)
       self._curated_history.extend(output_contents)
 
+  def _request_contents(self, input_content: Content) -> list[Content]:
+    """Returns the contents to send with the input: the curated history and the input."""
+    return _CachedContents(
+        self._curated_history + [input_content], self._contents_cache
+    )
+
   def get_history(self, curated: bool = False) -> list[Content]:
     """Returns the chat history.
 
@@ -178,6 +187,9 @@ class _BaseChat:
           history or the comprehensive (all turns) history. Defaults to False
           (returns the comprehensive history).
 
+    The wire format of the history is cached once sent, so replace a content
+    rather than modifying it in place.
+
     Returns:
         A list of `Content` objects representing the chat history.
     """
@@ -253,7 +265,7 @@ class Chat(_BaseChat):
     input_content = t.t_content(message)
     response = self._modules.generate_content(
         model=self._model,
-        contents=self._curated_history + [input_content],  # type: ignore[arg-type]
+        contents=self._request_contents(input_content),  # type: ignore[arg-type]
         config=config if config else self._config,
     )
     model_output = (
@@ -311,7 +323,7 @@ class Chat(_BaseChat):
     if isinstance(self._modules, Models):
       for chunk in self._modules.generate_content_stream(
           model=self._model,
-          contents=self._curated_history + [input_content],  # type: ignore[arg-type]
+          contents=self._request_contents(input_content),  # type: ignore[arg-type]
           config=config if config else self._config,
       ):
         if not _validate_response(chunk):
@@ -415,7 +427,7 @@ class AsyncChat(_BaseChat):
     input_content = t.t_content(message)
     response = await self._modules.generate_content(
         model=self._model,
-        contents=self._curated_history + [input_content],  # type: ignore[arg-type]
+        contents=self._request_contents(input_content),  # type: ignore[arg-type]
         config=config if config else self._config,
     )
     model_output = (
@@ -474,7 +486,7 @@ class AsyncChat(_BaseChat):
       chunk = None
       async for chunk in await self._modules.generate_content_stream(  # type: ignore[attr-defined]
           model=self._model,
-          contents=self._curated_history + [input_content],  # type: ignore[arg-type]
+          contents=self._request_contents(input_content),  # type: ignore[arg-type]
           config=config if config else self._config,
       ):
         if not _validate_response(chunk):
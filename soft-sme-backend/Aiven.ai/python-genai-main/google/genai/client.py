@@ -16,25 +16,29 @@
 import asyncio
 import os
 from types import TracebackType
-from typing import Optional, Union
+from typing import Optional, TYPE_CHECKING, Union
 
 import google.auth
 import pydantic
 
 from ._api_client import BaseApiClient
 from ._base_url import get_base_url
-from ._replay_api_client import ReplayApiClient
-from .batches import AsyncBatches, Batches
-from .caches import AsyncCaches, Caches
-from .chats import AsyncChats, Chats
-from .files import AsyncFiles, Files
-from .live import AsyncLive
-from .models import AsyncModels, Models
-from .operations import AsyncOperations, Operations
-from .tokens import AsyncTokens, Tokens
-from .tunings import AsyncTunings, Tunings
+from .instrumentation import Instrumentation
 from .types import HttpOptions, HttpOptionsDict, HttpRetryOptions
 
+# The API modules are imported on first use, so that importing the SDK and
+# creating a client stay fast.
+if TYPE_CHECKING:
+  from .batches import AsyncBatches, Batches
+  from .caches import AsyncCaches, Caches
+  from .chats import AsyncChats, Chats
+  from .files import AsyncFiles, Files
+  from .live import AsyncLive
+  from .models import AsyncModels, Models
+  from .operations import AsyncOperations, Operations
+  from .tokens import AsyncTokens, Tokens
+  from .tunings import AsyncTunings, Tunings
+
 
 class AsyncClient:
   """Client for making asynchronous (non-blocking) requests."""
@@ -42,49 +46,83 @@ class AsyncClient:
   def __init__(self, api_client: BaseApiClient):
 
     self._api_client = api_client
-    self._models = AsyncModels(self._api_client)
-    self._tunings = AsyncTunings(self._api_client)
-    self._caches = AsyncCaches(self._api_client)
-    self._batches = AsyncBatches(self._api_client)
-    self._files = AsyncFiles(self._api_client)
-    self._live = AsyncLive(self._api_client)
-    self._tokens = AsyncTokens(self._api_client)
-    self._operations = AsyncOperations(self._api_client)
+    self._models: Optional['AsyncModels'] = None
+    self._tunings: Optional['AsyncTunings'] = None
+    self._caches: Optional['AsyncCaches'] = None
+    self._batches: Optional['AsyncBatches'] = None
+    self._files: Optional['AsyncFiles'] = None
+    self._live: Optional['AsyncLive'] = None
+    self._tokens: Optional['AsyncTokens'] = None
+    self._operations: Optional['AsyncOperations'] = None
 
   @property
-  def models(self) -> AsyncModels:
+  def models(self) -> 'AsyncModels':
+    if self._models is None:
+      from .models import AsyncModels  # pylint: disable=g-import-not-at-top
+
+      self._models = AsyncModels(self._api_client)
     return self._models
 
   @property
-  def tunings(self) -> AsyncTunings:
+  def tunings(self) -> 'AsyncTunings':
+    if self._tunings is None:
+      from .tunings import AsyncTunings  # pylint: disable=g-import-not-at-top
+
+      self._tunings = AsyncTunings(self._api_client)
     return self._tunings
 
   @property
-  def caches(self) -> AsyncCaches:
+  def caches(self) -> 'AsyncCaches':
+    if self._caches is None:
+      from .caches import AsyncCaches  # pylint: disable=g-import-not-at-top
+
+      self._caches = AsyncCaches(self._api_client)
     return self._caches
 
   @property
-  def batches(self) -> AsyncBatches:
+  def batches(self) -> 'AsyncBatches':
+    if self._batches is None:
+      from .batches import AsyncBatches  # pylint: disable=g-import-not-at-top
+
+      self._batches = AsyncBatches(self._api_client)
     return self._batches
 
   @property
-  def chats(self) -> AsyncChats:
+  def chats(self) -> 'AsyncChats':
+    from .chats import AsyncChats  # pylint: disable=g-import-not-at-top
+
     return AsyncChats(modules=self.models)
 
   @property
-  def files(self) -> AsyncFiles:
+  def files(self) -> 'AsyncFiles':
+    if self._files is None:
+      from .files import AsyncFiles  # pylint: disable=g-import-not-at-top
+
+      self._files = AsyncFiles(self._api_client)
     return self._files
 
   @property
-  def live(self) -> AsyncLive:
+  def live(self) -> 'AsyncLive':
+    if self._live is None:
+      from .live import AsyncLive  # pylint: disable=g-import-not-at-top
+
+      self._live = AsyncLive(self._api_client)
     return self._live
 
   @property
-  def auth_tokens(self) -> AsyncTokens:
+  def auth_tokens(self) -> 'AsyncTokens':
+    if self._tokens is None:
+      from .tokens import AsyncTokens  # pylint: disable=g-import-not-at-top
+
+      self._tokens = AsyncTokens(self._api_client)
     return self._tokens
 
   @property
-  def operations(self) -> AsyncOperations:
+  def operations(self) -> 'AsyncOperations':
+    if self._operations is None:
+      from .operations import AsyncOperations  # pylint: disable=g-import-not-at-top
+
+      self._operations = AsyncOperations(self._api_client)
     return self._operations
 
   async def aclose(self) -> None:
@@ -191,6 +229,8 @@ class Client:
     http_options: Http options to use for the client. These options will be
       applied to all requests made by the client. Example usage: `client =
       genai.Client(http_options=types.HttpOptions(api_version='v1'))`.
+    instrumentation: Callbacks to observe the timing and token usage of the
+      requests of the client, see `google.genai.instrumentation`.
 
   Usage for the Gemini Developer API:
 
@@ -221,6 +261,7 @@ class Client:
       location: Optional[str] = None,
       debug_config: Optional[DebugConfig] = None,
       http_options: Optional[Union[HttpOptions, HttpOptionsDict]] = None,
+      instrumentation: Optional[Instrumentation] = None,
   ):
     """Initializes the client.
 
@@ -249,6 +290,9 @@ class Client:
          of the client. This is typically used when running test code.
        http_options (Union[HttpOptions, HttpOptionsDict]): Http options to use
          for the client.
+       instrumentation (Instrumentation): Callbacks to observe the timing and
+         token usage of requests, e.g. an
+         `instrumentation.LatencyAggregator`.
     """
 
     self._debug_config = debug_config or DebugConfig()
@@ -271,15 +315,16 @@ class Client:
         debug_config=self._debug_config,
         http_options=http_options,
     )
+    self._api_client.instrumentation = instrumentation
 
     self._aio = AsyncClient(self._api_client)
-    self._models = Models(self._api_client)
-    self._tunings = Tunings(self._api_client)
-    self._caches = Caches(self._api_client)
-    self._batches = Batches(self._api_client)
-    self._files = Files(self._api_client)
-    self._tokens = Tokens(self._api_client)
-    self._operations = Operations(self._api_client)
+    self._models: Optional['Models'] = None
+    self._tunings: Optional['Tunings'] = None
+    self._caches: Optional['Caches'] = None
+    self._batches: Optional['Batches'] = None
+    self._files: Optional['Files'] = None
+    self._tokens: Optional['Tokens'] = None
+    self._operations: Optional['Operations'] = None
 
   @staticmethod
   def _get_api_client(
@@ -296,6 +341,8 @@ class Client:
         'replay',
         'auto',
     ]:
+      from ._replay_api_client import ReplayApiClient  # pylint: disable=g-import-not-at-top
+
       return ReplayApiClient(
           mode=debug_config.client_mode,  # type: ignore[arg-type]
           replay_id=debug_config.replay_id,  # type: ignore[arg-type]
@@ -318,7 +365,9 @@ class Client:
     )
 
   @property
-  def chats(self) -> Chats:
+  def chats(self) -> 'Chats':
+    from .chats import Chats  # pylint: disable=g-import-not-at-top
+
     return Chats(modules=self.models)
 
   @property
@@ -326,31 +375,59 @@ class Client:
     return self._aio
 
   @property
-  def models(self) -> Models:
+  def models(self) -> 'Models':
+    if self._models is None:
+      from .models import Models  # pylint: disable=g-import-not-at-top
+
+      self._models = Models(self._api_client)
     return self._models
 
   @property
-  def tunings(self) -> Tunings:
+  def tunings(self) -> 'Tunings':
+    if self._tunings is None:
+      from .tunings import Tunings  # pylint: disable=g-import-not-at-top
+
+      self._tunings = Tunings(self._api_client)
     return self._tunings
 
   @property
-  def caches(self) -> Caches:
+  def caches(self) -> 'Caches':
+    if self._caches is None:
+      from .caches import Caches  # pylint: disable=g-import-not-at-top
+
+      self._caches = Caches(self._api_client)
     return self._caches
 
   @property
-  def batches(self) -> Batches:
+  def batches(self) -> 'Batches':
+    if self._batches is None:
+      from .batches import Batches  # pylint: disable=g-import-not-at-top
+
+      self._batches = Batches(self._api_client)
     return self._batches
 
   @property
-  def files(self) -> Files:
+  def files(self) -> 'Files':
+    if self._files is None:
+      from .files import Files  # pylint: disable=g-import-not-at-top
+
+      self._files = Files(self._api_client)
     return self._files
 
   @property
-  def auth_tokens(self) -> Tokens:
+  def auth_tokens(self) -> 'Tokens':
+    if self._tokens is None:
+      from .tokens import Tokens  # pylint: disable=g-import-not-at-top
+
+      self._tokens = Tokens(self._api_client)
     return self._tokens
 
   @property
-  def operations(self) -> Operations:
+  def operations(self) -> 'Operations':
+    if self._operations is None:
+      from .operations import Operations  # pylint: disable=g-import-not-at-top
+
+      self._operations = Operations(self._api_client)
     return self._operations
 
   @property
@@ -0,0 +1,557 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+"""Hooks to observe where the time of requests goes, and their token usage.
+
+Pass an `Instrumentation` to the client to be called as requests are built,
+sent, parsed, and as automatic function calling runs tools:
+
+.. code-block:: python
+
+  from google import genai
+  from google.genai import instrumentation
+
+  aggregator = instrumentation.LatencyAggregator()
+  client = genai.Client(api_key='my-api-key', instrumentation=aggregator)
+  ...
+  print(aggregator.phase_stats()['network'].p99)
+"""
+
+import collections
+import contextvars
+import dataclasses
+import logging
+import math
+import re
+import threading
+import time
+from typing import Any, Callable, Optional, TypeVar
+
+from . import types
+from . import version
+
+logger = logging.getLogger('google_genai.instrumentation')
+
+_MODEL = re.compile(r'models/([^/:?]+)')
+# The number of recent durations of each phase that percentiles are taken from.
+_WINDOW = 10_000
+
+
+@dataclasses.dataclass(frozen=True)
+class RequestStartEvent:
+  """A request about to be sent.
+
+  Attributes:
+    method: The HTTP method of the request.
+    path: The path of the request, e.g.
+      `models/gemini-2.5-flash:generateContent`.
+    model: The model of the request, if it has one.
+    build_seconds: The time taken to build the request. For generate content
+      requests, it includes the conversion of the contents and config.
+  """
+
+  method: str
+  path: str
+  model: Optional[str]
+  build_seconds: float
+
+
+@dataclasses.dataclass(frozen=True)
+class ResponseEvent:
+  """A response received, or a request that failed.
+
+  Attributes:
+    method: The HTTP method of the request.
+    path: The path of the request.
+    model: The model of the request, if it has one.
+    network_seconds: The time from sending the request to reading the whole
+      response body, or only its headers for streamed responses. It includes
+      retries and the waits of client-side rate limits.
+    serialize_seconds: The time taken to encode the JSON body of the request,
+      summed over retries.
+    request_bytes: The size of the body of the request.
+    response_bytes: The size of the body of the response. None for streamed
+      responses.
+    attempts: The number of times the request was sent.
+    error: The error the request failed with, if any.
+  """
+
+  method: str
+  path: str
+  model: Optional[str]
+  network_seconds: float
+  serialize_seconds: float
+  request_bytes: int
+  response_bytes: Optional[int]
+  attempts: int
+  error: Optional[BaseException] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class ParseDoneEvent:
+  """A response parsed into a response object.
+
+  Attributes:
+    path: The path of the request.
+    model: The model of the request, if it has one.
+    parse_seconds: The time taken to parse the response. For streamed
+      responses, it is summed over the chunks, and the event is sent once the
+      stream ends.
+    usage_metadata: The token usage of the response, if it reports one. For
+      streamed responses, the usage of the last chunk that reports one.
+  """
+
+  path: str
+  model: Optional[str]
+  parse_seconds: float
+  usage_metadata: Optional[types.GenerateContentResponseUsageMetadata]
+
+
+@dataclasses.dataclass(frozen=True)
+class ToolCallEvent:
+  """A function run by automatic function calling.
+
+  Attributes:
+    name: The name of the function.
+    seconds: The time taken by the function.
+    error: The error message of the function, if it failed or timed out.
+  """
+
+  name: str
+  seconds: float
+  error: Optional[str] = None
+
+
+class Instrumentation:
+  """Callbacks for the phases of requests. The default callbacks do nothing.
+
+  Callbacks run on the thread or event loop of the request, and must return
+  quickly. Errors they raise are logged, not raised.
+  """
+
+  def on_request_start(self, event: RequestStartEvent) -> None:
+    """Called when a request is built, before it is sent."""
+
+  def on_response(self, event: ResponseEvent) -> None:
+    """Called when a response is received, or a request failed."""
+
+  def on_parse_done(self, event: ParseDoneEvent) -> None:
+    """Called when a response is parsed."""
+
+  def on_tool_call(self, event: ToolCallEvent) -> None:
+    """Called when a function of automatic function calling returns."""
+
+
+_Event = TypeVar('_Event')
+
+
+def _notify(callback: Callable[[_Event], None], event: _Event) -> None:
+  try:
+    callback(event)
+  except Exception as e:  # pylint: disable=broad-except
+    logger.warning(
+        'Instrumentation callback %s failed: %s', callback.__name__, e
+    )
+
+
+def _model_of(path: str) -> Optional[str]:
+  match = _MODEL.search(path)
+  return match.group(1) if match else None
+
+
+def _body_size(body: Any) -> int:
+  if body is None:
+    return 0
+  if isinstance(body, bytes):
+    return len(body)
+  if isinstance(body, str):
+    return len(body) if body.isascii() else len(body.encode('utf-8'))
+  # Bodies streamed with a known length.
+  return getattr(body, 'content_length', 0) or 0
+
+
+class _RequestTrace:
+  """What is measured of a request while it is sent and parsed."""
+
+  def __init__(
+      self, instrumentation: Instrumentation, method: str, path: str
+  ):
+    self.instrumentation = instrumentation
+    self.method = method
+    self.path = path
+    self.model = _model_of(path)
+    self.sent = 0.0
+    self.serialize_seconds = 0.0
+    self.request_bytes = 0
+    self.attempts = 0
+    self.streamed = False
+    # Set when a response or chunk is received, and cleared once it is parsed.
+    self.parse_started: Optional[float] = None
+    self.parse_seconds = 0.0
+    self.usage_metadata: Optional[
+        types.GenerateContentResponseUsageMetadata
+    ] = None
+
+
+# The request being sent or parsed in the current thread or task.
+_current_trace: contextvars.ContextVar[Optional[_RequestTrace]] = (
+    contextvars.ContextVar('google_genai_request_trace', default=None)
+)
+# When the conversion of the arguments of the next request started.
+_build_started: contextvars.ContextVar[Optional[float]] = (
+    contextvars.ContextVar('google_genai_build_started', default=None)
+)
+
+
+def _start(
+    instrumentation: Instrumentation,
+    method: str,
+    path: str,
+    build_started: float,
+) -> _RequestTrace:
+  """Starts the trace of a request that was just built."""
+  trace = _RequestTrace(instrumentation, method, path)
+  _build_started.set(None)
+  _notify(
+      instrumentation.on_request_start,
+      RequestStartEvent(
+          method=method,
+          path=path,
+          model=trace.model,
+          build_seconds=time.perf_counter() - build_started,
+      ),
+  )
+  _current_trace.set(trace)
+  trace.sent = time.perf_counter()
+  return trace
+
+
+def _encoded(serialize_started: float, body: Any) -> None:
+  """Records the encoding of the body of the traced request, if any."""
+  trace = _current_trace.get()
+  if trace is None:
+    return
+  trace.serialize_seconds += time.perf_counter() - serialize_started
+  trace.request_bytes = _body_size(body)
+  trace.attempts += 1
+
+
+def _received(
+    trace: _RequestTrace,
+    response_body: Optional[str],
+    error: Optional[BaseException] = None,
+    streamed: bool = False,
+) -> None:
+  """Ends the network phase of a request."""
+  trace.streamed = streamed
+  _notify(
+      trace.instrumentation.on_response,
+      ResponseEvent(
+          method=trace.method,
+          path=trace.path,
+          model=trace.model,
+          network_seconds=time.perf_counter() - trace.sent,
+          serialize_seconds=trace.serialize_seconds,
+          request_bytes=trace.request_bytes,
+          response_bytes=(
+              None if streamed or error else _body_size(response_body)
+          ),
+          attempts=trace.attempts,
+          error=error,
+      ),
+  )
+  if error is not None:
+    _current_trace.set(None)
+  else:
+    trace.parse_started = time.perf_counter()
+
+
+def _parsed(response_model: Any) -> None:
+  """Records the parsing of the response to the traced request, if any."""
+  trace = _current_trace.get()
+  if trace is None or trace.parse_started is None:
+    return
+  trace.parse_seconds += time.perf_counter() - trace.parse_started
+  trace.parse_started = None
+  if isinstance(response_model, list):
+    response_model = response_model[0] if response_model else None
+  usage_metadata = getattr(response_model, 'usage_metadata', None)
+  if isinstance(usage_metadata, types.GenerateContentResponseUsageMetadata):
+    trace.usage_metadata = usage_metadata
+  if not trace.streamed:
+    _parse_done(trace)
+
+
+def _parse_done(trace: _RequestTrace) -> None:
+  """Ends the trace of a request. Streamed requests end with their stream."""
+  if _current_trace.get() is trace:
+    _current_trace.set(None)
+  _notify(
+      trace.instrumentation.on_parse_done,
+      ParseDoneEvent(
+          path=trace.path,
+          model=trace.model,
+          parse_seconds=trace.parse_seconds,
+          usage_metadata=trace.usage_metadata,
+      ),
+  )
+
+
+def _tool_called(
+    instrumentation: Optional[Instrumentation],
+    name: Optional[str],
+    started: float,
+    function_response: dict[str, Any],
+) -> None:
+  if instrumentation is None:
+    return
+  error = function_response.get('error')
+  _notify(
+      instrumentation.on_tool_call,
+      ToolCallEvent(
+          name=name or '',
+          seconds=time.perf_counter() - started,
+          error=None if error is None else str(error),
+      ),
+  )
+
+
+@dataclasses.dataclass(frozen=True)
+class PhaseStats:
+  """Percentiles of the recent durations of a phase, in seconds."""
+
+  count: int
+  p50: float
+  p95: float
+  p99: float
+  max: float
+
+
+@dataclasses.dataclass
+class ModelUsage:
+  """Requests and token counts of a model."""
+
+  requests: int = 0
+  errors: int = 0
+  request_bytes: int = 0
+  response_bytes: int = 0
+  prompt_token_count: int = 0
+  cached_content_token_count: int = 0
+  candidates_token_count: int = 0
+  thoughts_token_count: int = 0
+  total_token_count: int = 0
+
+
+def _percentile(ordered: list[float], percentile: float) -> float:
+  rank = max(1, math.ceil(percentile / 100 * len(ordered)))
+  return ordered[rank - 1]
+
+
+class LatencyAggregator(Instrumentation):
+  """Keeps the recent durations of each phase and the usage of each model.
+
+  The phases are `build`, `serialize`, `network`, `parse` and `tool`.
+  Percentiles are taken from the last `window` durations of each phase.
+  """
+
+  def __init__(self, window: int = _WINDOW):
+    self._window = window
+    self._lock = threading.Lock()
+    self._durations: dict[str, collections.deque[float]] = {}
+    self._usage: dict[str, ModelUsage] = {}
+
+  def _add(self, phase: str, seconds: float) -> None:
+    durations = self._durations.get(phase)
+    if durations is None:
+      durations = self._durations[phase] = collections.deque(
+          maxlen=self._window
+      )
+    durations.append(seconds)
+
+  def _model_usage(self, model: Optional[str]) -> ModelUsage:
+    key = model or ''
+    usage = self._usage.get(key)
+    if usage is None:
+      usage = self._usage[key] = ModelUsage()
+    return usage
+
+  def on_request_start(self, event: RequestStartEvent) -> None:
+    with self._lock:
+      self._add('build', event.build_seconds)
+
+  def on_response(self, event: ResponseEvent) -> None:
+    with self._lock:
+      self._add('serialize', event.serialize_seconds)
+      self._add('network', event.network_seconds)
+      usage = self._model_usage(event.model)
+      usage.requests += 1
+      usage.errors += event.error is not None
+      usage.request_bytes += event.request_bytes
+      usage.response_bytes += event.response_bytes or 0
+
+  def on_parse_done(self, event: ParseDoneEvent) -> None:
+    with self._lock:
+      self._add('parse', event.parse_seconds)
+      metadata = event.usage_metadata
+      if metadata is None:
+        return
+      usage = self._model_usage(event.model)
+      usage.prompt_token_count += metadata.prompt_token_count or 0
+      usage.cached_content_token_count += (
+          metadata.cached_content_token_count or 0
+      )
+      usage.candidates_token_count += metadata.candidates_token_count or 0
+      usage.thoughts_token_count += metadata.thoughts_token_count or 0
+      usage.total_token_count += metadata.total_token_count or 0
+
+  def on_tool_call(self, event: ToolCallEvent) -> None:
+    with self._lock:
+      self._add('tool', event.seconds)
+
+  def phase_stats(self) -> dict[str, PhaseStats]:
+    """Returns the percentiles of each phase that has durations."""
+    with self._lock:
+      snapshot = {
+          phase: sorted(durations)
+          for phase, durations in self._durations.items()
+          if durations
+      }
+    return {
+        phase: PhaseStats(
+            count=len(ordered),
+            p50=_percentile(ordered, 50),
+            p95=_percentile(ordered, 95),
+            p99=_percentile(ordered, 99),
+            max=ordered[-1],
+        )
+        for phase, ordered in snapshot.items()
+    }
+
+  def usage(self) -> dict[str, ModelUsage]:
+    """Returns the usage of each model. Requests without one are under ''."""
+    with self._lock:
+      return {
+          model: dataclasses.replace(usage)
+          for model, usage in self._usage.items()
+      }
+
+  def reset(self) -> None:
+    with self._lock:
+      self._durations.clear()
+      self._usage.clear()
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+  """Records the phases and token usage as OpenTelemetry metrics.
+
+  Durations are recorded in the `google_genai.client.phase.duration`
+  histogram, and token counts in the `gen_ai.client.token.usage` histogram of
+  the OpenTelemetry semantic conventions for generative AI. If no meter is
+  given and the `opentelemetry-api` package is not installed, nothing is
+  recorded.
+  """
+
+  def __init__(self, meter: Optional[Any] = None):
+    if meter is None:
+      try:
+        from opentelemetry import metrics  # pylint: disable=g-import-not-at-top
+      except ImportError:
+        logger.info(
+            'opentelemetry-api is not installed, metrics are not recorded.'
+        )
+        self._durations: Any = None
+        self._bytes: Any = None
+        self._tokens: Any = None
+        return
+      meter = metrics.get_meter('google_genai', version.__version__)
+    self._durations = meter.create_histogram(
+        'google_genai.client.phase.duration',
+        unit='s',
+        description='Duration of a phase of a request.',
+    )
+    self._bytes = meter.create_counter(
+        'google_genai.client.body.size',
+        unit='By',
+        description='Size of request and response bodies.',
+    )
+    self._tokens = meter.create_histogram(
+        'gen_ai.client.token.usage',
+        unit='{token}',
+        description='Number of input and output tokens used.',
+    )
+
+  @staticmethod
+  def _attributes(model: Optional[str], **attributes: str) -> dict[str, str]:
+    if model:
+      attributes['gen_ai.request.model'] = model
+    return attributes
+
+  def on_request_start(self, event: RequestStartEvent) -> None:
+    if self._durations is None:
+      return
+    self._durations.record(
+        event.build_seconds, self._attributes(event.model, phase='build')
+    )
+
+  def on_response(self, event: ResponseEvent) -> None:
+    if self._durations is None:
+      return
+    self._durations.record(
+        event.serialize_seconds,
+        self._attributes(event.model, phase='serialize'),
+    )
+    attributes = self._attributes(event.model, phase='network')
+    if event.error is not None:
+      attributes['error.type'] = type(event.error).__name__
+    self._durations.record(event.network_seconds, attributes)
+    self._bytes.add(
+        event.request_bytes, self._attributes(event.model, direction='request')
+    )
+    if event.response_bytes is not None:
+      self._bytes.add(
+          event.response_bytes,
+          self._attributes(event.model, direction='response'),
+      )
+
+  def on_parse_done(self, event: ParseDoneEvent) -> None:
+    if self._durations is None:
+      return
+    self._durations.record(
+        event.parse_seconds, self._attributes(event.model, phase='parse')
+    )
+    metadata = event.usage_metadata
+    if metadata is None:
+      return
+    if metadata.prompt_token_count is not None:
+      self._tokens.record(
+          metadata.prompt_token_count,
+          self._attributes(event.model, **{'gen_ai.token.type': 'input'}),
+      )
+    output = (metadata.candidates_token_count or 0) + (
+        metadata.thoughts_token_count or 0
+    )
+    if output:
+      self._tokens.record(
+          output,
+          self._attributes(event.model, **{'gen_ai.token.type': 'output'}),
+      )
+
+  def on_tool_call(self, event: ToolCallEvent) -> None:
+    if self._durations is None:
+      return
+    attributes = {'phase': 'tool', 'gen_ai.tool.name': event.name}
+    if event.error is not None:
+      attributes['error.type'] = 'tool_error'
+    self._durations.record(event.seconds, attributes)
@@ -15,7 +15,6 @@
 
 # Code generated by the Google Gen AI SDK generator DO NOT EDIT.
 
-import json
 import logging
 from typing import Any, Optional, TypeVar, Union
 from urllib.parse import urlencode
@@ -133,12 +132,13 @@ class Operations(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     return response_dict
 
@@ -181,14 +181,15 @@ class Operations(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     return response_dict
 
@@ -227,15 +228,17 @@ class Operations(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = self._api_client.request('get', path, request_dict, http_options)
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     return_value = types.ProjectOperation._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -336,14 +339,15 @@ class AsyncOperations(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     return response_dict
 
@@ -386,14 +390,15 @@ class AsyncOperations(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'post', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     return response_dict
 
@@ -432,17 +437,19 @@ class AsyncOperations(_api_module.BaseModule):
     ):
       http_options = parameter_model.config.http_options
 
-    request_dict = _common.convert_to_dict(request_dict)
-    request_dict = _common.encode_unserializable_types(request_dict)
+    request_dict = _common.convert_to_json_dict(request_dict)
 
     response = await self._api_client.async_request(
         'get', path, request_dict, http_options
     )
 
-    response_dict = {} if not response.body else json.loads(response.body)
+    response_dict = (
+        {} if not response.body else _common.json_loads(response.body)
+    )
 
     return_value = types.ProjectOperation._from_response(
-        response=response_dict, kwargs=parameter_model.model_dump()
+        response=response_dict,
+        kwargs=_common.get_response_kwargs(parameter_model),
     )
 
     self._api_client._verify_response(return_value)
@@ -16,6 +16,9 @@
 
 """Tests for get_function_response_parts."""
 
+import asyncio
+import threading
+import time
 import typing
 from typing import Any
 import pytest
@@ -160,6 +163,338 @@ def test_string_value():
     ) == expected_part.model_dump_json(exclude_none=True)
 
 
+def test_function_response_hook():
+  def func_under_test(a: int) -> int:
+    return a + 1
+
+  response = GenerateContentResponse(
+      candidates=[
+          Candidate(
+              content=Content(
+                  parts=[
+                      Part(
+                          function_call=FunctionCall(
+                              name='func_under_test',
+                              args={'a': 1},
+                          )
+                      )
+                  ]
+              )
+          )
+      ]
+  )
+  function_map = {'func_under_test': func_under_test}
+  hook_calls = []
+
+  def hook(function_call, function_response):
+    hook_calls.append((function_call, function_response))
+
+  actual_parts = get_function_response_parts(response, function_map, hook)
+
+  assert len(hook_calls) == 1
+  function_call, function_response = hook_calls[0]
+  assert function_call.name == 'func_under_test'
+  assert function_response.response == {'result': 2}
+  assert function_response is actual_parts[0].function_response
+
+
+def test_function_response_hook_error_is_not_raised():
+  def func_under_test(a: int) -> int:
+    return a + 1
+
+  def hook(function_call, function_response):
+    raise ValueError('hook failure')
+
+  response = GenerateContentResponse(
+      candidates=[
+          Candidate(
+              content=Content(
+                  parts=[
+                      Part(
+                          function_call=FunctionCall(
+                              name='func_under_test',
+                              args={'a': 1},
+                          )
+                      )
+                  ]
+              )
+          )
+      ]
+  )
+  actual_parts = get_function_response_parts(
+      response, {'func_under_test': func_under_test}, hook
+  )
+
+  assert actual_parts[0].function_response.response == {'result': 2}
+
+
+@pytest.mark.asyncio
+async def test_function_response_hook_async():
+  async def func_under_test(a: int) -> int:
+    return a + 1
+
+  response = GenerateContentResponse(
+      candidates=[
+          Candidate(
+              content=Content(
+                  parts=[
+                      Part(
+                          function_call=FunctionCall(
+                              name='func_under_test',
+                              args={'a': 1},
+                          )
+                      )
+                  ]
+              )
+          )
+      ]
+  )
+  hook_calls = []
+
+  async def hook(function_call, function_response):
+    hook_calls.append((function_call, function_response))
+
+  await get_function_response_parts_async(
+      response, {'func_under_test': func_under_test}, hook
+  )
+
+  assert len(hook_calls) == 1
+  assert hook_calls[0][1].response == {'result': 2}
+
+
+def _response_with_function_calls(*function_calls):
+  return GenerateContentResponse(
+      candidates=[
+          Candidate(
+              content=Content(
+                  parts=[
+                      Part(function_call=function_call)
+                      for function_call in function_calls
+                  ]
+              )
+          )
+      ]
+  )
+
+
+def test_concurrent_function_calls_preserve_order():
+  barrier = threading.Barrier(3, timeout=5)
+
+  def func_under_test(a: int) -> int:
+    # Only returns if all three calls are in flight at the same time.
+    barrier.wait()
+    return a * 10
+
+  response = _response_with_function_calls(
+      *[
+          FunctionCall(name='func_under_test', args={'a': a})
+          for a in (1, 2, 3)
+      ]
+  )
+  actual_parts = get_function_response_parts(
+      response,
+      {'func_under_test': func_under_test},
+      max_concurrent_function_calls=3,
+  )
+
+  assert [part.function_response.response for part in actual_parts] == [
+      {'result': 10},
+      {'result': 20},
+      {'result': 30},
+  ]
+
+
+def test_function_call_timeout():
+  release = threading.Event()
+
+  def slow_func() -> str:
+    release.wait(5)
+    return 'slow'
+
+  def fast_func() -> str:
+    return 'fast'
+
+  response = _response_with_function_calls(
+      FunctionCall(name='slow_func', args={}),
+      FunctionCall(name='fast_func', args={}),
+  )
+  try:
+    actual_parts = get_function_response_parts(
+        response,
+        {'slow_func': slow_func, 'fast_func': fast_func},
+        max_concurrent_function_calls=2,
+        function_call_timeout=0.1,
+    )
+  finally:
+    release.set()
+
+  assert 'error' in actual_parts[0].function_response.response
+  assert actual_parts[1].function_response.response == {'result': 'fast'}
+
+
+def test_function_call_timeout_counts_from_start():
+  def slow_func() -> str:
+    time.sleep(0.8)
+    return 'slow'
+
+  def fast_func() -> str:
+    return 'fast'
+
+  response = _response_with_function_calls(
+      FunctionCall(name='slow_func', args={}),
+      FunctionCall(name='fast_func', args={}),
+  )
+  actual_parts = get_function_response_parts(
+      response,
+      {'slow_func': slow_func, 'fast_func': fast_func},
+      function_call_timeout=0.2,
+  )
+
+  # fast_func is queued behind slow_func, but only starts its timeout once it
+  # runs.
+  assert 'error' in actual_parts[0].function_response.response
+  assert actual_parts[1].function_response.response == {'result': 'fast'}
+
+
+def test_hung_function_does_not_hold_up_queued_calls():
+  release = threading.Event()
+
+  def hung_func() -> str:
+    release.wait(5)
+    return 'hung'
+
+  def fast_func() -> str:
+    return 'fast'
+
+  response = _response_with_function_calls(
+      FunctionCall(name='hung_func', args={}),
+      FunctionCall(name='fast_func', args={}),
+      FunctionCall(name='fast_func', args={}),
+  )
+  start = time.monotonic()
+  try:
+    actual_parts = get_function_response_parts(
+        response,
+        {'hung_func': hung_func, 'fast_func': fast_func},
+        function_call_timeout=0.2,
+    )
+    elapsed = time.monotonic() - start
+  finally:
+    release.set()
+
+  assert 'error' in actual_parts[0].function_response.response
+  assert [part.function_response.response for part in actual_parts[1:]] == [
+      {'result': 'fast'},
+      {'result': 'fast'},
+  ]
+  assert elapsed < 1.0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_function_calls_async():
+  in_flight = 0
+  max_in_flight = 0
+
+  async def coroutine_func(a: int) -> int:
+    nonlocal in_flight, max_in_flight
+    in_flight += 1
+    max_in_flight = max(max_in_flight, in_flight)
+    await asyncio.sleep(0.05)
+    in_flight -= 1
+    return a + 1
+
+  def sync_func(a: int) -> int:
+    time.sleep(0.05)
+    return a - 1
+
+  response = _response_with_function_calls(
+      FunctionCall(name='coroutine_func', args={'a': 1}),
+      FunctionCall(name='sync_func', args={'a': 1}),
+      FunctionCall(name='coroutine_func', args={'a': 2}),
+  )
+  actual_parts = await get_function_response_parts_async(
+      response,
+      {'coroutine_func': coroutine_func, 'sync_func': sync_func},
+      max_concurrent_function_calls=4,
+  )
+
+  assert max_in_flight == 2
+  assert [part.function_response.response for part in actual_parts] == [
+      {'result': 2},
+      {'result': 0},
+      {'result': 3},
+  ]
+
+
+@pytest.mark.asyncio
+async def test_function_call_timeout_async():
+  async def slow_func() -> str:
+    await asyncio.sleep(5)
+    return 'slow'
+
+  response = _response_with_function_calls(
+      FunctionCall(name='slow_func', args={}),
+  )
+  actual_parts = await get_function_response_parts_async(
+      response, {'slow_func': slow_func}, function_call_timeout=0.05
+  )
+
+  assert 'error' in actual_parts[0].function_response.response
+
+
+@pytest.mark.asyncio
+async def test_sync_function_call_timeout_async():
+  def slow_func() -> str:
+    time.sleep(0.5)
+    return 'slow'
+
+  response = _response_with_function_calls(
+      FunctionCall(name='slow_func', args={}),
+  )
+  start = time.monotonic()
+  actual_parts = await get_function_response_parts_async(
+      response, {'slow_func': slow_func}, function_call_timeout=0.05
+  )
+
+  assert 'error' in actual_parts[0].function_response.response
+  assert time.monotonic() - start < 0.4
+
+
+@pytest.mark.asyncio
+async def test_hung_function_does_not_hold_up_queued_calls_async():
+  release = threading.Event()
+
+  def hung_func() -> str:
+    release.wait(5)
+    return 'hung'
+
+  def fast_func() -> str:
+    return 'fast'
+
+  response = _response_with_function_calls(
+      FunctionCall(name='hung_func', args={}),
+      FunctionCall(name='fast_func', args={}),
+      FunctionCall(name='fast_func', args={}),
+  )
+  start = time.monotonic()
+  try:
+    actual_parts = await get_function_response_parts_async(
+        response,
+        {'hung_func': hung_func, 'fast_func': fast_func},
+        function_call_timeout=0.2,
+    )
+    elapsed = time.monotonic() - start
+  finally:
+    release.set()
+
+  assert 'error' in actual_parts[0].function_response.response
+  assert [part.function_response.response for part in actual_parts[1:]] == [
+      {'result': 'fast'},
+      {'result': 'fast'},
+  ]
+  assert elapsed < 1.0
+
+
 @pytest.mark.asyncio
 async def test_mcp_tool():
   if not _is_mcp_imported:
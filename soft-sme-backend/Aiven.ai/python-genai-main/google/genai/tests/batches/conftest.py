@@ -0,0 +1,58 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Conftest for the batches tests."""
+
+import os
+import resource
+import threading
+
+import pytest
+
+
+class _PeakRss:
+  """Samples how much the resident set size grows, in a thread."""
+
+  def __init__(self):
+    self.growth = 0
+    self._stop = threading.Event()
+    self._thread = threading.Thread(target=self._sample, daemon=True)
+
+  def _rss(self):
+    # The second field of statm is the resident set size in pages.
+    with open('/proc/self/statm') as f:
+      return int(f.read().split()[1]) * resource.getpagesize()
+
+  def _sample(self):
+    while not self._stop.wait(0.005):
+      self.growth = max(self.growth, self._rss() - self._start)
+
+  def __enter__(self):
+    self._start = self._rss()
+    self._thread.start()
+    return self
+
+  def __exit__(self, *args):
+    self._stop.set()
+    self._thread.join()
+
+
+@pytest.fixture
+def peak_rss():
+  """Returns a context manager that measures how much the RSS grows."""
+  if not os.path.exists('/proc/self/statm'):
+    pytest.skip('Reads RSS from /proc.')
+  return _PeakRss
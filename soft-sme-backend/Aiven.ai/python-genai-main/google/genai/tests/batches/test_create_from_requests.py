@@ -0,0 +1,302 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for sharded batch jobs against a local stand-in of the API."""
+
+import http.server
+import json
+import os
+import threading
+from unittest import mock
+
+import pytest
+
+from ... import batches
+from ... import Client
+from ... import errors
+from ... import types
+
+
+_MODEL = 'gemini-2.5-flash'
+_REPORT = 'Revenue by product line and region for the quarter. ' * 20
+
+
+class _BatchServer(http.server.ThreadingHTTPServer):
+  """Stand-in for the Files API uploads and the Batch API.
+
+  Uploaded files and results are kept on disk. Each batch job succeeds as soon
+  as it is created, with a response per request that echoes its key.
+  """
+
+  def __init__(self, directory):
+    super().__init__(('127.0.0.1', 0), _BatchHandler)
+    self.directory = directory
+    self.uploads: dict[str, int] = {}
+    self.jobs: dict[str, dict] = {}
+    self.requests = 0
+
+  @property
+  def base_url(self) -> str:
+    return f'http://127.0.0.1:{self.server_address[1]}/'
+
+  def path_of(self, name: str) -> str:
+    return os.path.join(self.directory, name.replace('/', '-'))
+
+
+class _BatchHandler(http.server.BaseHTTPRequestHandler):
+
+  def log_message(self, *args):
+    pass
+
+  def _reply(self, body, headers=None):
+    data = json.dumps(body).encode()
+    self.send_response(200)
+    for key, value in (headers or {}).items():
+      self.send_header(key, value)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(data)))
+    self.end_headers()
+    self.wfile.write(data)
+
+  def _copy_body(self, f):
+    remaining = int(self.headers.get('Content-Length', 0))
+    while remaining:
+      data = self.rfile.read(min(remaining, 64 * 1024))
+      f.write(data)
+      remaining -= len(data)
+
+  def do_POST(self):
+    server = self.server
+    command = self.headers.get('X-Goog-Upload-Command')
+    if command == 'start':
+      self._copy_body(open(os.devnull, 'wb'))
+      name = f'files/upload-{len(server.uploads)}'
+      server.uploads[name] = 0
+      self._reply(
+          {},
+          {
+              'x-goog-upload-url': f'{server.base_url}{name}',
+              'x-goog-upload-status': 'active',
+          },
+      )
+    elif command:
+      name = self.path.lstrip('/')
+      with open(server.path_of(name), 'ab') as f:
+        self._copy_body(f)
+        server.uploads[name] = f.tell()
+      if 'finalize' not in command:
+        self._reply({}, {'x-goog-upload-status': 'active'})
+        return
+      file = {'name': name, 'sizeBytes': str(server.uploads[name])}
+      self._reply({'file': file}, {'x-goog-upload-status': 'final'})
+    elif self.path.endswith(':batchGenerateContent'):
+      body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+      batch = body['batch']
+      name = f'batches/job-{len(server.jobs)}'
+      result = f'files/result-{len(server.jobs)}'
+      with open(server.path_of(batch['inputConfig']['fileName'])) as src:
+        with open(server.path_of(result), 'w') as dest:
+          for line in src:
+            request = json.loads(line)
+            server.requests += 1
+            text = request['request']['contents'][0]['parts'][0]['text']
+            assert text.endswith(_REPORT)
+            response = {'candidates': [{
+                'content': {
+                    'role': 'model',
+                    'parts': [{'text': f'summary of {request["key"]}'}],
+                }
+            }]}
+            dest.write(
+                json.dumps({'key': request['key'], 'response': response})
+                + '\n'
+            )
+      server.jobs[name] = {
+          'name': name,
+          'metadata': {
+              'displayName': batch['displayName'],
+              'state': 'BATCH_STATE_SUCCEEDED',
+              'output': {'responsesFile': result},
+          },
+      }
+      self._reply(server.jobs[name])
+    else:
+      self.send_error(404)
+
+  def do_GET(self):
+    server = self.server
+    path = self.path.split('?')[0]
+    if path.endswith(':download'):
+      name = path[len('/v1beta/') : -len(':download')]
+      size = os.path.getsize(server.path_of(name))
+      self.send_response(200)
+      self.send_header('Content-Length', str(size))
+      self.end_headers()
+      with open(server.path_of(name), 'rb') as f:
+        while data := f.read(64 * 1024):
+          self.wfile.write(data)
+    elif path.startswith('/v1beta/batches/'):
+      self._reply(server.jobs[path[len('/v1beta/') :]])
+    else:
+      self.send_error(404)
+
+
+@pytest.fixture
+def server(tmp_path):
+  batch_server = _BatchServer(str(tmp_path))
+  thread = threading.Thread(target=batch_server.serve_forever, daemon=True)
+  thread.start()
+  yield batch_server
+  batch_server.shutdown()
+  batch_server.server_close()
+
+
+def _client(server):
+  return Client(
+      api_key='test-api-key',
+      http_options=types.HttpOptions(base_url=server.base_url),
+  )
+
+
+def _requests(count):
+  for i in range(count):
+    yield {'contents': f'Summarize report {i}: {_REPORT}'}
+
+
+def test_write_request_shards(tmp_path):
+  client = Client(api_key='test-api-key')
+  shards = []
+  for path in batches._write_request_shards(
+      client._api_client, _requests(10), str(tmp_path), 4000
+  ):
+    with open(path) as f:
+      shards.append([json.loads(line) for line in f])
+
+  assert [len(shard) for shard in shards] == [3, 3, 3, 1]
+  assert shards[0][1] == {
+      'key': '1',
+      'request': {
+          'contents': [{
+              'role': 'user',
+              'parts': [{'text': f'Summarize report 1: {_REPORT}'}],
+          }]
+      },
+  }
+  # Each file is removed once the next one is written.
+  assert not os.listdir(tmp_path)
+
+
+def test_request_larger_than_a_shard_raises(tmp_path):
+  client = Client(api_key='test-api-key')
+  with pytest.raises(ValueError, match='max_shard_bytes'):
+    list(
+        batches._write_request_shards(
+            client._api_client, _requests(1), str(tmp_path), 100
+        )
+    )
+  assert not os.listdir(tmp_path)
+
+
+def test_create_from_requests_keeps_memory_flat(server, peak_rss):
+  count = 100_000
+  client = _client(server)
+
+  with peak_rss() as rss:
+    jobs = client.batches.create_from_requests(
+        model=_MODEL,
+        requests=_requests(count),
+        config={'display_name': 'nightly'},
+        max_shard_bytes=16 * 1024 * 1024,
+    )
+    results = 0
+    for i, result in enumerate(client.batches.iter_results(jobs=jobs)):
+      assert result.metadata == {'key': str(i)}
+      assert result.response.text == f'summary of {i}'
+      results += 1
+
+  assert server.requests == results == count
+  # The requests are about 110 MB of JSONL.
+  assert len(jobs) == 7
+  assert [job.display_name for job in jobs] == [
+      f'nightly_{i:05d}' for i in range(7)
+  ]
+  # Uploads map the file of a shard, so its pages count towards RSS.
+  assert rss.growth < 64 * 1024 * 1024
+
+
+@pytest.mark.asyncio
+async def test_async_create_from_requests(server):
+  client = _client(server)
+
+  jobs = await client.aio.batches.create_from_requests(
+      model=_MODEL, requests=_requests(20), max_shard_bytes=4000
+  )
+  keys = [
+      result.metadata['key']
+      async for result in client.aio.batches.iter_results(
+          jobs=[job.name for job in jobs]
+      )
+  ]
+
+  assert len(jobs) == 7
+  assert keys == [str(i) for i in range(20)]
+  # The display names share a prefix.
+  prefix = jobs[0].display_name[: -len('_00000')]
+  assert [job.display_name for job in jobs] == [
+      f'{prefix}_{i:05d}' for i in range(7)
+  ]
+
+
+def test_created_jobs_are_kept_if_a_shard_fails(server):
+  client = _client(server)
+  create = client.batches.create
+
+  def create_two(**kwargs):
+    if len(server.jobs) == 2:
+      raise ValueError('Quota exceeded.')
+    return create(**kwargs)
+
+  with mock.patch.object(client.batches, 'create', create_two):
+    with pytest.raises(errors.BatchJobsCreationError) as error:
+      client.batches.create_from_requests(
+          model=_MODEL, requests=_requests(20), max_shard_bytes=4000
+      )
+
+  assert [job.name for job in error.value.jobs] == [
+      'batches/job-0',
+      'batches/job-1',
+  ]
+  assert isinstance(error.value.__cause__, ValueError)
+
+
+@pytest.mark.asyncio
+async def test_async_first_shard_failure_is_raised(server):
+  client = _client(server)
+
+  with pytest.raises(ValueError, match='max_shard_bytes'):
+    await client.aio.batches.create_from_requests(
+        model=_MODEL, requests=_requests(3), max_shard_bytes=100
+    )
+
+  assert not server.jobs
+
+
+def test_iter_results_of_a_running_job_raises(server):
+  job = types.BatchJob(
+      name='batches/running', state=types.JobState.JOB_STATE_RUNNING
+  )
+  with pytest.raises(ValueError, match='succeeded'):
+    next(_client(server).batches.iter_results(jobs=[job]))
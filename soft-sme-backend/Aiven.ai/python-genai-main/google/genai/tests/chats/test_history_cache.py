@@ -0,0 +1,190 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for the cached wire format of the chat history."""
+
+import json
+from unittest import mock
+
+import pytest
+
+from ... import Client
+from ... import models
+from ... import types
+
+
+_MODEL = 'gemini-2.5-flash'
+
+
+def _response(part):
+  return types.HttpResponse(
+      headers={},
+      body=json.dumps({
+          'candidates': [{
+              'content': {'role': 'model', 'parts': [part]},
+              'finishReason': 'STOP',
+          }]
+      }),
+  )
+
+
+def _client(vertexai):
+  if vertexai:
+    return Client(
+        vertexai=True, project='test-project', location='us-central1'
+    )
+  return Client(api_key='test-api-key')
+
+
+class _Requests:
+  """Records the request bodies and answers with canned responses."""
+
+  def __init__(self, *responses):
+    self.responses = list(responses)
+    self.bodies = []
+
+  def __call__(self, method, path, request_dict, http_options=None):
+    self.bodies.append(json.loads(json.dumps(request_dict)))
+    if len(self.responses) > 1:
+      return self.responses.pop(0)
+    return self.responses[0]
+
+  def streamed(self, method, path, request_dict, http_options=None):
+    yield self(method, path, request_dict, http_options)
+
+
+def _uncached_body(vertexai, contents, config=None):
+  client = _client(vertexai)
+  requests = _Requests(_response({'text': 'ok'}))
+  with mock.patch.object(client._api_client, 'request', requests):
+    client.models.generate_content(
+        model=_MODEL, contents=list(contents), config=config
+    )
+  return requests.bodies[0]
+
+
+@pytest.mark.parametrize('vertexai', [False, True])
+def test_history_is_converted_once(vertexai):
+  client = _client(vertexai)
+  requests = _Requests(_response({'text': 'ok'}))
+  history = [
+      types.Content(role='user', parts=[types.Part(text='Hi')]),
+      types.Content(role='model', parts=[types.Part(text='Hello')]),
+  ]
+  chat = client.chats.create(model=_MODEL, history=history)
+  converter = mock.Mock(wraps=models._Content_to_mldev)
+
+  with mock.patch.object(client._api_client, 'request', requests):
+    with mock.patch.object(models, '_Content_to_mldev', converter):
+      for i in range(4):
+        chat.send_message(f'Message {i}')
+
+  for body, sent in zip(requests.bodies, range(3, 10, 2)):
+    assert body == _uncached_body(
+        vertexai, chat.get_history(curated=True)[:sent]
+    )
+  if not vertexai:
+    # The history once, then the input and the previous response.
+    assert converter.call_count == 3 + 3 * 2
+
+
+def test_edited_history():
+  client = _client(vertexai=False)
+  requests = _Requests(_response({'text': 'ok'}))
+  chat = client.chats.create(model=_MODEL)
+
+  with mock.patch.object(client._api_client, 'request', requests):
+    chat.send_message('First')
+    chat.send_message('Second')
+    del chat.get_history(curated=True)[:2]
+    chat.send_message('Third')
+
+  assert requests.bodies[-1] == _uncached_body(
+      False, chat.get_history(curated=True)[:3]
+  )
+  assert requests.bodies[-1]['contents'][0]['parts'] == [{'text': 'Second'}]
+
+
+def _add(a: int, b: int) -> int:
+  """Adds two numbers."""
+  return a + b
+
+
+def test_afc_requests_use_the_cache():
+  client = _client(vertexai=False)
+  function_call = {'functionCall': {'name': '_add', 'args': {'a': 1, 'b': 2}}}
+  requests = _Requests(
+      _response({'text': 'ok'}),
+      _response(function_call),
+      _response({'text': '3'}),
+  )
+  chat = client.chats.create(model=_MODEL, config={'tools': [_add]})
+  converter = mock.Mock(wraps=models._Content_to_mldev)
+
+  with mock.patch.object(client._api_client, 'request', requests):
+    with mock.patch.object(models, '_Content_to_mldev', converter):
+      chat.send_message('Hi')
+      response = chat.send_message('1 + 2?')
+
+  assert response.text == '3'
+  history = chat.get_history(curated=True)
+  assert len(history) == 6
+  assert requests.bodies[-1] == _uncached_body(
+      False, history[:5], config={'tools': [_add]}
+  )
+  # Each content is converted once.
+  assert converter.call_count == 5
+
+
+def test_stream_uses_the_cache():
+  client = _client(vertexai=False)
+  requests = _Requests(_response({'text': 'ok'}))
+  chat = client.chats.create(model=_MODEL)
+  converter = mock.Mock(wraps=models._Content_to_mldev)
+
+  with mock.patch.object(
+      client._api_client, 'request_streamed', requests.streamed
+  ):
+    with mock.patch.object(models, '_Content_to_mldev', converter):
+      for i in range(3):
+        for _ in chat.send_message_stream(f'Message {i}'):
+          pass
+
+  assert requests.bodies[-1] == _uncached_body(
+      False, chat.get_history(curated=True)[:5]
+  )
+  assert converter.call_count == 1 + 2 * 2
+
+
+@pytest.mark.asyncio
+async def test_async_history_is_converted_once():
+  client = _client(vertexai=False)
+  requests = _Requests(_response({'text': 'ok'}))
+  chat = client.aio.chats.create(model=_MODEL)
+  converter = mock.Mock(wraps=models._Content_to_mldev)
+
+  async def async_request(*args, **kwargs):
+    return requests(*args, **kwargs)
+
+  with mock.patch.object(client._api_client, 'async_request', async_request):
+    with mock.patch.object(models, '_Content_to_mldev', converter):
+      for i in range(3):
+        await chat.send_message(f'Message {i}')
+
+  assert requests.bodies[-1] == _uncached_body(
+      False, chat.get_history(curated=True)[:5]
+  )
+  assert converter.call_count == 1 + 2 * 2
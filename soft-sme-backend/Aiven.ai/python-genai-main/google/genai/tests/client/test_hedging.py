@@ -0,0 +1,282 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for hedged requests against a stand-in with injected latencies."""
+
+import asyncio
+import concurrent.futures
+import http.server
+import json
+import random
+import threading
+import time
+
+import pytest
+
+from ... import _api_client as api_client
+from ... import _hedging
+from ... import Client
+from ... import types
+
+
+_MODEL = 'gemini-2.5-flash'
+_RESPONSE = json.dumps({
+    'candidates': [
+        {'content': {'role': 'model', 'parts': [{'text': 'ok'}]}}
+    ]
+}).encode()
+
+
+class _LatencyServer(http.server.ThreadingHTTPServer):
+  """Stand-in for generateContent that answers after an injected latency.
+
+  `latency(index)` returns how long to wait before answering the request with
+  the given index, and whether to answer with an error.
+  """
+
+  request_queue_size = 128
+
+  def __init__(self, latency):
+    super().__init__(('127.0.0.1', 0), _LatencyHandler)
+    self.latency = latency
+    self.requests = 0
+    self.lock = threading.Lock()
+
+  @property
+  def base_url(self) -> str:
+    return f'http://127.0.0.1:{self.server_address[1]}/'
+
+
+class _LatencyHandler(http.server.BaseHTTPRequestHandler):
+
+  def log_message(self, *args):
+    pass
+
+  def do_POST(self):
+    server = self.server
+    self.rfile.read(int(self.headers['Content-Length']))
+    with server.lock:
+      index = server.requests
+      server.requests += 1
+      seconds, fail = server.latency(index)
+    time.sleep(seconds)
+    if fail:
+      body = json.dumps(
+          {'error': {'code': 500, 'message': 'Failed.', 'status': 'INTERNAL'}}
+      ).encode()
+      self.send_response(500)
+    else:
+      body = _RESPONSE
+      self.send_response(200)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    try:
+      self.wfile.write(body)
+    except ConnectionError:
+      # The client cancelled the request that lost the race.
+      pass
+
+
+@pytest.fixture
+def server_factory():
+  servers = []
+
+  def start(latency):
+    server = _LatencyServer(latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    servers.append(server)
+    return server
+
+  yield start
+  for server in servers:
+    server.shutdown()
+    server.server_close()
+
+
+def _long_tail(seed):
+  """One request in 20 takes 100 times as long as the others."""
+  rng = random.Random(seed)
+  return lambda index: (1.0 if rng.random() < 0.05 else 0.01, False)
+
+
+def _client(server, hedging=None):
+  return Client(
+      api_key='test-api-key',
+      http_options=types.HttpOptions(base_url=server.base_url, hedging=hedging),
+  )
+
+
+def _p99(latencies):
+  return sorted(latencies)[int(len(latencies) * 0.99) - 1]
+
+
+def _timed_requests(client, count):
+  def request(i):
+    start = time.monotonic()
+    response = client.models.generate_content(model=_MODEL, contents=f'Hi {i}')
+    assert response.text == 'ok'
+    return time.monotonic() - start
+
+  with concurrent.futures.ThreadPoolExecutor(8) as executor:
+    return list(executor.map(request, range(count)))
+
+
+def test_hedging_cuts_tail_latency(server_factory):
+  count = 300
+  plain = server_factory(_long_tail(seed=1))
+  hedged = server_factory(_long_tail(seed=1))
+
+  plain_latencies = _timed_requests(_client(plain), count)
+  hedged_latencies = _timed_requests(
+      _client(
+          hedged,
+          types.HedgingOptions(
+              percentile=90, initial_delay=0.05, max_hedges_per_minute=1000
+          ),
+      ),
+      count,
+  )
+
+  assert _p99(plain_latencies) >= 1.0
+  assert _p99(hedged_latencies) < 0.5
+  # Requests slower than the 90th percentile are hedged.
+  assert count < hedged.requests < count * 1.25
+
+
+@pytest.mark.asyncio
+async def test_async_hedging_cancels_the_slower_request(server_factory):
+  server = server_factory(lambda index: (1.0 if index == 0 else 0.01, False))
+  client = _client(server, types.HedgingOptions(initial_delay=0.05))
+
+  start = time.monotonic()
+  response = await client.aio.models.generate_content(
+      model=_MODEL, contents='Hi'
+  )
+
+  assert response.text == 'ok'
+  assert time.monotonic() - start < 0.5
+  assert server.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_async_cancelled_request_records_its_latency():
+  hedger = _hedging.Hedger(types.HedgingOptions(initial_delay=0.05))
+  latencies = iter([1.0, 0.01])
+
+  async def request_once(http_request, stream):
+    await asyncio.sleep(next(latencies))
+    return 'ok'
+
+  http_request = api_client.HttpRequest(
+      headers={},
+      url=f'https://example.com/v1beta/models/{_MODEL}:generateContent',
+      method='post',
+      data={},
+  )
+  recorded = []
+  hedger._record = lambda model, seconds: recorded.append(seconds)
+
+  assert await hedger.async_call(request_once, http_request) == 'ok'
+
+  # The duplicate, then the cancelled request with its latency so far.
+  assert recorded == [
+      pytest.approx(0.01, abs=0.05),
+      pytest.approx(0.06, abs=0.05),
+  ]
+
+
+def test_requests_do_not_wait_for_the_thread_pool(
+    server_factory, monkeypatch
+):
+  monkeypatch.setattr(_hedging, '_MAX_THREADS', 1)
+  server = server_factory(lambda index: (0.2, False))
+  client = _client(
+      server,
+      types.HedgingOptions(initial_delay=10.0, max_hedges_per_minute=0),
+  )
+
+  start = time.monotonic()
+  with concurrent.futures.ThreadPoolExecutor(8) as executor:
+    list(
+        executor.map(
+            lambda i: client.models.generate_content(
+                model=_MODEL, contents=f'Hi {i}'
+            ),
+            range(8),
+        )
+    )
+
+  assert time.monotonic() - start < 1.0
+  assert server.requests == 8
+
+
+def test_first_success_is_returned(server_factory):
+  server = server_factory(
+      lambda index: (0.2, True) if index == 0 else (0.0, False)
+  )
+  client = _client(server, types.HedgingOptions(initial_delay=0.05))
+
+  response = client.models.generate_content(model=_MODEL, contents='Hi')
+
+  assert response.text == 'ok'
+  assert server.requests == 2
+
+
+def test_hedges_per_minute_are_capped(server_factory):
+  server = server_factory(lambda index: (0.1, False))
+  client = _client(
+      server,
+      types.HedgingOptions(initial_delay=0.01, max_hedges_per_minute=3),
+  )
+
+  for i in range(6):
+    client.models.generate_content(model=_MODEL, contents=f'Hi {i}')
+
+  assert server.requests == 6 + 3
+
+
+def test_other_requests_are_not_hedged(server_factory):
+  server = server_factory(lambda index: (0.1, False))
+  client = _client(server, types.HedgingOptions(initial_delay=0.01))
+
+  client.models.count_tokens(model=_MODEL, contents='Hi')
+
+  assert server.requests == 1
+
+
+def test_delay_follows_recent_latencies():
+  hedger = _hedging.Hedger(types.HedgingOptions(percentile=90))
+  assert hedger.delay(_MODEL) is None
+
+  for i in range(100):
+    hedger._record(_MODEL, 0.5 if i % 10 == 9 else 0.1)
+
+  assert hedger.delay(_MODEL) == pytest.approx(0.1, rel=0.1)
+  assert hedger.delay('gemini-2.0-flash') is None
+  for _ in range(100):
+    hedger._record(_MODEL, 0.5)
+  assert hedger.delay(_MODEL) == pytest.approx(0.5, rel=0.1)
+
+
+def test_latency_histogram_keeps_a_window():
+  histogram = _hedging._LatencyHistogram(window=10)
+  for seconds in [1.0] * 10 + [0.01] * 5:
+    histogram.add(seconds)
+
+  assert len(histogram) == 10
+  assert histogram.percentile(50) == pytest.approx(0.01, rel=0.1)
+  assert histogram.percentile(60) == pytest.approx(1.0, rel=0.1)
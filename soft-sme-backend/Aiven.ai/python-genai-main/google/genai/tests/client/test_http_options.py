@@ -31,6 +31,8 @@ def test_patch_http_options_with_copies_all_fields():
       async_client_args={'http1': True},
       extra_body={'key': 'value'},
       retry_options=types.HttpRetryOptions(attempts=10),
+      rate_limits={'*': types.RateLimitOptions(requests_per_minute=60)},
+      hedging=types.HedgingOptions(percentile=90),
   )
   options = types.HttpOptions()
   patched = _api_client.patch_http_options(options, patch_options)
@@ -45,6 +47,8 @@ def test_patch_http_options_with_copies_all_fields():
   assert patched.headers['X-Custom-Header'] == 'custom_value'
   assert patched.timeout == 10000
   assert patched.retry_options.attempts == 10
+  assert patched.rate_limits['*'].requests_per_minute == 60
+  assert patched.hedging.percentile == 90
   assert patched.client_args['http2']
   assert patched.async_client_args['http1']
 
@@ -47,6 +47,12 @@ def pytest_addoption(parser):
       default=False,
       help='Run private tests.',
   )
+  parser.addoption(
+      '--run-slow',
+      action='store_true',
+      default=False,
+      help='Run slow tests, e.g. the ones that stream gigabytes of data.',
+  )
 
 
 # Overridden via parameterized test.
@@ -13,6 +13,9 @@
 # limitations under the License.
 #
 
+import collections
+import concurrent.futures
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -318,6 +321,93 @@ class TestLocalTokenizer(unittest.TestCase):
         ['Hello']
     )
 
+  def test_count_tokens_batch_encodes_once(self):
+    self.mock_tokenizer.encode.return_value = [[1, 2], [3], [4, 5, 6]]
+    results = self.tokenizer.count_tokens_batch(
+        ['Hello', ['world', 'Hello'], 'How are you?'], num_threads=2
+    )
+    self.assertEqual([r.total_tokens for r in results], [2, 3, 3])
+    self.mock_tokenizer.encode.assert_called_once_with(
+        ['Hello', 'world', 'How are you?'], num_threads=2
+    )
+
+  def test_count_tokens_batch_caches_counts(self):
+    self.mock_tokenizer.encode.return_value = [[1, 2], [3]]
+    self.tokenizer.count_tokens_batch(['Hello', 'world'])
+    self.mock_tokenizer.encode.reset_mock()
+    self.mock_tokenizer.encode.return_value = [[4, 5, 6]]
+    results = self.tokenizer.count_tokens_batch(['world', 'Hi there!'])
+    self.assertEqual([r.total_tokens for r in results], [1, 3])
+    self.mock_tokenizer.encode.assert_called_once_with(
+        ['Hi there!'], num_threads=-1
+    )
+
+  def test_count_tokens_batch_cache_evicts_least_recent(self):
+    self.mock_tokenizer.encode.side_effect = lambda texts, **_: [
+        [0] * len(text) for text in texts
+    ]
+    with patch.object(local_tokenizer, '_TOKEN_COUNT_CACHE_SIZE', 2):
+      self.tokenizer.count_tokens_batch(['a', 'bb'])
+      self.tokenizer.count_tokens_batch(['a'])
+      self.tokenizer.count_tokens_batch(['ccc'])
+    self.assertEqual(list(self.tokenizer._token_counts), ['a', 'ccc'])
+
+  def test_count_tokens_batch_with_system_instruction(self):
+    self.mock_tokenizer.encode.return_value = [[1], [2, 3], [4, 5, 6]]
+    config = types.CountTokensConfig(
+        system_instruction=types.Content(parts=[types.Part(text='Be brief.')])
+    )
+    results = self.tokenizer.count_tokens_batch(
+        ['Hello', 'How are you?'], config=config
+    )
+    self.assertEqual([r.total_tokens for r in results], [3, 4])
+    self.mock_tokenizer.encode.assert_called_once_with(
+        ['Be brief.', 'Hello', 'How are you?'], num_threads=-1
+    )
+
+  def test_count_tokens_batch_with_executor(self):
+    self.mock_tokenizer.encode.side_effect = lambda texts, **_: [
+        [0] * len(text) for text in texts
+    ]
+    local_tokenizer._get_task_tokenizer.cache_clear()
+    self.addCleanup(local_tokenizer._get_task_tokenizer.cache_clear)
+    texts = [f'text {i}' for i in range(25)]
+    with patch.object(local_tokenizer, '_EXECUTOR_TASK_SIZE', 10):
+      with concurrent.futures.ThreadPoolExecutor(2) as executor:
+        results = self.tokenizer.count_tokens_batch(texts, executor=executor)
+    self.assertEqual([r.total_tokens for r in results], [len(t) for t in texts])
+    self.assertEqual(self.mock_tokenizer.encode.call_count, 3)
+
+  def test_count_tokens_batch_from_threads(self):
+    self.mock_tokenizer.encode.side_effect = lambda texts, **_: [
+        [0] * len(text) for text in texts
+    ]
+    texts = [f'text {i:>{i}}' for i in range(20)]
+
+    def count(offset):
+      totals = []
+      for i in range(200):
+        batch = [texts[(offset + i + j) % len(texts)] for j in range(3)]
+        results = self.tokenizer.count_tokens_batch(batch)
+        totals.append(
+            [r.total_tokens for r in results] == [len(t) for t in batch]
+        )
+      return all(totals)
+
+    # Lets other threads run between a lookup and the update of the cache.
+    class YieldingDict(collections.OrderedDict):
+
+      def get(self, *args):
+        value = super().get(*args)
+        time.sleep(0.0001)
+        return value
+
+    self.tokenizer._token_counts = YieldingDict()
+    with patch.object(local_tokenizer, '_TOKEN_COUNT_CACHE_SIZE', 4):
+      with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        self.assertTrue(all(executor.map(count, range(8))))
+    self.assertLessEqual(len(self.tokenizer._token_counts), 4)
+
 
 class TestParseHexByte(unittest.TestCase):
 
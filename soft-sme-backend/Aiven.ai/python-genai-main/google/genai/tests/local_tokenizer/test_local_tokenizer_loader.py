@@ -13,6 +13,9 @@
 # limitations under the License.
 #
 
+import hashlib
+import os
+import tempfile
 import unittest
 from unittest.mock import MagicMock, mock_open, patch
 
@@ -79,6 +82,7 @@ class TestLoaderFunctions(unittest.TestCase):
 
   def setUp(self):
     # Clear caches before each test
+    loader._load_model_proto_bytes.cache_clear()
     loader.load_model_proto.cache_clear()
     loader.get_sentencepiece.cache_clear()
     # Patch tempfile.gettempdir to control cache location
@@ -236,3 +240,83 @@ class TestLoaderFunctions(unittest.TestCase):
 
     # Should only be loaded once due to lru_cache
     mock_get.assert_called_once()
+
+
+class TestModelCache(unittest.TestCase):
+
+  def setUp(self):
+    loader._load_model_proto_bytes.cache_clear()
+    loader.load_model_proto.cache_clear()
+    loader.get_sentencepiece.cache_clear()
+    self.tempdir = tempfile.TemporaryDirectory()
+    self.addCleanup(self.tempdir.cleanup)
+    for patcher in (
+        patch("tempfile.gettempdir", return_value=self.tempdir.name),
+        patch.dict(
+            loader._TOKENIZERS,
+            {
+                "fake": loader._TokenizerConfig(
+                    model_url="https://example.com/fake.model",
+                    model_hash=hashlib.sha256(FAKE_MODEL_CONTENT).hexdigest(),
+                )
+            },
+        ),
+    ):
+      patcher.start()
+      self.addCleanup(patcher.stop)
+    self.get_patcher = patch.object(loader.requests, "get")
+    self.mock_get = self.get_patcher.start()
+    self.addCleanup(self.get_patcher.stop)
+    self.mock_get.return_value.content = FAKE_MODEL_CONTENT
+    self.model_path = os.path.join(
+        self.tempdir.name,
+        "vertexai_tokenizer_model",
+        hashlib.sha1(b"https://example.com/fake.model").hexdigest(),
+    )
+
+  def _clear_process_caches(self):
+    loader._load_model_proto_bytes.cache_clear()
+    loader.load_model_proto.cache_clear()
+    loader.get_sentencepiece.cache_clear()
+
+  def test_model_is_read_and_hashed_once(self):
+    with patch.object(
+        loader.hashlib, "sha256", wraps=hashlib.sha256
+    ) as mock_sha256:
+      loader.load_model_proto("fake")
+      loader.get_sentencepiece("fake")
+
+    self.mock_get.assert_called_once()
+    mock_sha256.assert_called_once()
+    with open(self.model_path, "rb") as f:
+      self.assertEqual(f.read(), FAKE_MODEL_CONTENT)
+    self.assertTrue(os.path.exists(loader._hash_sidecar_path(self.model_path)))
+
+  def test_cache_hit_skips_hashing_and_writing(self):
+    loader.load_model_proto("fake")
+    self._clear_process_caches()
+
+    with patch.object(
+        loader.hashlib, "sha256", wraps=hashlib.sha256
+    ) as mock_sha256, patch.object(
+        loader, "_maybe_save_to_cache"
+    ) as mock_save:
+      processor = loader.get_sentencepiece("fake")
+
+    self.assertIsInstance(processor, spm.SentencePieceProcessor)
+    self.mock_get.assert_called_once()
+    mock_sha256.assert_not_called()
+    mock_save.assert_not_called()
+
+  def test_changed_cache_file_is_hashed_again(self):
+    loader.load_model_proto("fake")
+    self._clear_process_caches()
+    with open(self.model_path, "wb") as f:
+      f.write(b"corrupted")
+    os.utime(self.model_path, ns=(0, 0))
+
+    loader.load_model_proto("fake")
+
+    self.assertEqual(self.mock_get.call_count, 2)
+    with open(self.model_path, "rb") as f:
+      self.assertEqual(f.read(), FAKE_MODEL_CONTENT)
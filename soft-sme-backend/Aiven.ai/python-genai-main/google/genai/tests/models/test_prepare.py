@@ -0,0 +1,175 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for models.prepare."""
+
+import json
+from unittest import mock
+import pytest
+from ... import Client
+from ... import types
+
+
+_TEXT_RESPONSE = {
+    'candidates': [{
+        'content': {'role': 'model', 'parts': [{'text': 'There are 3.'}]},
+        'finishReason': 'STOP',
+    }]
+}
+
+_FUNCTION_CALL_RESPONSE = {
+    'candidates': [{
+        'content': {
+            'role': 'model',
+            'parts': [{
+                'functionCall': {
+                    'name': 'count_orders',
+                    'args': {'status': 'open'},
+                }
+            }],
+        },
+        'finishReason': 'STOP',
+    }]
+}
+
+
+def count_orders(status: str) -> int:
+  """Counts the sales orders with the given status."""
+  return 3
+
+
+def _http_response(body):
+  return types.HttpResponse(headers={}, body=json.dumps(body))
+
+
+@pytest.fixture
+def client(use_vertex):
+  if use_vertex:
+    return Client(
+        vertexai=True, project='test-project', location='test-location'
+    )
+  return Client(api_key='test-api-key')
+
+
+@pytest.mark.parametrize('use_vertex', [True, False])
+def test_prepared_request_matches_generate_content(client):
+  config = types.GenerateContentConfig(
+      system_instruction='Answer in one sentence.',
+      temperature=0,
+      http_options=types.HttpOptions(headers={'x-test': 'value'}),
+  )
+  contents = [
+      types.Content(role='user', parts=[types.Part(text='How many orders?')]),
+  ]
+  with mock.patch.object(
+      client._api_client,
+      'request',
+      return_value=_http_response(_TEXT_RESPONSE),
+  ) as request:
+    expected = client.models.generate_content(
+        model='gemini-2.5-flash', contents=contents, config=config
+    )
+    prepared = client.models.prepare(model='gemini-2.5-flash', config=config)
+    actual = prepared.generate_content(contents=contents)
+
+  assert request.call_count == 2
+  assert request.call_args_list[0] == request.call_args_list[1]
+  assert actual.text == expected.text == 'There are 3.'
+
+
+def test_prepared_request_afc():
+  client = Client(api_key='test-api-key')
+  prepared = client.models.prepare(
+      model='gemini-2.5-flash',
+      config=types.GenerateContentConfig(tools=[count_orders]),
+  )
+  with mock.patch.object(
+      client._api_client,
+      'request',
+      side_effect=[
+          _http_response(_FUNCTION_CALL_RESPONSE),
+          _http_response(_TEXT_RESPONSE),
+      ],
+  ) as request:
+    response = prepared.generate_content(contents='How many open orders?')
+
+  assert response.text == 'There are 3.'
+  second_request = request.call_args_list[1].args[2]
+  assert second_request['contents'] == [
+      {'parts': [{'text': 'How many open orders?'}], 'role': 'user'},
+      {
+          'parts': [{
+              'functionCall': {
+                  'name': 'count_orders',
+                  'args': {'status': 'open'},
+              }
+          }],
+          'role': 'model',
+      },
+      {
+          'parts': [{
+              'functionResponse': {
+                  'name': 'count_orders',
+                  'response': {'result': 3},
+              }
+          }],
+          'role': 'user',
+      },
+  ]
+  assert len(response.automatic_function_calling_history) == 3
+
+
+def test_prepared_request_does_not_revalidate_config():
+  client = Client(api_key='test-api-key')
+  prepared = client.models.prepare(
+      model='gemini-2.5-flash',
+      config={'system_instruction': 'Answer in one sentence.'},
+  )
+  with mock.patch.object(
+      client._api_client,
+      'request',
+      return_value=_http_response(_TEXT_RESPONSE),
+  ), mock.patch.object(
+      types, '_GenerateContentParameters'
+  ) as parameters:
+    prepared.generate_content(contents='How many orders?')
+    prepared.generate_content(contents='How many customers?')
+
+  parameters.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_prepared_request_afc():
+  client = Client(api_key='test-api-key')
+  prepared = client.aio.models.prepare(
+      model='gemini-2.5-flash',
+      config=types.GenerateContentConfig(tools=[count_orders]),
+  )
+  with mock.patch.object(
+      client._api_client,
+      'async_request',
+      side_effect=[
+          _http_response(_FUNCTION_CALL_RESPONSE),
+          _http_response(_TEXT_RESPONSE),
+      ],
+  ) as request:
+    response = await prepared.generate_content(
+        contents='How many open orders?'
+    )
+
+  assert response.text == 'There are 3.'
+  assert request.call_count == 2
+  assert len(request.call_args_list[1].args[2]['contents']) == 3
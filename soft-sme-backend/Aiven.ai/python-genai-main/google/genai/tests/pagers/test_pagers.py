@@ -0,0 +1,186 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+"""Tests for the pagers of the list APIs."""
+
+import asyncio
+import json
+import threading
+import urllib.parse
+
+import httpx
+import pytest
+
+from ... import Client
+from ... import pagers
+from ... import types
+
+
+_PAGES = 5
+_PAGE_SIZE = 3
+
+
+def _response(page_token):
+  page = int(page_token or 0)
+  return types.ListFilesResponse(
+      files=[
+          types.File(name=f'files/{page}-{i}') for i in range(_PAGE_SIZE)
+      ],
+      next_page_token=str(page + 1) if page + 1 < _PAGES else None,
+  )
+
+
+_ALL_NAMES = [
+    f'files/{page}-{i}' for page in range(_PAGES) for i in range(_PAGE_SIZE)
+]
+
+
+class _Lister:
+  """Stand-in for the `_list` method of an API module."""
+
+  def __init__(self, fail_on=None):
+    self.page_tokens = []
+    self.fail_on = fail_on
+    self.lock = threading.Lock()
+
+  def __call__(self, *, config):
+    with self.lock:
+      self.page_tokens.append(config.get('page_token'))
+    if self.fail_on and config.get('page_token') == self.fail_on:
+      self.fail_on = None
+      raise ConnectionError('Injected failure.')
+    return _response(config.get('page_token'))
+
+
+class _AsyncLister(_Lister):
+
+  async def __call__(self, *, config):
+    await asyncio.sleep(0)
+    return super().__call__(config=config)
+
+
+def _pager(lister, **config):
+  return pagers.Pager('files', lister, lister(config=config), config)
+
+
+def test_iterates_over_all_pages():
+  lister = _Lister()
+  config = {'page_size': _PAGE_SIZE}
+
+  pager = _pager(lister, **config)
+
+  assert [file.name for file in pager] == _ALL_NAMES
+  assert lister.page_tokens == [None, '1', '2', '3', '4']
+  assert config == {'page_size': _PAGE_SIZE}
+  assert pager.config == {'page_size': _PAGE_SIZE, 'page_token': None}
+
+
+def test_all_items():
+  pager = _pager(_Lister())
+
+  assert [file.name for file in pager.all_items()] == _ALL_NAMES
+  with pytest.raises(IndexError):
+    pager.next_page()
+
+
+def test_prefetch_is_bounded():
+  lister = _Lister()
+
+  pager = _pager(lister, prefetch_pages=2)
+  for future in pager._prefetched:
+    future.result()
+
+  assert lister.page_tokens == [None, '1', '2']
+  pager.next_page()
+  for future in pager._prefetched:
+    future.result()
+  assert lister.page_tokens == [None, '1', '2', '3']
+  assert [file.name for file in pager.all_items()] == _ALL_NAMES[3:]
+  assert lister.page_tokens == [None, '1', '2', '3', '4']
+  assert pager._executor is None
+
+
+def test_prefetch_failure_is_raised_for_its_page():
+  lister = _Lister(fail_on='2')
+  pager = _pager(lister, prefetch_pages=3)
+
+  assert [file.name for file in pager.page] == _ALL_NAMES[:3]
+  pager.next_page()
+  with pytest.raises(ConnectionError):
+    pager.next_page()
+  # The failed page is fetched again.
+  assert [file.name for file in pager.all_items()] == _ALL_NAMES[3:]
+
+
+@pytest.mark.asyncio
+async def test_async_prefetch():
+  lister = _AsyncLister()
+  config = {'page_size': _PAGE_SIZE, 'prefetch_pages': 2}
+
+  pager = pagers.AsyncPager(
+      'files', lister, await lister(config=config), config
+  )
+  await asyncio.gather(*pager._prefetched)
+
+  assert lister.page_tokens == [None, '1', '2']
+  assert [file.name async for file in pager.all_items()] == _ALL_NAMES
+  assert lister.page_tokens == [None, '1', '2', '3', '4']
+
+
+@pytest.mark.asyncio
+async def test_async_prefetch_failure_is_raised_for_its_page():
+  lister = _AsyncLister(fail_on='1')
+  pager = pagers.AsyncPager(
+      'files', lister, await lister(config={}), {'prefetch_pages': 2}
+  )
+
+  with pytest.raises(ConnectionError):
+    await pager.next_page()
+  # The failed page is fetched again.
+  assert [file.name async for file in pager] == _ALL_NAMES
+
+
+def test_files_list_with_prefetch_pages():
+  requested = []
+
+  def handler(request: httpx.Request) -> httpx.Response:
+    query = dict(urllib.parse.parse_qsl(request.url.query.decode()))
+    requested.append(query)
+    response = _response(query.get('pageToken'))
+    return httpx.Response(
+        200,
+        json=json.loads(response.model_dump_json(by_alias=True)),
+    )
+
+  client = Client(
+      api_key='test-api-key',
+      http_options=types.HttpOptions(
+          client_args={'transport': httpx.MockTransport(handler)}
+      ),
+  )
+  pager = client.files.list(
+      config={'page_size': _PAGE_SIZE, 'prefetch_pages': 2}
+  )
+
+  assert [file.name for file in pager.all_items()] == _ALL_NAMES
+  assert [query.get('pageToken') for query in requested] == [
+      None,
+      '1',
+      '2',
+      '3',
+      '4',
+  ]
+  assert all('prefetchPages' not in query for query in requested)
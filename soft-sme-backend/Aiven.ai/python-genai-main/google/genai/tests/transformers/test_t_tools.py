@@ -17,6 +17,7 @@
 
 import typing
 from typing import Any
+from unittest import mock
 import pytest
 from ... import _transformers as t
 from ... import client as google_genai_client_module
@@ -99,6 +100,71 @@ def test_tool(client):
   assert t.t_tools(client, [tool]) == [tool]
 
 
+@pytest.mark.usefixtures('client')
+def test_function_declaration_is_cached(client):
+  def test_func(arg1: str, arg2: int):
+    pass
+
+  with mock.patch.object(
+      types.FunctionDeclaration,
+      'from_callable',
+      wraps=types.FunctionDeclaration.from_callable,
+  ) as from_callable:
+    first = t.t_tools(client, [test_func])
+    second = t.t_tools(client, [test_func])
+
+  assert from_callable.call_count == 1
+  assert first == second
+  # Callers get their own copy of the cached declaration.
+  assert (
+      first[0].function_declarations[0]
+      is not second[0].function_declarations[0]
+  )
+
+
+@pytest.mark.usefixtures('client')
+def test_function_declaration_cache_invalidated_on_code_change(client):
+  def test_func(arg1):
+    pass
+
+  def other_func(arg2):
+    pass
+
+  test_func.__annotations__ = {'arg1': str, 'arg2': int}
+  first = t.t_tools(client, [test_func])
+  test_func.__code__ = other_func.__code__
+  second = t.t_tools(client, [test_func])
+
+  assert first[0].function_declarations[0].parameters.properties == {
+      'arg1': types.Schema(type='STRING')
+  }
+  assert second[0].function_declarations[0].parameters.properties == {
+      'arg2': types.Schema(type='INTEGER')
+  }
+
+
+@pytest.mark.usefixtures('client')
+def test_method_declaration_is_cached(client):
+  class Database:
+
+    def query(self, sql: str) -> str:
+      return sql
+
+  with mock.patch.object(
+      types.FunctionDeclaration,
+      'from_callable',
+      wraps=types.FunctionDeclaration.from_callable,
+  ) as from_callable:
+    first = t.t_tools(client, [Database().query])
+    second = t.t_tools(client, [Database().query])
+
+  assert from_callable.call_count == 1
+  assert first == second
+  assert list(
+      first[0].function_declarations[0].parameters.properties.keys()
+  ) == ['sql']
+
+
 @pytest.mark.usefixtures('client')
 def test_mcp_tool(client):
   if not _is_mcp_imported:
@@ -55,8 +55,8 @@ def client(use_vertex):
     )
 
 @pytest.fixture
-def encode_unserializable_types_method():
-  with mock.patch.object(common_module, 'encode_unserializable_types', wraps=common_module.encode_unserializable_types) as method:
+def convert_to_json_dict_method():
+  with mock.patch.object(common_module, 'convert_to_json_dict', wraps=common_module.convert_to_json_dict) as method:
     yield method
 
 
@@ -73,10 +73,10 @@ def mock_request_method():
 
 # This test checks if user pass in valid base64 string(url safe base64)
 # via pydantic type, then SDK will return the raw bytes in pydantic type.
-@pytest.mark.usefixtures('client', 'mock_request_method', 'encode_unserializable_types_method')
+@pytest.mark.usefixtures('client', 'mock_request_method', 'convert_to_json_dict_method')
 @pytest.mark.parametrize('bytes_input', [_RAW_BYTES, _BASE64_URL_SAFE])
 def test_base64_pydantic_input_success(
-    client, mock_request_method, encode_unserializable_types_method, bytes_input
+    client, mock_request_method, convert_to_json_dict_method, bytes_input
 ):
   mock_request_method.return_value = types.HttpResponse(
       headers={'header_key': 'header_value'},
@@ -102,7 +102,7 @@ def test_base64_pydantic_input_success(
       ),
   )
 
-  encode_unserializable_types_method.assert_called()
+  convert_to_json_dict_method.assert_called()
   assert mock_request_method.call_count == 1
   assert (
       pytest_helper.get_value_ignore_key_case(
@@ -119,9 +119,9 @@ def test_base64_pydantic_input_success(
 
 # This test checks if user pass in valid base64 string(url safe base64)
 # via dict type, then SDK will return the raw bytes in pydantic type.
-@pytest.mark.usefixtures('client', 'mock_request_method', 'encode_unserializable_types_method')
+@pytest.mark.usefixtures('client', 'mock_request_method', 'convert_to_json_dict_method')
 @pytest.mark.parametrize('bytes_input', [_RAW_BYTES, _BASE64_URL_SAFE])
-def test_base64_dict_input_success(client, mock_request_method, encode_unserializable_types_method, bytes_input):
+def test_base64_dict_input_success(client, mock_request_method, convert_to_json_dict_method, bytes_input):
   mock_request_method.return_value = types.HttpResponse(
       headers={'header_key': 'header_value'},
       body = json.dumps({
@@ -146,7 +146,7 @@ def test_base64_dict_input_success(client, mock_request_method, encode_unseriali
       },
   )
 
-  encode_unserializable_types_method.assert_called()
+  convert_to_json_dict_method.assert_called()
   assert mock_request_method.call_count == 1
   assert (
       pytest_helper.get_value_ignore_key_case(